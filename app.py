@@ -1,17 +1,23 @@
 # app.py (main.py와 같은 위치에 생성)
 
 # 1. Flask 및 웹 요청 관련 도구 임포트
+import os
+import atexit
 from flask import Flask, request, jsonify
 from datetime import date
 
 # 2. main.py에서 했던 것처럼 모든 리포지토리와 서비스 임포트
+from src.logging_config import configure_logging
+from src.models.caravan import Caravan
 from src.models.common import UserRole
+from src.models.user import User
+from src.serializers import encoder_for, dumps_list, iter_json_array
 from src.exceptions.custom_exceptions import ValidationError
-from src.repositories.memory_repository import (InMemoryUserRepository,
-                                                InMemoryCaravanRepository,
-                                                InMemoryReservationRepository,
-                                                InMemoryPaymentRepository,
-                                                InMemoryReviewRepository)
+from src.repositories.concurrent_repository import (ThreadSafeUserRepository,
+                                                    ThreadSafeCaravanRepository,
+                                                    ThreadSafeReservationRepository,
+                                                    ThreadSafePaymentRepository,
+                                                    ThreadSafeReviewRepository)
 from src.services.user_service import UserService
 from src.services.caravan_service import CaravanService
 # ... (Reservation, Payment, Review 서비스도 모두 임포트) ...
@@ -19,16 +25,28 @@ from src.services.caravan_service import CaravanService
 # 3. Flask 앱 인스턴스 생성
 app = Flask(__name__)
 
+# 로그 설정: LOG_LEVEL (기본 INFO), LOG_QUEUE=1이면 로그 I/O를 백그라운드 스레드로 분리
+log_listener = configure_logging(os.environ.get("LOG_LEVEL", "INFO"),
+                                 use_queue=os.environ.get("LOG_QUEUE") == "1")
+if log_listener is not None:
+    atexit.register(log_listener.stop)
+
 # === 4. [DI] 모든 의존성 주입 (main.py의 DI 부분을 그대로 가져옴) ===
-# (이 객체들은 서버가 실행되는 동안 메모리에 계속 상주합니다)
-user_repo = InMemoryUserRepository()
-caravan_repo = InMemoryCaravanRepository()
+# (이 객체들은 서버가 실행되는 동안 메모리에 계속 상주하고, 요청 스레드들이 함께 사용합니다)
+user_repo = ThreadSafeUserRepository()
+caravan_repo = ThreadSafeCaravanRepository()
+reservation_repo = ThreadSafeReservationRepository()
+payment_repo = ThreadSafePaymentRepository()
+review_repo = ThreadSafeReviewRepository()
 # ... (다른 리포지토리들도 생성) ...
 
 user_service = UserService(user_repo=user_repo)
-caravan_service = CaravanService(caravan_repo=caravan_repo)
+caravan_service = CaravanService(caravan_repo=caravan_repo,
+                                 reservation_repo=reservation_repo)
 # ... (다른 서비스들도 생성) ...
 
+encode_caravan = encoder_for(Caravan)
+
 # === 5. API 엔드포인트(라우트) 생성 ===
 
 
@@ -104,6 +122,8 @@ def search_caravans_route():
 
     요청 쿼리 스트링 예시:
     ?capacity=3
+    ?capacity=3&start_date=2025-12-01&end_date=2025-12-03 (해당 기간 예약 가능한 카라반만)
+    ?capacity=3&stream=1 (결과가 많을 때: 응답 본문을 나눠서 전송)
     ?capacity=3&user_id=... (실제로는 인증된 유저 ID를 사용해야 함)
     """
     try:
@@ -126,16 +146,25 @@ def search_caravans_route():
 
         min_capacity = int(capacity_str)
 
+        # (선택) 날짜 조건: YYYY-MM-DD
+        start_str = request.args.get("start_date")
+        end_str = request.args.get("end_date")
+        start_date = date.fromisoformat(start_str) if start_str else None
+        end_date = date.fromisoformat(end_str) if end_str else None
+
         # 3. 핵심 로직 실행 (CaravanService 호출)
         caravans = caravan_service.search_caravans(guest=temp_guest,
-                                                   min_capacity=min_capacity)
+                                                   min_capacity=min_capacity,
+                                                   start_date=start_date,
+                                                   end_date=end_date)
 
         # 4. 성공 응답 반환 (JSON)
-        # (dataclass 리스트를 dict 리스트로 변환)
-        from dataclasses import asdict
-        response_data = [asdict(caravan) for caravan in caravans]
-
-        return jsonify(response_data), 200  # 200: 'OK'
+        # (모델 전용 인코더로 dict 변환 - Enum은 이름으로, stream=1이면 배열을 조각으로 나눠 전송)
+        if request.args.get("stream", type=int):
+            return app.response_class(iter_json_array(caravans, encode_caravan),
+                                      mimetype="application/json"), 200
+        return app.response_class(dumps_list(caravans, encode_caravan),
+                                  mimetype="application/json"), 200  # 200: 'OK'
 
     except (ValidationError, ValueError) as e:  # ValueError (int 변환 실패)
         # 5. 비즈니스 로직 에러 처리
@@ -0,0 +1,266 @@
+# asgi.py (app.py와 같은 위치)
+"""
+비동기 JSON API (ASGI) - 검색, 가용성, 견적, 예약 신청
+
+app.py(Flask, WSGI)는 요청 1개가 끝날 때까지 워커(스레드)를 붙잡지만, 이 앱은 이벤트 루프 하나가
+DB 호출을 기다리는 동안 다른 요청을 계속 처리합니다. 프레임워크 없이 ASGI 규격만 구현하므로
+어떤 ASGI 서버로도 실행할 수 있습니다.
+
+실행: uvicorn asgi:app --workers 2   (또는 hypercorn asgi:app)
+
+워커 프로세스가 여러 개여도 같은 데이터를 보도록 기본 앱은 SQL 리포지토리를 사용합니다.
+DB는 환경 변수 REPOSITORY_DATABASE_URL (기본값: 이 파일 옆의 caravan_repository.db, WAL 프로필 적용)
+
+GET  /caravans/search?capacity=3&user=guest[&start_date=2030-01-01&end_date=2030-01-03][&limit=20&cursor=...]
+GET  /caravans/availability?ids=a,b,c&start_date=2030-01-01&end_date=2030-01-03
+POST /quotes        {"caravan_id": "...", "start_date": "2030-01-01", "end_date": "2030-01-03"}
+POST /reservations  {"user": "guest", "caravan_id": "...", "start_date": "...", "end_date": "..."}
+"""
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from urllib.parse import parse_qs
+
+from src.logging_config import configure_logging
+from src.models.caravan import Caravan
+from src.models.reservation import Reservation
+from src.exceptions.custom_exceptions import ValidationError, ReservationConflictError
+from src.repositories.base import CaravanRepository, ReservationRepository, UserRepository
+from src.repositories.sql_repository import (SqlCaravanRepository, SqlReservationRepository, SqlUserRepository,
+                                             create_repository_engine)
+from src.repositories.sqlite_profile import SqliteProfile, is_memory_database
+from src.repositories.async_repository import (ExecutorCaravanRepository, ExecutorReservationRepository,
+                                               ExecutorUserRepository)
+from src.services.async_service import AsyncCaravanService, AsyncReservationService
+from src.services.factories import ReservationFactory
+from src.services.observers import NotificationService
+from src.services.pricing import PricingEngine
+from src.services.validators import ReservationValidator
+from src.serializers import encoder_for, dumps
+
+logger = logging.getLogger("src.asgi")
+
+MAX_BODY_BYTES = 64 * 1024
+MAX_IDS_PER_REQUEST = 100
+
+class HttpError(Exception):
+    def __init__(self, status: int, message: str):
+        self.status = status
+        self.message = message
+        super().__init__(message)
+
+def parse_date(value: str | None, name: str, required: bool = True) -> date | None:
+    if not value:
+        if required:
+            raise ValidationError(f"{name}는 필수입니다. (YYYY-MM-DD)")
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise ValidationError(f"{name}는 YYYY-MM-DD 형식이어야 합니다: {value}")
+
+caravan_to_dict = encoder_for(Caravan)
+reservation_to_dict = encoder_for(Reservation)
+
+class Request:
+    def __init__(self, scope: dict, body: bytes):
+        self.method = scope["method"]
+        self.path = scope["path"]
+        self.query = {key: values[-1] for key, values in parse_qs(scope.get("query_string", b"").decode()).items()}
+        self._body = body
+
+    def json(self) -> dict:
+        try:
+            data = json.loads(self._body or b"null")
+        except ValueError:
+            raise ValidationError("요청 본문이 올바른 JSON이 아닙니다.")
+        if not isinstance(data, dict):
+            raise ValidationError("요청 본문은 JSON 객체여야 합니다.")
+        return data
+
+class CaravanApi:
+    """ASGI 앱. 라우트 함수는 (상태 코드, JSON으로 보낼 값)을 반환합니다."""
+    def __init__(self, caravan_service: AsyncCaravanService, reservation_service: AsyncReservationService,
+                 on_shutdown=None):
+        self._caravans = caravan_service
+        self._reservations = reservation_service
+        self._on_shutdown = on_shutdown
+        self._routes = {
+            ("GET", "/"): self.health,
+            ("GET", "/caravans/search"): self.search,
+            ("GET", "/caravans/availability"): self.availability,
+            ("POST", "/quotes"): self.quote,
+            ("POST", "/reservations"): self.reserve,
+        }
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+        try:
+            body = await self._read_body(receive)
+            status, payload = await self._dispatch(Request(scope, body))
+        except HttpError as e:
+            status, payload = e.status, {"error": e.message}
+        await self._send_json(send, status, payload)
+
+    async def _dispatch(self, request: Request) -> tuple[int, object]:
+        handler = self._routes.get((request.method, request.path))
+        if handler is None:
+            if any(path == request.path for _, path in self._routes):
+                raise HttpError(405, "허용되지 않는 메서드입니다.")
+            raise HttpError(404, "없는 경로입니다.")
+        try:
+            return await handler(request)
+        except HttpError:
+            raise
+        except ValidationError as e:
+            return 400, {"error": e.message}
+        except ReservationConflictError as e:
+            return 409, {"error": e.message}
+        except ValueError as e: # 숫자 변환 실패 등
+            return 400, {"error": str(e)}
+        except Exception:
+            logger.exception("비동기 API 처리 중 오류: %s %s", request.method, request.path)
+            return 500, {"error": "서버 내부 오류"}
+
+    async def _read_body(self, receive) -> bytes:
+        chunks, size = [], 0
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                break
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > MAX_BODY_BYTES:
+                raise HttpError(413, "요청 본문이 너무 큽니다.")
+            chunks.append(chunk)
+            if not message.get("more_body", False):
+                break
+        return b"".join(chunks)
+
+    async def _send_json(self, send, status: int, payload):
+        body = dumps(payload)
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"application/json; charset=utf-8"),
+                        (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                if self._on_shutdown is not None:
+                    self._on_shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _user(self, username: str | None):
+        if not username:
+            raise ValidationError("user는 필수입니다.")
+        user = await self._caravans.get_user(username)
+        if user is None:
+            raise HttpError(404, f"없는 사용자입니다: {username}")
+        return user
+
+    async def _caravan(self, caravan_id: str | None):
+        if not caravan_id:
+            raise ValidationError("caravan_id는 필수입니다.")
+        caravan = await self._caravans.get_caravan(caravan_id)
+        if caravan is None:
+            raise HttpError(404, f"없는 카라반입니다: {caravan_id}")
+        return caravan
+
+    # --- 라우트 ---
+
+    async def health(self, request: Request):
+        return 200, {"status": "ok"}
+
+    async def search(self, request: Request):
+        """limit 또는 cursor가 있으면 페이지 단위(수용 인원 순), 없으면 app.py와 같은 전체 목록(기간 필터 가능)"""
+        guest = await self._user(request.query.get("user"))
+        if "capacity" not in request.query:
+            raise ValidationError("capacity 쿼리 파라미터는 필수입니다.")
+        min_capacity = int(request.query["capacity"])
+        if "limit" in request.query or "cursor" in request.query:
+            page = await self._caravans.search_caravans_page(
+                guest, min_capacity, int(request.query.get("limit", 20)), request.query.get("cursor"))
+            return 200, {"items": [caravan_to_dict(c) for c in page.items], "next_cursor": page.next_cursor}
+        caravans = await self._caravans.search_caravans(
+            guest, min_capacity,
+            parse_date(request.query.get("start_date"), "start_date", required=False),
+            parse_date(request.query.get("end_date"), "end_date", required=False))
+        return 200, [caravan_to_dict(c) for c in caravans]
+
+    async def availability(self, request: Request):
+        ids = [i for i in request.query.get("ids", "").split(",") if i]
+        if not 1 <= len(ids) <= MAX_IDS_PER_REQUEST:
+            raise ValidationError(f"ids는 1개 이상 {MAX_IDS_PER_REQUEST}개 이하로 요청해 주세요.")
+        available = await self._caravans.available_caravan_ids(
+            ids, parse_date(request.query.get("start_date"), "start_date"),
+            parse_date(request.query.get("end_date"), "end_date"))
+        return 200, {"available": available}
+
+    async def quote(self, request: Request):
+        data = request.json()
+        caravan = await self._caravan(data.get("caravan_id"))
+        quote = self._reservations.quote(caravan, parse_date(data.get("start_date"), "start_date"),
+                                         parse_date(data.get("end_date"), "end_date"))
+        return 200, {"caravan_id": caravan.caravan_id, "nights": quote.nights, "base_price": quote.base_price,
+                     "discount": quote.discount, "total_price": quote.total_price}
+
+    async def reserve(self, request: Request):
+        data = request.json()
+        guest = await self._user(data.get("user"))
+        caravan = await self._caravan(data.get("caravan_id"))
+        reservation = await self._reservations.create_reservation(
+            guest, caravan, parse_date(data.get("start_date"), "start_date"),
+            parse_date(data.get("end_date"), "end_date"))
+        return 201, reservation_to_dict(reservation)
+
+def create_app(caravan_repo: CaravanRepository, reservation_repo: ReservationRepository, user_repo: UserRepository,
+               pricing_engine: PricingEngine | None = None, notification_service: NotificationService | None = None,
+               db_threads: int = 32) -> CaravanApi:
+    """
+    동기 리포지토리를 스레드 풀(db_threads개) 어댑터로 감싸 비동기 서비스에 연결합니다.
+    db_threads는 동시에 진행되는 리포지토리 호출 수의 상한이며, 대기 중인 요청은 이벤트 루프에서 기다립니다.
+    """
+    executor = ThreadPoolExecutor(max_workers=db_threads, thread_name_prefix="asgi-db")
+    async_reservations = ExecutorReservationRepository(reservation_repo, executor)
+    caravan_service = AsyncCaravanService(ExecutorCaravanRepository(caravan_repo, executor), async_reservations,
+                                          ExecutorUserRepository(user_repo, executor))
+    reservation_service = AsyncReservationService(
+        validator=ReservationValidator(reservation_repo),
+        repository=async_reservations,
+        factory=ReservationFactory(),
+        pricing_engine=pricing_engine or PricingEngine(),
+        notification_service=notification_service or NotificationService(),
+    )
+    return CaravanApi(caravan_service, reservation_service, on_shutdown=lambda: executor.shutdown(wait=False))
+
+def create_default_app() -> CaravanApi:
+    """
+    REPOSITORY_DATABASE_URL의 DB를 쓰는 SQL 리포지토리로 앱을 만듭니다.
+    워커(프로세스)마다 엔진을 따로 만들지만 DB는 하나이므로, 한 워커에서 한 예약을 다른 워커도 봅니다.
+    """
+    url = os.environ.get("REPOSITORY_DATABASE_URL",
+                         "sqlite:///" + os.path.join(os.path.dirname(os.path.abspath(__file__)), "caravan_repository.db"))
+    db_threads = int(os.environ.get("ASGI_DB_THREADS", 32))
+    # 스레드 풀의 스레드마다 커넥션 1개 (메모리 DB는 커넥션 1개를 공유하므로 제외)
+    engine_kwargs = {} if is_memory_database(url) else {"pool_size": db_threads, "max_overflow": 0}
+    engine = create_repository_engine(url, sqlite_profile=SqliteProfile.from_env(), **engine_kwargs)
+    return create_app(SqlCaravanRepository(engine), SqlReservationRepository(engine), SqlUserRepository(engine),
+                      db_threads=db_threads)
+
+# === 기본 앱 (워커 간에 공유되는 SQL 리포지토리) ===
+configure_logging(os.environ.get("LOG_LEVEL", "INFO"))
+app = create_default_app()
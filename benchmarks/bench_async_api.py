@@ -0,0 +1,153 @@
+# benchmarks/bench_async_api.py
+"""
+느린 DB 호출이 섞인 검색 요청의 처리량/지연: 동기 워커(gunicorn sync) vs 비동기 API(asgi.py)
+
+- 같은 기간 검색(GET /caravans/search?capacity=&user=&start_date=&end_date=)을 동시 클라이언트 C개가 반복합니다.
+- 리포지토리의 가용성 조회에 latency초의 대기(원격 DB 왕복을 흉내)를 넣습니다.
+- sync: gunicorn sync 워커 W개처럼 요청을 동시에 W개까지만 처리 (나머지는 대기열에서 기다림)
+- async: 이벤트 루프 1개 + 리포지토리 스레드 풀 db_threads개
+네트워크 서버(gunicorn/uvicorn) 없이 앱을 직접 호출하므로 소켓/HTTP 파싱 비용은 빠져 있습니다.
+
+실행: python -m benchmarks.bench_async_api [동시 클라이언트 수] [동기 워커 수] [DB 지연 ms]
+"""
+import asyncio
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from urllib.parse import urlencode
+
+from src.models.caravan import Caravan
+from src.models.common import UserRole
+from src.models.user import User
+
+CARAVANS = 300
+REQUESTS_PER_CLIENT = 20
+
+
+def slow(method, latency: float):
+    def wrapper(*args):
+        time.sleep(latency)
+        return method(*args)
+    return wrapper
+
+
+def seed(caravan_repo, user_repo):
+    caravan_repo.add_all([Caravan(host_id="h", name=f"C{i}", capacity=1 + i % 8, caravan_id=f"c{i}")
+                          for i in range(CARAVANS)])
+    user_repo.add(User(username="bench", role=UserRole.GUEST))
+
+
+def query(i: int) -> dict:
+    start = date(2030, 1, 1) + timedelta(days=i % 60)
+    return {"capacity": 4, "user": "bench", "start_date": start.isoformat(),
+            "end_date": (start + timedelta(days=2)).isoformat()}
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+def run_sync(clients: int, workers: int, latency: float) -> tuple[float, list[float]]:
+    """
+    sync 워커 1개 = 요청 1개를 끝까지 처리하는 스레드. 동시에 W개까지만 처리하고 나머지 클라이언트는 기다립니다.
+    (app.py의 검색 라우트는 asdict 응답이 CaravanStatus를 직렬화하지 못하므로, 같은 서비스 호출 + 같은 JSON 변환을 직접 실행)
+    """
+    from asgi import caravan_to_dict
+    from src.repositories.concurrent_repository import (ThreadSafeUserRepository, ThreadSafeCaravanRepository,
+                                                        ThreadSafeReservationRepository)
+    from src.services.caravan_service import CaravanService
+    caravans, reservations, users = (ThreadSafeCaravanRepository(), ThreadSafeReservationRepository(),
+                                     ThreadSafeUserRepository())
+    seed(caravans, users)
+    reservations.find_available_caravan_ids = slow(reservations.find_available_caravan_ids, latency)
+    service = CaravanService(caravan_repo=caravans, reservation_repo=reservations)
+    pool = ThreadPoolExecutor(max_workers=workers) # 대기 요청은 FIFO 큐에서 기다림 (gunicorn backlog)
+    latencies: list[float] = []
+    lock = threading.Lock()
+
+    def handle(params: dict) -> bytes:
+        guest = users.get_by_username(params["user"])
+        found = service.search_caravans(guest=guest, min_capacity=int(params["capacity"]),
+                                        start_date=date.fromisoformat(params["start_date"]),
+                                        end_date=date.fromisoformat(params["end_date"]))
+        return json.dumps([caravan_to_dict(c) for c in found], ensure_ascii=False).encode()
+
+    def client(n: int):
+        for i in range(REQUESTS_PER_CLIENT):
+            started = time.perf_counter()
+            pool.submit(handle, query(n + i)).result()
+            with lock:
+                latencies.append(time.perf_counter() - started)
+
+    threads = [threading.Thread(target=client, args=(n,)) for n in range(clients)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    pool.shutdown()
+    return elapsed, latencies
+
+
+def run_async(clients: int, latency: float, db_threads: int) -> tuple[float, list[float]]:
+    from asgi import create_app
+    from src.repositories.concurrent_repository import (ThreadSafeUserRepository, ThreadSafeCaravanRepository,
+                                                        ThreadSafeReservationRepository)
+    caravans, reservations, users = (ThreadSafeCaravanRepository(), ThreadSafeReservationRepository(),
+                                     ThreadSafeUserRepository())
+    seed(caravans, users)
+    reservations.find_available_caravan_ids = slow(reservations.find_available_caravan_ids, latency)
+    app = create_app(caravans, reservations, users, db_threads=db_threads)
+    latencies: list[float] = []
+
+    async def request(path_query: str):
+        path, _, query_string = path_query.partition("?")
+        scope = {"type": "http", "method": "GET", "path": path, "query_string": query_string.encode()}
+        sent = []
+
+        async def receive():
+            return {"type": "http.request", "body": b""}
+
+        async def send(message):
+            sent.append(message)
+
+        await app(scope, receive, send)
+        return sent[0]["status"]
+
+    async def client(n: int):
+        for i in range(REQUESTS_PER_CLIENT):
+            started = time.perf_counter()
+            assert await request("/caravans/search?" + urlencode(query(n + i))) == 200
+            latencies.append(time.perf_counter() - started)
+
+    async def main():
+        await asyncio.gather(*(client(n) for n in range(clients)))
+
+    started = time.perf_counter()
+    asyncio.run(main())
+    return time.perf_counter() - started, latencies
+
+
+def main():
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    latency = (float(sys.argv[3]) if len(sys.argv) > 3 else 20) / 1000
+    db_threads = 32
+    total = clients * REQUESTS_PER_CLIENT
+    print(f"동시 클라이언트 {clients}개 x {REQUESTS_PER_CLIENT}회, DB 지연 {latency * 1000:.0f}ms, 카라반 {CARAVANS}대\n")
+    print(f"{'방식':<28} | {'req/s':>7} | {'p50':>8} | {'p99':>8}")
+    for name, (elapsed, latencies) in [
+        (f"sync (워커 {workers}개)", run_sync(clients, workers, latency)),
+        (f"async (루프 1개, DB 스레드 {db_threads}개)", run_async(clients, latency, db_threads)),
+    ]:
+        print(f"{name:<28} | {total / elapsed:>7.0f} | {percentile(latencies, 0.5) * 1000:>6.0f}ms | "
+              f"{percentile(latencies, 0.99) * 1000:>6.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
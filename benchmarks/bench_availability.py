@@ -0,0 +1,90 @@
+# benchmarks/bench_availability.py
+"""
+예약 가능 여부 조회 벤치마크: 날짜별 dict 방식 vs 구간 인덱스(IntervalIndex)
+
+실행: python -m benchmarks.bench_availability
+"""
+import random
+import timeit
+from datetime import date, timedelta
+
+from src.repositories.interval_index import IntervalIndex
+
+BASE = date(2030, 1, 1)
+STAY_DAYS = (2, 7, 30, 90)
+PROBES = 10_000
+PER_CARAVAN = 1_000  # 카라반 한 대당 예약 수 (date 범위를 넘지 않도록 분산)
+
+def build_reservations(count: int, seed: int = 42) -> dict[str, list[tuple[date, date, str]]]:
+    """카라반별로 겹치지 않는 예약을 총 count개 만듭니다."""
+    rng = random.Random(seed)
+    by_caravan: dict[str, list[tuple[date, date, str]]] = {}
+    for c in range(max(1, count // PER_CARAVAN)):
+        reservations = []
+        cursor = BASE
+        for i in range(min(count, PER_CARAVAN)):
+            days = rng.choice(STAY_DAYS)
+            start_date = cursor + timedelta(days=rng.randint(0, 3))
+            end_date = start_date + timedelta(days=days - 1)
+            reservations.append((start_date, end_date, f"c{c}-r{i}"))
+            cursor = end_date + timedelta(days=1)
+        by_caravan[f"c{c}"] = reservations
+    return by_caravan
+
+def build_day_map(by_caravan) -> dict[str, dict[date, str]]:
+    """기존 방식: 예약된 날짜마다 dict 항목 1개"""
+    result = {}
+    for caravan_id, reservations in by_caravan.items():
+        bookings: dict[date, str] = {}
+        for start_date, end_date, reservation_id in reservations:
+            current_date = start_date
+            while current_date <= end_date:
+                bookings[current_date] = reservation_id
+                current_date += timedelta(days=1)
+        result[caravan_id] = bookings
+    return result
+
+def day_map_available(bookings, start_date: date, end_date: date) -> bool:
+    current_date = start_date
+    while current_date <= end_date:
+        if current_date in bookings:
+            return False
+        current_date += timedelta(days=1)
+    return True
+
+def build_interval_index(by_caravan) -> dict[str, IntervalIndex]:
+    result = {}
+    for caravan_id, reservations in by_caravan.items():
+        index = IntervalIndex()
+        for start_date, end_date, reservation_id in reservations:
+            index.add(start_date, end_date, reservation_id)
+        result[caravan_id] = index
+    return result
+
+def main():
+    rng = random.Random(7)
+    print(f"{'예약 수':>8} | {'방식':<8} | {'적재(ms)':>9} | {'항목 수':>9} | {'조회(us/건)':>11}")
+    for count in (1_000, 10_000, 100_000):
+        by_caravan = build_reservations(count)
+        caravan_ids = list(by_caravan)
+        horizon = min((r[-1][1] - BASE).days for r in by_caravan.values())
+        probes = []
+        for _ in range(PROBES):
+            start_date = BASE + timedelta(days=rng.randint(0, horizon))
+            end_date = start_date + timedelta(days=rng.choice(STAY_DAYS) - 1)
+            probes.append((rng.choice(caravan_ids), start_date, end_date))
+
+        load = timeit.timeit(lambda: build_day_map(by_caravan), number=1)
+        day_map = build_day_map(by_caravan)
+        entries = sum(len(b) for b in day_map.values())
+        probe = timeit.timeit(lambda: [day_map_available(day_map[c], s, e) for c, s, e in probes], number=1)
+        print(f"{count:>8} | {'day-map':<8} | {load * 1e3:>9.1f} | {entries:>9} | {probe / PROBES * 1e6:>11.2f}")
+
+        load = timeit.timeit(lambda: build_interval_index(by_caravan), number=1)
+        index = build_interval_index(by_caravan)
+        entries = sum(len(i) for i in index.values())
+        probe = timeit.timeit(lambda: [index[c].overlaps(s, e) for c, s, e in probes], number=1)
+        print(f"{count:>8} | {'interval':<8} | {load * 1e3:>9.1f} | {entries:>9} | {probe / PROBES * 1e6:>11.2f}")
+
+if __name__ == "__main__":
+    main()
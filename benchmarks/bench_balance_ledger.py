@@ -0,0 +1,73 @@
+# benchmarks/bench_balance_ledger.py
+"""
+잔액 조회 벤치마크: 잔액 스냅샷(user.balance_minor) vs 원장 합계(SUM) (SQLite 파일 DB)
+
+- 원장 길이를 늘려 가며(충전 내역 n건) 한 사용자의 잔액을 읽는 시간을 비교합니다.
+- 스냅샷은 기본 키로 컬럼 하나를 읽으므로 원장 길이와 관계없이 일정해야 합니다.
+- 충전(post_balance_entry + 커밋) 1건 시간도 함께 표시합니다.
+
+실행: python -m benchmarks.bench_balance_ledger [최대 원장 길이]
+"""
+import os
+import sys
+import tempfile
+import time
+import timeit
+
+# main.py를 import 하기 전에 임시 DB 파일을 지정해야 합니다.
+DB_PATH = os.path.join(tempfile.mkdtemp(), 'bench_ledger.db')
+os.environ['DATABASE_URL'] = 'sqlite:///' + DB_PATH
+
+from main import app, db, User, BalanceLedger, post_balance_entry  # noqa: E402
+
+REPEAT = 200
+
+
+def grow_ledger(user_id: int, target: int, current: int):
+    """원장을 target건까지 채웁니다. (벤치마크 준비용 대량 INSERT + 스냅샷 맞춤)"""
+    rows = [{'user_id': user_id, 'amount_minor': 1000, 'balance_after_minor': 1000 * (i + 1),
+             'entry_type': 'deposit'} for i in range(current, target)]
+    db.session.execute(db.insert(BalanceLedger), rows)
+    db.session.execute(db.update(User).where(User.id == user_id).values(balance_minor=1000 * target))
+    db.session.commit()
+
+
+def per_call_us(func) -> float:
+    return min(timeit.repeat(func, number=REPEAT, repeat=3)) / REPEAT * 1e6
+
+
+def main():
+    largest = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    sizes = [n for n in (1_000, 10_000, 100_000, 1_000_000) if n <= largest] or [largest]
+    with app.app_context():
+        db.create_all()
+        guest = User(email='bench@guest.com', name='Guest', password_hash='x')
+        other = User(email='other@guest.com', name='Other', password_hash='x')
+        db.session.add_all([guest, other])
+        db.session.commit()
+
+        def snapshot():
+            return db.session.scalar(db.select(User.balance_minor).where(User.id == guest.id))
+
+        def ledger_sum():
+            return db.session.scalar(db.select(db.func.sum(BalanceLedger.amount_minor)).where(
+                BalanceLedger.user_id == guest.id))
+
+        print(f"{'원장 길이':>10} | {'스냅샷 조회':>10} | {'원장 SUM':>10}")
+        current = 0
+        for size in sizes:
+            grow_ledger(guest.id, size, current)
+            current = size
+            assert snapshot() == ledger_sum() == 1000 * size
+            print(f"{size:>10} | {per_call_us(snapshot):>8.0f}us | {per_call_us(ledger_sum):>8.0f}us")
+
+        started = time.perf_counter()
+        for _ in range(REPEAT):
+            post_balance_entry(other.id, 1000, 'deposit')
+            db.session.commit()
+        print(f"\n충전 1건 (원장 INSERT + 스냅샷 UPDATE + 커밋): "
+              f"{(time.perf_counter() - started) / REPEAT * 1e6:.0f}us")
+
+
+if __name__ == "__main__":
+    main()
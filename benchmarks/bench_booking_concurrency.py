@@ -0,0 +1,135 @@
+# benchmarks/bench_booking_concurrency.py
+"""
+예약 신청/승인 동시성 벤치마크: 잠금 없는 확인-후-쓰기 vs caravan_booking_lock (SQLite 파일 DB)
+
+여러 프로세스가 소수의 카라반에 겹치는 기간을 신청 + 즉시 승인합니다.
+- unsafe: 기존 라우트와 같은 방식 (겹침 확인 SELECT 후 별도로 INSERT/UPDATE)
+- safe: create_pending_reservation / confirm_reservation
+
+실행: python -m benchmarks.bench_booking_concurrency [프로세스 수] [프로세스당 시도 수]
+"""
+import multiprocessing
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+CARAVANS = 5
+
+
+def prepare(db_path: str, workers: int):
+    from sqlalchemy import create_engine
+    from main import db, User, Caravan, UserRole
+    engine = create_engine('sqlite:///' + db_path)
+    db.metadata.create_all(engine)
+    with engine.begin() as conn:
+        for i in range(1 + workers):
+            conn.execute(User.__table__.insert().values(
+                email=f'u{i}@bench.com', name=f'U{i}', password_hash='x',
+                user_role=UserRole.HOST if i == 0 else UserRole.GUEST))
+        for i in range(CARAVANS):
+            conn.execute(Caravan.__table__.insert().values(
+                host_id=1, name=f'C{i}', location='서울', daily_rate=50000, capacity=4))
+    engine.dispose()
+
+
+def confirmed_overlap(main, caravan_id, start, end, exclude_id=None):
+    """기존 라우트의 겹침 확인 (예약 테이블 조회, 달력 비트맵 도입 전 방식)"""
+    Reservation = main.Reservation
+    query = Reservation.query.filter(
+        Reservation.caravan_id == caravan_id,
+        Reservation.status == main.ReservationStatus.CONFIRMED,
+        Reservation.start_date < end,
+        Reservation.end_date > start)
+    if exclude_id is not None:
+        query = query.filter(Reservation.id != exclude_id)
+    return main.db.session.query(query.exists()).scalar()
+
+
+def unsafe_book(main, caravan_id, guest_id, start, end):
+    """잠금 없이 확인 후 쓰기 (경쟁 조건 존재)"""
+    db, Reservation, Status = main.db, main.Reservation, main.ReservationStatus
+    if confirmed_overlap(main, caravan_id, start, end):
+        return False
+    reservation = Reservation(caravan_id=caravan_id, guest_id=guest_id, start_date=start,
+                              end_date=end, total_price=100000, status=Status.PENDING)
+    db.session.add(reservation)
+    db.session.commit()
+    if confirmed_overlap(main, caravan_id, start, end, exclude_id=reservation.id):
+        return False
+    time.sleep(0)  # 다른 프로세스에 실행 기회를 줌
+    reservation.status = Status.CONFIRMED
+    db.session.commit()
+    return True
+
+
+def safe_book(main, caravan_id, guest_id, start, end):
+    try:
+        reservation = main.create_pending_reservation(caravan_id, guest_id, start, end, 100000)
+        main.confirm_reservation(reservation.id)
+        return True
+    except main.BookingConflictError:
+        return False
+
+
+def worker(mode: str, seed: int, rounds: int, barrier, result_queue):
+    import main
+    book = safe_book if mode == 'safe' else unsafe_book
+    rng = random.Random(seed)
+    successes = 0
+    with main.app.app_context():
+        barrier.wait()
+        for _ in range(rounds):
+            start = date(2030, 1, 1) + timedelta(days=rng.randint(0, 60))
+            end = start + timedelta(days=rng.randint(1, 5))
+            if book(main, rng.randint(1, CARAVANS), seed + 2, start, end):
+                successes += 1
+    result_queue.put(successes)
+
+
+def count_double_bookings(db_path: str) -> int:
+    conn = sqlite3.connect(db_path)
+    overlapping = conn.execute(
+        "SELECT COUNT(*) FROM reservation a JOIN reservation b "
+        "ON a.caravan_id = b.caravan_id AND a.id < b.id "
+        "AND a.start_date < b.end_date AND a.end_date > b.start_date "
+        "WHERE a.status = 'CONFIRMED' AND b.status = 'CONFIRMED'").fetchone()[0]
+    conn.close()
+    return overlapping
+
+
+def run(mode: str, workers: int, rounds: int):
+    db_path = os.path.join(tempfile.mkdtemp(), f'bench_booking_{mode}.db')
+    prepare(db_path, workers)
+    os.environ['DATABASE_URL'] = 'sqlite:///' + db_path  # spawn된 자식 프로세스가 물려받음
+    ctx = multiprocessing.get_context('spawn')
+    barrier = ctx.Barrier(workers + 1)
+    result_queue = ctx.Queue()
+    procs = [ctx.Process(target=worker, args=(mode, seed, rounds, barrier, result_queue))
+             for seed in range(workers)]
+    for proc in procs:
+        proc.start()
+    barrier.wait()  # 모든 자식의 import가 끝난 뒤 시간 측정 시작
+    started = time.perf_counter()
+    confirmed = sum(result_queue.get() for _ in procs)
+    elapsed = time.perf_counter() - started
+    for proc in procs:
+        proc.join()
+    return elapsed, confirmed, count_double_bookings(db_path)
+
+
+def main():
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    print(f"프로세스 {workers}개 x 시도 {rounds}회, 카라반 {CARAVANS}대\n")
+    print(f"{'방식':<8} | {'시도/s':>8} | {'확정':>6} | {'겹치는 확정 쌍':>12}")
+    for mode in ('unsafe', 'safe'):
+        elapsed, confirmed, doubles = run(mode, workers, rounds)
+        print(f"{mode:<8} | {workers * rounds / elapsed:>8.0f} | {confirmed:>6} | {doubles:>12}")
+
+
+if __name__ == '__main__':
+    main()
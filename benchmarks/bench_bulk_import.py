@@ -0,0 +1,64 @@
+# benchmarks/bench_bulk_import.py
+"""
+카라반 적재 벤치마크: 건별 add(기존 register_caravan 방식) vs BulkImportService (CSV 스트리밍 + 묶음 저장)
+
+실행: python -m benchmarks.bench_bulk_import [카라반 수]
+"""
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+
+from src.models.caravan import Caravan
+from src.repositories.memory_repository import InMemoryCaravanRepository, InMemoryReservationRepository
+from src.repositories.sql_repository import SqlCaravanRepository, SqlReservationRepository, create_repository_engine
+from src.services.bulk_service import BulkImportService, CARAVAN_FIELDS, read_rows, write_rows
+
+
+def make_csv(count: int) -> str:
+    rng = random.Random(3)
+    out = io.StringIO()
+    write_rows(out, ({"caravan_id": f"{i:08d}", "host_id": "Host", "name": f"C{i}", "capacity": rng.randint(1, 8),
+                      "daily_rate": rng.randrange(40000, 150000, 5000), "status": "AVAILABLE", "amenities": ""}
+                     for i in range(count)), "csv", CARAVAN_FIELDS)
+    return out.getvalue()
+
+
+def per_row(repo, text: str) -> float:
+    started = time.perf_counter()
+    for row in read_rows(io.StringIO(text), "csv"):
+        repo.add(Caravan(host_id=row["host_id"], name=row["name"], capacity=int(row["capacity"]),
+                         caravan_id=row["caravan_id"], daily_rate=int(row["daily_rate"])))
+    return time.perf_counter() - started
+
+
+def bulk(caravan_repo, reservation_repo, text: str) -> float:
+    started = time.perf_counter()
+    BulkImportService(caravan_repo, reservation_repo).import_caravans(read_rows(io.StringIO(text), "csv"))
+    return time.perf_counter() - started
+
+
+def sql_repos():
+    engine = create_repository_engine("sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench_bulk.db"))
+    return SqlCaravanRepository(engine), SqlReservationRepository(engine)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    text = make_csv(count)
+    # 파일 DB에 건별 트랜잭션은 매우 느리므로 SQL 건별 적재는 1/10만 측정해 환산합니다.
+    sql_sample = max(1, count // 10)
+    sample_text = make_csv(sql_sample)
+    print(f"카라반 {count}건 CSV 적재\n")
+    print(f"{'저장소':<10} | {'건별 add(s)':>12} | {'대량 적재(s)':>12}")
+    print(f"{'InMemory':<10} | {per_row(InMemoryCaravanRepository(), text):>12.2f} | "
+          f"{bulk(InMemoryCaravanRepository(), InMemoryReservationRepository(), text):>12.2f}")
+    per_row_sql = per_row(sql_repos()[0], sample_text) * count / sql_sample
+    print(f"{'SQL':<10} | {per_row_sql:>11.2f}* | {bulk(*sql_repos(), text):>12.2f}")
+    print(f"\n* {sql_sample}건 측정값을 {count}건으로 환산")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# benchmarks/bench_capacity_index.py
+"""
+카라반 범위 검색 벤치마크: 전체 순회(기존 방식) vs (capacity, caravan_id) 정렬 인덱스
+
+실행: python -m benchmarks.bench_capacity_index
+"""
+import random
+import timeit
+
+from src.models.caravan import Caravan
+from src.models.common import CaravanStatus
+from src.repositories.memory_repository import InMemoryCaravanRepository
+
+REPEAT = 5
+CASES = {
+    # 이름: (min_capacity, max_capacity, min_rate, max_rate, available_only)
+    "인원>=10": (10, None, None, None, False),
+    "인원 6~7 + 요금 + 상태": (6, 7, 60000, 90000, True),
+    "인원>=2": (2, None, None, None, False),
+}
+
+
+def make_caravans(count: int) -> list[Caravan]:
+    rng = random.Random(1)
+    statuses = [CaravanStatus.AVAILABLE] * 8 + [CaravanStatus.RESERVED, CaravanStatus.MAINTENANCE]
+    return [
+        Caravan(host_id="Host", name=f"C{i}", capacity=min(10, int(rng.expovariate(0.35)) + 1),
+                caravan_id=f"{i:08d}", daily_rate=rng.randrange(40000, 150000, 5000),
+                status=rng.choice(statuses))
+        for i in range(count)
+    ]
+
+
+def linear_scan(caravans, min_capacity, max_capacity, min_rate, max_rate, available_only):
+    """기존 방식: 모든 카라반을 순회하며 조건 검사"""
+    return [
+        c for c in caravans.values()
+        if c.capacity >= min_capacity
+        and (max_capacity is None or c.capacity <= max_capacity)
+        and (min_rate is None or c.daily_rate >= min_rate)
+        and (max_rate is None or c.daily_rate <= max_rate)
+        and (not available_only or c.status == CaravanStatus.AVAILABLE)
+    ]
+
+
+def main():
+    print(f"{'카라반 수':>9} | {'조건':<22} | {'결과 수':>8} | {'전체 순회(ms)':>13} | {'인덱스(ms)':>10}")
+    for count in (10_000, 100_000, 1_000_000):
+        repo = InMemoryCaravanRepository()
+        repo.add_all(make_caravans(count))
+        for name, args in CASES.items():
+            scan = timeit.timeit(lambda: linear_scan(repo._caravans, *args), number=REPEAT) / REPEAT
+            indexed = timeit.timeit(lambda: repo.search_by_range(*args), number=REPEAT) / REPEAT
+            found = len(repo.search_by_range(*args))
+            assert found == len(linear_scan(repo._caravans, *args))
+            print(f"{count:>9} | {name:<22} | {found:>8} | {scan * 1e3:>13.2f} | {indexed * 1e3:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
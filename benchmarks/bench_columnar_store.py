@@ -0,0 +1,96 @@
+# benchmarks/bench_columnar_store.py
+"""
+예약 분석 집계 벤치마크: 예약 객체를 하나씩 도는 집계(기존) vs ColumnarReservationStore
+
+- 카라반별 매출, 호스트별 매출, 호스트x월 매출, 한 달 가동률, 평균 숙박일
+- 열 저장소는 스냅샷을 한 번 만든 뒤 여러 보고서를 뽑는 용도이므로, 스냅샷 생성 시간은 따로 표시합니다.
+
+실행: python -m benchmarks.bench_columnar_store [예약 수]
+"""
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+from src.models.common import ReservationStatus
+from src.models.reservation import Reservation
+from src.repositories.columnar_store import ColumnarReservationStore, BOOKED_STATUSES
+from src.repositories.memory_repository import InMemoryReservationRepository
+
+
+def timed(func, repeat: int = 3) -> tuple[float, object]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def row_reports(repo: InMemoryReservationRepository, hosts: dict[str, str], period: tuple[date, date]):
+    """기존 방식: 보고서마다 예약 객체를 처음부터 끝까지 순회"""
+    by_caravan, by_host, by_host_month = {}, {}, {}
+    booked_nights, stays, nights = 0, 0, 0
+    for r in repo.iter_all():
+        if r.status not in BOOKED_STATUSES:
+            continue
+        by_caravan[r.caravan_id] = by_caravan.get(r.caravan_id, 0) + r.total_price
+        host_id = hosts[r.caravan_id]
+        by_host[host_id] = by_host.get(host_id, 0) + r.total_price
+        key = (host_id, r.start_date.year, r.start_date.month)
+        by_host_month[key] = by_host_month.get(key, 0) + r.total_price
+        booked_nights += max(0, (min(r.end_date, period[1]) - max(r.start_date, period[0])).days + 1)
+        stays += 1
+        nights += (r.end_date - r.start_date).days + 1
+    return by_caravan, by_host, by_host_month, booked_nights, nights / stays
+
+
+def columnar_reports(store: ColumnarReservationStore, hosts: dict[str, str], period: tuple[date, date]):
+    return (store.revenue_by_caravan(), store.revenue_by_host(hosts), store.revenue_by_month(hosts),
+            store.occupancy_rate(*period), store.average_stay_nights())
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    rng = random.Random(19)
+    caravans = [f"caravan-{i}" for i in range(max(1, count // 100))]
+    hosts = {caravan_id: f"host-{i % 500}" for i, caravan_id in enumerate(caravans)}
+    statuses = [ReservationStatus.CONFIRMED] * 6 + [ReservationStatus.COMPLETED] * 2 + \
+        [ReservationStatus.PENDING, ReservationStatus.CANCELLED]
+    repo = InMemoryReservationRepository()
+    reservations = []
+    next_free = dict.fromkeys(caravans, date(2030, 1, 1)) # 같은 카라반의 예약은 겹치지 않게 차례로 배치
+    for _ in range(count):
+        caravan_id = rng.choice(caravans)
+        start = next_free[caravan_id] + timedelta(days=rng.randrange(8))
+        end = start + timedelta(days=rng.randrange(14))
+        next_free[caravan_id] = end + timedelta(days=1)
+        reservations.append(Reservation(guest_id=f"guest-{rng.randrange(count // 10 or 1)}",
+                                        caravan_id=caravan_id, start_date=start, end_date=end,
+                                        total_price=rng.randrange(50_000, 2_000_000, 1_000),
+                                        status=rng.choice(statuses)))
+    repo.add_all(reservations)
+    period = (date(2030, 7, 1), date(2030, 7, 31))
+
+    build_time, store = timed(lambda: ColumnarReservationStore.from_repository(repo), repeat=1)
+    print(f"예약 {count}건, 카라반 {len(caravans)}대, 호스트 500명")
+    print(f"열 저장소 스냅샷 생성: {build_time * 1000:.0f}ms (1회)\n")
+
+    print(f"{'보고서':<22} | {'객체 순회':>10} | {'열 저장소':>10}")
+    row_total, _ = timed(lambda: row_reports(repo, hosts, period))
+    for name, func in [
+        ("카라반별 매출", lambda: store.revenue_by_caravan()),
+        ("호스트별 매출", lambda: store.revenue_by_host(hosts)),
+        ("호스트x월 매출", lambda: store.revenue_by_month(hosts)),
+        ("7월 가동률", lambda: store.occupancy_rate(*period)),
+        ("평균 숙박일", lambda: store.average_stay_nights()),
+    ]:
+        elapsed, _ = timed(func)
+        print(f"{name:<22} | {'':>10} | {elapsed * 1000:>8.1f}ms")
+    column_total, _ = timed(lambda: columnar_reports(store, hosts, period))
+    print(f"{'보고서 5종 합계':<22} | {row_total * 1000:>8.1f}ms | {column_total * 1000:>8.1f}ms"
+          f"  ({row_total / column_total:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# benchmarks/bench_concurrent_repository.py
+"""
+예약 리포지토리 스레드 스트레스 벤치마크
+
+- InMemory: 잠금 없음 (검증 후 저장 사이에 다른 스레드가 끼어들 수 있음)
+- 전역 잠금: 모든 예약이 잠금 하나를 공유
+- 카라반별 잠금: ThreadSafeReservationRepository
+
+각 스레드가 무작위 카라반/날짜로 "가능 여부 확인 -> 저장"을 반복하고,
+끝난 뒤 겹치는 예약 쌍과 인덱스/저장소 불일치를 검사합니다.
+카라반별 잠금의 이점이 드러나도록 저장 직전에 짧은 I/O 대기(결제 확인 등)를 흉내냅니다.
+
+실행: python -m benchmarks.bench_concurrent_repository [스레드 수] [스레드당 시도 수]
+"""
+import random
+import sys
+import threading
+import time
+from datetime import date, timedelta
+
+from src.models.reservation import Reservation
+from src.repositories.memory_repository import InMemoryReservationRepository
+from src.repositories.concurrent_repository import ThreadSafeReservationRepository
+from src.exceptions.custom_exceptions import ReservationConflictError
+
+CARAVANS = 50
+IO_DELAY = 0.0002  # 확인과 저장 사이의 작업 시간(초)
+
+
+class UnsafeRepository(InMemoryReservationRepository):
+    """기존 서비스 흐름: is_caravan_available 확인 후 별도로 add"""
+    def reserve_if_available(self, reservation):
+        if not self.is_caravan_available(reservation.caravan_id, reservation.start_date, reservation.end_date):
+            return False
+        time.sleep(IO_DELAY)
+        try:
+            self.add(reservation)
+        except ReservationConflictError:
+            return False
+        return True
+
+
+class GlobalLockRepository(InMemoryReservationRepository):
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+
+    def reserve_if_available(self, reservation):
+        with self._lock:
+            if not self.is_caravan_available(reservation.caravan_id, reservation.start_date, reservation.end_date):
+                return False
+            time.sleep(IO_DELAY)
+            self.add(reservation)
+            return True
+
+
+class StripedRepository(ThreadSafeReservationRepository):
+    def reserve_if_available(self, reservation):
+        with self._lock_for(reservation.caravan_id):
+            bookings = self._bookings_by_caravan.get(reservation.caravan_id)
+            if bookings is not None and bookings.overlaps(reservation.start_date, reservation.end_date):
+                return False
+            time.sleep(IO_DELAY)
+        return super().reserve_if_available(reservation)
+
+
+def count_problems(repo) -> int:
+    """같은 카라반에서 겹치는 예약 쌍 + 인덱스에 없는 저장 예약 수"""
+    problems = 0
+    by_caravan: dict[str, list[Reservation]] = {}
+    for reservation in repo._reservations.values():
+        by_caravan.setdefault(reservation.caravan_id, []).append(reservation)
+    for caravan_id, reservations in by_caravan.items():
+        reservations.sort(key=lambda r: r.start_date)
+        for prev, cur in zip(reservations, reservations[1:]):
+            if cur.start_date <= prev.end_date:
+                problems += 1
+        problems += len(reservations) - len(repo._bookings_by_caravan[caravan_id])
+    return problems
+
+
+def run(repo, threads: int, rounds: int) -> tuple[float, int, int]:
+    barrier = threading.Barrier(threads + 1)
+    successes = [0] * threads
+
+    def worker(i):
+        rng = random.Random(i)
+        barrier.wait()
+        for _ in range(rounds):
+            start = date(2030, 1, 1) + timedelta(days=rng.randint(0, 120))
+            reservation = Reservation(guest_id=f"G{i}", caravan_id=f"c{rng.randrange(CARAVANS)}",
+                                      start_date=start, end_date=start + timedelta(days=rng.randint(0, 4)),
+                                      total_price=100000)
+            if repo.reserve_if_available(reservation):
+                successes[i] += 1
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for w in workers:
+        w.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for w in workers:
+        w.join()
+    elapsed = time.perf_counter() - started
+    return threads * rounds / elapsed, sum(successes), count_problems(repo)
+
+
+def main():
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    print(f"스레드 {threads}개 x 시도 {rounds}회, 카라반 {CARAVANS}대, 확인-저장 사이 대기 {IO_DELAY * 1000:.1f}ms\n")
+    print(f"{'방식':<12} | {'시도/s':>8} | {'저장':>6} | {'겹침/불일치':>10}")
+    for name, repo in [("InMemory", UnsafeRepository()),
+                       ("전역 잠금", GlobalLockRepository()),
+                       ("카라반별 잠금", StripedRepository())]:
+        rate, stored, problems = run(repo, threads, rounds)
+        print(f"{name:<12} | {rate:>8.0f} | {stored:>6} | {problems:>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+# benchmarks/bench_location_search.py
+"""
+위치 검색 벤치마크: LIKE '%q%' vs FTS5 (caravan 100k건, SQLite 파일 DB)
+
+실행: python -m benchmarks.bench_location_search [카라반 수]
+"""
+import os
+import random
+import sys
+import tempfile
+import timeit
+
+# main.py를 import 하기 전에 임시 DB 파일을 지정해야 합니다.
+DB_PATH = os.path.join(tempfile.mkdtemp(), 'bench_search.db')
+os.environ['DATABASE_URL'] = 'sqlite:///' + DB_PATH
+
+from main import (app, db, User, Caravan, UserRole, caravan_fts, caravan_search_query,  # noqa: E402
+                  fts_match_expression, search_caravan_page)
+
+CITIES = ['서울', '부산', '인천', '대구', '대전', '광주', '울산', '수원', '강릉', '제주', '여수', '속초', '전주', '경주', '춘천']
+DISTRICTS = ['중구', '동구', '서구', '남구', '북구', '해운대', '마포', '애월', '경포', '돌산', '영랑', '수성']
+WORDS = ['바다', '전망', '캠핑', '가족', '반려견', '바베큐', '넓은', '조용한', '산', '계곡', '온수', '샤워']
+QUERIES = ['제주', '해운대', '강릉 경포', '울릉', '울']  # '울릉'은 10건뿐인 희귀 지역
+PAGE_SIZE = 20
+REPEAT = 20
+
+
+def seed(count: int):
+    rng = random.Random(42)
+    host = User(email='bench@host.com', name='Host', password_hash='x', user_role=UserRole.HOST)
+    db.session.add(host)
+    db.session.flush()
+    rows = [{
+        'host_id': host.id,
+        'name': f'카라반 {i}',
+        'location': f'{rng.choice(CITIES)} {rng.choice(DISTRICTS)}',
+        'daily_rate': 50000,
+        'capacity': rng.randint(1, 8),
+        'description': ' '.join(rng.choices(WORDS, k=8)),
+    } for i in range(count)]
+    for row in rng.sample(rows, 10):
+        row['location'] = '울릉 도동'
+    db.session.execute(db.insert(Caravan), rows)
+    db.session.commit()
+
+
+def fts_ids(q):
+    match = fts_match_expression(q)
+    return db.session.execute(db.select(caravan_fts.c.rowid).where(
+        caravan_fts.c.caravan_fts.op('MATCH')(match))).all()
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    with app.app_context():
+        db.create_all()
+        load = timeit.timeit(lambda: seed(count), number=1)
+        print(f"카라반 {count}건 적재 (FTS 트리거 포함): {load:.1f}s\n")
+        print("첫 페이지: 20건 (LIKE는 id순, FTS는 관련도순) / 매칭 id: 조건에 맞는 id 전체 조회")
+        print(f"{'검색어':<8} | {'LIKE 첫 페이지(ms)':>16} | {'FTS 첫 페이지(ms)':>15} | {'LIKE 매칭 id(ms)':>15} | {'FTS 매칭 id(ms)':>14} | {'건수':>6}")
+        for q in QUERIES:
+            like_page = timeit.timeit(lambda: caravan_search_query(q).order_by(Caravan.id).limit(PAGE_SIZE).all(),
+                                      number=REPEAT) / REPEAT
+            fts_page = timeit.timeit(lambda: search_caravan_page(q, None, None, None, PAGE_SIZE),
+                                     number=REPEAT) / REPEAT
+            like_all = timeit.timeit(lambda: caravan_search_query(q).with_entities(Caravan.id).all(),
+                                     number=REPEAT) / REPEAT
+            fts_all = timeit.timeit(lambda: fts_ids(q), number=REPEAT) / REPEAT
+            matched = len(fts_ids(q))
+            print(f"{q:<8} | {like_page * 1e3:>16.2f} | {fts_page * 1e3:>15.2f} | {like_all * 1e3:>15.2f} | {fts_all * 1e3:>14.2f} | {matched:>6}")
+    os.remove(DB_PATH)
+
+
+if __name__ == '__main__':
+    main()
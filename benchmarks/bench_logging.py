@@ -0,0 +1,84 @@
+# benchmarks/bench_logging.py
+"""
+ReservationService.create_reservation 처리량 벤치마크 (로깅 끔 / 동기 파일 로깅 / 큐 로깅)
+
+실행: python -m benchmarks.bench_logging
+"""
+import logging
+import os
+import tempfile
+import time
+import timeit
+from datetime import date, timedelta
+
+from src.logging_config import configure_logging
+from src.models.caravan import Caravan
+from src.models.common import UserRole
+from src.models.user import User
+from src.repositories.memory_repository import InMemoryReservationRepository
+from src.services.factories import ReservationFactory
+from src.services.observers import NotificationService
+from src.services.reservation_service import ReservationService
+from src.services.strategies import NoDiscountStrategy, PriceCalculator
+from src.services.validators import ReservationValidator
+
+COUNT = 20_000
+
+
+class SlowSinkHandler(logging.FileHandler):
+    """파이프가 가득 찬 stdout처럼 기록마다 0.2ms씩 막히는 출력 대상"""
+    def emit(self, record):
+        time.sleep(0.0002)
+        super().emit(record)
+
+
+def run_bookings(count: int) -> float:
+    """카라반마다 예약 1건씩 count건을 생성하고 걸린 시간(초)을 반환합니다."""
+    repo = InMemoryReservationRepository()
+    service = ReservationService(
+        validator=ReservationValidator(repo),
+        repository=repo,
+        factory=ReservationFactory(),
+        price_calculator=PriceCalculator(NoDiscountStrategy()),
+        notification_service=NotificationService(),
+    )
+    guest = User(username="BenchGuest", role=UserRole.GUEST)
+    caravans = [Caravan(host_id="Host", name=f"C{i}", capacity=4) for i in range(count)]
+    start_date = date.today() + timedelta(days=30)
+    end_date = start_date + timedelta(days=2)
+
+    def book_all():
+        for caravan in caravans:
+            assert service.create_reservation(guest, caravan, start_date, end_date) is not None
+
+    return timeit.timeit(book_all, number=1)
+
+
+def main():
+    log_path = os.path.join(tempfile.mkdtemp(), "bench.log")
+    scenarios = [
+        ("로깅 끔 (WARNING)", dict(level=logging.WARNING)),
+        ("INFO, 동기 파일", dict(level=logging.INFO)),
+        ("INFO, 큐", dict(level=logging.INFO, use_queue=True)),
+        ("DEBUG, 동기 파일", dict(level=logging.DEBUG)),
+        ("DEBUG, 큐", dict(level=logging.DEBUG, use_queue=True)),
+        ("INFO, 느린 출력 동기", dict(level=logging.INFO, slow=True)),
+        ("INFO, 느린 출력 큐", dict(level=logging.INFO, use_queue=True, slow=True)),
+    ]
+    print("예약/초는 요청 스레드 기준 (큐 방식의 남은 로그 기록 시간은 제외)")
+    print(f"{'설정':<18} | {'예약/초':>10} | {'예약당(us)':>10}")
+    for name, options in scenarios:
+        slow = options.pop("slow", False)
+        handler = SlowSinkHandler(log_path) if slow else logging.FileHandler(log_path)
+        listener = configure_logging(handler=handler, **options)
+        count = COUNT // 10 if slow else COUNT
+        elapsed = run_bookings(count)
+        if listener is not None:
+            listener.stop()
+        handler.close()
+        print(f"{name:<18} | {count / elapsed:>10.0f} | {elapsed / count * 1e6:>10.1f}")
+    os.remove(log_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# benchmarks/bench_model_memory.py
+"""
+예약 1건당 메모리 벤치마크: 기존 @dataclass(__dict__) vs __slots__ Reservation vs CompactReservation(bytes/int ID)
+
+게스트/카라반 ID 문자열은 여러 예약이 공유하므로 측정 전에 만들어 두고,
+예약마다 새로 생기는 객체(예약 객체, 예약 ID, 날짜)만 tracemalloc으로 잽니다.
+
+실행: python -m benchmarks.bench_model_memory [예약 수]
+"""
+import gc
+import random
+import sys
+import tracemalloc
+import uuid
+from dataclasses import dataclass, field
+from datetime import date
+
+from src.models.common import ReservationStatus
+from src.models.compact import CompactReservation, encode_id
+from src.models.reservation import Reservation
+
+
+@dataclass
+class DictReservation:
+    """slots 적용 전 Reservation과 같은 정의 (비교 기준)"""
+    guest_id: str
+    caravan_id: str
+    start_date: date
+    end_date: date
+    total_price: int
+    reservation_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    status: ReservationStatus = ReservationStatus.PENDING
+
+
+def bytes_per_record(build, count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    records = build(count)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert len(records) == count
+    return (after - before - sys.getsizeof(records)) / count
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rng = random.Random(5)
+    guests = [str(uuid.uuid4()) for _ in range(count // 20)]
+    caravans = [str(uuid.uuid4()) for _ in range(count // 200)]
+    origin = date(2030, 1, 1).toordinal()
+    rows = []
+    for i in range(count):
+        start = origin + rng.randint(0, 700)
+        rows.append((rng.choice(guests), rng.choice(caravans), start, start + rng.randint(0, 13),
+                     rng.randrange(50000, 2000000, 1000), i))
+
+    def plain(cls):
+        return lambda n: [cls(guest_id=g, caravan_id=c, start_date=date.fromordinal(s), end_date=date.fromordinal(e),
+                              total_price=p) for g, c, s, e, p, _ in rows[:n]]
+
+    def compact(id_format):
+        def build(n):
+            return [CompactReservation(
+                key=encode_id(str(uuid.uuid4()) if id_format == "bytes" else str(i), id_format),
+                guest_id=g, caravan_id=c, start_ordinal=s, end_ordinal=e, total_price=p)
+                for g, c, s, e, p, i in rows[:n]]
+        return build
+
+    print(f"예약 {count}건, 1건당 메모리 (예약 객체 + 예약 ID + 날짜)\n")
+    print(f"{'모델':<34} | {'bytes/건':>9}")
+    baseline = None
+    for name, build in [
+        ("@dataclass (__dict__, 기존)", plain(DictReservation)),
+        ("@dataclass(slots=True) Reservation", plain(Reservation)),
+        ("CompactReservation (16바이트 ID)", compact("bytes")),
+        ("CompactReservation (정수 ID)", compact("int")),
+    ]:
+        size = bytes_per_record(build, count)
+        baseline = baseline or size
+        print(f"{name:<34} | {size:>9.0f}  ({size / baseline:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# benchmarks/bench_pricing.py
+"""
+가격 계산 벤치마크: 기존 방식(요청마다 set_strategy + PriceCalculator) vs PricingEngine.quote / quote_many
+
+실행: python -m benchmarks.bench_pricing
+"""
+import random
+import time
+from datetime import date, timedelta
+
+from src.services.pricing import PricingEngine, PricingRules
+from src.services.strategies import PriceCalculator, LongStayDiscountStrategy, NoDiscountStrategy
+
+COUNT = 100_000
+SEASONAL = PricingRules(weekday_multipliers=(0.9, 0.9, 0.9, 0.9, 1.1, 1.3, 1.2),
+                        month_multipliers={7: 1.3, 8: 1.3, 12: 1.1})
+
+
+def make_requests(count: int) -> list[tuple[int, date, date]]:
+    rng = random.Random(7)
+    origin = date.today()
+    requests = []
+    for _ in range(count):
+        check_in = origin + timedelta(days=rng.randint(0, 540))
+        requests.append((rng.randrange(40000, 150000, 5000), check_in, check_in + timedelta(days=rng.randint(1, 21))))
+    return requests
+
+
+def legacy(requests):
+    """기존 ReservationService 방식: 공유 계산기의 전략을 바꾼 뒤 계산 (종료일 포함 -> 체크아웃 전날을 종료일로)"""
+    calculator = PriceCalculator(NoDiscountStrategy())
+    for daily_rate, check_in, check_out in requests:
+        if (check_out - check_in).days >= 7:
+            calculator.set_strategy(LongStayDiscountStrategy())
+        else:
+            calculator.set_strategy(NoDiscountStrategy())
+        calculator.calculate_total_price(daily_rate, check_in, check_out - timedelta(days=1))
+
+
+def per_day(rules: PricingRules, requests):
+    """누적합 없이 밤마다 배율을 계산하는 방식 (시즌/요일 요금을 단순 구현했을 때)"""
+    for daily_rate, check_in, check_out in requests:
+        nights = (check_out - check_in).days
+        price = sum(daily_rate * rules.day_basis(check_in + timedelta(days=n)) for n in range(nights)) // 10_000
+        for strategy in rules.discounts:
+            price -= strategy.calculate_discount(price, nights)
+
+
+def timed(fn) -> float:
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+
+def main():
+    requests = make_requests(COUNT)
+    engine = PricingEngine()
+    seasonal = PricingEngine(SEASONAL)
+    print(f"견적 {COUNT}건 (1~21박)\n")
+    print(f"{'방식':<34} | {'시간(s)':>8} | {'견적/초':>10}")
+    for name, fn in [
+        ("PriceCalculator + set_strategy", lambda: legacy(requests)),
+        ("PricingEngine.quote (기본 규칙)", lambda: [engine.quote(*r) for r in requests]),
+        ("PricingEngine.quote_many (기본 규칙)", lambda: engine.quote_many(requests)),
+        ("밤마다 배율 계산 (시즌/요일)", lambda: per_day(SEASONAL, requests)),
+        ("PricingEngine.quote_many (시즌/요일)", lambda: seasonal.quote_many(requests)),
+    ]:
+        elapsed = timed(fn)
+        print(f"{name:<34} | {elapsed:>8.3f} | {COUNT / elapsed:>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
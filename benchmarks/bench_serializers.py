@@ -0,0 +1,68 @@
+# benchmarks/bench_serializers.py
+"""
+카라반 검색 응답 직렬화 벤치마크: asdict + json (기존 방식) vs 모델 인코더 (src/serializers.py)
+
+- 기존 방식은 Enum을 직렬화하지 못하므로 default=(Enum -> 이름)을 붙여 같은 JSON을 만들게 합니다.
+- 인코더 + 표준 json, 인코더 + orjson(설치된 경우), 스트리밍(조각 전체를 만드는 시간)을 비교합니다.
+
+실행: python -m benchmarks.bench_serializers [카라반 수]
+"""
+import json
+import sys
+import time
+from dataclasses import asdict
+from enum import Enum
+
+from src import serializers
+from src.models.caravan import Caravan
+from src.models.common import CaravanStatus
+from src.serializers import encoder_for, dumps_stdlib, iter_json_array
+
+AMENITIES = ["샤워", "주방", "와이파이", "에어컨", "반려동물", "캠프파이어"]
+
+
+def timed(func, repeat: int = 5) -> tuple[float, object]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def enum_name(value):
+    if isinstance(value, Enum):
+        return value.name
+    raise TypeError(f"직렬화할 수 없는 값: {value!r}")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    statuses = list(CaravanStatus)
+    caravans = [Caravan(host_id=f"host-{i % 300}", name=f"카라반 {i}", capacity=1 + i % 8, daily_rate=50_000 + i,
+                        status=statuses[i % len(statuses)], amenities=AMENITIES[:i % len(AMENITIES) + 1])
+                for i in range(count)]
+    encode = encoder_for(Caravan)
+
+    cases = [
+        ("asdict + json (기존)", lambda: json.dumps([asdict(c) for c in caravans], ensure_ascii=False,
+                                                  separators=(",", ":"), default=enum_name).encode()),
+        ("인코더 + json", lambda: dumps_stdlib([encode(c) for c in caravans])),
+    ]
+    if serializers.orjson is not None:
+        cases.append(("인코더 + orjson", lambda: serializers.orjson.dumps([encode(c) for c in caravans])))
+    cases.append((f"스트리밍 ({serializers.JSON_BACKEND})", lambda: b"".join(iter_json_array(caravans, encode))))
+
+    print(f"카라반 {count}대 응답 직렬화 (5회 중 최솟값)\n")
+    print(f"{'방식':<22} | {'시간':>8} | {'배속':>6} | {'크기':>9}")
+    baseline, expected = None, None
+    for name, func in cases:
+        elapsed, body = timed(func)
+        if baseline is None:
+            baseline, expected = elapsed, json.loads(body)
+        assert json.loads(body) == expected  # 모든 방식이 같은 JSON을 만드는지 확인
+        print(f"{name:<22} | {elapsed * 1000:>6.1f}ms | {baseline / elapsed:>5.1f}x | {len(body) / 1024:>7.0f}KB")
+
+
+if __name__ == "__main__":
+    main()
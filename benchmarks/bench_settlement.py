@@ -0,0 +1,72 @@
+# benchmarks/bench_settlement.py
+"""
+결제 요청 벤치마크: 요청마다 PG 승인을 기다리는 방식 vs 정산 파이프라인(SettlementPipeline)
+
+- PG 호출 1회에 delay초가 걸리는 가짜 PG (묶음 크기와 관계없이 같은 왕복 시간)
+- 요청마다 PG 승인: process_payment 안에서 settle_batch([결제 1건]) 후 저장
+- 파이프라인: PENDING으로 저장하고 바로 반환, 워커가 batch_size개씩 묶어 PG 호출 + 결과 일괄 저장
+
+실행: python -m benchmarks.bench_settlement [결제 수] [PG 지연 ms]
+"""
+import sys
+import time
+from datetime import date
+from unittest.mock import Mock
+
+from src.models.payment import PaymentStatus
+from src.models.reservation import Reservation
+from src.repositories.concurrent_repository import ThreadSafePaymentRepository
+from src.repositories.memory_repository import InMemoryReservationRepository
+from src.services.observers import NotificationService
+from src.services.payment_service import PaymentService
+from src.services.settlement import FakePaymentGateway, SettlementPipeline
+
+
+def reservations(count: int) -> InMemoryReservationRepository:
+    repo = InMemoryReservationRepository()
+    for i in range(count):
+        repo.add(Reservation(guest_id=f"g{i}", caravan_id=f"c{i}", start_date=date(2030, 1, 1),
+                             end_date=date(2030, 1, 2), total_price=100000, reservation_id=f"res-{i}"))
+    return repo
+
+
+def inline(count: int, delay: float) -> tuple[float, float, int]:
+    """(가정) 요청 스레드가 PG 승인까지 기다리는 방식"""
+    gateway = FakePaymentGateway(delay=delay)
+    payment_repo = ThreadSafePaymentRepository()
+    service = PaymentService(payment_repo, reservations(count), Mock(spec=NotificationService))
+    started = time.perf_counter()
+    for i in range(count):
+        payment = service.process_payment(f"res-{i}", 100000, idempotency_key=f"k{i}")
+        gateway.settle_batch([payment])
+        payment_repo.add(payment)
+    elapsed = time.perf_counter() - started
+    return elapsed, elapsed, gateway.attempts
+
+
+def pipelined(count: int, delay: float, batch_size: int = 50) -> tuple[float, float, int]:
+    gateway = FakePaymentGateway(delay=delay)
+    payment_repo = ThreadSafePaymentRepository()
+    pipeline = SettlementPipeline(gateway, payment_repo, batch_size=batch_size)
+    service = PaymentService(payment_repo, reservations(count), Mock(spec=NotificationService), settlement=pipeline)
+    started = time.perf_counter()
+    payments = [service.process_payment(f"res-{i}", 100000, idempotency_key=f"k{i}") for i in range(count)]
+    accepted = time.perf_counter() - started
+    pipeline.shutdown()
+    settled = time.perf_counter() - started
+    assert all(payment_repo.get_by_id(p.payment_id).status == PaymentStatus.COMPLETED for p in payments)
+    return accepted, settled, gateway.attempts
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    delay = (float(sys.argv[2]) if len(sys.argv) > 2 else 20) / 1000
+    print(f"결제 {count}건, PG 호출 1회 {delay * 1000:.0f}ms\n")
+    print(f"{'방식':<22} | {'요청 1건 평균':>12} | {'전체 정산 완료':>12} | {'PG 호출':>7}")
+    for name, (accepted, settled, calls) in [("요청마다 PG 승인", inline(count, delay)),
+                                             ("정산 파이프라인 (50건 묶음)", pipelined(count, delay))]:
+        print(f"{name:<22} | {accepted / count * 1e6:>10.0f}us | {settled * 1000:>10.0f}ms | {calls:>7}")
+
+
+if __name__ == "__main__":
+    main()
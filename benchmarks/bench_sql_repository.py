@@ -0,0 +1,65 @@
+# benchmarks/bench_sql_repository.py
+"""
+리포지토리 백엔드 비교 벤치마크: InMemory vs SQL(SQLite 파일 DB, 커넥션 풀)
+
+실행: python -m benchmarks.bench_sql_repository [카라반 수] [예약 수]
+"""
+import os
+import random
+import sys
+import tempfile
+import timeit
+from datetime import date, timedelta
+
+from src.models.caravan import Caravan
+from src.models.reservation import Reservation
+from src.repositories.memory_repository import InMemoryCaravanRepository, InMemoryReservationRepository
+from src.repositories.sql_repository import SqlCaravanRepository, SqlReservationRepository, create_repository_engine
+
+REPEAT = 20
+BASE = date(2030, 1, 1)
+
+
+def make_data(caravan_count: int, reservation_count: int):
+    rng = random.Random(7)
+    caravans = [Caravan(host_id="Host", name=f"C{i}", capacity=rng.randint(1, 8), caravan_id=f"{i:08d}")
+                for i in range(caravan_count)]
+    reservations = []
+    for i in range(reservation_count):
+        start = BASE + timedelta(days=rng.randint(0, 364))
+        reservations.append(Reservation(guest_id="G", caravan_id=f"{rng.randrange(caravan_count):08d}",
+                                        start_date=start, end_date=start + timedelta(days=rng.randint(0, 3)),
+                                        total_price=100000))
+    return caravans, reservations
+
+
+def bench(name, caravan_repo, reservation_repo, caravans, reservations):
+    load = timeit.timeit(lambda: caravan_repo.add_all(caravans), number=1)
+    book = timeit.timeit(lambda: [reservation_repo.reserve_if_available(r) for r in reservations], number=1)
+    ids = [c.caravan_id for c in caravans[:1000]]
+    start, end = BASE + timedelta(days=100), BASE + timedelta(days=103)
+    single = timeit.timeit(lambda: reservation_repo.is_caravan_available(ids[0], start, end), number=REPEAT * 50) / (REPEAT * 50)
+    batch = timeit.timeit(lambda: reservation_repo.find_available_caravan_ids(ids, start, end), number=REPEAT) / REPEAT
+    page = timeit.timeit(lambda: caravan_repo.search_by_capacity_page(4, 20, "5:00001000"), number=REPEAT) / REPEAT
+    print(f"{name:<10} | {load * 1000:>10.0f} | {len(reservations) / book:>10.0f} | "
+          f"{single * 1e6:>10.1f} | {batch * 1000:>12.2f} | {page * 1000:>10.2f}")
+
+
+def main():
+    caravan_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    reservation_count = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+    caravans, reservations = make_data(caravan_count, reservation_count)
+    print(f"카라반 {caravan_count}건, 예약 {reservation_count}건\n")
+    print(f"{'백엔드':<10} | {'적재(ms)':>10} | {'예약/s':>10} | {'가능 확인(us)':>10} | "
+          f"{'1000대 확인(ms)':>12} | {'페이지(ms)':>10}")
+
+    bench("InMemory", InMemoryCaravanRepository(), InMemoryReservationRepository(), caravans, reservations)
+
+    db_path = os.path.join(tempfile.mkdtemp(), "bench_repo.db")
+    engine = create_repository_engine("sqlite:///" + db_path)
+    bench("SQL", SqlCaravanRepository(engine), SqlReservationRepository(engine), caravans, reservations)
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
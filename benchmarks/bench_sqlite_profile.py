@@ -0,0 +1,125 @@
+# benchmarks/bench_sqlite_profile.py
+"""
+쓰기가 계속되는 동안의 읽기 처리량: SQLite 기본 설정(롤백 저널) vs WAL 프로필 (src/repositories/sqlite_profile.py)
+
+gunicorn 워커처럼 프로세스 여러 개가 같은 파일 DB를 씁니다.
+- 읽기 프로세스: 카라반 검색 1페이지 (search_caravan_page, 날짜 필터 포함)
+- 쓰기 프로세스: 예약 신청 + 승인 (caravan_booking_lock 트랜잭션)
+정해진 시간 동안 각자 최대한 반복하고, 처리량과 읽기 지연(p50/p99), 잠금 오류 수를 비교합니다.
+
+실행: python -m benchmarks.bench_sqlite_profile [읽기 프로세스 수] [쓰기 프로세스 수] [초]
+"""
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+CARAVANS = 200
+
+
+def prepare(db_path: str, guests: int):
+    from sqlalchemy import create_engine
+    from main import db, User, Caravan, UserRole
+    engine = create_engine('sqlite:///' + db_path)
+    db.metadata.create_all(engine)
+    with engine.begin() as conn:
+        for i in range(1 + guests):
+            conn.execute(User.__table__.insert().values(
+                email=f'u{i}@bench.com', name=f'U{i}', password_hash='x',
+                user_role=UserRole.HOST if i == 0 else UserRole.GUEST))
+        conn.execute(Caravan.__table__.insert(), [
+            {'host_id': 1, 'name': f'캠핑카 {i}', 'location': ('서울', '부산', '강릉')[i % 3],
+             'daily_rate': 50000 + i * 100, 'capacity': 2 + i % 5} for i in range(CARAVANS)])
+    engine.dispose()
+
+
+def reader(seed: int, seconds: float, barrier, result_queue):
+    import main
+    from sqlalchemy.exc import OperationalError
+    rng = random.Random(seed)
+    latencies, errors = [], 0
+    with main.app.app_context():
+        barrier.wait()
+        deadline = time.perf_counter() + seconds
+        while (started := time.perf_counter()) < deadline:
+            start = date(2030, 1, 1) + timedelta(days=rng.randint(0, 90))
+            try:
+                main.search_caravan_page(None, start, start + timedelta(days=3), None, 20)
+                main.db.session.commit()  # 읽기 트랜잭션 종료 (요청 끝과 같음)
+                latencies.append(time.perf_counter() - started)
+            except OperationalError:
+                main.db.session.rollback()
+                errors += 1
+    result_queue.put(('read', latencies, errors))
+
+
+def writer(seed: int, seconds: float, barrier, result_queue):
+    import main
+    from sqlalchemy.exc import OperationalError
+    rng = random.Random(seed)
+    latencies, errors = [], 0
+    with main.app.app_context():
+        barrier.wait()
+        deadline = time.perf_counter() + seconds
+        while (started := time.perf_counter()) < deadline:
+            start = date(2030, 1, 1) + timedelta(days=rng.randint(0, 90))
+            try:
+                reservation = main.create_pending_reservation(
+                    rng.randint(1, CARAVANS), seed + 2, start, start + timedelta(days=rng.randint(1, 4)), 100000)
+                main.confirm_reservation(reservation.id)
+            except main.BookingConflictError:
+                pass
+            except OperationalError:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+    result_queue.put(('write', latencies, errors))
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))] if ordered else 0.0
+
+
+def run(profile: str, readers: int, writers: int, seconds: float):
+    db_path = os.path.join(tempfile.mkdtemp(), f'bench_{profile}.db')
+    prepare(db_path, writers)
+    # spawn된 자식 프로세스가 물려받음 (main import 시 엔진 설정이 결정됨)
+    os.environ['DATABASE_URL'] = 'sqlite:///' + db_path
+    os.environ['SQLITE_PROFILE'] = profile
+    ctx = multiprocessing.get_context('spawn')
+    barrier = ctx.Barrier(readers + writers)
+    result_queue = ctx.Queue()
+    procs = [ctx.Process(target=reader, args=(seed, seconds, barrier, result_queue)) for seed in range(readers)]
+    procs += [ctx.Process(target=writer, args=(seed, seconds, barrier, result_queue)) for seed in range(writers)]
+    for proc in procs:
+        proc.start()
+    results = {'read': ([], 0), 'write': ([], 0)}
+    for _ in procs:
+        kind, latencies, errors = result_queue.get()
+        results[kind] = (results[kind][0] + latencies, results[kind][1] + errors)
+    for proc in procs:
+        proc.join()
+    return results
+
+
+def main():
+    readers = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    writers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    seconds = float(sys.argv[3]) if len(sys.argv) > 3 else 5.0
+    print(f"읽기 프로세스 {readers}개 + 쓰기 프로세스 {writers}개, {seconds:.0f}초, 카라반 {CARAVANS}대\n")
+    print(f"{'프로필':<6} | {'읽기/s':>7} | {'읽기 p50':>9} | {'읽기 p99':>9} | {'쓰기/s':>7} | {'잠금 오류':>8}")
+    for profile in ('none', 'wal'):
+        results = run(profile, readers, writers, seconds)
+        reads, read_errors = results['read']
+        writes, write_errors = results['write']
+        print(f"{profile:<6} | {len(reads) / seconds:>7.0f} | {percentile(reads, 0.5) * 1000:>7.2f}ms | "
+              f"{percentile(reads, 0.99) * 1000:>7.2f}ms | {len(writes) / seconds:>7.0f} | "
+              f"{read_errors + write_errors:>8}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,15 +1,27 @@
 import os
-from flask import Flask, render_template, redirect, url_for, flash, request
+import re
+import json
+from contextlib import contextmanager
+import click
+from flask import Flask, render_template, redirect, url_for, flash, request, jsonify, stream_with_context, abort, get_template_attribute
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql, sqlite
 from flask_login import UserMixin, LoginManager, login_user, logout_user, current_user, login_required
 from werkzeug.security import generate_password_hash, check_password_hash
 from flask_wtf import FlaskForm
-from wtforms import StringField, PasswordField, SubmitField, SelectField, FloatField, IntegerField, TextAreaField, BooleanField, DateField
+from wtforms import StringField, PasswordField, SubmitField, SelectField, FloatField, DecimalField, IntegerField, TextAreaField, BooleanField, DateField
 from wtforms.validators import DataRequired, Email, EqualTo, Length, ValidationError, NumberRange
-from datetime import datetime
+from datetime import datetime, date
+from decimal import Decimal, InvalidOperation
 from enum import Enum
 from flask import flash, redirect, url_for, request
 from flask_login import login_required, current_user
+from src.services.bulk_service import read_rows, write_rows, format_from_path
+from src.services.cache import InMemoryLRUCache, RedisCacheBackend, ReadThroughCache
+from src.repositories import month_bitmap
+from src.services.pricing import PricingEngine
+from src.repositories.sqlite_profile import SqliteProfile, install_sqlite_profile, is_memory_database, pool_options
 
 # --- 1. 애플리케이션 및 DB 설정 ---
 
@@ -17,11 +29,26 @@ basedir = os.path.abspath(os.path.dirname(__file__))
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'your_super_secret_key_that_should_be_changed'
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + os.path.join(
-    basedir, 'caravan_share.db')
+# DATABASE_URL 환경 변수가 있으면 우선 사용 (테스트/배포 환경)
+app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get(
+    'DATABASE_URL', 'sqlite:///' + os.path.join(basedir, 'caravan_share.db'))
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# 파일 DB는 워커당 커넥션 풀 크기를 지정 (메모리 DB는 커넥션 1개를 공유하므로 제외)
+if not is_memory_database(app.config['SQLALCHEMY_DATABASE_URI']):
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = pool_options()
+# 검색 결과 페이지 크기 (per_page 쿼리 파라미터로 MAX_PAGE_SIZE까지 조절 가능)
+app.config['SEARCH_PAGE_SIZE'] = int(os.environ.get('SEARCH_PAGE_SIZE', 20))
+MAX_PAGE_SIZE = 100
+# 잔액은 보조 통화 단위 정수로 저장 (KRW는 ISO 4217 소수 자릿수 0이므로 1원 = 1)
+BALANCE_MINOR_UNITS = 1
+# 카라반 상세 캐시 (CACHE_REDIS_URL이 있으면 워커 간 공유 캐시 사용)
+app.config['DETAIL_CACHE_TTL'] = int(os.environ.get('DETAIL_CACHE_TTL', 300))
+app.config['DETAIL_CACHE_SIZE'] = int(os.environ.get('DETAIL_CACHE_SIZE', 1024))
 
 db = SQLAlchemy(app)
+# SQLite PRAGMA 프로필 (WAL 등, SQLITE_PROFILE=none이면 적용하지 않음)
+with app.app_context():
+    install_sqlite_profile(db.engine, SqliteProfile.from_env())
 login_manager = LoginManager(app)
 login_manager.login_view = 'login'
 login_manager.login_message_category = 'info'
@@ -70,10 +97,21 @@ class User(db.Model, UserMixin):
     host_review_count = db.Column(db.Integer, default=0)
     average_guest_rating = db.Column(db.Float, default=0.0)
     guest_review_count = db.Column(db.Integer, default=0)
-    balance = db.Column(db.Float, default=0.0, nullable=False)
+    # 평점 누적 합계 (리뷰마다 전체 재조회 없이 평균을 갱신하기 위함)
+    host_rating_sum = db.Column(db.Integer, default=0, server_default='0')
+    guest_rating_sum = db.Column(db.Integer, default=0, server_default='0')
+    # 잔액 스냅샷 (보조 통화 단위 정수). 원장(balance_ledger)에 기록할 때 같은 트랜잭션에서 SQL로 증감합니다.
+    balance_minor = db.Column(db.BigInteger, default=0, server_default='0', nullable=False)
+    # 이전 float 잔액 컬럼 (더 이상 갱신하지 않음, ensure_schema가 원장으로 옮길 때만 읽음)
+    legacy_balance = db.Column('balance', db.Float, default=0.0, nullable=False)
 
     caravans = db.relationship('Caravan', backref='host', lazy=True)
 
+    @property
+    def balance(self):
+        """원 단위 잔액 (표시용, Decimal)"""
+        return Decimal(self.balance_minor or 0) / BALANCE_MINOR_UNITS
+
     def set_password(self, password):
         self.password_hash = generate_password_hash(password)
 
@@ -95,6 +133,58 @@ class Caravan(db.Model):
     # 🚨 [수정] 카라반 자체의 평점 및 카운트 추가
     average_rating = db.Column(db.Float, default=0.0)
     review_count = db.Column(db.Integer, default=0)
+    rating_sum = db.Column(db.Integer, default=0, server_default='0')
+    # 예약 신청/승인 시마다 증가 (동시 처리 감지용 버전)
+    booking_version = db.Column(db.Integer, default=0, server_default='0')
+
+    __table_args__ = (
+        db.Index('ix_caravan_host_id', 'host_id'),  # 호스트의 카라반 목록
+        db.Index('ix_caravan_location', 'location'),
+    )
+
+
+# --- 카라반 전문 검색(FTS5) 인덱스 (SQLite 전용) ---
+# caravan 테이블을 원본으로 하는 external-content FTS5 테이블이며, 트리거로 동기화합니다.
+# 순위(rank)는 bm25이고 위치 > 이름 > 설명 순으로 가중치를 둡니다.
+caravan_fts = db.table('caravan_fts', db.column('rowid'), db.column('rank'),
+                       db.column('caravan_fts'))
+
+CARAVAN_FTS_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS caravan_fts USING fts5(
+        name, location, description,
+        content='caravan', content_rowid='id',
+        tokenize='unicode61', prefix='2 3')""",
+    "INSERT INTO caravan_fts(caravan_fts, rank) VALUES('rank', 'bm25(2.0, 5.0, 1.0)')",
+    """CREATE TRIGGER IF NOT EXISTS caravan_fts_ai AFTER INSERT ON caravan BEGIN
+        INSERT INTO caravan_fts(rowid, name, location, description)
+        VALUES (new.id, new.name, new.location, new.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS caravan_fts_ad AFTER DELETE ON caravan BEGIN
+        INSERT INTO caravan_fts(caravan_fts, rowid, name, location, description)
+        VALUES ('delete', old.id, old.name, old.location, old.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS caravan_fts_au
+    AFTER UPDATE OF name, location, description ON caravan BEGIN
+        INSERT INTO caravan_fts(caravan_fts, rowid, name, location, description)
+        VALUES ('delete', old.id, old.name, old.location, old.description);
+        INSERT INTO caravan_fts(rowid, name, location, description)
+        VALUES (new.id, new.name, new.location, new.description);
+    END""",
+]
+
+
+@event.listens_for(Caravan.__table__, 'after_create')
+def create_caravan_fts(target, connection, **kw):
+    """caravan 테이블 생성 직후 FTS 테이블과 동기화 트리거를 만듭니다."""
+    if connection.dialect.name == 'sqlite':
+        for ddl in CARAVAN_FTS_DDL:
+            connection.exec_driver_sql(ddl)
+
+
+@event.listens_for(Caravan.__table__, 'before_drop')
+def drop_caravan_fts(target, connection, **kw):
+    if connection.dialect.name == 'sqlite':
+        connection.exec_driver_sql('DROP TABLE IF EXISTS caravan_fts')
 
 
 class Reservation(db.Model):
@@ -118,6 +208,14 @@ class Reservation(db.Model):
     caravan = db.relationship('Caravan', backref='reservations')
     guest = db.relationship('User', backref='reservations')
 
+    __table_args__ = (
+        # 중복 예약 확인, 날짜 검색(안티 조인), 호스트 예약 목록(caravan_id IN)
+        db.Index('ix_reservation_caravan_status_dates', 'caravan_id',
+                 'status', 'start_date', 'end_date'),
+        # 게스트 예약 목록
+        db.Index('ix_reservation_guest_id', 'guest_id', 'status'),
+    )
+
 
 class Review(db.Model):
     """리뷰/평가 정보 모델"""
@@ -159,6 +257,82 @@ class Review(db.Model):
                                                  lazy='dynamic'),
                               foreign_keys=[caravan_id])
 
+    __table_args__ = (
+        db.Index('ix_review_reviewed_user_id', 'reviewed_user_id'),  # 평점 계산
+        db.Index('ix_review_caravan_id', 'caravan_id'),
+        db.Index('ix_review_reservation_id', 'reservation_id'),
+    )
+
+
+class CaravanCalendar(db.Model):
+    """카라반 월별 예약 달력 - 확정(CONFIRMED) 예약의 밤을 비트맵으로 저장 (src/repositories/month_bitmap.py)
+
+    booked_mask의 (일 - 1)번째 비트가 1이면 그날 밤이 예약된 것이며, 예약 확정/완료 시
+    caravan_booking_lock 트랜잭션 안에서 함께 갱신됩니다.
+    """
+    __tablename__ = 'caravan_calendar'
+    caravan_id = db.Column(db.Integer,
+                           db.ForeignKey('caravan.id'),
+                           primary_key=True)
+    month = db.Column(db.Date, primary_key=True)  # 해당 월의 1일
+    booked_mask = db.Column(db.Integer, nullable=False, default=0)
+
+
+class BookingStatsMixin:
+    """예약 요약 집계 컬럼 (연도별). 예약 신청/승인/거절 시 같은 트랜잭션에서 원자적으로 증감합니다.
+
+    - bookings, revenue, pending_count: 체크인 연도 기준
+    - nights_booked: 그 해에 속한 확정/완료 숙박의 밤 수 (연말에 걸친 예약은 연도별로 나눔)
+    """
+    year = db.Column(db.Integer, primary_key=True)
+    bookings = db.Column(db.Integer, nullable=False, default=0)
+    nights_booked = db.Column(db.Integer, nullable=False, default=0)
+    revenue = db.Column(db.Float, nullable=False, default=0.0)
+    pending_count = db.Column(db.Integer, nullable=False, default=0)
+
+
+class CaravanStats(BookingStatsMixin, db.Model):
+    """카라반별 연간 예약 요약"""
+    __tablename__ = 'caravan_stats'
+    caravan_id = db.Column(db.Integer,
+                           db.ForeignKey('caravan.id'),
+                           primary_key=True)
+    host_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+
+    __table_args__ = (
+        db.Index('ix_caravan_stats_host_year', 'host_id', 'year'),  # 호스트의 카라반별 요약
+    )
+
+
+class HostStats(BookingStatsMixin, db.Model):
+    """호스트별 연간 예약 요약 (대시보드는 이 행만 읽음)"""
+    __tablename__ = 'host_stats'
+    host_id = db.Column(db.Integer,
+                        db.ForeignKey('user.id'),
+                        primary_key=True)
+
+
+class BalanceLedger(db.Model):
+    """잔액 원장 (추가만 하고 수정/삭제하지 않음). 사용자 잔액 = amount_minor 합계 = user.balance_minor"""
+    __tablename__ = 'balance_ledger'
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    amount_minor = db.Column(db.BigInteger, nullable=False)  # 보조 통화 단위 정수 (충전은 양수)
+    balance_after_minor = db.Column(db.BigInteger, nullable=False)  # 기록 직후 잔액 스냅샷
+    entry_type = db.Column(db.String(20), nullable=False)  # deposit / admin_deposit / opening
+    actor_id = db.Column(db.Integer, db.ForeignKey('user.id'))  # 기록을 실행한 사용자 (관리자 충전 등)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.Index('ix_balance_ledger_user', 'user_id', 'id'),  # 사용자별 거래 내역
+    )
+
+
+@event.listens_for(BalanceLedger, 'before_update')
+@event.listens_for(BalanceLedger, 'before_delete')
+def reject_ledger_change(mapper, connection, entry):
+    raise ValueError(f'잔액 원장은 추가만 할 수 있습니다. (항목 {entry.id})')
+
 
 # --- 3. WTForms 정의 ---
 
@@ -268,45 +442,818 @@ class ReviewForm(FlaskForm):
     submit = SubmitField('리뷰 제출')
 
 
-# 🚨 [추가] 평점 계산 헬퍼 함수
-def update_user_rating(user_id, is_host_rating=True):
-    """특정 사용자가 받은 모든 리뷰를 기반으로 평균 평점과 리뷰 수를 업데이트합니다."""
+class AdminDepositForm(FlaskForm):
+    """관리자가 특정 게스트에게 잔액을 충전하는 폼"""
+    user_id = IntegerField('충전 대상 게스트 ID', validators=[DataRequired()])
+    amount = DecimalField('충전 금액 (KRW)',
+                          validators=[DataRequired(),
+                                      NumberRange(min=1000)])
+    submit = SubmitField('잔액 충전 실행')
 
-    # 1. 대상 사용자가 받은 모든 리뷰를 조회
-    reviews = Review.query.filter_by(reviewed_user_id=user_id).all()
-    user = User.query.get(user_id)
 
-    if reviews:
-        total_score = sum(r.rating for r in reviews)
-        count = len(reviews)
-        new_average = total_score / count
+# --- 가격 계산 (src 서비스와 같은 가격 엔진 사용) ---
 
-        # 2. User 모델 업데이트
-        if is_host_rating:
-            # 호스트로서의 평점 업데이트 (게스트로부터 받은 리뷰)
-            user.average_host_rating = round(new_average, 2)
-            user.host_review_count = count
-        else:
-            # 게스트로서의 평점 업데이트 (호스트로부터 받은 리뷰)
-            user.average_guest_rating = round(new_average, 2)
-            user.guest_review_count = count
+pricing_engine = PricingEngine()
+MAX_QUOTES_PER_REQUEST = 1000
 
-        db.session.commit()
-    elif is_host_rating:
-        # 리뷰가 없으면 0으로 초기화
-        user.average_host_rating = 0.0
-        user.host_review_count = 0
-        db.session.commit()
-    # 게스트 평점은 호스트가 리뷰를 작성해야 계산되므로 여기서는 무시
 
+def quote_stay(daily_rate, start_date, end_date):
+    """체크인 ~ 체크아웃(미포함) 숙박의 가격 견적 (src.services.pricing.Quote)"""
+    return pricing_engine.quote(round(daily_rate), start_date, end_date)
 
-class AdminDepositForm(FlaskForm):
-    """관리자가 특정 게스트에게 잔액을 충전하는 폼"""
-    user_id = IntegerField('충전 대상 게스트 ID', validators=[DataRequired()])
-    amount = FloatField('충전 금액 (KRW)',
-                        validators=[DataRequired(),
-                                    NumberRange(min=1000)])
-    submit = SubmitField('잔액 충전 실행')
+
+# --- 카라반 상세 캐시 ---
+
+
+def build_detail_cache():
+    redis_url = os.environ.get('CACHE_REDIS_URL')
+    if redis_url:
+        import redis  # 공유 캐시를 쓸 때만 필요한 선택 의존성
+        backend = RedisCacheBackend(redis.Redis.from_url(redis_url))
+    else:
+        backend = InMemoryLRUCache(max_entries=app.config['DETAIL_CACHE_SIZE'])
+    return ReadThroughCache(backend, ttl=app.config['DETAIL_CACHE_TTL'])
+
+
+detail_cache = build_detail_cache()
+
+
+def caravan_detail_key(caravan_id):
+    return f'caravan:{caravan_id}'
+
+
+def load_caravan_detail(caravan_id):
+    """카라반 요약 정보와 렌더링된 상세 페이지 조각(평점, 호스트 카드, 리뷰 목록)을 만듭니다.
+
+    예약 폼(CSRF 토큰)은 요청마다 달라지므로 조각에 넣지 않습니다. 없는 카라반이면 None.
+    """
+    caravan = db.session.execute(
+        db.select(Caravan).options(db.joinedload(Caravan.host)).where(
+            Caravan.id == caravan_id)).scalar_one_or_none()
+    if caravan is None:
+        return None
+    reviews = Review.query.filter_by(caravan_id=caravan_id).options(
+        db.joinedload(Review.reviewer)).order_by(Review.id).all()
+
+    def fragment(name, *args):
+        return str(get_template_attribute('_caravan_detail.html', name)(*args))
+
+    return {
+        'caravan': {**caravan_to_dict(caravan), 'host_id': caravan.host_id},
+        'fragments': {
+            'summary': fragment('summary', caravan),
+            'host_card': fragment('host_card', caravan.host),
+            'reviews': fragment('reviews', reviews, caravan.review_count),
+        },
+    }
+
+
+def invalidate_caravan_details(*caravan_ids):
+    """카라반 정보가 바뀐 뒤(커밋 후) 상세 캐시를 지웁니다."""
+    detail_cache.invalidate(*(caravan_detail_key(i) for i in caravan_ids))
+
+
+def invalidate_host_caravan_details(host_id):
+    """호스트 정보(이름, 평점)는 그 호스트의 모든 카라반 상세에 표시되므로 함께 지웁니다."""
+    invalidate_caravan_details(*db.session.scalars(
+        db.select(Caravan.id).where(Caravan.host_id == host_id)))
+
+
+# 🚨 [추가] 평점 집계 헬퍼 함수
+def record_review_rating(review):
+    """리뷰 1건을 호스트/카라반 평점 집계에 반영합니다.
+
+    누적 합계와 개수를 SQL에서 원자적으로 증가시키므로 리뷰 수와 관계없이 O(1)이며,
+    커밋은 호출자가 리뷰 저장과 같은 트랜잭션에서 수행합니다.
+    """
+    db.session.execute(
+        db.update(User).where(User.id == review.reviewed_user_id).values(
+            host_rating_sum=User.host_rating_sum + review.rating,
+            host_review_count=User.host_review_count + 1,
+            average_host_rating=db.func.round(
+                (User.host_rating_sum + review.rating) * 1.0 /
+                (User.host_review_count + 1), 2)))
+    db.session.execute(
+        db.update(Caravan).where(Caravan.id == review.caravan_id).values(
+            rating_sum=Caravan.rating_sum + review.rating,
+            review_count=Caravan.review_count + 1,
+            average_rating=db.func.round(
+                (Caravan.rating_sum + review.rating) * 1.0 /
+                (Caravan.review_count + 1), 2)))
+
+
+def rebuild_rating_aggregates():
+    """리뷰 테이블 전체에서 호스트/카라반 평점 집계를 다시 계산합니다. (복구용)"""
+
+    def review_count(condition):
+        return db.select(db.func.count(
+            Review.id)).where(condition).scalar_subquery()
+
+    def rating_sum(condition):
+        return db.select(db.func.coalesce(db.func.sum(Review.rating),
+                                          0)).where(condition).scalar_subquery()
+
+    def average(total, count):
+        return db.case((count > 0, db.func.round(total * 1.0 / count, 2)),
+                       else_=0.0)
+
+    received = Review.reviewed_user_id == User.id
+    db.session.execute(
+        db.update(User).values(host_review_count=review_count(received),
+                               host_rating_sum=rating_sum(received)))
+    db.session.execute(
+        db.update(User).values(average_host_rating=average(
+            User.host_rating_sum, User.host_review_count)))
+
+    of_caravan = Review.caravan_id == Caravan.id
+    db.session.execute(
+        db.update(Caravan).values(review_count=review_count(of_caravan),
+                                  rating_sum=rating_sum(of_caravan)))
+    db.session.execute(
+        db.update(Caravan).values(
+            average_rating=average(Caravan.rating_sum, Caravan.review_count)))
+    db.session.commit()
+    detail_cache.clear()
+
+
+@app.cli.command('rebuild-ratings')
+def rebuild_ratings_command():
+    """flask --app main rebuild-ratings : 평점 집계를 처음부터 다시 계산합니다."""
+    rebuild_rating_aggregates()
+    print("평점 집계 재계산 완료")
+
+
+# --- 카라반 대량 적재 / 내보내기 (CSV, JSONL) ---
+# 건별 db.session.add + commit 대신 CARAVAN_IMPORT_CHUNK건마다 executemany INSERT 한 번 + commit 한 번
+
+
+CARAVAN_IMPORT_CHUNK = 1000
+CARAVAN_EXPORT_FIELDS = ['id', 'host_id', 'name', 'location', 'daily_rate',
+                         'capacity', 'description', 'status']
+
+
+def caravan_row_errors(row):
+    """카라반 등록 폼(CaravanRegistrationForm)과 같은 규칙으로 행을 검증해 오류 목록을 반환합니다."""
+    errors = []
+    for name in ('name', 'location'):
+        value = (row.get(name) or '').strip()
+        if not value or len(value) > 100:
+            errors.append(f'{name}: 1~100자여야 합니다.')
+    if not (row.get('description') or '').strip():
+        errors.append('description: 필수 항목입니다.')
+    try:
+        if float(row.get('daily_rate')) < 1000:
+            errors.append('daily_rate: 1000 이상이어야 합니다.')
+    except (TypeError, ValueError):
+        errors.append('daily_rate: 숫자여야 합니다.')
+    try:
+        if int(row.get('capacity')) < 1:
+            errors.append('capacity: 1 이상이어야 합니다.')
+    except (TypeError, ValueError):
+        errors.append('capacity: 정수여야 합니다.')
+    try:
+        int(row.get('host_id'))
+    except (TypeError, ValueError):
+        errors.append('host_id: 정수여야 합니다.')
+    status = row.get('status') or 'AVAILABLE'
+    if status not in CaravanStatus.__members__:
+        errors.append(f'status: 알 수 없는 값입니다 ({status}).')
+    return errors
+
+
+def import_caravan_rows(rows, chunk_size=CARAVAN_IMPORT_CHUNK):
+    """카라반 행을 검증해 chunk_size건씩 일괄 INSERT 합니다. (저장 건수, [(행 번호, 사유)]) 반환"""
+    imported, errors, chunk = 0, [], []
+
+    def flush():
+        host_ids = {row['host_id'] for _, row in chunk}
+        known = set(db.session.execute(
+            db.select(User.id).where(User.id.in_(host_ids))).scalars())
+        valid = []
+        for line_no, row in chunk:
+            if row['host_id'] in known:
+                valid.append(row)
+            else:
+                errors.append((line_no, f"host_id: 존재하지 않는 사용자입니다 ({row['host_id']})."))
+        if valid:
+            db.session.execute(db.insert(Caravan), valid)
+            db.session.commit()
+        return len(valid)
+
+    for line_no, row in enumerate(rows, start=1):
+        row_errors = caravan_row_errors(row)
+        if row_errors:
+            errors.append((line_no, ' '.join(row_errors)))
+            continue
+        chunk.append((line_no, {
+            'host_id': int(row['host_id']),
+            'name': row['name'].strip(),
+            'location': row['location'].strip(),
+            'daily_rate': float(row['daily_rate']),
+            'capacity': int(row['capacity']),
+            'description': row['description'],
+            'status': CaravanStatus[row.get('status') or 'AVAILABLE'],
+        }))
+        if len(chunk) >= chunk_size:
+            imported += flush()
+            chunk = []
+    if chunk:
+        imported += flush()
+    return imported, errors
+
+
+def iter_caravan_rows(batch_size=CARAVAN_IMPORT_CHUNK):
+    """카라반을 id 순서로 batch_size건씩 나눠 읽어 dict로 내보냅니다."""
+    query = db.select(*(getattr(Caravan, name) for name in CARAVAN_EXPORT_FIELDS)).order_by(Caravan.id)
+    for row in db.session.execute(query.execution_options(yield_per=batch_size)).mappings():
+        yield {**row, 'status': row['status'].name if row['status'] else None}
+
+
+@app.cli.command('rebuild-calendar')
+def rebuild_calendar_command():
+    """확정 예약 전체로 카라반 달력 비트맵을 다시 만듭니다."""
+    rebuild_booking_calendar()
+    click.echo(f'달력 {CaravanCalendar.query.count()}개월분을 다시 만들었습니다.')
+
+
+@app.cli.command('rebuild-stats')
+def rebuild_stats_command():
+    """flask --app main rebuild-stats : 예약 요약 테이블을 검증하고 다시 계산합니다. (cron 등으로 주기 실행)"""
+    corrected = rebuild_booking_stats()
+    click.echo(f'예약 요약을 다시 계산했습니다. (불일치 {corrected}행 수정)')
+
+
+@app.cli.command('rebuild-balances')
+def rebuild_balances_command():
+    """flask --app main rebuild-balances : 잔액 스냅샷을 원장 합계와 비교해 다시 계산합니다."""
+    corrected = rebuild_balances()
+    click.echo(f'잔액 스냅샷을 검증했습니다. (불일치 {corrected}명 수정)')
+
+
+@app.cli.command('import-caravans')
+@click.argument('path')
+@click.option('--chunk-size', default=CARAVAN_IMPORT_CHUNK, show_default=True, help='트랜잭션 1회당 행 수')
+def import_caravans_command(path, chunk_size):
+    """flask --app main import-caravans fleet.csv : CSV/JSONL 카라반을 대량 등록합니다."""
+    with open(path, encoding='utf-8', newline='') as stream:
+        imported, errors = import_caravan_rows(
+            read_rows(stream, format_from_path(path)), chunk_size)
+    print(f"카라반 {imported}건 등록, {len(errors)}건 거부")
+    for line_no, message in errors[:20]:
+        print(f"  {line_no}행: {message}")
+
+
+@app.cli.command('export-caravans')
+@click.argument('path')
+def export_caravans_command(path):
+    """flask --app main export-caravans fleet.jsonl : 카라반 전체를 CSV/JSONL로 내보냅니다."""
+    with open(path, 'w', encoding='utf-8', newline='') as stream:
+        count = write_rows(stream, iter_caravan_rows(), format_from_path(path),
+                           CARAVAN_EXPORT_FIELDS)
+    print(f"카라반 {count}건 내보내기 완료")
+
+
+def ensure_schema():
+    """create_all()은 이미 존재하는 테이블을 변경하지 않으므로, 누락된 컬럼과 인덱스를 추가합니다."""
+    inspector = db.inspect(db.engine)
+    preparer = db.engine.dialect.identifier_preparer
+    added = []
+    with db.engine.begin() as conn:
+        for table in db.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {c['name'] for c in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                ddl = (f'ALTER TABLE {preparer.format_table(table)} '
+                       f'ADD COLUMN {preparer.format_column(column)} '
+                       f'{column.type.compile(db.engine.dialect)}')
+                if column.server_default is not None:
+                    ddl += f" DEFAULT {column.server_default.arg}"
+                conn.exec_driver_sql(ddl)
+                added.append(column.name)
+    # 새로 추가된 평점 합계 컬럼은 0으로 채워지므로, 기존 리뷰 개수와 맞도록 리뷰 테이블에서 다시 집계합니다.
+    # (그대로 두면 다음 리뷰부터 평균이 '합계 0 + 새 평점'으로 계산됩니다)
+    if any(name.endswith('rating_sum') for name in added):
+        rebuild_rating_aggregates()
+    # 달력 테이블이 새로 생긴 DB라면 기존 확정 예약으로 채웁니다.
+    if (db.session.query(CaravanCalendar.caravan_id).first() is None and
+            Reservation.query.filter_by(status=ReservationStatus.CONFIRMED).first()):
+        rebuild_booking_calendar()
+    # 잔액 스냅샷 컬럼이 새로 생긴 DB라면 이전 float 잔액을 원장으로 옮깁니다.
+    if 'balance_minor' in added:
+        migrate_legacy_balances()
+    # 요약 테이블이 새로 생긴 DB라면 기존 예약으로 채웁니다.
+    if (db.session.query(HostStats.host_id).first() is None and
+            db.session.query(Reservation.id).first() is not None):
+        rebuild_booking_stats()
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(db.engine, checkfirst=True)
+
+    # 기존 DB에 FTS 테이블이 없으면 만들고 현재 카라반 데이터로 채웁니다.
+    if fts_enabled() and not db.inspect(db.engine).has_table('caravan_fts'):
+        with db.engine.begin() as conn:
+            create_caravan_fts(Caravan.__table__, conn)
+            conn.exec_driver_sql(
+                "INSERT INTO caravan_fts(caravan_fts) VALUES('rebuild')")
+
+
+def fts_enabled():
+    return db.engine.dialect.name == 'sqlite'
+
+
+def fts_match_expression(text):
+    """검색어를 FTS5 MATCH 식으로 변환합니다. 각 단어는 접두어 검색, 단어 사이는 AND입니다.
+    ('서울 마포' -> '"서울"* "마포"*', 단어가 없으면 None)
+    """
+    words = re.findall(r'\w+', text or '')
+    if not words:
+        return None
+    return ' '.join(f'"{word}"*' for word in words)
+
+
+# --- 예약 트랜잭션 (중복 확정 방지) ---
+
+
+class BookingConflictError(Exception):
+    """확정 예약과 기간이 겹치거나, 동시에 다른 요청이 같은 예약을 처리한 경우"""
+
+    def __init__(self, message="선택하신 기간에는 이미 확정된 예약이 있습니다."):
+        self.message = message
+        super().__init__(self.message)
+
+
+@contextmanager
+def caravan_booking_lock(caravan_id):
+    """카라반 1대의 예약 확인 + 쓰기를 하나의 트랜잭션으로 묶습니다.
+
+    SQLite는 BEGIN IMMEDIATE로 쓰기 잠금을 먼저 잡고, 그 외 DB는 카라반 행을
+    SELECT ... FOR UPDATE로 잠급니다. 블록 안에서 예외가 나면 롤백, 아니면 커밋하며
+    booking_version을 조건부로 증가시켜 잠금 없이 끼어든 쓰기도 충돌로 처리합니다.
+
+    블록의 커밋/롤백이 호출자의 다른 변경까지 함께 처리하지 않도록, 아직 커밋하지 않은
+    변경이 세션에 남아 있으면 RuntimeError를 발생시킵니다.
+    """
+    connection = db.session.connection()
+    is_sqlite = connection.dialect.name == 'sqlite'
+    if (db.session.new or db.session.dirty or db.session.deleted or
+            (is_sqlite and connection.connection.dbapi_connection.in_transaction)):
+        raise RuntimeError(
+            "caravan_booking_lock은 커밋되지 않은 변경이 없는 세션에서만 사용할 수 있습니다.")
+    if is_sqlite:
+        connection.exec_driver_sql('BEGIN IMMEDIATE')
+    try:
+        caravan = db.session.execute(
+            db.select(Caravan).where(Caravan.id == caravan_id).with_for_update(
+            ).execution_options(populate_existing=True)).scalar_one()
+        seen_version = caravan.booking_version or 0
+        yield caravan
+        bumped = db.session.execute(
+            db.update(Caravan).where(
+                Caravan.id == caravan_id,
+                db.func.coalesce(Caravan.booking_version, 0) == seen_version).values(
+                    booking_version=seen_version + 1).execution_options(
+                        synchronize_session=False))
+        if bumped.rowcount != 1:
+            raise BookingConflictError("동시에 다른 예약이 처리되었습니다. 다시 시도해 주세요.")
+        db.session.commit()
+    except BaseException:
+        db.session.rollback()
+        raise
+
+
+def calendar_masks(caravan_ids, months):
+    """{(카라반 ID, 월): 예약 비트맵}을 한 번의 쿼리로 읽습니다. (행이 없는 달은 빈 달)"""
+    rows = db.session.execute(
+        db.select(CaravanCalendar.caravan_id, CaravanCalendar.month,
+                  CaravanCalendar.booked_mask).where(
+                      CaravanCalendar.caravan_id.in_(caravan_ids),
+                      CaravanCalendar.month.in_(months)))
+    return {(caravan_id, month): mask for caravan_id, month, mask in rows}
+
+
+def has_confirmed_overlap(caravan_id, start_date, end_date):
+    """기간이 겹치는 확정(CONFIRMED) 예약이 있는지 달력 비트맵으로 확인합니다. (체크아웃 날짜는 미포함)"""
+    months = [month for month, _ in month_bitmap.night_masks(start_date, end_date)]
+    masks = {month: mask for (_, month), mask in
+             calendar_masks([caravan_id], months).items()}
+    return not month_bitmap.is_free(masks, start_date, end_date)
+
+
+def mark_booked_nights(caravan_id, start_date, end_date, booked=True):
+    """확정/해제된 예약의 밤을 달력 비트맵에 반영합니다. (caravan_booking_lock 안에서 호출)"""
+    for month, mask in month_bitmap.night_masks(start_date, end_date):
+        row = db.session.get(CaravanCalendar, (caravan_id, month))
+        if row is None:
+            row = CaravanCalendar(caravan_id=caravan_id, month=month, booked_mask=0)
+            db.session.add(row)
+        row.booked_mask = row.booked_mask | mask if booked else row.booked_mask & ~mask
+
+
+def rebuild_booking_calendar():
+    """확정 예약 전체로 달력 비트맵을 다시 만듭니다. (기존 DB 업그레이드/복구용)"""
+    masks = {}
+    confirmed = db.session.execute(
+        db.select(Reservation.caravan_id, Reservation.start_date,
+                  Reservation.end_date).where(
+                      Reservation.status == ReservationStatus.CONFIRMED))
+    for caravan_id, start_date, end_date in confirmed:
+        for month, mask in month_bitmap.night_masks(start_date, end_date):
+            masks[caravan_id, month] = masks.get((caravan_id, month), 0) | mask
+    db.session.execute(db.delete(CaravanCalendar))
+    if masks:
+        db.session.execute(db.insert(CaravanCalendar), [
+            {'caravan_id': caravan_id, 'month': month, 'booked_mask': mask}
+            for (caravan_id, month), mask in masks.items()])
+    db.session.commit()
+
+
+def create_pending_reservation(caravan_id, guest_id, start_date, end_date,
+                               total_price):
+    """확정 예약과의 겹침 확인과 예약 신청(PENDING) 저장을 원자적으로 수행합니다."""
+    with caravan_booking_lock(caravan_id) as caravan:
+        if has_confirmed_overlap(caravan_id, start_date, end_date):
+            raise BookingConflictError(
+                "선택하신 기간에는 이미 확정된 예약이 있어 신청할 수 없습니다.")
+        reservation = Reservation(caravan_id=caravan_id,
+                                  guest_id=guest_id,
+                                  start_date=start_date,
+                                  end_date=end_date,
+                                  total_price=total_price,
+                                  status=ReservationStatus.PENDING)
+        db.session.add(reservation)
+        record_booking_stats(caravan.host_id, reservation, pending=1)
+    return reservation
+
+
+def confirm_reservation(reservation_id):
+    """승인 대기 예약을 확정합니다. 상태 재확인 + 겹침 확인 + 확정을 원자적으로 수행합니다."""
+    caravan_id = db.session.execute(
+        db.select(Reservation.caravan_id).where(
+            Reservation.id == reservation_id)).scalar_one()
+    with caravan_booking_lock(caravan_id) as caravan:
+        reservation = db.session.execute(
+            db.select(Reservation).where(
+                Reservation.id == reservation_id).execution_options(
+                    populate_existing=True)).scalar_one()
+        if reservation.status != ReservationStatus.PENDING:
+            raise BookingConflictError('이미 처리되었거나 취소된 예약입니다.')
+        if has_confirmed_overlap(caravan_id, reservation.start_date,
+                                 reservation.end_date):
+            raise BookingConflictError('같은 기간에 이미 확정된 예약이 있어 승인할 수 없습니다.')
+        reservation.status = ReservationStatus.CONFIRMED
+        mark_booked_nights(caravan_id, reservation.start_date, reservation.end_date)
+        record_booking_stats(caravan.host_id, reservation, pending=-1, booked=1)
+    return reservation
+
+
+def cancel_pending_reservation(reservation_id):
+    """승인 대기 예약을 거절(CANCELLED)합니다. 상태 재확인 + 거절 + 요약 집계 갱신을 원자적으로 수행합니다."""
+    caravan_id = db.session.execute(
+        db.select(Reservation.caravan_id).where(
+            Reservation.id == reservation_id)).scalar_one()
+    with caravan_booking_lock(caravan_id) as caravan:
+        reservation = db.session.execute(
+            db.select(Reservation).where(
+                Reservation.id == reservation_id).execution_options(
+                    populate_existing=True)).scalar_one()
+        if reservation.status != ReservationStatus.PENDING:
+            raise BookingConflictError('이미 처리되었거나 취소된 예약입니다.')
+        reservation.status = ReservationStatus.CANCELLED
+        caravan.status = CaravanStatus.AVAILABLE
+        record_booking_stats(caravan.host_id, reservation, pending=-1)
+    return reservation
+
+
+def complete_confirmed_reservation(reservation_id):
+    """확정 예약을 완료 처리하고, 남은 밤을 달력에서 해제합니다. (확정 예약만 날짜를 차지함)"""
+    caravan_id = db.session.execute(
+        db.select(Reservation.caravan_id).where(
+            Reservation.id == reservation_id)).scalar_one()
+    with caravan_booking_lock(caravan_id):
+        reservation = db.session.execute(
+            db.select(Reservation).where(
+                Reservation.id == reservation_id).execution_options(
+                    populate_existing=True)).scalar_one()
+        if reservation.status != ReservationStatus.CONFIRMED:
+            raise BookingConflictError('확정되지 않은 예약은 완료할 수 없습니다.')
+        reservation.status = ReservationStatus.COMPLETED
+        mark_booked_nights(caravan_id, reservation.start_date, reservation.end_date,
+                           booked=False)
+    return reservation
+
+
+# --- 호스트/카라반 예약 요약 (대시보드용 집계 테이블) ---
+# 완료(COMPLETED)는 확정 예약의 숙박/매출을 그대로 유지하므로 요약 값이 바뀌지 않습니다.
+
+BOOKED_STATUSES = (ReservationStatus.CONFIRMED, ReservationStatus.COMPLETED)
+STATS_COUNTERS = ('bookings', 'nights_booked', 'revenue', 'pending_count')
+
+
+def nights_by_year(start_date, end_date):
+    """[start_date, end_date) 숙박의 밤 수를 연도별로 나눕니다. ({2030: 2, 2031: 1})"""
+    nights = {}
+    for year in range(start_date.year, end_date.year + 1):
+        count = (min(end_date, date(year + 1, 1, 1)) - max(start_date, date(year, 1, 1))).days
+        if count > 0:
+            nights[year] = count
+    return nights
+
+
+def booking_stats_deltas(reservation, pending=0, booked=0):
+    """예약 1건의 상태 변화를 {연도: {컬럼: 증감}}으로 바꿉니다."""
+    deltas = {reservation.start_date.year: {
+        'pending_count': pending,
+        'bookings': booked,
+        'revenue': booked * reservation.total_price,
+    }}
+    if booked:
+        for year, nights in nights_by_year(reservation.start_date,
+                                           reservation.end_date).items():
+            deltas.setdefault(year, {})['nights_booked'] = booked * nights
+    return deltas
+
+
+# INSERT ... ON CONFLICT DO UPDATE를 지원하는 방언 (SQLite 3.24+, PostgreSQL 9.5+)
+UPSERT_INSERTS = {'sqlite': sqlite.insert, 'postgresql': postgresql.insert}
+
+
+def increment_stats(model, keys, delta, extra=None):
+    """요약 행의 컬럼을 SQL에서 원자적으로 증감하고, 행이 없으면 새로 만듭니다.
+
+    한 문장의 upsert(INSERT ... ON CONFLICT DO UPDATE)이므로 같은 (키, 연도)의 첫 예약이
+    동시에 들어와도 두 트랜잭션이 모두 INSERT를 시도하다 기본 키 충돌로 실패하지 않습니다.
+    """
+    delta = {column: value for column, value in delta.items() if value}
+    if not delta:
+        return
+    increments = {column: getattr(model, column) + value for column, value in delta.items()}
+    row = {column: 0 for column in STATS_COUNTERS} | keys | (extra or {}) | delta
+    upsert_insert = UPSERT_INSERTS.get(db.session.get_bind().dialect.name)
+    if upsert_insert is not None:
+        db.session.execute(upsert_insert(model).values(row).on_conflict_do_update(
+            index_elements=list(keys), set_=increments))
+        return
+    # 그 밖의 방언: UPDATE 후 행이 없으면 INSERT
+    updated = db.session.execute(
+        db.update(model).where(*(getattr(model, key) == value
+                                 for key, value in keys.items())).values(
+            increments).execution_options(synchronize_session=False))
+    if updated.rowcount == 0:
+        db.session.execute(db.insert(model).values(row))
+
+
+def record_booking_stats(host_id, reservation, pending=0, booked=0):
+    """예약 신청/승인/거절을 카라반·호스트 요약에 반영합니다. (caravan_booking_lock 안에서 호출)"""
+    for year, delta in booking_stats_deltas(reservation, pending, booked).items():
+        increment_stats(CaravanStats,
+                        {'caravan_id': reservation.caravan_id, 'year': year},
+                        delta, extra={'host_id': host_id})
+        increment_stats(HostStats, {'host_id': host_id, 'year': year}, delta)
+
+
+def rebuild_booking_stats():
+    """예약 테이블 전체로 요약 테이블을 다시 계산합니다. (주기적 검증/복구용, flask rebuild-stats)"""
+    caravan_rows, host_rows = {}, {}
+    reservations = db.session.execute(
+        db.select(Reservation, Caravan.host_id).join(Reservation.caravan).where(
+            Reservation.status.in_((ReservationStatus.PENDING, *BOOKED_STATUSES))))
+    for reservation, host_id in reservations:
+        booked = reservation.status in BOOKED_STATUSES
+        deltas = booking_stats_deltas(reservation, pending=int(not booked), booked=int(booked))
+        for year, delta in deltas.items():
+            for rows, key, keys in (
+                    (caravan_rows, (reservation.caravan_id, year),
+                     {'caravan_id': reservation.caravan_id, 'host_id': host_id, 'year': year}),
+                    (host_rows, (host_id, year), {'host_id': host_id, 'year': year})):
+                row = rows.setdefault(key, {column: 0 for column in STATS_COUNTERS} | keys)
+                for column, value in delta.items():
+                    row[column] += value
+    corrected = (stats_drift(CaravanStats, ('caravan_id', 'year'), caravan_rows) +
+                 stats_drift(HostStats, ('host_id', 'year'), host_rows))
+    db.session.execute(db.delete(CaravanStats))
+    db.session.execute(db.delete(HostStats))
+    if caravan_rows:
+        db.session.execute(db.insert(CaravanStats), list(caravan_rows.values()))
+        db.session.execute(db.insert(HostStats), list(host_rows.values()))
+    db.session.commit()
+    if corrected:
+        app.logger.warning('예약 요약 %d행이 예약 테이블과 달라 다시 계산했습니다.', corrected)
+    return corrected
+
+
+def stats_drift(model, key_columns, expected):
+    """저장된 요약 행 중 다시 계산한 값(expected)과 다른 행 수 (없어야 할 행/빠진 행 포함)"""
+    stored = {
+        tuple(getattr(stats, column) for column in key_columns):
+        tuple(getattr(stats, column) for column in STATS_COUNTERS)
+        for stats in model.query
+    }
+    keys = stored.keys() | expected.keys()
+    zero = (0,) * len(STATS_COUNTERS)
+    return sum(
+        stored.get(key, zero) != tuple(expected[key][column] for column in STATS_COUNTERS)
+        if key in expected else stored[key] != zero
+        for key in keys)
+
+
+def days_in_year(year):
+    return (date(year + 1, 1, 1) - date(year, 1, 1)).days
+
+
+def stats_to_dict(stats, year, caravan_count=1):
+    """요약 행(없으면 0)을 JSON/템플릿용 dict로 바꿉니다. occupancy_rate는 그 해 전체 밤 대비 예약된 밤(%)"""
+    values = {column: getattr(stats, column) if stats else 0 for column in STATS_COUNTERS}
+    capacity = caravan_count * days_in_year(year)
+    values['occupancy_rate'] = round(values['nights_booked'] * 100 / capacity, 1) if capacity else 0.0
+    values['year'] = year
+    return values
+
+
+def host_stats_summary(host_id, year):
+    """대시보드 요약: 호스트 요약 행(연도별 1행)과 카라반 수를 읽습니다.
+
+    예약 테이블은 읽지 않으므로 예약 수와 관계없고, 비용은 호스트의 요약 연도 수(host_stats 행)와
+    카라반 수(host_id 인덱스 COUNT)에 비례합니다.
+
+    승인 대기(pending_count)는 체크인 연도와 관계없이 지금 처리해야 할 건수이므로 모든 연도의 합계입니다.
+    """
+    rows = {stats.year: stats for stats in HostStats.query.filter_by(host_id=host_id)}
+    caravan_count = db.session.scalar(
+        db.select(db.func.count(Caravan.id)).where(Caravan.host_id == host_id))
+    summary = stats_to_dict(rows.get(year), year, caravan_count)
+    summary['pending_count'] = sum(stats.pending_count for stats in rows.values())
+    summary['caravan_count'] = caravan_count
+    return summary
+
+
+# --- 잔액 원장 ---
+# 충전마다 원장에 한 줄을 추가하고, 같은 트랜잭션에서 user.balance_minor를 SQL(balance_minor + n)로 증감합니다.
+# 잔액 조회는 스냅샷 컬럼 하나만 읽으므로 원장 길이와 관계없이 O(1)입니다.
+
+
+def to_minor_units(amount):
+    """금액(문자열/숫자)을 보조 통화 단위 정수로 바꿉니다. 숫자가 아니거나 보조 단위보다 작은 금액이면 ValueError"""
+    try:
+        value = Decimal(str(amount)) * BALANCE_MINOR_UNITS
+    except (InvalidOperation, TypeError):
+        raise ValueError(f'금액이 숫자가 아닙니다: {amount}')
+    if not value.is_finite() or value != value.to_integral_value():
+        raise ValueError(f'{Decimal(1) / BALANCE_MINOR_UNITS}원 단위로 입력해 주세요: {amount}')
+    return int(value)
+
+
+def post_balance_entry(user_id, amount_minor, entry_type, actor_id=None):
+    """원장에 한 줄을 추가하고 잔액 스냅샷을 원자적으로 증감한 뒤 새 잔액(보조 단위)을 반환합니다. (커밋은 호출하는 쪽에서)
+
+    UPDATE가 먼저 사용자 행(SQLite는 DB) 쓰기 잠금을 잡으므로, 동시에 충전해도 잔액 증감과 balance_after가 순서대로 기록됩니다.
+    """
+    updated = db.session.execute(
+        db.update(User).where(User.id == user_id).values(
+            balance_minor=User.balance_minor + amount_minor).execution_options(
+                synchronize_session=False))
+    if updated.rowcount == 0:
+        raise ValueError(f'존재하지 않는 사용자입니다: {user_id}')
+    balance_after = db.session.scalar(db.select(User.balance_minor).where(User.id == user_id))
+    db.session.add(BalanceLedger(user_id=user_id, amount_minor=amount_minor,
+                                 balance_after_minor=balance_after,
+                                 entry_type=entry_type, actor_id=actor_id))
+    return balance_after
+
+
+def migrate_legacy_balances():
+    """이전 float 잔액(balance 컬럼)을 원장의 opening 항목과 잔액 스냅샷으로 옮깁니다. (원 단위 미만은 반올림)"""
+    migrated = 0
+    for user in User.query.filter(User.legacy_balance != 0, User.balance_minor == 0).all():
+        if db.session.query(BalanceLedger.id).filter_by(user_id=user.id).first() is not None:
+            continue
+        amount_minor = int((Decimal(repr(user.legacy_balance)) * BALANCE_MINOR_UNITS).quantize(Decimal(1)))
+        post_balance_entry(user.id, amount_minor, 'opening')
+        migrated += 1
+    db.session.commit()
+    return migrated
+
+
+def rebuild_balances():
+    """원장 합계로 잔액 스냅샷을 검증하고, 다른 사용자만 고친 뒤 고친 사용자 수를 반환합니다. (flask rebuild-balances)"""
+    totals = dict(db.session.execute(
+        db.select(BalanceLedger.user_id, db.func.sum(BalanceLedger.amount_minor)).group_by(
+            BalanceLedger.user_id)).all())
+    drifted = [(user_id, totals.get(user_id, 0)) for user_id, balance_minor in db.session.execute(
+        db.select(User.id, User.balance_minor)) if balance_minor != totals.get(user_id, 0)]
+    for user_id, expected in drifted:
+        db.session.execute(db.update(User).where(User.id == user_id).values(
+            balance_minor=expected).execution_options(synchronize_session=False))
+    db.session.commit()
+    if drifted:
+        app.logger.warning('잔액 스냅샷 %d건이 원장 합계와 달라 다시 계산했습니다.', len(drifted))
+    return len(drifted)
+
+
+def filter_available_caravans(query, start_date, end_date):
+    """기간 내 확정(CONFIRMED) 예약이 있는 카라반을 안티 조인(NOT EXISTS) 한 번으로 제외합니다."""
+    conflicting = db.select(Reservation.id).where(
+        Reservation.caravan_id == Caravan.id,
+        Reservation.status == ReservationStatus.CONFIRMED,
+        Reservation.start_date < end_date,
+        Reservation.end_date > start_date).exists()
+    return query.filter(~conflicting)
+
+
+def parse_date_range(start_str, end_str):
+    """YYYY-MM-DD 문자열 두 개를 날짜로 변환합니다. 둘 다 비어 있으면 (None, None)을 반환합니다."""
+    if not start_str and not end_str:
+        return None, None
+    try:
+        start_date = datetime.strptime(start_str or '', '%Y-%m-%d').date()
+        end_date = datetime.strptime(end_str or '', '%Y-%m-%d').date()
+    except ValueError:
+        raise ValueError("날짜는 YYYY-MM-DD 형식으로 입력해 주세요.")
+    if end_date <= start_date:
+        raise ValueError("종료일은 시작일보다 늦어야 합니다.")
+    return start_date, end_date
+
+
+def caravan_search_query(location=None, start_date=None, end_date=None):
+    """위치(LIKE)/날짜 조건으로 카라반 검색 쿼리를 만듭니다. (정렬/페이지는 paginate_by_id에서 적용)"""
+    query = Caravan.query
+    if location:
+        query = query.filter(Caravan.location.contains(location))
+    if start_date and end_date:
+        query = filter_available_caravans(query, start_date, end_date)
+    return query
+
+
+def paginate_by_id(query, model, after_id, page_size):
+    """키셋(커서) 페이지네이션: OFFSET 대신 id > after_id 조건을 쓰므로 몇 번째 페이지든 비용이 같습니다.
+
+    (items, 다음 페이지 커서)를 반환하며, 마지막 페이지면 커서는 None입니다.
+    """
+    if after_id is not None:
+        query = query.filter(model.id > after_id)
+    rows = query.order_by(model.id).limit(page_size + 1).all()
+    if len(rows) > page_size:
+        return rows[:page_size], rows[page_size - 1].id
+    return rows, None
+
+
+def search_caravan_page(location, start_date, end_date, after, page_size):
+    """검색 조건에 맞는 카라반 한 페이지와 다음 페이지 커서(문자열, 없으면 None)를 반환합니다.
+
+    위치 검색어가 있고 FTS를 쓸 수 있으면 관련도(bm25) 순으로 정렬하며 커서는 '순위:id',
+    그 외에는 id 순이며 커서는 'id'입니다. 잘못된 커서는 ValueError가 발생합니다.
+    """
+    match = fts_match_expression(location) if fts_enabled() else None
+    if match is None:
+        query = caravan_search_query(location, start_date, end_date)
+        after_id = int(after) if after else None
+        caravans, next_after = paginate_by_id(query, Caravan, after_id,
+                                              page_size)
+        return caravans, None if next_after is None else str(next_after)
+
+    matches = db.select(caravan_fts.c.rowid.label('caravan_id'),
+                        caravan_fts.c.rank.label('rank')).where(
+                            caravan_fts.c.caravan_fts.op('MATCH')(
+                                match)).subquery()
+    query = caravan_search_query(None, start_date, end_date).join(
+        matches, matches.c.caravan_id == Caravan.id).add_columns(matches.c.rank)
+    if after:
+        rank, _, after_id = after.rpartition(':')
+        rank, after_id = float(rank), int(after_id)
+        query = query.filter(
+            db.or_(matches.c.rank > rank,
+                   db.and_(matches.c.rank == rank, Caravan.id > after_id)))
+    rows = query.order_by(matches.c.rank,
+                          Caravan.id).limit(page_size + 1).all()
+    caravans = [caravan for caravan, _ in rows[:page_size]]
+    if len(rows) > page_size:
+        last_caravan, last_rank = rows[page_size - 1]
+        return caravans, f'{last_rank!r}:{last_caravan.id}'
+    return caravans, None
+
+
+def requested_page_size():
+    """per_page 쿼리 파라미터를 1 ~ MAX_PAGE_SIZE 범위로 제한해 반환합니다."""
+    page_size = request.args.get('per_page',
+                                 app.config['SEARCH_PAGE_SIZE'],
+                                 type=int)
+    return max(1, min(page_size, MAX_PAGE_SIZE))
+
+
+def caravan_to_dict(caravan):
+    """API 응답용 카라반 요약 정보"""
+    return {
+        'id': caravan.id,
+        'name': caravan.name,
+        'location': caravan.location,
+        'daily_rate': caravan.daily_rate,
+        'capacity': caravan.capacity,
+        'status': caravan.status.value if caravan.status else None,
+        'average_rating': caravan.average_rating,
+        'review_count': caravan.review_count,
+    }
 
 
 # --- 4. 라우트 정의 ---
@@ -378,48 +1325,193 @@ def logout():
 @app.route('/dashboard')
 @login_required
 def dashboard():
-    # ... (기존 코드 유지)
-    return render_template('dashboard.html', title='대시보드', user=current_user)
+    # 호스트는 올해 예약 요약(요약 테이블 조회)을 함께 표시
+    stats = None
+    if current_user.user_role == UserRole.HOST:
+        stats = host_stats_summary(current_user.id, date.today().year)
+    return render_template('dashboard.html', title='대시보드', user=current_user,
+                           stats=stats)
 
 
 @app.route('/caravans/search', methods=['GET', 'POST'])
 @login_required
 def search_caravans():
-    # ... (기존 코드 유지)
+    """카라반 검색 (POST: 검색 폼 제출, GET: 전체 목록 또는 ?after= 다음 페이지)"""
     form = CaravanSearchForm()
-    caravans = []
+    page_size = requested_page_size()
+    after = request.args.get('after')
 
     if form.validate_on_submit():
         location_query = form.location.data
-        caravans = Caravan.query.filter(
-            Caravan.location.contains(location_query)).all()
-        flash(f"'{location_query}' 지역에서 {len(caravans)}개의 카라반을 찾았습니다.", 'info')
-
+        start_str, end_str = form.start_date.data, form.end_date.data
+        flash(f"'{location_query}' 지역 검색 결과입니다.", 'info')
     else:
-        all_caravans = Caravan.query.all()
-        caravans = all_caravans
-
-        print(f"--- [DEBUG] DB 조회 결과: 총 {len(all_caravans)}개 ---")
-        if all_caravans:
-            print(
-                f"첫 번째 카라반: ID={all_caravans[0].id}, 이름={all_caravans[0].name}, 위치={all_caravans[0].location}"
-            )
+        location_query = request.args.get('location', '')
+        start_str = request.args.get('start_date', '')
+        end_str = request.args.get('end_date', '')
+        if request.method == 'GET':
+            form.location.data = location_query
+            form.start_date.data = start_str
+            form.end_date.data = end_str
+
+    # 체크인/체크아웃 날짜가 올바르면 해당 기간에 예약 가능한 카라반만 조회
+    try:
+        start_date, end_date = parse_date_range(start_str, end_str)
+    except ValueError as e:
+        start_date = end_date = None
+        start_str = end_str = ''
+        flash(f"{e} 날짜 조건 없이 검색합니다.", 'warning')
+
+    try:
+        caravans, next_after = search_caravan_page(location_query, start_date,
+                                                   end_date, after, page_size)
+    except ValueError:
+        # 잘못된 커서는 첫 페이지로 처리
+        caravans, next_after = search_caravan_page(location_query, start_date,
+                                                   end_date, None, page_size)
+
+    next_url = None
+    if next_after is not None:
+        params = {'location': location_query, 'start_date': start_str,
+                  'end_date': end_str, 'per_page': request.args.get('per_page')}
+        next_url = url_for('search_caravans', after=next_after,
+                           **{k: v for k, v in params.items() if v})
 
     return render_template('search_caravans.html',
                            title='카라반 검색',
                            form=form,
-                           caravans=caravans)
+                           caravans=caravans,
+                           next_url=next_url)
+
+
+@app.route('/api/caravans/search', methods=['GET'])
+@login_required
+def search_caravans_api():
+    """
+    카라반 검색 JSON API (키셋 페이지네이션)
+    GET /api/caravans/search?location=서울&start_date=2025-12-01&end_date=2025-12-03&per_page=50&after=120
+
+    - 기본: {"items": [...], "next_cursor": "170"} 한 페이지를 반환 (다음 요청은 after=next_cursor)
+    - location이 있으면 FTS 관련도 순(커서는 '순위:id'), 없으면 id 순
+    - stream=1: 모든 페이지를 한 줄에 한 페이지씩 NDJSON으로 스트리밍
+    """
+    try:
+        start_date, end_date = parse_date_range(request.args.get('start_date'),
+                                                request.args.get('end_date'))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    location = request.args.get('location')
+    page_size = requested_page_size()
+    after = request.args.get('after')
+
+    def page_json(cursor):
+        caravans, next_cursor = search_caravan_page(location, start_date,
+                                                    end_date, cursor, page_size)
+        return {"items": [caravan_to_dict(c) for c in caravans],
+                "next_cursor": next_cursor}
+
+    try:
+        first_page = page_json(after)
+    except ValueError:
+        return jsonify({"error": "유효하지 않은 커서입니다."}), 400
+
+    if not request.args.get('stream', type=int):
+        return jsonify(first_page)
+
+    def generate_pages():
+        page = first_page
+        while True:
+            yield json.dumps(page, ensure_ascii=False) + '\n'
+            if page["next_cursor"] is None:
+                break
+            page = page_json(page["next_cursor"])
+
+    return app.response_class(stream_with_context(generate_pages()),
+                              mimetype='application/x-ndjson')
+
+
+@app.route('/api/caravans/calendar', methods=['GET'])
+@login_required
+def caravan_calendar_api():
+    """
+    여러 카라반의 한 달 예약 현황 JSON API (달력 비트맵 1회 조회)
+    GET /api/caravans/calendar?month=2030-01&ids=1,2,3
+
+    {"month": "2030-01", "days": 31,
+     "caravans": [{"id": 1, "booked_days": [3, 4], "free_nights": 29}, ...]}
+    """
+    try:
+        month = datetime.strptime(request.args.get('month', ''), '%Y-%m').date()
+        ids = [int(i) for i in request.args.get('ids', '').split(',') if i.strip()]
+    except ValueError:
+        return jsonify({"error": "month=YYYY-MM, ids=1,2,3 형식으로 요청해 주세요."}), 400
+    if not 1 <= len(ids) <= MAX_PAGE_SIZE:
+        return jsonify({"error": f"카라반 ID는 1개 이상 {MAX_PAGE_SIZE}개 이하로 요청해 주세요."}), 400
+
+    existing = db.session.scalars(
+        db.select(Caravan.id).where(Caravan.id.in_(ids)).order_by(Caravan.id)).all()
+    masks = calendar_masks(existing, [month])
+    return jsonify({
+        "month": month.strftime('%Y-%m'),
+        "days": month_bitmap.days_in_month(month),
+        "caravans": [{
+            "id": caravan_id,
+            "booked_days": month_bitmap.booked_days(masks.get((caravan_id, month), 0)),
+            "free_nights": month_bitmap.free_nights(month, masks.get((caravan_id, month), 0)),
+        } for caravan_id in existing],
+    })
+
+
+@app.route('/api/quotes', methods=['POST'])
+@login_required
+def quotes_api():
+    """
+    여러 (카라반, 기간)의 가격 견적을 한 번에 계산하는 JSON API
+    POST /api/quotes  {"quotes": [{"caravan_id": 1, "start_date": "2030-01-01", "end_date": "2030-01-08"}, ...]}
+
+    응답: {"quotes": [{"caravan_id": 1, "nights": 7, "base_price": 350000, "discount": 35000,
+                       "total_price": 315000}, ...]} (요청 순서 유지)
+    """
+    items = (request.get_json(silent=True) or {}).get('quotes')
+    if not isinstance(items, list) or not 1 <= len(items) <= MAX_QUOTES_PER_REQUEST:
+        return jsonify({"error": f"quotes는 1개 이상 {MAX_QUOTES_PER_REQUEST}개 이하의 목록이어야 합니다."}), 400
+    try:
+        stays = [(int(item['caravan_id']),
+                  *parse_date_range(item['start_date'], item['end_date']))
+                 for item in items]
+    except (KeyError, TypeError, ValueError):
+        return jsonify({"error": "각 항목에는 caravan_id, start_date, end_date(YYYY-MM-DD)가 필요합니다."}), 400
+
+    rates = dict(db.session.execute(
+        db.select(Caravan.id, Caravan.daily_rate).where(
+            Caravan.id.in_({caravan_id for caravan_id, _, _ in stays}))).all())
+    missing = sorted({caravan_id for caravan_id, _, _ in stays} - rates.keys())
+    if missing:
+        return jsonify({"error": f"존재하지 않는 카라반입니다: {missing}"}), 404
+
+    quotes = pricing_engine.quote_many(
+        (round(rates[caravan_id]), start_date, end_date)
+        for caravan_id, start_date, end_date in stays)
+    return jsonify({"quotes": [
+        {"caravan_id": caravan_id, "nights": q.nights, "base_price": q.base_price,
+         "discount": q.discount, "total_price": q.total_price}
+        for (caravan_id, _, _), q in zip(stays, quotes)]})
 
 
 @app.route('/caravans/<int:caravan_id>', methods=['GET'])
 def caravan_detail(caravan_id):
-    """카라반 상세 정보를 보여주는 라우트"""
-    caravan = Caravan.query.get_or_404(caravan_id)
+    """카라반 상세 정보를 보여주는 라우트 (카라반 정보와 페이지 조각은 detail_cache에서 읽음)"""
+    detail = detail_cache.get_or_load(caravan_detail_key(caravan_id),
+                                      lambda: load_caravan_detail(caravan_id))
+    if detail is None:
+        abort(404)
     form = ReservationForm()
 
     return render_template('caravan_detail.html',
-                           title=f"{caravan.name} 상세 정보",
-                           caravan=caravan,
+                           title=f"{detail['caravan']['name']} 상세 정보",
+                           caravan=detail['caravan'],
+                           fragments=detail['fragments'],
                            form=form)
 
 
@@ -434,33 +1526,17 @@ def reserve_caravan(caravan_id):
         start_date = form.start_date.data
         end_date = form.end_date.data
 
-        # 🚨 [핵심 로직] 중복 예약 확인
-        conflicting_reservations = Reservation.query.filter(
-            Reservation.caravan_id == caravan_id,
-            Reservation.status == ReservationStatus.CONFIRMED,
-            Reservation.start_date < end_date, Reservation.end_date
-            > start_date).count()
+        # 가격 계산 (체크아웃 날짜 미포함, 장기 숙박 할인 등은 가격 엔진 규칙을 따름)
+        total_price = quote_stay(caravan.daily_rate, start_date, end_date).total_price
 
-        if conflicting_reservations > 0:
-            flash("선택하신 기간에는 이미 확정된 예약이 있어 신청할 수 없습니다.", 'danger')
+        # 🚨 [핵심 로직] 중복 예약 확인 + 저장을 하나의 잠금 트랜잭션으로 처리
+        try:
+            create_pending_reservation(caravan_id, current_user.id, start_date,
+                                       end_date, total_price)
+        except BookingConflictError as e:
+            flash(e.message, 'danger')
             return redirect(url_for('caravan_detail', caravan_id=caravan_id))
 
-        # 가격 계산
-        duration_days = (end_date - start_date).days
-        total_price = duration_days * caravan.daily_rate
-
-        # Reservation 객체 생성 및 DB 저장
-        new_reservation = Reservation(
-            caravan_id=caravan_id,
-            guest_id=current_user.id,
-            start_date=start_date,
-            end_date=end_date,
-            total_price=total_price,
-            status=ReservationStatus.PENDING  # 일단 승인 대기로 저장
-        )
-        db.session.add(new_reservation)
-        db.session.commit()
-
         flash(f"예약 신청이 완료되었습니다. 총 {total_price:,.0f} KRW이며, 호스트 승인 대기 중입니다.",
               'success')
         return redirect(url_for('reservations_guest'))
@@ -483,18 +1559,20 @@ def reservations_guest():
 @app.route('/reservations/host', methods=['GET'])
 @login_required
 def reservations_host():
-    # ... (기존 코드 유지)
-    host_caravan_ids = [c.id for c in current_user.caravans]
-
-    if not host_caravan_ids:
+    """호스트 예약 관리 라우트 (예약 + 카라반 + 게스트를 조인 쿼리 1회로 조회)"""
+    host_reservations = Reservation.query.join(Reservation.caravan).filter(
+        Caravan.host_id == current_user.id).options(
+            db.contains_eager(Reservation.caravan),
+            db.joinedload(Reservation.guest)).order_by(
+                Reservation.start_date).all()
+
+    if not host_reservations and not db.session.query(
+            Caravan.query.filter_by(host_id=current_user.id).exists()).scalar():
         flash("등록된 카라반이 없습니다. 먼저 카라반을 등록해주세요.", 'warning')
         return render_template('reservations_host.html',
                                title='예약 관리 (호스트)',
                                reservations=[])
 
-    host_reservations = Reservation.query.filter(
-        Reservation.caravan_id.in_(host_caravan_ids)).all()
-
     return render_template('reservations_host.html',
                            title='예약 관리 (호스트)',
                            reservations=host_reservations)
@@ -512,6 +1590,7 @@ def edit_profile():
         current_user.name = form.name.data
         current_user.contact = form.contact.data
         db.session.commit()
+        invalidate_host_caravan_details(current_user.id)
         flash('프로필 정보가 업데이트되었습니다.', 'success')
         return redirect(url_for('dashboard'))
 
@@ -536,6 +1615,7 @@ def register_caravan():
                           description=form.description.data)
         db.session.add(caravan)
         db.session.commit()
+        invalidate_caravan_details(caravan.id)
         flash('카라반 등록이 완료되었습니다.', 'success')
         return redirect(url_for('dashboard'))
 
@@ -556,9 +1636,11 @@ def approve_reservation(reservation_id):
     if reservation.status != ReservationStatus.PENDING:
         flash('이미 처리되었거나 취소된 예약입니다.', 'warning')
     else:
-        reservation.status = ReservationStatus.CONFIRMED
-        db.session.commit()
-        flash(f'예약 #{reservation_id}가 승인되었습니다.', 'success')
+        try:
+            confirm_reservation(reservation_id)
+            flash(f'예약 #{reservation_id}가 승인되었습니다.', 'success')
+        except BookingConflictError as e:
+            flash(e.message, 'warning')
 
     return redirect(url_for('reservations_host'))
 
@@ -576,9 +1658,11 @@ def reject_reservation(reservation_id):
     if reservation.status != ReservationStatus.PENDING:
         flash('이미 처리되었거나 취소된 예약입니다.', 'warning')
     else:
-        reservation.status = ReservationStatus.CANCELLED
-        reservation.caravan.status = CaravanStatus.AVAILABLE
-        db.session.commit()
+        try:
+            cancel_pending_reservation(reservation_id)
+            invalidate_caravan_details(reservation.caravan_id)
+        except BookingConflictError as e:
+            flash(e.message, 'warning')
 
     return redirect(url_for('reservations_host'))
 
@@ -597,11 +1681,13 @@ def complete_reservation(reservation_id):
     if reservation.status != ReservationStatus.CONFIRMED:
         flash('확정되지 않은 예약은 완료할 수 없습니다.', 'warning')
     else:
-        # 거래 완료 상태로 변경
-        reservation.status = ReservationStatus.COMPLETED
-        db.session.commit()
-        flash(f'예약 #{reservation_id}가 완료 상태로 변경되었습니다. 이제 게스트는 리뷰를 작성할 수 있습니다.',
-              'success')
+        # 거래 완료 상태로 변경 (달력 비트맵도 같은 트랜잭션에서 갱신)
+        try:
+            complete_confirmed_reservation(reservation_id)
+            flash(f'예약 #{reservation_id}가 완료 상태로 변경되었습니다. 이제 게스트는 리뷰를 작성할 수 있습니다.',
+                  'success')
+        except BookingConflictError as e:
+            flash(e.message, 'warning')
 
     return redirect(url_for('reservations_host'))
 
@@ -644,10 +1730,10 @@ def write_review(reservation_id):
         # 4. 리뷰 작성 완료 플래그 설정
         reservation.guest_reviewed = True
 
-        db.session.commit()  # 리뷰 객체와 플래그를 DB에 먼저 저장
-
-        # 5. 평점 업데이트 로직 실행 (호스트의 평점 업데이트)
-        update_user_rating(reviewed_host.id, is_host_rating=True)
+        # 5. 호스트/카라반 평점 집계 반영 후 리뷰와 함께 한 번에 커밋
+        record_review_rating(new_review)
+        db.session.commit()
+        invalidate_host_caravan_details(reviewed_host.id)
 
         flash("리뷰가 성공적으로 제출되었습니다!", 'success')
         return redirect(url_for('reservations_guest'))
@@ -668,25 +1754,26 @@ def deposit():
 
     if request.method == 'POST':
         try:
-            # 폼 데이터에서 'amount' 값을 가져와 float형으로 변환합니다.
-            amount = float(request.form.get('amount'))
+            # 폼 데이터의 'amount'를 float을 거치지 않고 보조 통화 단위 정수로 변환합니다.
+            amount_minor = to_minor_units(request.form.get('amount'))
 
             # 금액이 양수인지 검증합니다.
-            if amount <= 0:
+            if amount_minor <= 0:
                 flash('충전 금액은 양수여야 합니다.', 'danger')
                 return redirect(url_for('dashboard'))
 
-            # 현재 사용자의 잔액을 업데이트하고 DB에 커밋합니다.
-            current_user.balance += amount
+            # 원장 기록 + 잔액 스냅샷 증감(SQL)을 한 트랜잭션으로 커밋합니다. (동시 충전에도 유실 없음)
+            post_balance_entry(current_user.id, amount_minor, 'deposit', actor_id=current_user.id)
             db.session.commit()
 
             # 성공 메시지를 띄우고 대시보드로 리다이렉트합니다.
             # 금액에 콤마를 넣어 더 보기 좋게 만듭니다.
+            amount = Decimal(amount_minor) / BALANCE_MINOR_UNITS
             flash(f'잔액이 성공적으로 충전되었습니다. 충전 금액: ₩{amount:,.0f}', 'success')
             return redirect(url_for('dashboard'))
 
         except ValueError:
-            # 숫자가 아닌 값이 입력된 경우
+            # 숫자가 아니거나 원 단위 미만의 값이 입력된 경우
             flash('유효한 금액(숫자)을 입력해 주세요.', 'danger')
         except Exception as e:
             # 기타 DB 또는 서버 오류 발생 시
@@ -697,6 +1784,41 @@ def deposit():
     return redirect(url_for('dashboard'))
 
 
+@app.route('/api/stats/host', methods=['GET'])
+@login_required
+def host_stats_api():
+    """
+    호스트 예약 요약 JSON API (호스트 전용)
+    GET /api/stats/host?year=2030 (기본값: 올해)
+
+    {"host": {"year": 2030, "bookings": 3, "nights_booked": 12, "revenue": 600000.0,
+              "pending_count": 1, "occupancy_rate": 1.6, "caravan_count": 2},
+     "caravans": [{"id": 1, "name": "...", "year": 2030, "bookings": 3, ...}, ...]}
+    """
+    if current_user.user_role != UserRole.HOST:
+        return jsonify({"error": "권한이 없습니다."}), 403
+    year = request.args.get('year', date.today().year, type=int)
+    caravans = db.session.execute(
+        db.select(Caravan.id, Caravan.name, CaravanStats).outerjoin(
+            CaravanStats, db.and_(CaravanStats.caravan_id == Caravan.id,
+                                  CaravanStats.year == year)).where(
+                Caravan.host_id == current_user.id).order_by(Caravan.id))
+    return jsonify({
+        "host": host_stats_summary(current_user.id, year),
+        "caravans": [{"id": caravan_id, "name": name, **stats_to_dict(stats, year)}
+                     for caravan_id, name, stats in caravans],
+    })
+
+
+@app.route('/api/cache/stats', methods=['GET'])
+@login_required
+def cache_stats_api():
+    """카라반 상세 캐시 적중/미스/축출 횟수 (호스트 전용)"""
+    if current_user.user_role != UserRole.HOST:
+        return jsonify({"error": "권한이 없습니다."}), 403
+    return jsonify({"caravan_detail": detail_cache.stats()})
+
+
 # main.py 파일의 라우트 정의 섹션에 추가 (기존 deposit_funds 대체)
 
 
@@ -719,12 +1841,20 @@ def admin_deposit():
             flash(f"ID {form.user_id.data}는 유효한 게스트 계정이 아닙니다.", 'danger')
             return redirect(url_for('admin_deposit'))
 
-        # 잔액 충전 로직
-        user_to_update.balance += amount
+        try:
+            amount_minor = to_minor_units(amount)
+        except ValueError as e:
+            flash(str(e), 'danger')
+            return redirect(url_for('admin_deposit'))
+
+        # 잔액 충전 로직 (원장 기록 + 잔액 스냅샷 증감을 한 트랜잭션으로)
+        balance_minor = post_balance_entry(user_to_update.id, amount_minor, 'admin_deposit',
+                                           actor_id=current_user.id)
         db.session.commit()
 
+        balance = Decimal(balance_minor) / BALANCE_MINOR_UNITS
         flash(
-            f"{user_to_update.name} 님에게 ₩{amount:,.0f} KRW가 충전되었습니다. 현재 잔액: ₩{user_to_update.balance:,.0f}",
+            f"{user_to_update.name} 님에게 ₩{amount:,.0f} KRW가 충전되었습니다. 현재 잔액: ₩{balance:,.0f}",
             'success')
         return redirect(url_for('dashboard'))
 
@@ -744,6 +1874,7 @@ if __name__ == '__main__':
     with app.app_context():
 
         db.create_all()
+        ensure_schema()
         print("데이터베이스 초기화 완료")
 
     app.run(host='0.0.0.0', port=PORT, debug=True)
@@ -0,0 +1,70 @@
+# src/bulk_cli.py
+"""
+카라반/예약 대량 적재·내보내기 CLI (SQL 리포지토리 대상)
+
+    python -m src.bulk_cli import caravans fleet.csv --db sqlite:///caravanshare.db
+    python -m src.bulk_cli import reservations history.jsonl --db sqlite:///caravanshare.db --chunk-size 5000
+    python -m src.bulk_cli export caravans fleet.jsonl --db sqlite:///caravanshare.db
+
+형식은 파일 확장자(.csv / .jsonl)로 정하며 --format으로 바꿀 수 있습니다. 파일 자리에 '-'를 주면 표준 입출력을 사용합니다.
+"""
+import argparse
+import os
+import sys
+from contextlib import nullcontext
+from src.repositories.sql_repository import SqlCaravanRepository, SqlReservationRepository, create_repository_engine
+from src.services.bulk_service import BulkImportService, DEFAULT_CHUNK_SIZE, format_from_path, read_rows
+from src.exceptions.custom_exceptions import ValidationError
+
+MAX_REPORTED_ERRORS = 20
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m src.bulk_cli", description="카라반/예약 대량 적재·내보내기")
+    parser.add_argument("action", choices=["import", "export"])
+    parser.add_argument("entity", choices=["caravans", "reservations"])
+    parser.add_argument("path", help="CSV/JSONL 파일 경로 ('-'는 표준 입출력)")
+    parser.add_argument("--db", default=os.environ.get("REPOSITORY_DATABASE_URL"),
+                        help="SQLAlchemy DB URL (기본값: 환경 변수 REPOSITORY_DATABASE_URL)")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="파일 형식 (기본값: 확장자로 판단)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="트랜잭션 1회당 행 수")
+    return parser
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    if not args.db:
+        print("--db 또는 REPOSITORY_DATABASE_URL이 필요합니다.", file=sys.stderr)
+        return 2
+
+    engine = create_repository_engine(args.db)
+    try:
+        fmt = args.format or format_from_path(args.path)
+        service = BulkImportService(SqlCaravanRepository(engine), SqlReservationRepository(engine),
+                                    chunk_size=args.chunk_size)
+        if args.action == "export":
+            target = nullcontext(sys.stdout) if args.path == "-" else open(args.path, "w", encoding="utf-8", newline="")
+            with target as stream:
+                export = service.export_caravans if args.entity == "caravans" else service.export_reservations
+                count = export(stream, fmt)
+            print(f"{args.entity} {count}건 내보내기 완료", file=sys.stderr)
+            return 0
+
+        source = nullcontext(sys.stdin) if args.path == "-" else open(args.path, encoding="utf-8", newline="")
+        with source as stream:
+            load = service.import_caravans if args.entity == "caravans" else service.import_reservations
+            result = load(read_rows(stream, fmt))
+    except ValidationError as e:
+        print(e.message, file=sys.stderr)
+        return 2
+    except OSError as e:
+        print(f"파일을 열 수 없습니다: {e}", file=sys.stderr)
+        return 2
+    finally:
+        engine.dispose()
+
+    print(f"{args.entity} {result.imported}건 적재, {len(result.errors)}건 거부", file=sys.stderr)
+    for line_no, message in result.errors[:MAX_REPORTED_ERRORS]:
+        print(f"  {line_no}행: {message}", file=sys.stderr)
+    return 1 if result.errors else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
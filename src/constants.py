@@ -1,4 +1,6 @@
 # src/constants.py
 
 MIN_RESERVATION_DAYS = 1
-DEFAULT_DAILY_RATE = 100000
\ No newline at end of file
+DEFAULT_DAILY_RATE = 100000
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
@@ -0,0 +1,37 @@
+# src/logging_config.py
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+LOG_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+
+def configure_logging(
+    level: int | str = logging.INFO,
+    use_queue: bool = False,
+    handler: logging.Handler | None = None
+) -> QueueListener | None:
+    """
+    src 패키지 로거를 설정합니다. (모듈별 로거는 모두 'src' 하위)
+
+    use_queue=True면 요청 스레드에서는 큐에 넣기만 하고, 실제 출력(I/O)은
+    QueueListener의 백그라운드 스레드가 handler로 처리합니다.
+    이 경우 반환된 listener를 종료 시 stop() 해야 남은 로그가 모두 기록됩니다.
+    """
+    if handler is None:
+        handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    logger = logging.getLogger("src")
+    for old_handler in list(logger.handlers):
+        logger.removeHandler(old_handler)
+    logger.setLevel(level)
+
+    if not use_queue:
+        logger.addHandler(handler)
+        return None
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    return listener
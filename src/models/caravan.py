@@ -4,7 +4,7 @@ import uuid
 from src.models.common import CaravanStatus # ❗️ import 경로 변경
 from src.constants import DEFAULT_DAILY_RATE # ❗️ import 경로 변경
 
-@dataclass
+@dataclass(slots=True)
 class Caravan:
     # 기본값 없는 필드
     host_id: str
@@ -0,0 +1,79 @@
+# src/models/compact.py
+"""
+대량 인메모리 데이터(수백만 건의 예약)를 위한 압축 모델
+
+- 예약 ID는 36자 UUID 문자열 대신 16바이트 bytes(id_format="bytes") 또는 정수(id_format="int")로 저장
+- 날짜는 date 객체 대신 서수(date.toordinal()) 정수로 저장
+- frozen + __slots__ (인스턴스 __dict__ 없음). 상태 변경은 dataclasses.replace()로 새 객체를 만듭니다.
+
+서비스/리포지토리가 읽는 속성(reservation_id, start_date, end_date 등)은 Reservation과 같은 이름과 타입으로 제공합니다.
+"""
+import sys
+import uuid
+from dataclasses import dataclass
+from datetime import date
+from src.models.common import ReservationStatus
+from src.models.reservation import Reservation
+from src.exceptions.custom_exceptions import ValidationError
+
+ID_FORMATS = ("bytes", "int")
+
+def encode_id(value: str, id_format: str = "bytes") -> bytes | int:
+    """문자열 ID를 압축 형식으로 바꿉니다. (bytes: UUID 문자열, int: 숫자 문자열)"""
+    try:
+        if id_format == "bytes":
+            return uuid.UUID(value).bytes
+        if id_format == "int":
+            return int(value)
+    except ValueError:
+        raise ValidationError(f"ID를 {id_format} 형식으로 바꿀 수 없습니다: {value}")
+    raise ValidationError(f"지원하지 않는 ID 형식입니다: {id_format} ({', '.join(ID_FORMATS)})")
+
+def decode_id(key: bytes | int) -> str:
+    return str(uuid.UUID(bytes=key)) if isinstance(key, bytes) else str(key)
+
+@dataclass(frozen=True, slots=True)
+class CompactReservation:
+    key: bytes | int
+    guest_id: str
+    caravan_id: str
+    start_ordinal: int
+    end_ordinal: int
+    total_price: int
+    status: ReservationStatus = ReservationStatus.PENDING
+
+    @property
+    def reservation_id(self) -> str:
+        return decode_id(self.key)
+
+    @property
+    def start_date(self) -> date:
+        return date.fromordinal(self.start_ordinal)
+
+    @property
+    def end_date(self) -> date:
+        return date.fromordinal(self.end_ordinal)
+
+    @classmethod
+    def from_reservation(cls, reservation: Reservation, id_format: str = "bytes") -> "CompactReservation":
+        # 게스트/카라반 ID는 여러 예약이 같은 값을 가지므로 intern으로 문자열 객체 하나를 공유합니다.
+        return cls(
+            key=encode_id(reservation.reservation_id, id_format),
+            guest_id=sys.intern(reservation.guest_id),
+            caravan_id=sys.intern(reservation.caravan_id),
+            start_ordinal=reservation.start_date.toordinal(),
+            end_ordinal=reservation.end_date.toordinal(),
+            total_price=reservation.total_price,
+            status=reservation.status,
+        )
+
+    def to_reservation(self) -> Reservation:
+        return Reservation(
+            guest_id=self.guest_id,
+            caravan_id=self.caravan_id,
+            start_date=self.start_date,
+            end_date=self.end_date,
+            total_price=self.total_price,
+            reservation_id=self.reservation_id,
+            status=self.status,
+        )
@@ -0,0 +1,11 @@
+# src/models/page.py
+from dataclasses import dataclass, field
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+@dataclass
+class Page(Generic[T]):
+    """키셋(커서) 페이지네이션 결과. next_cursor가 None이면 마지막 페이지입니다."""
+    items: list[T] = field(default_factory=list)
+    next_cursor: str | None = None
@@ -9,11 +9,16 @@ class PaymentStatus(Enum):
     COMPLETED = auto() # 결제 완료
     FAILED = auto()    # 결제 실패
 
-@dataclass
+@dataclass(slots=True)
 class Payment:
     reservation_id: str
     amount: int
     
     payment_id: str = field(default_factory=lambda: str(uuid.uuid4()))
     status: PaymentStatus = PaymentStatus.PENDING
-    created_at: datetime = field(default_factory=datetime.now)
\ No newline at end of file
+    created_at: datetime = field(default_factory=datetime.now)
+    idempotency_key: str | None = None   # 클라이언트가 재시도해도 같은 결제로 처리하기 위한 키
+    gateway_reference: str | None = None # 정산 후 결제 대행사(PG)의 거래 번호
+
+# 예약당 하나만 있을 수 있는 결제 상태 (진행 중이거나 완료된 결제). FAILED 뒤에는 다시 결제할 수 있습니다.
+ACTIVE_PAYMENT_STATUSES = frozenset({PaymentStatus.PENDING, PaymentStatus.COMPLETED})
\ No newline at end of file
@@ -4,7 +4,7 @@ from datetime import date
 import uuid
 from src.models.common import ReservationStatus # ❗️ import 경로 변경
 
-@dataclass
+@dataclass(slots=True)
 class Reservation:
     # 기본값 없는 필드
     guest_id: str
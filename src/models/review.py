@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 import uuid
 
-@dataclass
+@dataclass(slots=True)
 class Review:
     reservation_id: str
     guest_id: str
@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 import uuid
 from src.models.common import UserRole # ❗️ import 경로 변경
 
-@dataclass
+@dataclass(slots=True)
 class User:
     # 기본값이 없는 필드를 먼저 선언
     username: str
@@ -0,0 +1,86 @@
+# src/repositories/async_repository.py
+"""
+비동기(asyncio) 리포지토리 인터페이스와 동기 리포지토리 어댑터
+
+- Async*Repository: 비동기 서비스(src/services/async_service.py)가 의존하는 인터페이스 (필요한 조회/저장만)
+- Executor*Repository: 기존 동기 리포지토리(InMemory/ThreadSafe/Sql)의 메서드를 스레드 풀에서 실행합니다.
+  DB 호출이 느려도 이벤트 루프는 다른 요청을 계속 처리하며, 동시에 실행되는 DB 호출 수는 풀 크기로 제한됩니다.
+"""
+import asyncio
+import functools
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor
+from datetime import date
+from src.models.caravan import Caravan
+from src.models.page import Page
+from src.models.reservation import Reservation
+from src.models.user import User
+from src.repositories.base import CaravanRepository, ReservationRepository, UserRepository
+
+class AsyncCaravanRepository(ABC):
+    @abstractmethod
+    async def get_by_id(self, caravan_id: str) -> Caravan | None:
+        pass
+
+    @abstractmethod
+    async def search_by_capacity(self, min_capacity: int) -> list[Caravan]:
+        pass
+
+    @abstractmethod
+    async def search_by_capacity_page(self, min_capacity: int, limit: int, cursor: str | None = None) -> Page[Caravan]:
+        pass
+
+class AsyncReservationRepository(ABC):
+    @abstractmethod
+    async def find_available_caravan_ids(self, caravan_ids: list[str], start_date: date, end_date: date) -> list[str]:
+        pass
+
+    @abstractmethod
+    async def reserve_if_available(self, reservation: Reservation) -> bool:
+        """겹치는 예약이 없으면 저장하고 True, 있으면 저장하지 않고 False를 반환합니다. (확인과 저장이 원자적)"""
+        pass
+
+class AsyncUserRepository(ABC):
+    @abstractmethod
+    async def get_by_username(self, username: str) -> User | None:
+        pass
+
+class _ExecutorAdapter:
+    """동기 리포지토리 호출을 executor(None이면 이벤트 루프의 기본 스레드 풀)에서 실행합니다."""
+    def __init__(self, repository, executor: Executor | None = None):
+        self._repository = repository
+        self._executor = executor
+
+    async def _call(self, method: str, *args):
+        func = functools.partial(getattr(self._repository, method), *args)
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func)
+
+class ExecutorCaravanRepository(_ExecutorAdapter, AsyncCaravanRepository):
+    def __init__(self, repository: CaravanRepository, executor: Executor | None = None):
+        super().__init__(repository, executor)
+
+    async def get_by_id(self, caravan_id: str) -> Caravan | None:
+        return await self._call("get_by_id", caravan_id)
+
+    async def search_by_capacity(self, min_capacity: int) -> list[Caravan]:
+        return await self._call("search_by_capacity", min_capacity)
+
+    async def search_by_capacity_page(self, min_capacity: int, limit: int, cursor: str | None = None) -> Page[Caravan]:
+        return await self._call("search_by_capacity_page", min_capacity, limit, cursor)
+
+class ExecutorReservationRepository(_ExecutorAdapter, AsyncReservationRepository):
+    def __init__(self, repository: ReservationRepository, executor: Executor | None = None):
+        super().__init__(repository, executor)
+
+    async def find_available_caravan_ids(self, caravan_ids: list[str], start_date: date, end_date: date) -> list[str]:
+        return await self._call("find_available_caravan_ids", caravan_ids, start_date, end_date)
+
+    async def reserve_if_available(self, reservation: Reservation) -> bool:
+        return await self._call("reserve_if_available", reservation)
+
+class ExecutorUserRepository(_ExecutorAdapter, AsyncUserRepository):
+    def __init__(self, repository: UserRepository, executor: Executor | None = None):
+        super().__init__(repository, executor)
+
+    async def get_by_username(self, username: str) -> User | None:
+        return await self._call("get_by_username", username)
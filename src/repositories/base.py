@@ -1,5 +1,6 @@
 # src/repositories/base.py
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from datetime import date
 from src.models.reservation import Reservation # ❗️ import 경로 변경
 
@@ -17,6 +18,33 @@ class ReservationRepository(ABC):
     def is_caravan_available(self, caravan_id: str, start_date: date, end_date: date) -> bool:
         pass
 
+    @abstractmethod
+    def reserve_if_available(self, reservation: Reservation) -> bool:
+        """겹치는 예약이 없으면 저장하고 True, 있으면 저장하지 않고 False를 반환합니다. (확인과 저장이 원자적)"""
+        pass
+
+    @abstractmethod
+    def find_available_caravan_ids(self, caravan_ids: list[str], start_date: date, end_date: date) -> list[str]:
+        """caravan_ids 중 해당 기간에 예약이 없는 카라반 ID만 (입력 순서대로) 반환합니다."""
+        pass
+
+    @abstractmethod
+    def add_all(self, reservations: list[Reservation], rebuild_index: bool = True):
+        """
+        검증이 끝난 예약을 대량 저장합니다. (대량 적재용)
+        rebuild_index=False이면 rebuild_index()를 호출할 때까지 가용성 인덱스 갱신을 미룹니다.
+        """
+        pass
+
+    def rebuild_index(self):
+        """add_all(..., rebuild_index=False)로 미뤄 둔 가용성 인덱스를 한 번에 다시 만듭니다."""
+        pass
+
+    @abstractmethod
+    def iter_all(self) -> Iterator[Reservation]:
+        """모든 예약을 순회합니다. (내보내기용, 전체를 한 번에 메모리에 올리지 않음)"""
+        pass
+
     # src/repositories/base.py
 # ... (기존 ReservationRepository 코드) ...
 
@@ -33,6 +61,28 @@ class PaymentRepository(ABC):
     def get_by_id(self, payment_id: str) -> Payment | None:
         pass
 
+    @abstractmethod
+    def add_if_absent(self, payment: Payment) -> Payment:
+        """
+        같은 멱등 키의 결제나 같은 예약의 진행 중/완료 결제(ACTIVE_PAYMENT_STATUSES)가 있으면 저장하지 않고 그 결제를,
+        없으면 payment를 저장하고 그대로 반환합니다. (확인과 저장이 원자적)
+        """
+        pass
+
+    @abstractmethod
+    def add_all(self, payments: list[Payment]):
+        """여러 결제를 한 번에 저장(갱신)합니다. (정산 결과 반영용)"""
+        pass
+
+    @abstractmethod
+    def get_by_idempotency_key(self, idempotency_key: str) -> Payment | None:
+        pass
+
+    @abstractmethod
+    def find_by_reservation_id(self, reservation_id: str) -> list[Payment]:
+        """예약의 결제 시도를 저장한 순서대로 반환합니다."""
+        pass
+
 class ReviewRepository(ABC):
     @abstractmethod
     def add(self, review: Review):
@@ -45,6 +95,7 @@ class ReviewRepository(ABC):
     # src/repositories/base.py
 # ... (기존 PaymentRepository, ReviewRepository 코드 아래에 추가) ...
 from src.models.caravan import Caravan
+from src.models.page import Page
 
 class CaravanRepository(ABC):
     @abstractmethod
@@ -55,10 +106,39 @@ class CaravanRepository(ABC):
     def get_by_id(self, caravan_id: str) -> Caravan | None:
         pass
     
+    @abstractmethod
+    def add_all(self, caravans: list[Caravan], rebuild_index: bool = True):
+        """
+        카라반을 대량 저장합니다. (대량 적재용)
+        rebuild_index=False이면 rebuild_index()를 호출할 때까지 검색 인덱스 갱신을 미룹니다.
+        """
+        pass
+
+    def rebuild_index(self):
+        """add_all(..., rebuild_index=False)로 미뤄 둔 검색 인덱스를 한 번에 다시 만듭니다."""
+        pass
+
     @abstractmethod
     def search_by_capacity(self, min_capacity: int) -> list[Caravan]:
         pass
 
+    @abstractmethod
+    def search_by_range(
+        self,
+        min_capacity: int = 1,
+        max_capacity: int | None = None,
+        min_daily_rate: int | None = None,
+        max_daily_rate: int | None = None,
+        available_only: bool = False
+    ) -> list[Caravan]:
+        """수용 인원/1일 요금 범위(양 끝 포함)와 상태(AVAILABLE만) 조건으로 검색합니다."""
+        pass
+
+    @abstractmethod
+    def search_by_capacity_page(self, min_capacity: int, limit: int, cursor: str | None = None) -> Page[Caravan]:
+        """cursor(직전 페이지의 next_cursor) 다음부터 최대 limit개를 반환합니다."""
+        pass
+
     # src/repositories/base.py
 # ... (기존 CaravanRepository 코드 아래에 추가) ...
 from src.models.user import User
@@ -0,0 +1,156 @@
+# src/repositories/columnar_store.py
+"""
+예약 분석용 열(column) 저장소 스냅샷
+
+- 예약을 (카라반, 시작일) 순으로 정렬해 열마다 array에 담습니다. (카라반/게스트 ID는 정수 코드로 사전 인코딩)
+- 카라반별 행 범위(offsets)를 미리 구해 두므로, 카라반별 매출/숙박일 합계는 array 구간 sum() 한 번씩이면 됩니다.
+- 날짜는 서수 정수이며 src 예약 규칙대로 종료일을 포함합니다. (숙박일 = 종료 - 시작 + 1)
+- 만든 뒤에는 바뀌지 않는 스냅샷입니다. 최신 데이터가 필요하면 from_repository()로 다시 만듭니다.
+"""
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Mapping
+from datetime import date
+from src.models.common import ReservationStatus
+from src.models.reservation import Reservation
+from src.repositories.base import ReservationRepository
+
+BOOKED_STATUSES = frozenset({ReservationStatus.CONFIRMED, ReservationStatus.COMPLETED})
+
+class ColumnarReservationStore:
+    def __init__(self, reservations: Iterable[Reservation]):
+        # (카라반, 시작일)로만 정렬합니다. 전체 튜플을 비교하면 나머지가 같은 행끼리 상태(Enum)를 비교하다 TypeError가 납니다.
+        rows = sorted(
+            ((r.caravan_id, r.start_date.toordinal(), r.end_date.toordinal(), r.guest_id, r.total_price, r.status)
+             for r in reservations),
+            key=lambda row: (row[0], row[1])
+        )
+        self.caravan_ids: list[str] = []     # 코드 -> 카라반 ID
+        self.guest_ids: list[str] = []       # 코드 -> 게스트 ID
+        guest_codes: dict[str, int] = {}
+        self.offsets = array("q", [0])       # 카라반 코드 c의 행 범위 = offsets[c]:offsets[c + 1]
+        self.caravan = array("i")
+        self.guest = array("i")
+        self.start = array("i")
+        self.end = array("i")
+        self.month = array("i")              # 체크인 월 = 연 * 12 + (월 - 1)
+        self.price = array("q")
+        self.status = array("b")
+        self.revenue = array("q")            # 확정/완료 예약의 금액, 그 외 0
+        self.nights = array("i")             # 확정/완료 예약의 숙박일, 그 외 0
+        # (카라반, 체크인 월)별 매출 소계. 정렬 순서상 같은 카라반의 같은 달 예약은 붙어 있으므로 한 번에 만들어 둡니다.
+        self.run_caravan = array("i")
+        self.run_month = array("i")
+        self.run_revenue = array("q")
+
+        month_of: dict[int, int] = {} # 서수 -> 월 (같은 날짜는 한 번만 변환)
+        for caravan_id, start, end, guest_id, price, status in rows:
+            if not self.caravan_ids or self.caravan_ids[-1] != caravan_id:
+                if self.caravan_ids:
+                    self.offsets.append(len(self.caravan))
+                self.caravan_ids.append(caravan_id)
+            booked = status in BOOKED_STATUSES
+            code = len(self.caravan_ids) - 1
+            self.caravan.append(code)
+            self.guest.append(guest_codes.setdefault(guest_id, len(guest_codes)))
+            self.start.append(start)
+            self.end.append(end)
+            month = month_of.get(start)
+            if month is None:
+                day = date.fromordinal(start)
+                month = month_of[start] = day.year * 12 + day.month - 1
+            self.month.append(month)
+            self.price.append(price)
+            self.status.append(status.value)
+            self.revenue.append(price if booked else 0)
+            self.nights.append(end - start + 1 if booked else 0)
+            if self.run_caravan and self.run_caravan[-1] == code and self.run_month[-1] == month:
+                self.run_revenue[-1] += self.revenue[-1]
+            else:
+                self.run_caravan.append(code)
+                self.run_month.append(month)
+                self.run_revenue.append(self.revenue[-1])
+        if self.caravan_ids:
+            self.offsets.append(len(self.caravan))
+        self.guest_ids = list(guest_codes)
+        self.max_nights = max(self.nights, default=0)
+
+    @classmethod
+    def from_repository(cls, repository: ReservationRepository) -> "ColumnarReservationStore":
+        return cls(repository.iter_all())
+
+    def __len__(self) -> int:
+        return len(self.caravan)
+
+    def _ranges(self):
+        offsets = self.offsets
+        for code, caravan_id in enumerate(self.caravan_ids):
+            yield caravan_id, offsets[code], offsets[code + 1]
+
+    def revenue_by_caravan(self) -> dict[str, int]:
+        """카라반별 매출 (확정/완료 예약)"""
+        revenue = self.revenue
+        return {caravan_id: sum(revenue[lo:hi]) for caravan_id, lo, hi in self._ranges()}
+
+    def nights_by_caravan(self) -> dict[str, int]:
+        nights = self.nights
+        return {caravan_id: sum(nights[lo:hi]) for caravan_id, lo, hi in self._ranges()}
+
+    def revenue_by_host(self, host_of_caravan: Mapping[str, str]) -> dict[str, int]:
+        """호스트별 매출. host_of_caravan: {카라반 ID: 호스트 ID} (없는 카라반은 제외)"""
+        totals: dict[str, int] = {}
+        for caravan_id, revenue in self.revenue_by_caravan().items():
+            host_id = host_of_caravan.get(caravan_id)
+            if host_id is not None:
+                totals[host_id] = totals.get(host_id, 0) + revenue
+        return totals
+
+    def revenue_by_month(self, host_of_caravan: Mapping[str, str] | None = None) -> dict[tuple, int]:
+        """
+        체크인 월별 매출. 키는 (연, 월)이며, host_of_caravan을 주면 (호스트 ID, 연, 월)입니다.
+        """
+        if host_of_caravan is None:
+            hosts = [None] * len(self.caravan_ids)
+        else:
+            hosts = [host_of_caravan.get(caravan_id, False) for caravan_id in self.caravan_ids] # False: 제외
+        totals: dict[tuple, int] = {}
+        for code, month, amount in zip(self.run_caravan, self.run_month, self.run_revenue):
+            host_id = hosts[code]
+            if not amount or host_id is False:
+                continue
+            key = (host_id, month)
+            totals[key] = totals.get(key, 0) + amount
+        # 월 정수(연 * 12 + 월 - 1)는 집계가 끝난 뒤 키마다 한 번만 (연, 월)로 바꿉니다.
+        return {
+            (month // 12, month % 12 + 1) if host_id is None else (host_id, month // 12, month % 12 + 1): amount
+            for (host_id, month), amount in totals.items()
+        }
+
+    def occupancy_rate(self, start_date: date, end_date: date, caravan_ids: Iterable[str] | None = None) -> float:
+        """
+        [start_date, end_date] 기간(양 끝 포함)의 가동률 = 예약된 숙박일 / (카라반 수 x 기간 일수)
+        caravan_ids를 주지 않으면 예약이 한 건이라도 있는 카라반 전체가 대상입니다.
+        """
+        first, last = start_date.toordinal(), end_date.toordinal()
+        codes = {caravan_id: code for code, caravan_id in enumerate(self.caravan_ids)}
+        targets = list(caravan_ids) if caravan_ids is not None else self.caravan_ids
+        if not targets or last < first:
+            return 0.0
+        booked = 0
+        for caravan_id in targets:
+            code = codes.get(caravan_id)
+            if code is None:
+                continue
+            lo, hi = self.offsets[code], self.offsets[code + 1]
+            # 카라반 안에서는 시작일 순이므로, 최대 숙박일보다 더 앞에서 시작한 예약(기간 전에 끝남)은 이분 탐색으로 건너뜁니다.
+            i = bisect_left(self.start, first - self.max_nights + 1, lo, hi)
+            while i < hi and self.start[i] <= last:
+                if self.nights[i]:
+                    booked += max(0, min(self.end[i], last) - max(self.start[i], first) + 1)
+                i += 1
+        return booked / (len(targets) * (last - first + 1))
+
+    def average_stay_nights(self) -> float:
+        """확정/완료 예약의 평균 숙박일"""
+        booked = len(self.nights) - self.nights.count(0)
+        return sum(self.nights) / booked if booked else 0.0
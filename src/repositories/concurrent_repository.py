@@ -0,0 +1,193 @@
+# src/repositories/concurrent_repository.py
+import logging
+import threading
+from datetime import date
+from src.models.reservation import Reservation
+from src.models.caravan import Caravan
+from src.models.page import Page
+from src.models.payment import Payment
+from src.models.review import Review
+from src.models.user import User
+from src.repositories.interval_index import IntervalIndex
+from src.repositories.memory_repository import (InMemoryReservationRepository,
+                                                InMemoryCaravanRepository,
+                                                InMemoryPaymentRepository,
+                                                InMemoryReviewRepository,
+                                                InMemoryUserRepository)
+from src.exceptions.custom_exceptions import ReservationConflictError
+
+logger = logging.getLogger(__name__)
+
+class ThreadSafeReservationRepository(InMemoryReservationRepository):
+    """
+    멀티 스레드 서버(threaded Flask, gunicorn gthread)용 예약 리포지토리
+
+    - 카라반마다 별도의 잠금을 두어, 서로 다른 카라반의 예약은 서로 기다리지 않습니다.
+    - 같은 카라반의 겹침 확인 + 구간 인덱스 수정은 그 카라반의 잠금 안에서만 일어납니다.
+    - 예약 ID 등록은 dict.setdefault 한 번으로 처리하므로 전역 잠금이 필요 없습니다.
+    """
+    def __init__(self):
+        super().__init__()
+        self._caravan_locks: dict[str, threading.Lock] = {}
+
+    def _lock_for(self, caravan_id: str) -> threading.Lock:
+        lock = self._caravan_locks.get(caravan_id)
+        if lock is None:
+            # 두 스레드가 동시에 만들어도 setdefault로 먼저 등록된 잠금 하나만 사용됩니다.
+            lock = self._caravan_locks.setdefault(caravan_id, threading.Lock())
+        return lock
+
+    def add(self, reservation: Reservation):
+        if not self.reserve_if_available(reservation):
+            raise ReservationConflictError("선택한 날짜에 이미 예약이 있습니다.")
+
+    def reserve_if_available(self, reservation: Reservation) -> bool:
+        caravan_id = reservation.caravan_id
+        with self._lock_for(caravan_id):
+            bookings = self._bookings_by_caravan.get(caravan_id)
+            if bookings is not None and bookings.overlaps(reservation.start_date, reservation.end_date):
+                return False
+            if self._reservations.setdefault(reservation.reservation_id, reservation) is not reservation:
+                raise ReservationConflictError(f"예약 ID {reservation.reservation_id}가 이미 존재합니다.")
+            if bookings is None:
+                bookings = self._bookings_by_caravan[caravan_id] = IntervalIndex()
+            bookings.add(reservation.start_date, reservation.end_date, reservation.reservation_id)
+
+        logger.debug("리포지토리: 예약 %s 추가됨", reservation.reservation_id)
+        return True
+
+    def add_all(self, reservations: list[Reservation], rebuild_index: bool = True):
+        """
+        동시 예약과 섞여도 가용성 인덱스가 항상 맞도록, 카라반별 잠금 안에서 기존 구간과 병합해 바로 다시 만듭니다.
+        (rebuild_index=False여도 미루지 않으며, 저장은 카라반 단위로 원자적입니다.)
+        """
+        by_caravan: dict[str, list[Reservation]] = {}
+        for reservation in reservations:
+            by_caravan.setdefault(reservation.caravan_id, []).append(reservation)
+
+        for caravan_id, group in by_caravan.items():
+            with self._lock_for(caravan_id):
+                existing = self._bookings_by_caravan.get(caravan_id)
+                index = IntervalIndex.build([
+                    *(existing or ()),
+                    *((r.start_date, r.end_date, r.reservation_id) for r in group)
+                ])
+                claimed = []
+                for reservation in group:
+                    if self._reservations.setdefault(reservation.reservation_id, reservation) is not reservation:
+                        for done in claimed:
+                            del self._reservations[done.reservation_id]
+                        raise ReservationConflictError(f"예약 ID {reservation.reservation_id}가 이미 존재합니다.")
+                    claimed.append(reservation)
+                self._bookings_by_caravan[caravan_id] = index
+        logger.debug("리포지토리: 예약 %s건 대량 추가됨", len(reservations))
+
+    def rebuild_index(self):
+        # add_all이 항상 즉시 반영하므로 다시 만들 것이 없습니다.
+        pass
+
+    def is_caravan_available(self, caravan_id: str, start_date: date, end_date: date) -> bool:
+        bookings = self._bookings_by_caravan.get(caravan_id)
+        if bookings is None:
+            return True
+        with self._lock_for(caravan_id):
+            return not bookings.overlaps(start_date, end_date)
+
+    def find_available_caravan_ids(self, caravan_ids: list[str], start_date: date, end_date: date) -> list[str]:
+        # 예약이 있는 카라반만 해당 카라반의 잠금을 잠깐씩 잡습니다. (여러 잠금을 동시에 잡지 않음)
+        return [
+            caravan_id for caravan_id in caravan_ids
+            if self.is_caravan_available(caravan_id, start_date, end_date)
+        ]
+
+class ThreadSafeCaravanRepository(InMemoryCaravanRepository):
+    """
+    정렬 인덱스(병렬 리스트)를 하나의 잠금으로 보호합니다.
+    카라반 등록은 드물고 조회는 슬라이스 복사뿐이므로 잠금 구간이 짧습니다.
+    """
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+
+    def add(self, caravan: Caravan):
+        with self._lock:
+            super().add(caravan)
+
+    def add_all(self, caravans: list[Caravan], rebuild_index: bool = True):
+        with self._lock:
+            super().add_all(caravans, rebuild_index=False)
+            if rebuild_index:
+                super().rebuild_index()
+
+    def rebuild_index(self):
+        with self._lock:
+            super().rebuild_index()
+
+    def search_by_capacity(self, min_capacity: int) -> list[Caravan]:
+        with self._lock:
+            return super().search_by_capacity(min_capacity)
+
+    def search_by_range(
+        self,
+        min_capacity: int = 1,
+        max_capacity: int | None = None,
+        min_daily_rate: int | None = None,
+        max_daily_rate: int | None = None,
+        available_only: bool = False
+    ) -> list[Caravan]:
+        with self._lock:
+            candidates = super().search_by_range(min_capacity, max_capacity)
+        if min_daily_rate is None and max_daily_rate is None and not available_only:
+            return candidates
+        # 요금/상태 필터는 잠금 밖에서 (이미 복사한 후보 목록만 사용)
+        return self._filter(candidates, min_daily_rate, max_daily_rate, available_only)
+
+    def search_by_capacity_page(self, min_capacity: int, limit: int, cursor: str | None = None) -> Page[Caravan]:
+        with self._lock:
+            return super().search_by_capacity_page(min_capacity, limit, cursor)
+
+class ThreadSafePaymentRepository(InMemoryPaymentRepository):
+    """
+    세 개의 dict(결제 ID, 멱등 키, 예약 ID 기준)를 함께 갱신합니다.
+    add_if_absent의 확인과 저장도 같은 잠금 안에서 처리하므로, 같은 키로 동시에 재시도해도 결제는 하나만 저장됩니다.
+    """
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+
+    def add(self, payment: Payment):
+        with self._lock:
+            super().add(payment)
+
+    def add_if_absent(self, payment: Payment) -> Payment:
+        with self._lock:
+            existing = self._existing_for(payment)
+            if existing is not None:
+                return existing
+            InMemoryPaymentRepository.add(self, payment) # 이미 잠금을 잡고 있으므로 부모 구현을 직접 호출
+            return payment
+
+    def add_all(self, payments: list[Payment]):
+        with self._lock:
+            for payment in payments:
+                InMemoryPaymentRepository.add(self, payment)
+
+class ThreadSafeReviewRepository(InMemoryReviewRepository):
+    """두 개의 dict(리뷰 ID, 예약 ID 기준)를 함께 갱신합니다."""
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+
+    def add(self, review: Review):
+        with self._lock:
+            super().add(review)
+
+class ThreadSafeUserRepository(InMemoryUserRepository):
+    """두 개의 dict(사용자 ID, 사용자 이름 기준)를 함께 갱신합니다."""
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+
+    def add(self, user: User):
+        with self._lock:
+            super().add(user)
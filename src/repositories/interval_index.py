@@ -0,0 +1,63 @@
+# src/repositories/interval_index.py
+from bisect import bisect_left, bisect_right
+from datetime import date
+from src.exceptions.custom_exceptions import ReservationConflictError
+
+class IntervalIndex:
+    """
+    카라반 한 대의 예약 구간 인덱스 (bisect 기반 정렬 리스트)
+
+    - 구간은 [start_date, end_date] 양 끝을 포함하며 서로 겹치지 않습니다.
+    - 겹치지 않는 구간은 시작일로 정렬하면 종료일도 함께 정렬되므로,
+      겹침 검사는 숙박 기간과 관계없이 이분 탐색 한 번(O(log n))이면 됩니다.
+    """
+    def __init__(self):
+        self._starts: list[date] = []
+        self._ends: list[date] = []
+        self._ids: list[str] = []
+
+    @classmethod
+    def build(cls, intervals: list[tuple[date, date, str]]) -> "IntervalIndex":
+        """(start_date, end_date, reservation_id) 목록으로 한 번에 만듭니다. 정렬 1회 + 인접 구간 비교로 O(n log n)"""
+        index = cls()
+        ordered = sorted(intervals)
+        for (_, prev_end, _), (start, _, reservation_id) in zip(ordered, ordered[1:]):
+            if start <= prev_end:
+                raise ReservationConflictError(f"예약 {reservation_id}가 다른 예약과 겹칩니다.")
+        index._starts = [start for start, _, _ in ordered]
+        index._ends = [end for _, end, _ in ordered]
+        index._ids = [reservation_id for _, _, reservation_id in ordered]
+        return index
+
+    def __iter__(self):
+        return zip(self._starts, self._ends, self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def overlaps(self, start_date: date, end_date: date) -> bool:
+        """[start_date, end_date]와 겹치는 구간이 있는지 확인합니다."""
+        if end_date < start_date:
+            return False
+        # end_date 이하에서 시작하는 마지막 구간만 확인하면 됩니다.
+        idx = bisect_right(self._starts, end_date) - 1
+        return idx >= 0 and self._ends[idx] >= start_date
+
+    def add(self, start_date: date, end_date: date, reservation_id: str):
+        """구간을 추가합니다. 기존 구간과 겹치면 ReservationConflictError가 발생합니다."""
+        if self.overlaps(start_date, end_date):
+            raise ReservationConflictError("선택한 날짜에 이미 예약이 있습니다.")
+        idx = bisect_left(self._starts, start_date)
+        self._starts.insert(idx, start_date)
+        self._ends.insert(idx, end_date)
+        self._ids.insert(idx, reservation_id)
+
+    def remove(self, start_date: date, reservation_id: str) -> bool:
+        """시작일과 예약 ID로 구간을 찾아 삭제합니다. 삭제했으면 True를 반환합니다."""
+        idx = bisect_left(self._starts, start_date)
+        if idx < len(self._ids) and self._ids[idx] == reservation_id:
+            del self._starts[idx]
+            del self._ends[idx]
+            del self._ids[idx]
+            return True
+        return False
@@ -1,64 +1,145 @@
 # src/repositories/memory_repository.py
-from datetime import date, timedelta
+import logging
+from collections.abc import Iterator
+from datetime import date
 from src.models.reservation import Reservation
 from src.repositories.base import ReservationRepository
+from src.repositories.interval_index import IntervalIndex
 from src.exceptions.custom_exceptions import ReservationConflictError
 
+logger = logging.getLogger(__name__)
+
 class InMemoryReservationRepository(ReservationRepository):
     """
     메모리 기반 리포지토리 구현체
     """
     def __init__(self):
         self._reservations: dict[str, Reservation] = {}
-        self._bookings_by_caravan: dict[str, dict[date, str]] = {}
+        self._bookings_by_caravan: dict[str, IntervalIndex] = {}
+        self._pending: list[Reservation] = [] # add_all(..., rebuild_index=False)로 반영을 미룬 예약
 
     def add(self, reservation: Reservation):
         if reservation.reservation_id in self._reservations:
             raise ReservationConflictError(f"예약 ID {reservation.reservation_id}가 이미 존재합니다.")
         
-        self._reservations[reservation.reservation_id] = reservation
-        
         if reservation.caravan_id not in self._bookings_by_caravan:
-            self._bookings_by_caravan[reservation.caravan_id] = {}
-            
-        current_date = reservation.start_date
-        while current_date <= reservation.end_date:
-            self._bookings_by_caravan[reservation.caravan_id][current_date] = reservation.reservation_id
-            current_date += timedelta(days=1)
+            self._bookings_by_caravan[reservation.caravan_id] = IntervalIndex()
+
+        # 구간 인덱스에 먼저 넣어 겹치는 예약이면 저장하지 않습니다.
+        self._bookings_by_caravan[reservation.caravan_id].add(
+            reservation.start_date, reservation.end_date, reservation.reservation_id
+        )
+        self._reservations[reservation.reservation_id] = reservation
         
-        print(f"리포지토리: 예약 {reservation.reservation_id} 추가됨")
+        logger.debug("리포지토리: 예약 %s 추가됨", reservation.reservation_id)
 
     def get_by_id(self, reservation_id: str) -> Reservation | None:
         return self._reservations.get(reservation_id)
 
-    def is_caravan_available(self, caravan_id: str, start_date: date, end_date: date) -> bool:
-        caravan_bookings = self._bookings_by_caravan.get(caravan_id, {})
-        
-        current_date = start_date
-        while current_date <= end_date:
-            if current_date in caravan_bookings:
-                return False
-            current_date += timedelta(days=1)
-            
+    def add_all(self, reservations: list[Reservation], rebuild_index: bool = True):
+        """
+        rebuild_index=False이면 예약을 대기 목록에만 쌓아 두고, rebuild_index() 때 한 번에 반영합니다.
+        (반영 전에는 조회되지 않으며, 겹침이 있으면 대기 중인 예약 전체를 저장하지 않습니다.)
+        """
+        new_ids = {reservation.reservation_id for reservation in reservations}
+        pending_ids = {reservation.reservation_id for reservation in self._pending}
+        if (len(new_ids) != len(reservations) or not new_ids.isdisjoint(self._reservations)
+                or not new_ids.isdisjoint(pending_ids)):
+            raise ReservationConflictError("이미 존재하거나 중복된 예약 ID가 있습니다.")
+        self._pending.extend(reservations)
+        if rebuild_index:
+            self.rebuild_index()
+
+    def rebuild_index(self):
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        intervals_by_caravan: dict[str, list[tuple[date, date, str]]] = {}
+        for reservation in pending:
+            intervals_by_caravan.setdefault(reservation.caravan_id, []).append(
+                (reservation.start_date, reservation.end_date, reservation.reservation_id)
+            )
+        # 새 인덱스를 모두 만든 뒤(겹치면 여기서 예외) 저장소와 인덱스를 함께 교체합니다.
+        rebuilt = {
+            caravan_id: IntervalIndex.build([*self._bookings_by_caravan.get(caravan_id, ()), *intervals])
+            for caravan_id, intervals in intervals_by_caravan.items()
+        }
+        for reservation in pending:
+            self._reservations[reservation.reservation_id] = reservation
+        self._bookings_by_caravan.update(rebuilt)
+        logger.debug("리포지토리: 예약 %s건 대량 추가됨", len(pending))
+
+    def iter_all(self) -> Iterator[Reservation]:
+        return iter(list(self._reservations.values()))
+
+    def reserve_if_available(self, reservation: Reservation) -> bool:
+        if not self.is_caravan_available(reservation.caravan_id, reservation.start_date, reservation.end_date):
+            return False
+        self.add(reservation)
         return True
 
+    def is_caravan_available(self, caravan_id: str, start_date: date, end_date: date) -> bool:
+        caravan_bookings = self._bookings_by_caravan.get(caravan_id)
+        if caravan_bookings is None:
+            return True
+        return not caravan_bookings.overlaps(start_date, end_date)
+
+    def find_available_caravan_ids(self, caravan_ids: list[str], start_date: date, end_date: date) -> list[str]:
+        bookings = self._bookings_by_caravan
+        return [
+            caravan_id for caravan_id in caravan_ids
+            if caravan_id not in bookings or not bookings[caravan_id].overlaps(start_date, end_date)
+        ]
+
 # --- Payment & Review Repositories ---
 from src.repositories.base import PaymentRepository, ReviewRepository
-from src.models.payment import Payment
+from src.models.payment import Payment, ACTIVE_PAYMENT_STATUSES
 from src.models.review import Review
 
 class InMemoryPaymentRepository(PaymentRepository):
+    """결제 ID 외에 멱등 키, 예약 ID 기준 보조 인덱스를 유지합니다."""
     def __init__(self):
         self._payments: dict[str, Payment] = {}
+        self._by_idempotency_key: dict[str, str] = {} # idempotency_key -> payment_id
+        self._by_reservation: dict[str, list[str]] = {} # reservation_id -> payment_id 목록 (저장 순서)
 
     def add(self, payment: Payment):
+        if payment.payment_id not in self._payments:
+            self._by_reservation.setdefault(payment.reservation_id, []).append(payment.payment_id)
+        if payment.idempotency_key is not None:
+            self._by_idempotency_key[payment.idempotency_key] = payment.payment_id
         self._payments[payment.payment_id] = payment
-        print(f"결제 리포지토리: 결제 {payment.payment_id} 추가됨")
+        logger.debug("결제 리포지토리: 결제 %s 추가됨", payment.payment_id)
 
     def get_by_id(self, payment_id: str) -> Payment | None:
-        # vvv --- 수정된 부분 --- vvv
-        return self._payments.get(payment_id) # ❗️ ']' 기호 삭제
-        # ^^^ --- 수정된 부분 --- ^^^
+        return self._payments.get(payment_id)
+
+    def add_if_absent(self, payment: Payment) -> Payment:
+        existing = self._existing_for(payment)
+        if existing is not None:
+            return existing
+        self.add(payment)
+        return payment
+
+    def _existing_for(self, payment: Payment) -> Payment | None:
+        """add_if_absent가 저장하지 않을 이유가 되는 기존 결제 (멱등 키 우선, 그다음 예약의 진행 중/완료 결제)"""
+        if payment.idempotency_key in self._by_idempotency_key:
+            return self._payments[self._by_idempotency_key[payment.idempotency_key]]
+        for payment_id in self._by_reservation.get(payment.reservation_id, ()):
+            if self._payments[payment_id].status in ACTIVE_PAYMENT_STATUSES:
+                return self._payments[payment_id]
+        return None
+
+    def add_all(self, payments: list[Payment]):
+        for payment in payments:
+            self.add(payment)
+
+    def get_by_idempotency_key(self, idempotency_key: str) -> Payment | None:
+        payment_id = self._by_idempotency_key.get(idempotency_key)
+        return self._payments.get(payment_id) if payment_id is not None else None
+
+    def find_by_reservation_id(self, reservation_id: str) -> list[Payment]:
+        return [self._payments[payment_id] for payment_id in self._by_reservation.get(reservation_id, ())]
 
 class InMemoryReviewRepository(ReviewRepository):
     def __init__(self):
@@ -68,32 +149,115 @@ class InMemoryReviewRepository(ReviewRepository):
     def add(self, review: Review):
         self._reviews[review.review_id] = review
         self._reviews_by_reservation[review.reservation_id] = review
-        print(f"리뷰 리포지토리: 리뷰 {review.review_id} 추가됨")
+        logger.debug("리뷰 리포지토리: 리뷰 %s 추가됨", review.review_id)
 
     def get_by_reservation_id(self, reservation_id: str) -> Review | None:
         return self._reviews_by_reservation.get(reservation_id)
 
 # --- Caravan & User Repositories ---
+from bisect import bisect_left, bisect_right
 from src.repositories.base import CaravanRepository
 from src.models.caravan import Caravan
+from src.models.common import CaravanStatus
+from src.models.page import Page
 
 class InMemoryCaravanRepository(CaravanRepository):
+    """
+    (capacity, caravan_id) 정렬 보조 인덱스를 유지하므로
+    수용 인원 범위 조회는 O(log n + k)입니다. (수용 인원을 바꾸면 add()로 다시 저장)
+    """
     def __init__(self):
         self._caravans: dict[str, Caravan] = {}
+        # 같은 위치끼리 대응하는 정렬 리스트 (결과를 dict 조회 없이 슬라이스로 바로 꺼내기 위함)
+        self._capacity_keys: list[tuple[int, str]] = []
+        self._capacity_caravans: list[Caravan] = []
+        self._indexed_keys: dict[str, tuple[int, str]] = {} # caravan_id -> 인덱스에 들어간 키
 
     def add(self, caravan: Caravan):
+        self._unindex(caravan.caravan_id)
+        key = (caravan.capacity, caravan.caravan_id)
+        pos = bisect_left(self._capacity_keys, key)
+        self._capacity_keys.insert(pos, key)
+        self._capacity_caravans.insert(pos, caravan)
+        self._indexed_keys[caravan.caravan_id] = key
         self._caravans[caravan.caravan_id] = caravan
-        print(f"카라반 리포지토리: 카라반 {caravan.caravan_id} 추가됨")
+        logger.debug("카라반 리포지토리: 카라반 %s 추가됨", caravan.caravan_id)
+
+    def add_all(self, caravans: list[Caravan], rebuild_index: bool = True):
+        """대량 적재: 인덱스를 건별 삽입 대신 마지막에 한 번 정렬합니다."""
+        for caravan in caravans:
+            self._caravans[caravan.caravan_id] = caravan
+        if rebuild_index:
+            self.rebuild_index()
+
+    def rebuild_index(self):
+        ordered = sorted(self._caravans.values(), key=lambda c: (c.capacity, c.caravan_id))
+        self._capacity_keys = [(c.capacity, c.caravan_id) for c in ordered]
+        self._capacity_caravans = ordered
+        self._indexed_keys = {key[1]: key for key in self._capacity_keys}
+
+    def _unindex(self, caravan_id: str):
+        key = self._indexed_keys.pop(caravan_id, None)
+        if key is not None:
+            pos = bisect_left(self._capacity_keys, key)
+            del self._capacity_keys[pos]
+            del self._capacity_caravans[pos]
+
+    def _capacity_range(self, min_capacity: int, max_capacity: int | None = None) -> tuple[int, int]:
+        start = bisect_left(self._capacity_keys, (min_capacity,))
+        if max_capacity is None:
+            return start, len(self._capacity_keys)
+        return start, bisect_left(self._capacity_keys, (max_capacity + 1,))
 
     def get_by_id(self, caravan_id: str) -> Caravan | None:
         return self._caravans.get(caravan_id)
 
     def search_by_capacity(self, min_capacity: int) -> list[Caravan]:
+        start, stop = self._capacity_range(min_capacity)
+        return self._capacity_caravans[start:stop]
+
+    def search_by_range(
+        self,
+        min_capacity: int = 1,
+        max_capacity: int | None = None,
+        min_daily_rate: int | None = None,
+        max_daily_rate: int | None = None,
+        available_only: bool = False
+    ) -> list[Caravan]:
+        start, stop = self._capacity_range(min_capacity, max_capacity)
+        candidates = self._capacity_caravans[start:stop]
+        if min_daily_rate is None and max_daily_rate is None and not available_only:
+            return candidates
+        return self._filter(candidates, min_daily_rate, max_daily_rate, available_only)
+
+    @staticmethod
+    def _filter(
+        candidates: list[Caravan],
+        min_daily_rate: int | None,
+        max_daily_rate: int | None,
+        available_only: bool
+    ) -> list[Caravan]:
+        low = min_daily_rate if min_daily_rate is not None else float("-inf")
+        high = max_daily_rate if max_daily_rate is not None else float("inf")
         return [
-            caravan for caravan in self._caravans.values()
-            if caravan.capacity >= min_capacity
+            caravan for caravan in candidates
+            if low <= caravan.daily_rate <= high
+            and (not available_only or caravan.status == CaravanStatus.AVAILABLE)
         ]
 
+    def search_by_capacity_page(self, min_capacity: int, limit: int, cursor: str | None = None) -> Page[Caravan]:
+        # 커서('capacity:caravan_id') 위치부터 이분 탐색으로 시작하므로 앞 페이지를 다시 훑지 않습니다.
+        start, stop = self._capacity_range(min_capacity)
+        if cursor is not None:
+            capacity, _, caravan_id = cursor.partition(":")
+            start = max(start, bisect_right(self._capacity_keys, (int(capacity), caravan_id)))
+
+        items = self._capacity_caravans[start:min(stop, start + limit)]
+        if start + limit < stop:
+            capacity, caravan_id = self._capacity_keys[start + limit - 1]
+            return Page(items=items, next_cursor=f"{capacity}:{caravan_id}")
+        return Page(items=items, next_cursor=None)
+
 from src.repositories.base import UserRepository
 from src.models.user import User
 
@@ -105,7 +269,7 @@ class InMemoryUserRepository(UserRepository):
     def add(self, user: User):
         self._users_by_id[user.user_id] = user
         self._users_by_username[user.username] = user
-        print(f"사용자 리포지토리: {user.username} 추가됨")
+        logger.debug("사용자 리포지토리: %s 추가됨", user.username)
 
     def get_by_username(self, username: str) -> User | None:
         return self._users_by_username.get(username)
\ No newline at end of file
@@ -0,0 +1,48 @@
+# src/repositories/month_bitmap.py
+"""
+카라반 예약 달력의 월별 비트맵 (정수 비트셋)
+
+- 한 달을 정수 하나로 표현하며, (일 - 1)번째 비트가 1이면 그날 밤이 예약된 것입니다.
+- 숙박 기간은 [start_date, end_date) 반열림 구간입니다. (체크아웃 날짜의 밤은 포함하지 않음)
+- 기간 확인은 월마다 AND 한 번, 한 달의 빈 밤 수는 popcount 한 번으로 계산합니다.
+"""
+import calendar
+from collections.abc import Iterator, Mapping
+from datetime import date, timedelta
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+def next_month(month: date) -> date:
+    return (month.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+def days_in_month(month: date) -> int:
+    return calendar.monthrange(month.year, month.month)[1]
+
+def full_mask(month: date) -> int:
+    return (1 << days_in_month(month)) - 1
+
+def night_masks(start_date: date, end_date: date) -> Iterator[tuple[date, int]]:
+    """[start_date, end_date) 기간의 밤들을 (월 첫날, 비트마스크) 쌍으로 나눕니다."""
+    day = start_date
+    while day < end_date:
+        month = month_start(day)
+        last = min(end_date, next_month(month)) # 이 달에서 마지막 밤의 다음 날
+        yield month, ((1 << (last - day).days) - 1) << (day.day - 1)
+        day = last
+
+def is_free(masks: Mapping[date, int], start_date: date, end_date: date) -> bool:
+    """월별 비트맵(masks)에서 기간의 모든 밤이 비어 있는지 확인합니다. (없는 달은 모두 빈 것으로 간주)"""
+    return all(not masks.get(month, 0) & mask for month, mask in night_masks(start_date, end_date))
+
+def booked_days(mask: int) -> list[int]:
+    """예약된 밤의 날짜(일) 목록"""
+    days = []
+    while mask:
+        low = mask & -mask
+        days.append(low.bit_length())
+        mask ^= low
+    return days
+
+def free_nights(month: date, mask: int) -> int:
+    return days_in_month(month) - (mask & full_mask(month)).bit_count()
@@ -0,0 +1,390 @@
+# src/repositories/sql_repository.py
+"""
+SQLAlchemy(Core) 기반 리포지토리 구현체
+
+InMemory*Repository와 같은 인터페이스를 구현하므로 서비스 계층 코드를 그대로 운영 DB에 연결할 수 있습니다.
+- 모든 리포지토리는 하나의 Engine(커넥션 풀)을 공유하고, 메서드 호출마다 풀에서 커넥션을 빌려 트랜잭션 1개로 처리합니다.
+- 예약 가능 여부 확인은 SQL(EXISTS)로 처리하며, reserve_if_available은 INSERT ... SELECT ... WHERE NOT EXISTS
+  한 문장으로 확인과 저장을 원자적으로 수행합니다.
+"""
+import logging
+from collections.abc import Iterator
+from datetime import date
+import sqlalchemy as sa
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.pool import StaticPool
+from src.models.caravan import Caravan
+from src.models.common import UserRole, CaravanStatus, ReservationStatus
+from src.models.page import Page
+from src.models.payment import Payment, PaymentStatus, ACTIVE_PAYMENT_STATUSES
+from src.models.reservation import Reservation
+from src.models.review import Review
+from src.models.user import User
+from src.repositories.base import (ReservationRepository, CaravanRepository, UserRepository,
+                                   PaymentRepository, ReviewRepository)
+from src.repositories.sqlite_profile import SqliteProfile, install_sqlite_profile
+from src.exceptions.custom_exceptions import ValidationError, ReservationConflictError
+
+logger = logging.getLogger(__name__)
+
+# IN (...) 목록 1회당 최대 바인드 변수 수 (오래된 SQLite의 999개 제한)
+IN_CLAUSE_CHUNK = 900
+
+metadata = sa.MetaData()
+
+users = sa.Table(
+    "users", metadata,
+    sa.Column("user_id", sa.String(36), primary_key=True),
+    sa.Column("username", sa.String(50), nullable=False, unique=True),
+    sa.Column("role", sa.Enum(UserRole), nullable=False),
+    sa.Column("trust_score", sa.Float, nullable=False),
+)
+
+caravans = sa.Table(
+    "caravans", metadata,
+    sa.Column("caravan_id", sa.String(36), primary_key=True),
+    sa.Column("host_id", sa.String(36), nullable=False),
+    sa.Column("name", sa.String(100), nullable=False),
+    sa.Column("capacity", sa.Integer, nullable=False),
+    sa.Column("daily_rate", sa.Integer, nullable=False),
+    sa.Column("status", sa.Enum(CaravanStatus), nullable=False),
+    sa.Column("amenities", sa.JSON, nullable=False),
+    sa.Index("ix_caravans_capacity", "capacity", "caravan_id"), # 수용 인원 범위 조회 + 키셋 페이지
+)
+
+reservations = sa.Table(
+    "reservations", metadata,
+    sa.Column("reservation_id", sa.String(36), primary_key=True),
+    sa.Column("guest_id", sa.String(36), nullable=False),
+    sa.Column("caravan_id", sa.String(36), nullable=False),
+    sa.Column("start_date", sa.Date, nullable=False),
+    sa.Column("end_date", sa.Date, nullable=False),
+    sa.Column("total_price", sa.Integer, nullable=False),
+    sa.Column("status", sa.Enum(ReservationStatus), nullable=False),
+    sa.Index("ix_reservations_caravan_dates", "caravan_id", "start_date", "end_date"), # 겹침 확인
+)
+
+payments = sa.Table(
+    "payments", metadata,
+    sa.Column("payment_id", sa.String(36), primary_key=True),
+    sa.Column("reservation_id", sa.String(36), nullable=False, index=True),
+    sa.Column("amount", sa.Integer, nullable=False),
+    sa.Column("status", sa.Enum(PaymentStatus), nullable=False),
+    sa.Column("created_at", sa.DateTime, nullable=False),
+    sa.Column("idempotency_key", sa.String(64), nullable=True, unique=True), # 같은 키로 재시도하면 UNIQUE 위반
+    sa.Column("gateway_reference", sa.String(64), nullable=True),
+)
+
+reviews = sa.Table(
+    "reviews", metadata,
+    sa.Column("review_id", sa.String(36), primary_key=True),
+    sa.Column("reservation_id", sa.String(36), nullable=False, unique=True),
+    sa.Column("guest_id", sa.String(36), nullable=False),
+    sa.Column("host_id", sa.String(36), nullable=False),
+    sa.Column("rating", sa.Integer, nullable=False),
+    sa.Column("comment", sa.Text, nullable=False),
+    sa.Column("created_at", sa.DateTime, nullable=False),
+)
+
+def create_repository_engine(url: str = "sqlite://", sqlite_profile: SqliteProfile | None = None,
+                             **engine_kwargs) -> sa.Engine:
+    """
+    리포지토리용 Engine을 만들고 테이블을 생성합니다.
+    - 메모리 SQLite('sqlite://')는 커넥션마다 DB가 따로 생기므로 커넥션 1개를 공유합니다. (StaticPool)
+    - 그 외에는 SQLAlchemy 기본 커넥션 풀을 사용합니다. (pool_size 등은 engine_kwargs로 조정)
+    - sqlite_profile을 주면 커넥션마다 PRAGMA(WAL 등)를 적용합니다. (sqlite_profile.py)
+    """
+    if url in ("sqlite://", "sqlite:///:memory:"):
+        engine_kwargs.setdefault("poolclass", StaticPool)
+        engine_kwargs.setdefault("connect_args", {"check_same_thread": False})
+    engine = sa.create_engine(url, **engine_kwargs)
+    install_sqlite_profile(engine, sqlite_profile)
+    metadata.create_all(engine)
+    return engine
+
+def _upsert(conn: sa.Connection, table: sa.Table, row: dict):
+    """기본 키가 같은 행이 있으면 갱신, 없으면 추가합니다. (InMemory 리포지토리의 dict 덮어쓰기와 동일)"""
+    key = table.primary_key.columns[0]
+    updated = conn.execute(table.update().where(key == row[key.name]).values(row))
+    if updated.rowcount == 0:
+        conn.execute(table.insert().values(row))
+
+def _overlapping(caravan_id, start_date: date, end_date: date):
+    """[start_date, end_date]와 겹치는 예약 조건 (양 끝 포함, InMemory 리포지토리와 동일)"""
+    return sa.and_(
+        reservations.c.caravan_id == caravan_id,
+        reservations.c.start_date <= end_date,
+        reservations.c.end_date >= start_date,
+    )
+
+class SqlReservationRepository(ReservationRepository):
+    def __init__(self, engine: sa.Engine):
+        self._engine = engine
+
+    def add(self, reservation: Reservation):
+        if not self.reserve_if_available(reservation):
+            raise ReservationConflictError("선택한 날짜에 이미 예약이 있습니다.")
+
+    def reserve_if_available(self, reservation: Reservation) -> bool:
+        row = _reservation_row(reservation)
+        candidate = sa.select(*(
+            sa.literal(row[column.name], column.type).label(column.name) for column in reservations.columns
+        )).where(~sa.exists().where(_overlapping(reservation.caravan_id, reservation.start_date, reservation.end_date)))
+        try:
+            with self._engine.begin() as conn:
+                if conn.dialect.name != "sqlite":
+                    # SQLite는 쓰기가 직렬화되지만, 그 외 DB는 같은 카라반의 동시 예약을 행 잠금으로 순서화합니다.
+                    conn.execute(sa.select(caravans.c.caravan_id).where(
+                        caravans.c.caravan_id == reservation.caravan_id).with_for_update())
+                inserted = conn.execute(reservations.insert().from_select(list(row), candidate))
+        except IntegrityError:
+            raise ReservationConflictError(f"예약 ID {reservation.reservation_id}가 이미 존재합니다.")
+
+        if inserted.rowcount == 0:
+            return False
+        logger.debug("SQL 리포지토리: 예약 %s 추가됨", reservation.reservation_id)
+        return True
+
+    def add_all(self, reservation_list: list[Reservation], rebuild_index: bool = True):
+        """대량 적재: executemany INSERT 한 번 (겹침 확인은 호출하는 쪽에서 끝난 것으로 봅니다)"""
+        if not reservation_list:
+            return
+        try:
+            with self._engine.begin() as conn:
+                conn.execute(reservations.insert(), [_reservation_row(r) for r in reservation_list])
+        except IntegrityError:
+            raise ReservationConflictError("이미 존재하거나 중복된 예약 ID가 있습니다.")
+
+    def iter_all(self) -> Iterator[Reservation]:
+        # 서버 측 커서(지원 DB)로 나눠 가져오므로 전체 결과를 한 번에 메모리에 올리지 않습니다.
+        with self._engine.connect() as conn:
+            result = conn.execution_options(yield_per=1000).execute(
+                reservations.select().order_by(reservations.c.reservation_id))
+            for row in result.mappings():
+                yield Reservation(**row)
+
+    def get_by_id(self, reservation_id: str) -> Reservation | None:
+        with self._engine.connect() as conn:
+            row = conn.execute(reservations.select().where(
+                reservations.c.reservation_id == reservation_id)).mappings().first()
+        return Reservation(**row) if row else None
+
+    def is_caravan_available(self, caravan_id: str, start_date: date, end_date: date) -> bool:
+        with self._engine.connect() as conn:
+            taken = conn.execute(sa.select(sa.exists().where(
+                _overlapping(caravan_id, start_date, end_date)))).scalar()
+        return not taken
+
+    def find_available_caravan_ids(self, caravan_ids: list[str], start_date: date, end_date: date) -> list[str]:
+        # 카라반마다 질의하지 않고, 겹치는 예약이 있는 카라반 ID만 IN 목록 단위로 한 번에 조회합니다.
+        booked: set[str] = set()
+        with self._engine.connect() as conn:
+            for i in range(0, len(caravan_ids), IN_CLAUSE_CHUNK):
+                chunk = caravan_ids[i:i + IN_CLAUSE_CHUNK]
+                booked.update(conn.execute(sa.select(reservations.c.caravan_id).distinct().where(
+                    reservations.c.caravan_id.in_(chunk),
+                    reservations.c.start_date <= end_date,
+                    reservations.c.end_date >= start_date,
+                )).scalars())
+        return [caravan_id for caravan_id in caravan_ids if caravan_id not in booked]
+
+def _reservation_row(reservation: Reservation) -> dict:
+    return {
+        "reservation_id": reservation.reservation_id,
+        "guest_id": reservation.guest_id,
+        "caravan_id": reservation.caravan_id,
+        "start_date": reservation.start_date,
+        "end_date": reservation.end_date,
+        "total_price": reservation.total_price,
+        "status": reservation.status,
+    }
+
+class SqlCaravanRepository(CaravanRepository):
+    def __init__(self, engine: sa.Engine):
+        self._engine = engine
+
+    def add(self, caravan: Caravan):
+        with self._engine.begin() as conn:
+            _upsert(conn, caravans, _caravan_row(caravan))
+        logger.debug("SQL 카라반 리포지토리: 카라반 %s 추가됨", caravan.caravan_id)
+
+    def add_all(self, caravan_list: list[Caravan], rebuild_index: bool = True):
+        """대량 적재: 기존 ID를 한 번에 지우고 executemany INSERT 한 번으로 저장합니다."""
+        rows = [_caravan_row(caravan) for caravan in caravan_list]
+        if not rows:
+            return
+        with self._engine.begin() as conn:
+            ids = [row["caravan_id"] for row in rows]
+            for i in range(0, len(ids), IN_CLAUSE_CHUNK):
+                conn.execute(caravans.delete().where(caravans.c.caravan_id.in_(ids[i:i + IN_CLAUSE_CHUNK])))
+            conn.execute(caravans.insert(), rows)
+
+    def get_by_id(self, caravan_id: str) -> Caravan | None:
+        with self._engine.connect() as conn:
+            row = conn.execute(caravans.select().where(caravans.c.caravan_id == caravan_id)).mappings().first()
+        return Caravan(**row) if row else None
+
+    def search_by_capacity(self, min_capacity: int) -> list[Caravan]:
+        return self.search_by_range(min_capacity=min_capacity)
+
+    def search_by_range(
+        self,
+        min_capacity: int = 1,
+        max_capacity: int | None = None,
+        min_daily_rate: int | None = None,
+        max_daily_rate: int | None = None,
+        available_only: bool = False
+    ) -> list[Caravan]:
+        query = caravans.select().where(caravans.c.capacity >= min_capacity)
+        if max_capacity is not None:
+            query = query.where(caravans.c.capacity <= max_capacity)
+        if min_daily_rate is not None:
+            query = query.where(caravans.c.daily_rate >= min_daily_rate)
+        if max_daily_rate is not None:
+            query = query.where(caravans.c.daily_rate <= max_daily_rate)
+        if available_only:
+            query = query.where(caravans.c.status == CaravanStatus.AVAILABLE)
+        return self._fetch(query.order_by(caravans.c.capacity, caravans.c.caravan_id))
+
+    def search_by_capacity_page(self, min_capacity: int, limit: int, cursor: str | None = None) -> Page[Caravan]:
+        # 커서 형식은 InMemoryCaravanRepository와 같습니다. ('capacity:caravan_id')
+        query = caravans.select().where(caravans.c.capacity >= min_capacity)
+        if cursor is not None:
+            capacity, _, caravan_id = cursor.partition(":")
+            query = query.where(sa.tuple_(caravans.c.capacity, caravans.c.caravan_id) > (int(capacity), caravan_id))
+        items = self._fetch(query.order_by(caravans.c.capacity, caravans.c.caravan_id).limit(limit + 1))
+        if len(items) > limit:
+            last = items[limit - 1]
+            return Page(items=items[:limit], next_cursor=f"{last.capacity}:{last.caravan_id}")
+        return Page(items=items, next_cursor=None)
+
+    def _fetch(self, query) -> list[Caravan]:
+        with self._engine.connect() as conn:
+            return [Caravan(**row) for row in conn.execute(query).mappings()]
+
+def _caravan_row(caravan: Caravan) -> dict:
+    return {
+        "caravan_id": caravan.caravan_id,
+        "host_id": caravan.host_id,
+        "name": caravan.name,
+        "capacity": caravan.capacity,
+        "daily_rate": caravan.daily_rate,
+        "status": caravan.status,
+        "amenities": list(caravan.amenities),
+    }
+
+class SqlUserRepository(UserRepository):
+    def __init__(self, engine: sa.Engine):
+        self._engine = engine
+
+    def add(self, user: User):
+        row = {"user_id": user.user_id, "username": user.username,
+               "role": user.role, "trust_score": user.trust_score}
+        try:
+            with self._engine.begin() as conn:
+                _upsert(conn, users, row)
+        except IntegrityError:
+            # 사용자 이름은 UNIQUE이므로, 서비스의 중복 확인 이후 동시에 가입한 경우도 여기서 막힙니다.
+            raise ValidationError(f"사용자 이름 '{user.username}'(은)는 이미 존재합니다.")
+        logger.debug("SQL 사용자 리포지토리: %s 추가됨", user.username)
+
+    def get_by_username(self, username: str) -> User | None:
+        with self._engine.connect() as conn:
+            row = conn.execute(users.select().where(users.c.username == username)).mappings().first()
+        return User(**row) if row else None
+
+def _payment_row(payment: Payment) -> dict:
+    return {"payment_id": payment.payment_id, "reservation_id": payment.reservation_id,
+            "amount": payment.amount, "status": payment.status, "created_at": payment.created_at,
+            "idempotency_key": payment.idempotency_key, "gateway_reference": payment.gateway_reference}
+
+class SqlPaymentRepository(PaymentRepository):
+    def __init__(self, engine: sa.Engine):
+        self._engine = engine
+
+    def add(self, payment: Payment):
+        with self._engine.begin() as conn:
+            _upsert(conn, payments, _payment_row(payment))
+        logger.debug("SQL 결제 리포지토리: 결제 %s 추가됨", payment.payment_id)
+
+    def get_by_id(self, payment_id: str) -> Payment | None:
+        return self._first(payments.c.payment_id == payment_id)
+
+    def add_if_absent(self, payment: Payment) -> Payment:
+        """
+        INSERT ... SELECT ... WHERE NOT EXISTS(같은 예약의 진행 중/완료 결제) 한 문장으로 확인과 저장을 처리하고,
+        같은 멱등 키의 동시 저장은 UNIQUE 제약으로 막습니다. 저장하지 못했으면 이미 있는 결제를 다시 읽어 반환합니다.
+        """
+        row = _payment_row(payment)
+        active = sa.exists().where(payments.c.reservation_id == payment.reservation_id,
+                                   payments.c.status.in_(list(ACTIVE_PAYMENT_STATUSES)))
+        candidate = sa.select(*(
+            sa.literal(row[column.name], column.type).label(column.name) for column in payments.columns
+        )).where(~active)
+        try:
+            with self._engine.begin() as conn:
+                if conn.dialect.name != "sqlite":
+                    # 같은 예약의 동시 결제를 예약 행 잠금으로 순서화합니다. (reserve_if_available과 같은 방식)
+                    conn.execute(sa.select(reservations.c.reservation_id).where(
+                        reservations.c.reservation_id == payment.reservation_id).with_for_update())
+                inserted = conn.execute(payments.insert().from_select(list(row), candidate))
+        except IntegrityError:
+            inserted = None
+        if inserted is not None and inserted.rowcount == 1:
+            logger.debug("SQL 결제 리포지토리: 결제 %s 추가됨", payment.payment_id)
+            return payment
+
+        existing = None
+        if payment.idempotency_key is not None:
+            existing = self.get_by_idempotency_key(payment.idempotency_key)
+        if existing is None:
+            existing = self._first(payments.c.reservation_id == payment.reservation_id,
+                                   payments.c.status.in_(list(ACTIVE_PAYMENT_STATUSES)))
+        if existing is None:
+            raise ValidationError(f"결제 ID {payment.payment_id}가 이미 존재합니다.")
+        return existing
+
+    def add_all(self, payment_list: list[Payment]):
+        """기존 ID를 한 번에 지우고 executemany INSERT 한 번으로 저장합니다. (트랜잭션 1개)"""
+        rows = [_payment_row(payment) for payment in payment_list]
+        if not rows:
+            return
+        with self._engine.begin() as conn:
+            ids = [row["payment_id"] for row in rows]
+            for i in range(0, len(ids), IN_CLAUSE_CHUNK):
+                conn.execute(payments.delete().where(payments.c.payment_id.in_(ids[i:i + IN_CLAUSE_CHUNK])))
+            conn.execute(payments.insert(), rows)
+
+    def get_by_idempotency_key(self, idempotency_key: str) -> Payment | None:
+        return self._first(payments.c.idempotency_key == idempotency_key)
+
+    def find_by_reservation_id(self, reservation_id: str) -> list[Payment]:
+        query = payments.select().where(payments.c.reservation_id == reservation_id).order_by(
+            payments.c.created_at, payments.c.payment_id)
+        with self._engine.connect() as conn:
+            return [Payment(**row) for row in conn.execute(query).mappings()]
+
+    def _first(self, *conditions) -> Payment | None:
+        with self._engine.connect() as conn:
+            row = conn.execute(payments.select().where(*conditions)).mappings().first()
+        return Payment(**row) if row else None
+
+class SqlReviewRepository(ReviewRepository):
+    def __init__(self, engine: sa.Engine):
+        self._engine = engine
+
+    def add(self, review: Review):
+        row = {"review_id": review.review_id, "reservation_id": review.reservation_id,
+               "guest_id": review.guest_id, "host_id": review.host_id, "rating": review.rating,
+               "comment": review.comment, "created_at": review.created_at}
+        try:
+            with self._engine.begin() as conn:
+                _upsert(conn, reviews, row)
+        except IntegrityError:
+            raise ValidationError("이미 이 예약에 대한 리뷰를 작성했습니다.")
+        logger.debug("SQL 리뷰 리포지토리: 리뷰 %s 추가됨", review.review_id)
+
+    def get_by_reservation_id(self, reservation_id: str) -> Review | None:
+        with self._engine.connect() as conn:
+            row = conn.execute(reviews.select().where(reviews.c.reservation_id == reservation_id)).mappings().first()
+        return Review(**row) if row else None
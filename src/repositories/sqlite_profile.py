@@ -0,0 +1,97 @@
+# src/repositories/sqlite_profile.py
+"""
+SQLite 파일 DB의 엔진 설정 (PRAGMA + 커넥션 풀 크기)
+
+- 기본 롤백 저널에서는 쓰기 커밋 중에 읽기가, 읽기 중에 쓰기 커밋이 서로를 막습니다.
+  WAL 저널에서는 읽기가 스냅샷을 읽으므로 쓰기 1개와 읽기 여러 개가 동시에 진행됩니다.
+- PRAGMA는 커넥션마다 적용해야 하므로 엔진의 connect 이벤트에서 실행합니다. (install_sqlite_profile)
+- journal_mode=WAL은 DB 파일에 저장되어 유지됩니다. (프로필을 끄더라도 기존 파일은 WAL로 남음)
+- 메모리 DB('sqlite://')는 WAL을 쓰지 않으며, SQLite가 아닌 엔진에는 아무것도 하지 않습니다.
+
+환경 변수
+- SQLITE_PROFILE: "wal"(기본) 또는 "none"(SQLite 기본 설정 그대로)
+- SQLITE_SYNCHRONOUS, SQLITE_BUSY_TIMEOUT_MS, SQLITE_MMAP_SIZE, SQLITE_CACHE_SIZE_KIB: 개별 값 조정
+- DB_POOL_SIZE: 워커(프로세스)당 커넥션 수. 없으면 GUNICORN_THREADS(워커당 스레드 수, 기본 1)를 따릅니다.
+"""
+import logging
+import os
+from collections.abc import Mapping
+from dataclasses import dataclass
+import sqlalchemy as sa
+
+logger = logging.getLogger(__name__)
+
+SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+@dataclass(frozen=True)
+class SqliteProfile:
+    """
+    - journal_mode: WAL이면 읽기와 쓰기가 서로 막지 않음
+    - synchronous: WAL에서 NORMAL은 커밋마다 fsync하지 않고 체크포인트 때만 fsync (전원 장애 시 마지막 커밋만 유실 가능, DB 손상 없음)
+    - busy_timeout_ms: 잠금을 기다리는 최대 시간 (넘으면 "database is locked")
+    - mmap_size: 읽기를 메모리 맵으로 처리할 최대 바이트 수
+    - cache_size_kib: 커넥션당 페이지 캐시 크기 (PRAGMA cache_size의 음수 = KiB 단위)
+    """
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    busy_timeout_ms: int = 5_000
+    mmap_size: int = 256 * 1024 * 1024
+    cache_size_kib: int = 64 * 1024
+
+    def __post_init__(self):
+        if self.synchronous.upper() not in SYNCHRONOUS_MODES:
+            raise ValueError(f"synchronous는 {', '.join(SYNCHRONOUS_MODES)} 중 하나여야 합니다: {self.synchronous}")
+
+    def pragmas(self) -> list[str]:
+        return [
+            f"PRAGMA journal_mode={self.journal_mode}",
+            f"PRAGMA synchronous={self.synchronous.upper()}",
+            f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}",
+            f"PRAGMA mmap_size={int(self.mmap_size)}",
+            f"PRAGMA cache_size=-{int(self.cache_size_kib)}",
+        ]
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] = os.environ) -> "SqliteProfile | None":
+        """환경 변수로 프로필을 만듭니다. SQLITE_PROFILE=none이면 None (PRAGMA를 적용하지 않음)"""
+        if environ.get("SQLITE_PROFILE", "wal").lower() == "none":
+            return None
+        default = cls()
+        return cls(
+            synchronous=environ.get("SQLITE_SYNCHRONOUS", default.synchronous),
+            busy_timeout_ms=int(environ.get("SQLITE_BUSY_TIMEOUT_MS", default.busy_timeout_ms)),
+            mmap_size=int(environ.get("SQLITE_MMAP_SIZE", default.mmap_size)),
+            cache_size_kib=int(environ.get("SQLITE_CACHE_SIZE_KIB", default.cache_size_kib)),
+        )
+
+def is_memory_database(url: str | sa.URL) -> bool:
+    database = sa.make_url(url).database
+    return not database or database == ":memory:"
+
+def install_sqlite_profile(engine: sa.Engine, profile: SqliteProfile | None):
+    """engine이 새 커넥션을 열 때마다 profile의 PRAGMA를 실행하도록 connect 이벤트를 등록합니다."""
+    if profile is None or engine.dialect.name != "sqlite":
+        return
+    statements = profile.pragmas()
+    if is_memory_database(engine.url):
+        statements = [statement for statement in statements if "journal_mode" not in statement]
+
+    @sa.event.listens_for(engine, "connect")
+    def apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+    logger.info("SQLite 프로필 적용: %s", "; ".join(statements))
+
+def pool_options(environ: Mapping[str, str] = os.environ) -> dict:
+    """
+    워커(프로세스)당 커넥션 풀 설정. gunicorn 워커는 각자 풀을 가지므로,
+    워커가 동시에 처리하는 요청 수(스레드 수)만큼 커넥션을 두고 CLI/백그라운드 작업용 여유분을 더합니다.
+    """
+    threads = int(environ.get("GUNICORN_THREADS", 1))
+    pool_size = int(environ.get("DB_POOL_SIZE", threads))
+    return {"pool_size": pool_size, "max_overflow": max(2, pool_size // 2)}
@@ -0,0 +1,93 @@
+# src/serializers.py
+"""
+JSON 응답 직렬화 - 모델별 인코더와 (선택) orjson 빠른 경로
+
+- encoder_for(Caravan): 필드 목록을 한 번만 읽어 만든 전용 함수(obj -> dict)를 반환합니다.
+  asdict()처럼 값을 재귀적으로 deepcopy하지 않고, Enum은 이름(.name), date/datetime은 ISO 문자열,
+  list/tuple/set 필드는 얕은 list 복사로 바꿉니다.
+- dumps(value): orjson이 설치되어 있으면 orjson, 없으면 표준 json으로 UTF-8 bytes를 만듭니다.
+- iter_json_array(items, encode): 큰 결과를 batch_size개씩 직렬화해 JSON 배열 조각(bytes)으로 내보냅니다.
+"""
+import functools
+import json
+import types
+import typing
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import fields, is_dataclass
+from datetime import date
+from enum import Enum
+from itertools import islice
+
+try:
+    import orjson  # 선택 의존성: 있으면 직렬화를 C 구현으로 처리
+except ImportError:
+    orjson = None
+
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+STREAM_BATCH_SIZE = 500
+
+_stdlib_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+def dumps_stdlib(value) -> bytes:
+    return _stdlib_encoder.encode(value).encode()
+
+if orjson is not None:
+    def dumps(value) -> bytes:
+        return orjson.dumps(value)
+else:
+    dumps = dumps_stdlib
+
+def _unwrap_optional(annotation) -> tuple[object, bool]:
+    """X | None (Optional[X])이면 (X, True), 아니면 (annotation, False)"""
+    if typing.get_origin(annotation) in (typing.Union, types.UnionType):
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1 and len(typing.get_args(annotation)) == 2:
+            return args[0], True
+    return annotation, False
+
+def _field_expression(name: str, annotation) -> str:
+    attr = f"obj.{name}"
+    annotation, optional = _unwrap_optional(annotation)
+    origin = typing.get_origin(annotation) or annotation
+    if isinstance(origin, type) and issubclass(origin, Enum):
+        expression = f"{attr}.name"
+    elif isinstance(origin, type) and issubclass(origin, date):  # datetime도 date의 하위 클래스
+        expression = f"{attr}.isoformat()"
+    elif origin in (list, tuple, set, frozenset):
+        expression = f"list({attr})"
+    else:
+        return attr
+    return f"({expression} if {attr} is not None else None)" if optional else expression
+
+@functools.cache
+def encoder_for(model: type) -> Callable[[object], dict]:
+    """
+    dataclass 모델의 전용 인코더를 만듭니다. (모델당 한 번 생성 후 재사용)
+    생성되는 함수는 {"필드": obj.필드, ...} 딕셔너리 리터럴 하나이므로 필드마다 분기하지 않습니다.
+    """
+    if not is_dataclass(model):
+        raise TypeError(f"dataclass 모델만 인코더를 만들 수 있습니다: {model!r}")
+    hints = typing.get_type_hints(model)
+    items = ", ".join(f"{f.name!r}: {_field_expression(f.name, hints[f.name])}" for f in fields(model))
+    source = f"def encode(obj):\n    return {{{items}}}\n"
+    namespace: dict = {}
+    exec(compile(source, f"<encoder {model.__qualname__}>", "exec"), namespace)
+    encode = namespace["encode"]
+    encode.__qualname__ = encode.__name__ = f"encode_{model.__name__.lower()}"
+    return encode
+
+def dumps_list(items: Iterable, encode: Callable[[object], dict]) -> bytes:
+    return dumps([encode(item) for item in items])
+
+def iter_json_array(items: Iterable, encode: Callable[[object], dict],
+                    batch_size: int = STREAM_BATCH_SIZE) -> Iterator[bytes]:
+    """
+    items를 JSON 배열 하나로 직렬화하되, 전체를 한 번에 만들지 않고 batch_size개씩 조각으로 내보냅니다.
+    조각을 모두 이어 붙이면 dumps_list(items, encode)와 같은 배열입니다.
+    """
+    iterator = iter(items)
+    separator = b"["
+    while batch := list(islice(iterator, batch_size)):
+        yield separator + dumps([encode(item) for item in batch])[1:-1]
+        separator = b","
+    yield b"[]" if separator == b"[" else b"]"
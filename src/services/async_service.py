@@ -0,0 +1,116 @@
+# src/services/async_service.py
+"""
+비동기(asyncio) 서비스 - 검색, 가용성, 견적, 예약 신청
+
+CaravanService/ReservationService와 같은 규칙(validate_request_rules, PricingEngine)을 쓰되,
+리포지토리는 Async*Repository로 await하므로 DB 호출을 기다리는 동안 이벤트 루프가 다른 요청을 처리합니다.
+알림 서비스는 호출 즉시 반환해야 합니다. (로그만 남기는 NotificationService 또는 큐 기반 AsyncNotificationService)
+"""
+import logging
+from datetime import date, timedelta
+from src.models.caravan import Caravan
+from src.models.common import UserRole
+from src.models.page import Page
+from src.models.reservation import Reservation
+from src.models.user import User
+from src.repositories.async_repository import AsyncCaravanRepository, AsyncReservationRepository, AsyncUserRepository
+from src.services.caravan_service import validate_page_cursor
+from src.services.factories import ReservationFactory
+from src.services.observers import NotificationService
+from src.services.pricing import PricingEngine, Quote
+from src.services.validators import ReservationValidator
+from src.exceptions.custom_exceptions import ValidationError, ReservationConflictError
+from src.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+
+logger = logging.getLogger(__name__)
+
+def validate_search_period(start_date: date | None, end_date: date | None):
+    if (start_date is None) != (end_date is None) or (start_date and end_date < start_date):
+        raise ValidationError("예약 날짜가 유효하지 않습니다.")
+
+class AsyncCaravanService:
+    def __init__(self, caravan_repo: AsyncCaravanRepository, reservation_repo: AsyncReservationRepository,
+                 user_repo: AsyncUserRepository):
+        self._caravan_repo = caravan_repo
+        self._reservation_repo = reservation_repo
+        self._user_repo = user_repo
+
+    async def get_user(self, username: str) -> User | None:
+        return await self._user_repo.get_by_username(username)
+
+    async def get_caravan(self, caravan_id: str) -> Caravan | None:
+        return await self._caravan_repo.get_by_id(caravan_id)
+
+    async def search_caravans(self, guest: User, min_capacity: int, start_date: date | None = None,
+                              end_date: date | None = None) -> list[Caravan]:
+        """CaravanService.search_caravans와 같습니다. (기간을 주면 예약 가능한 카라반만)"""
+        if guest.role != UserRole.GUEST:
+            raise ValidationError("게스트만 카라반을 검색할 수 있습니다.")
+        validate_search_period(start_date, end_date)
+        caravans = await self._caravan_repo.search_by_capacity(min_capacity)
+        if start_date is None:
+            return caravans
+        available_ids = set(await self._reservation_repo.find_available_caravan_ids(
+            [caravan.caravan_id for caravan in caravans], start_date, end_date
+        ))
+        return [caravan for caravan in caravans if caravan.caravan_id in available_ids]
+
+    async def search_caravans_page(self, guest: User, min_capacity: int, limit: int = DEFAULT_PAGE_SIZE,
+                                   cursor: str | None = None) -> Page[Caravan]:
+        if guest.role != UserRole.GUEST:
+            raise ValidationError("게스트만 카라반을 검색할 수 있습니다.")
+        if not (1 <= limit <= MAX_PAGE_SIZE):
+            raise ValidationError(f"페이지 크기는 1 이상 {MAX_PAGE_SIZE} 이하이어야 합니다.")
+        if cursor is not None:
+            validate_page_cursor(cursor)
+        return await self._caravan_repo.search_by_capacity_page(min_capacity, limit, cursor)
+
+    async def available_caravan_ids(self, caravan_ids: list[str], start_date: date, end_date: date) -> list[str]:
+        validate_search_period(start_date, end_date)
+        if not caravan_ids:
+            return []
+        return await self._reservation_repo.find_available_caravan_ids(caravan_ids, start_date, end_date)
+
+class AsyncReservationService:
+    def __init__(self, validator: ReservationValidator, repository: AsyncReservationRepository,
+                 factory: ReservationFactory, pricing_engine: PricingEngine,
+                 notification_service: NotificationService):
+        self._validator = validator
+        self._repository = repository
+        self._factory = factory
+        self._pricing_engine = pricing_engine
+        self._notification_service = notification_service
+
+    def quote(self, caravan: Caravan, start_date: date, end_date: date) -> Quote:
+        """종료일을 포함하는 기간(src 예약 규칙)의 견적. 가격 엔진은 미리 계산된 표만 읽으므로 await가 필요 없습니다."""
+        if end_date < start_date:
+            raise ValidationError("예약 날짜가 유효하지 않습니다.")
+        return self._pricing_engine.quote(caravan.daily_rate, start_date, end_date + timedelta(days=1))
+
+    async def create_reservation(self, guest: User, caravan: Caravan, start_date: date, end_date: date) -> Reservation:
+        """
+        ReservationService.create_reservation과 같은 절차이지만, 실패 이유를 API가 응답할 수 있도록
+        None을 반환하지 않고 ValidationError/ReservationConflictError를 그대로 발생시킵니다.
+        """
+        self._validator.validate_request_rules(guest, caravan, start_date, end_date)
+        reservation = self._factory.create_reservation(
+            guest_id=guest.user_id,
+            caravan_id=caravan.caravan_id,
+            start_date=start_date,
+            end_date=end_date,
+            total_price=self.quote(caravan, start_date, end_date).total_price
+        )
+        # 가용성 확인과 저장은 리포지토리가 한 번에(원자적으로) 처리합니다.
+        if not await self._repository.reserve_if_available(reservation):
+            logger.warning("예약 실패: %s (%s ~ %s) 기간 충돌", caravan.caravan_id, start_date, end_date)
+            raise ReservationConflictError("선택한 날짜에 이미 예약이 있습니다.")
+
+        self._notification_service.send_notification(
+            user_id=guest.user_id,
+            message=f"예약 신청이 완료되었습니다. (ID: {reservation.reservation_id})"
+        )
+        self._notification_service.send_notification(
+            user_id=caravan.host_id,
+            message=f"{caravan.name}에 새로운 예약 신청이 있습니다. 승인이 필요합니다."
+        )
+        return reservation
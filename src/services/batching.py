@@ -0,0 +1,77 @@
+# src/services/batching.py
+"""
+큐 + 워커 스레드 묶음 처리의 공통 부분 (AsyncNotificationService, SettlementPipeline)
+
+- 생산자는 _queue에 항목을 넣고, 워커 스레드가 큐에서 batch_size개까지 모아 _process_batch()를 한 번 호출합니다.
+- shutdown()은 워커 수만큼 종료 표시를 큐에 넣으므로, 그 앞에 들어온 항목은 모두 처리된 뒤 워커가 끝납니다.
+- _process_batch()에서 예외가 나도 로그만 남기고 워커는 다음 묶음을 계속 처리합니다.
+"""
+import logging
+import queue
+import threading
+from abc import ABC, abstractmethod
+
+logger = logging.getLogger(__name__)
+
+class BatchingWorker(ABC):
+    """
+    하위 클래스는 필요한 속성을 모두 설정한 뒤 __init__ 마지막에 _start_workers()를 호출하고,
+    _process_batch()에서 묶음 하나를 처리합니다. 통계 값은 _count()로 스레드 안전하게 올립니다.
+    """
+    _STOP = object()
+
+    def __init__(self, workers: int, max_queue_size: int, batch_size: int, thread_name: str):
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._batch_size = batch_size
+        self._stats_lock = threading.Lock()
+        self._closed = False
+        self._workers = [
+            threading.Thread(target=self._run_worker, name=f"{thread_name}-{i}", daemon=True)
+            for i in range(workers)
+        ]
+
+    def _start_workers(self):
+        for worker in self._workers:
+            worker.start()
+
+    @abstractmethod
+    def _process_batch(self, batch: list):
+        """큐에서 꺼낸 항목 묶음(1개 이상, batch_size개 이하)을 처리합니다."""
+        pass
+
+    def shutdown(self, timeout: float | None = None):
+        """새 항목을 받지 않고, 큐에 남은 항목을 모두 처리한 뒤 워커를 종료합니다."""
+        if self._closed:
+            return
+        self._closed = True
+        for _ in self._workers:
+            self._queue.put(self._STOP)
+        for worker in self._workers:
+            worker.join(timeout)
+
+    def _count(self, name: str, amount: int):
+        with self._stats_lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def _run_worker(self):
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                return
+            batch = [item]
+            stop_after_batch = False
+            while len(batch) < self._batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stop_after_batch = True
+                    break
+                batch.append(item)
+            try:
+                self._process_batch(batch)
+            except Exception:
+                logger.exception("%s: %s건 묶음 처리 중 예외 (워커는 계속 실행)", threading.current_thread().name, len(batch))
+            if stop_after_batch:
+                return
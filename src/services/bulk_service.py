@@ -0,0 +1,288 @@
+# src/services/bulk_service.py
+"""
+카라반/예약 대량 적재(CSV, JSONL)와 내보내기
+
+- 입력은 한 줄씩 읽어 chunk_size건마다 리포지토리 add_all()로 저장합니다. (건별 add/commit 없음)
+- 인메모리 리포지토리의 검색/가용성 인덱스는 적재 중에는 갱신하지 않고 마지막에 한 번 다시 만듭니다.
+- 내보내기도 페이지/커서 단위로 읽어 바로 쓰므로 전체 데이터를 메모리에 올리지 않습니다.
+"""
+import csv
+import json
+import logging
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import date
+from typing import IO
+from src.models.caravan import Caravan
+from src.models.common import CaravanStatus, ReservationStatus
+from src.models.reservation import Reservation
+from src.repositories.base import CaravanRepository, ReservationRepository
+from src.repositories.interval_index import IntervalIndex
+from src.services.caravan_service import validate_capacity
+from src.services.validators import ReservationValidator
+from src.constants import DEFAULT_DAILY_RATE
+from src.exceptions.custom_exceptions import ValidationError, ReservationConflictError
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_FORMATS = ("csv", "jsonl")
+CARAVAN_FIELDS = ["caravan_id", "host_id", "name", "capacity", "daily_rate", "status", "amenities"]
+RESERVATION_FIELDS = ["reservation_id", "guest_id", "caravan_id", "start_date", "end_date", "total_price", "status"]
+DEFAULT_CHUNK_SIZE = 1000
+
+@dataclass
+class InvalidRow:
+    """읽을 수 없는 입력 행 (JSON 문법 오류 등). 적재 시 해당 행 번호와 사유가 errors에 남습니다."""
+    message: str
+
+def read_rows(stream: IO[str], fmt: str) -> Iterator[dict | InvalidRow | None]:
+    """
+    CSV(헤더 포함) 또는 JSONL을 한 행씩 dict로 읽습니다.
+    JSONL은 물리적인 줄마다 하나씩 내보내 행 번호가 파일의 줄 번호와 같습니다.
+    (빈 줄은 None, JSON 문법 오류는 InvalidRow)
+    """
+    if fmt == "csv":
+        yield from csv.DictReader(stream)
+    elif fmt == "jsonl":
+        for line in stream:
+            if not line.strip():
+                yield None
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                yield InvalidRow(f"JSON 형식이 잘못되었습니다: {e.msg} ({e.colno}열)")
+    else:
+        raise ValidationError(f"지원하지 않는 형식입니다: {fmt} (csv 또는 jsonl)")
+
+def write_rows(stream: IO[str], rows: Iterable[dict], fmt: str, fieldnames: list[str]) -> int:
+    """행을 CSV 또는 JSONL로 바로바로 씁니다. 쓴 행 수를 반환합니다."""
+    if fmt not in SUPPORTED_FORMATS:
+        raise ValidationError(f"지원하지 않는 형식입니다: {fmt} (csv 또는 jsonl)")
+    writer = csv.DictWriter(stream, fieldnames=fieldnames) if fmt == "csv" else None
+    if writer is not None:
+        writer.writeheader()
+    count = 0
+    for row in rows:
+        if writer is not None:
+            writer.writerow(row)
+        else:
+            stream.write(json.dumps(row, ensure_ascii=False) + "\n")
+        count += 1
+    return count
+
+def format_from_path(path: str) -> str:
+    """파일 확장자로 형식을 정합니다. (.csv / .jsonl)"""
+    fmt = path.rsplit(".", 1)[-1].lower()
+    if fmt not in SUPPORTED_FORMATS:
+        raise ValidationError(f"파일 형식을 알 수 없습니다: {path} (.csv 또는 .jsonl)")
+    return fmt
+
+@dataclass
+class ImportResult:
+    imported: int = 0
+    errors: list[tuple[int, str]] = field(default_factory=list) # (행 번호, 사유)
+
+def _as_object(row) -> dict:
+    if isinstance(row, InvalidRow):
+        raise ValidationError(row.message)
+    if not isinstance(row, dict):
+        raise ValidationError(f"행이 JSON 객체가 아닙니다: {type(row).__name__}")
+    return row
+
+def _enum(enum_class, value, default):
+    if value in (None, ""):
+        return default
+    try:
+        return enum_class[str(value).upper()]
+    except KeyError:
+        raise ValidationError(f"알 수 없는 상태값입니다: {value}")
+
+def _int(row: dict, name: str, default: int | None = None) -> int:
+    value = row.get(name)
+    if value in (None, ""):
+        if default is None:
+            raise ValidationError(f"{name} 값이 없습니다.")
+        return default
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValidationError(f"{name} 값이 정수가 아닙니다: {value}")
+
+def _required(row: dict, name: str) -> str:
+    value = row.get(name)
+    if value in (None, ""):
+        raise ValidationError(f"{name} 값이 없습니다.")
+    return str(value)
+
+def caravan_from_row(row: dict) -> Caravan:
+    row = _as_object(row)
+    amenities = row.get("amenities") or []
+    if isinstance(amenities, str):
+        amenities = [item for item in amenities.split(";") if item] # CSV: '샤워;주방'
+    elif not isinstance(amenities, list):
+        raise ValidationError(f"amenities 값이 목록이 아닙니다: {amenities}")
+    caravan = Caravan(
+        host_id=_required(row, "host_id"),
+        name=_required(row, "name"),
+        capacity=_int(row, "capacity"),
+        daily_rate=_int(row, "daily_rate", DEFAULT_DAILY_RATE),
+        status=_enum(CaravanStatus, row.get("status"), CaravanStatus.AVAILABLE),
+        amenities=list(amenities),
+    )
+    if row.get("caravan_id"):
+        caravan.caravan_id = str(row["caravan_id"])
+    return caravan
+
+def caravan_to_row(caravan: Caravan, fmt: str) -> dict:
+    return {
+        "caravan_id": caravan.caravan_id,
+        "host_id": caravan.host_id,
+        "name": caravan.name,
+        "capacity": caravan.capacity,
+        "daily_rate": caravan.daily_rate,
+        "status": caravan.status.name,
+        "amenities": ";".join(caravan.amenities) if fmt == "csv" else list(caravan.amenities),
+    }
+
+def reservation_from_row(row: dict) -> Reservation:
+    row = _as_object(row)
+    try:
+        start_date = date.fromisoformat(_required(row, "start_date"))
+        end_date = date.fromisoformat(_required(row, "end_date"))
+    except ValueError as e:
+        raise ValidationError(f"날짜 형식이 잘못되었습니다 (YYYY-MM-DD): {e}")
+    reservation = Reservation(
+        guest_id=_required(row, "guest_id"),
+        caravan_id=_required(row, "caravan_id"),
+        start_date=start_date,
+        end_date=end_date,
+        total_price=_int(row, "total_price"),
+        status=_enum(ReservationStatus, row.get("status"), ReservationStatus.PENDING),
+    )
+    if row.get("reservation_id"):
+        reservation.reservation_id = str(row["reservation_id"])
+    return reservation
+
+def reservation_to_row(reservation: Reservation) -> dict:
+    return {
+        "reservation_id": reservation.reservation_id,
+        "guest_id": reservation.guest_id,
+        "caravan_id": reservation.caravan_id,
+        "start_date": reservation.start_date.isoformat(),
+        "end_date": reservation.end_date.isoformat(),
+        "total_price": reservation.total_price,
+        "status": reservation.status.name,
+    }
+
+class BulkImportService:
+    def __init__(
+        self,
+        caravan_repo: CaravanRepository,
+        reservation_repo: ReservationRepository,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ):
+        if chunk_size < 1:
+            raise ValidationError("chunk_size는 1 이상이어야 합니다.")
+        self._caravan_repo = caravan_repo
+        self._reservation_repo = reservation_repo
+        self._validator = ReservationValidator(reservation_repo)
+        self._chunk_size = chunk_size
+
+    def import_caravans(self, rows: Iterable[dict]) -> ImportResult:
+        """
+        카라반 행을 검증(수용 인원 규칙 등)한 뒤 chunk_size건씩 저장합니다.
+        잘못된 행(JSON 오류, 객체가 아닌 행 포함)은 건너뛰고 (행 번호, 사유)를 errors에 남깁니다. 같은 ID는 덮어씁니다.
+        """
+        result = ImportResult()
+        chunk: list[Caravan] = []
+        for line_no, row in enumerate(rows, start=1):
+            if row is None:
+                continue # 빈 줄 (행 번호만 차지)
+            try:
+                caravan = caravan_from_row(row)
+                validate_capacity(caravan.capacity)
+                if caravan.daily_rate < 0:
+                    raise ValidationError("1일 요금은 0 이상이어야 합니다.")
+            except ValidationError as e:
+                result.errors.append((line_no, e.message))
+                continue
+            chunk.append(caravan)
+            if len(chunk) >= self._chunk_size:
+                self._caravan_repo.add_all(chunk, rebuild_index=False)
+                result.imported += len(chunk)
+                chunk = []
+        if chunk:
+            self._caravan_repo.add_all(chunk, rebuild_index=False)
+            result.imported += len(chunk)
+        self._caravan_repo.rebuild_index()
+
+        logger.info("대량 적재: 카라반 %s건 저장, %s건 거부", result.imported, len(result.errors))
+        return result
+
+    def import_reservations(self, rows: Iterable[dict]) -> ImportResult:
+        """
+        예약 행을 검증(기간 규칙, 겹침)한 뒤 chunk_size건씩 저장합니다. 과거 예약 이관을 위해 지난 날짜도 허용합니다.
+        겹침은 이미 저장된 예약(리포지토리)과 이번 파일 안의 예약(임시 구간 인덱스) 모두와 비교합니다.
+        """
+        result = ImportResult()
+        chunk: list[tuple[int, Reservation]] = []
+        seen_ids: set[str] = set()
+        imported_by_caravan: dict[str, IntervalIndex] = {}
+
+        for line_no, row in enumerate(rows, start=1):
+            if row is None:
+                continue # 빈 줄 (행 번호만 차지)
+            try:
+                reservation = reservation_from_row(row)
+                self._validator.validate_period(reservation.start_date, reservation.end_date, allow_past=True)
+                if reservation.total_price < 0:
+                    raise ValidationError("총 금액은 0 이상이어야 합니다.")
+                if reservation.reservation_id in seen_ids:
+                    raise ValidationError(f"예약 ID {reservation.reservation_id}가 파일 안에서 중복됩니다.")
+                index = imported_by_caravan.setdefault(reservation.caravan_id, IntervalIndex())
+                if index.overlaps(reservation.start_date, reservation.end_date) or \
+                        not self._reservation_repo.is_caravan_available(
+                            reservation.caravan_id, reservation.start_date, reservation.end_date):
+                    raise ReservationConflictError("선택한 날짜에 이미 예약이 있습니다.")
+            except (ValidationError, ReservationConflictError) as e:
+                result.errors.append((line_no, e.message))
+                continue
+            index.add(reservation.start_date, reservation.end_date, reservation.reservation_id)
+            seen_ids.add(reservation.reservation_id)
+            chunk.append((line_no, reservation))
+            if len(chunk) >= self._chunk_size:
+                self._flush_reservations(chunk, result)
+                chunk = []
+        if chunk:
+            self._flush_reservations(chunk, result)
+        self._reservation_repo.rebuild_index()
+
+        logger.info("대량 적재: 예약 %s건 저장, %s건 거부", result.imported, len(result.errors))
+        return result
+
+    def _flush_reservations(self, chunk: list[tuple[int, Reservation]], result: ImportResult):
+        try:
+            self._reservation_repo.add_all([reservation for _, reservation in chunk], rebuild_index=False)
+        except ReservationConflictError as e:
+            # 이미 저장되어 있던 예약 ID와 충돌: 이 묶음은 통째로 저장되지 않음
+            result.errors.append((chunk[0][0], f"{chunk[0][0]}~{chunk[-1][0]}행 저장 실패: {e.message}"))
+            return
+        result.imported += len(chunk)
+
+    def export_caravans(self, stream: IO[str], fmt: str, page_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """카라반 전체를 (수용 인원, ID) 순서로 키셋 페이지 단위로 읽어 씁니다."""
+        def rows() -> Iterator[dict]:
+            cursor = None
+            while True:
+                page = self._caravan_repo.search_by_capacity_page(1, page_size, cursor)
+                for caravan in page.items:
+                    yield caravan_to_row(caravan, fmt)
+                if page.next_cursor is None:
+                    return
+                cursor = page.next_cursor
+        return write_rows(stream, rows(), fmt, CARAVAN_FIELDS)
+
+    def export_reservations(self, stream: IO[str], fmt: str) -> int:
+        return write_rows(stream, (reservation_to_row(r) for r in self._reservation_repo.iter_all()),
+                          fmt, RESERVATION_FIELDS)
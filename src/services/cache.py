@@ -0,0 +1,153 @@
+# src/services/cache.py
+"""
+읽기 위주 데이터(카라반 상세 등)를 위한 읽기 통과(read-through) 캐시
+
+- CacheBackend: 저장소 인터페이스 (프로세스 내 LRU, 여러 워커가 공유하는 외부 저장소)
+- ReadThroughCache: 없으면 loader로 읽어 채우고, 쓰기 경로에서 invalidate()로 지웁니다.
+"""
+import json
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+class CacheBackend(ABC):
+    """캐시 저장소 인터페이스. 값은 JSON으로 표현 가능한 dict/list/str/숫자만 저장합니다."""
+    evictions = 0 # 용량 초과로 밀려난 항목 수 (외부 저장소는 알 수 없으므로 0)
+
+    @abstractmethod
+    def get(self, key: str) -> Any | None:
+        """값이 없거나 만료되었으면 None을 반환합니다."""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: float):
+        pass
+
+    @abstractmethod
+    def delete(self, *keys: str):
+        pass
+
+    @abstractmethod
+    def clear(self):
+        pass
+
+    def __len__(self) -> int:
+        return 0
+
+class InMemoryLRUCache(CacheBackend):
+    """
+    프로세스 내 LRU 캐시 (항목별 TTL)
+    - max_entries를 넘으면 가장 오래 사용하지 않은 항목부터 버림 (evictions 증가)
+    - 만료된 항목은 조회 시점에 지움
+    """
+    def __init__(self, max_entries: int = 1024, clock: Callable[[], float] = time.monotonic):
+        if max_entries < 1:
+            raise ValueError("max_entries는 1 이상이어야 합니다.")
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict() # key -> (만료 시각, 값)
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float):
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, *keys: str):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+class RedisCacheBackend(CacheBackend):
+    """
+    여러 워커(gunicorn 프로세스)가 공유하는 캐시. redis-py 호환 클라이언트(get/set/delete/scan_iter)를 받습니다.
+    값은 JSON 문자열로 저장하며, 만료는 서버의 TTL(px)에 맡깁니다.
+    """
+    def __init__(self, client, prefix: str = "caravanshare:"):
+        self._client = client
+        self._prefix = prefix
+
+    def get(self, key: str) -> Any | None:
+        raw = self._client.get(self._prefix + key)
+        return None if raw is None else json.loads(raw)
+
+    def set(self, key: str, value: Any, ttl: float):
+        self._client.set(self._prefix + key, json.dumps(value, ensure_ascii=False), px=int(ttl * 1000))
+
+    def delete(self, *keys: str):
+        if keys:
+            self._client.delete(*(self._prefix + key for key in keys))
+
+    def clear(self):
+        keys = list(self._client.scan_iter(match=self._prefix + "*"))
+        if keys:
+            self._client.delete(*keys)
+
+class ReadThroughCache:
+    """
+    get_or_load(key, loader): 캐시에 있으면 그대로, 없으면 loader()로 읽어 ttl초 동안 저장합니다.
+    loader가 None을 반환하면(예: 없는 카라반) 저장하지 않습니다.
+    """
+    def __init__(self, backend: CacheBackend, ttl: float = 300):
+        self._backend = backend
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load(self, key: str, loader: Callable[[], Any | None]) -> Any | None:
+        value = self._backend.get(key)
+        if value is not None:
+            with self._lock:
+                self.hits += 1
+            return value
+        with self._lock:
+            self.misses += 1
+        value = loader()
+        if value is not None:
+            self._backend.set(key, value, self._ttl)
+        return value
+
+    def invalidate(self, *keys: str):
+        self._backend.delete(*keys)
+        logger.debug("캐시 무효화: %s", keys)
+
+    def clear(self):
+        self._backend.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self._backend.evictions,
+            "size": len(self._backend),
+        }
@@ -1,13 +1,39 @@
 # src/services/caravan_service.py
+import logging
+from datetime import date
 from src.models.user import User
 from src.models.caravan import Caravan
+from src.models.page import Page
 from src.models.common import UserRole
-from src.repositories.base import CaravanRepository
+from src.repositories.base import CaravanRepository, ReservationRepository
 from src.exceptions.custom_exceptions import ValidationError
+from src.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+
+logger = logging.getLogger(__name__)
+
+def validate_capacity(capacity: int):
+    """카라반 수용 인원 규칙 (등록/대량 적재 공통)"""
+    if capacity < 1:
+        raise ValidationError("수용 인원은 1명 이상이어야 합니다.")
+
+def validate_page_cursor(cursor: str):
+    """search_by_capacity_page의 커서 형식('capacity:caravan_id')을 검증합니다."""
+    capacity, separator, caravan_id = cursor.partition(":")
+    try:
+        int(capacity)
+    except ValueError:
+        raise ValidationError(f"잘못된 페이지 커서입니다: {cursor}")
+    if not separator or not caravan_id:
+        raise ValidationError(f"잘못된 페이지 커서입니다: {cursor}")
 
 class CaravanService:
-    def __init__(self, caravan_repo: CaravanRepository):
+    def __init__(
+        self,
+        caravan_repo: CaravanRepository,
+        reservation_repo: ReservationRepository | None = None
+    ):
         self._caravan_repo = caravan_repo
+        self._reservation_repo = reservation_repo
 
     def register_caravan(
         self,
@@ -23,8 +49,7 @@ class CaravanService:
             raise ValidationError("호스트만 카라반을 등록할 수 있습니다.")
         
         # 2. 검증: 수용 인원은 1명 이상
-        if capacity < 1:
-            raise ValidationError("수용 인원은 1명 이상이어야 합니다.")
+        validate_capacity(capacity)
             
         # 3. 객체 생성 및 저장
         caravan = Caravan(
@@ -34,16 +59,56 @@ class CaravanService:
         )
         self._caravan_repo.add(caravan)
         
-        print(f"카라반 서비스: {host.username}님이 {name} 카라반 등록 완료")
+        logger.info("카라반 서비스: %s님이 %s 카라반 등록 완료", host.username, name)
         return caravan
 
-    def search_caravans(self, guest: User, min_capacity: int) -> list[Caravan]:
+    def search_caravans(
+        self,
+        guest: User,
+        min_capacity: int,
+        start_date: date | None = None,
+        end_date: date | None = None
+    ) -> list[Caravan]:
         """
         [MVP 1-2] 게스트가 카라반을 검색합니다.
+        start_date/end_date를 함께 주면 해당 기간에 예약 가능한 카라반만 반환합니다.
         """
         # 1. 검증: 게스트만 검색 가능
         if guest.role != UserRole.GUEST:
             raise ValidationError("게스트만 카라반을 검색할 수 있습니다.")
         
-        print(f"카라반 서비스: {guest.username}님이 수용 인원 {min_capacity}명 이상 검색")
-        return self._caravan_repo.search_by_capacity(min_capacity)
\ No newline at end of file
+        logger.debug("카라반 서비스: %s님이 수용 인원 %s명 이상 검색", guest.username, min_capacity)
+        caravans = self._caravan_repo.search_by_capacity(min_capacity)
+
+        # 2. (선택) 날짜 필터: 리포지토리 일괄 조회 1회로 처리
+        if start_date is None and end_date is None:
+            return caravans
+        if start_date is None or end_date is None or end_date < start_date:
+            raise ValidationError("예약 날짜가 유효하지 않습니다.")
+        if self._reservation_repo is None:
+            raise ValidationError("날짜 조건 검색을 사용할 수 없습니다.")
+
+        available_ids = set(self._reservation_repo.find_available_caravan_ids(
+            [caravan.caravan_id for caravan in caravans], start_date, end_date
+        ))
+        return [caravan for caravan in caravans if caravan.caravan_id in available_ids]
+
+    def search_caravans_page(
+        self,
+        guest: User,
+        min_capacity: int,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None
+    ) -> Page[Caravan]:
+        """
+        카라반 검색 결과를 키셋 페이지 단위로 반환합니다.
+        (다음 페이지는 반환된 next_cursor를 그대로 넘겨 조회)
+        """
+        if guest.role != UserRole.GUEST:
+            raise ValidationError("게스트만 카라반을 검색할 수 있습니다.")
+        if not (1 <= limit <= MAX_PAGE_SIZE):
+            raise ValidationError(f"페이지 크기는 1 이상 {MAX_PAGE_SIZE} 이하이어야 합니다.")
+        if cursor is not None:
+            validate_page_cursor(cursor)
+
+        return self._caravan_repo.search_by_capacity_page(min_capacity, limit, cursor)
@@ -1,6 +1,107 @@
 # src/services/observers.py
+import logging
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from src.services.batching import BatchingWorker
+
+logger = logging.getLogger(__name__)
 
 class NotificationService:
     """옵저버 역할 (실제로는 이메일, SMS, 푸시 알림 전송)"""
     def send_notification(self, user_id: str, message: str):
-        print(f"알림 (옵저버): [To: {user_id}] {message}")
\ No newline at end of file
+        logger.info("알림 (옵저버): [To: %s] %s", user_id, message)
+
+# --- 비동기 알림 전송 파이프라인 ---
+
+@dataclass
+class Notification:
+    user_id: str
+    message: str
+
+class NotificationTransport(ABC):
+    """실제 전송 수단 (이메일/SMS/푸시 게이트웨이) 인터페이스"""
+    @abstractmethod
+    def send_batch(self, notifications: list[Notification]):
+        """알림 묶음을 전송합니다. 실패하면 예외를 발생시킵니다."""
+        pass
+
+class InMemoryNotificationTransport(NotificationTransport):
+    """
+    오프라인 테스트용 가짜 전송 수단
+    - delay: 묶음 1회 전송에 걸리는 시간(초)
+    - fail_times: 처음 n번의 전송 시도를 실패시킴 (재시도 검증용)
+    """
+    def __init__(self, delay: float = 0.0, fail_times: int = 0):
+        self.delay = delay
+        self.fail_times = fail_times
+        self.sent: list[Notification] = []
+        self.batches: list[int] = [] # 전송된 묶음 크기
+        self.attempts = 0
+        self._lock = threading.Lock()
+
+    def send_batch(self, notifications: list[Notification]):
+        if self.delay:
+            time.sleep(self.delay)
+        with self._lock:
+            self.attempts += 1
+            if self.fail_times > 0:
+                self.fail_times -= 1
+                raise ConnectionError("가짜 전송 실패")
+            self.sent.extend(notifications)
+            self.batches.append(len(notifications))
+
+class AsyncNotificationService(NotificationService, BatchingWorker):
+    """
+    알림을 제한된 크기의 큐에 넣고 즉시 반환하며, 워커 스레드들이 묶음 단위로 전송합니다.
+    (예약 처리 시간이 알림 전송 시간에 좌우되지 않음)
+
+    - 전송 실패 시 backoff_base * 2^n 초 간격으로 max_retries번까지 재시도
+    - 큐가 가득 차면 예약을 막지 않도록 알림을 버리고 dropped를 증가
+    - shutdown() 호출 시 큐에 남은 알림을 모두 전송한 뒤 워커를 종료
+    """
+    def __init__(
+        self,
+        transport: NotificationTransport,
+        workers: int = 2,
+        max_queue_size: int = 1000,
+        batch_size: int = 50,
+        max_retries: int = 3,
+        backoff_base: float = 0.1
+    ):
+        super().__init__(workers, max_queue_size, batch_size, thread_name="notification-worker")
+        self._transport = transport
+        self._max_retries = max_retries
+        self._backoff_base = backoff_base
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+        self.retried = 0
+        self._start_workers()
+
+    def send_notification(self, user_id: str, message: str):
+        if self._closed:
+            raise RuntimeError("이미 종료된 알림 서비스입니다.")
+        try:
+            self._queue.put_nowait(Notification(user_id=user_id, message=message))
+        except queue.Full:
+            self._count("dropped", 1)
+            logger.warning("알림 큐가 가득 차 알림을 버립니다: [To: %s]", user_id)
+
+    def _process_batch(self, batch: list[Notification]):
+        for attempt in range(self._max_retries + 1):
+            try:
+                self._transport.send_batch(batch)
+                self._count("sent", len(batch))
+                logger.debug("알림 %s건 전송 완료", len(batch))
+                return
+            except Exception as e:
+                if attempt == self._max_retries:
+                    self._count("failed", len(batch))
+                    logger.error("알림 %s건 전송 실패 (재시도 %s회 후 포기): %s", len(batch), attempt, e)
+                    return
+                self._count("retried", 1)
+                logger.warning("알림 전송 실패, %s초 후 재시도: %s", self._backoff_base * 2 ** attempt, e)
+                time.sleep(self._backoff_base * 2 ** attempt)
@@ -1,39 +1,78 @@
 # src/services/payment_service.py
+import logging
 from src.repositories.base import PaymentRepository, ReservationRepository
-from src.models.reservation import Reservation
+from src.models.common import ReservationStatus
 from src.models.payment import Payment, PaymentStatus
 from src.services.observers import NotificationService
+from src.services.settlement import SettlementPipeline
+from src.exceptions.custom_exceptions import ValidationError
+
+logger = logging.getLogger(__name__)
 
 class PaymentService:
     def __init__(
         self,
         payment_repo: PaymentRepository,
         reservation_repo: ReservationRepository,
-        notification_service: NotificationService
+        notification_service: NotificationService,
+        settlement: SettlementPipeline | None = None
     ):
         self._payment_repo = payment_repo
         self._reservation_repo = reservation_repo
         self._notification_service = notification_service
+        self._settlement = settlement
 
-    def process_payment(self, reservation_id: str, amount: int) -> Payment:
+    def process_payment(self, reservation_id: str, amount: int, idempotency_key: str | None = None) -> Payment:
         """
-        결제 시도 및 처리를 담당합니다.
-        (실제로는 PG사 연동 로직이 들어갑니다)
+        결제를 요청합니다.
+        - 같은 idempotency_key로 다시 요청하면 새 결제를 만들지 않고 처음 결제를 반환합니다. (클라이언트 재시도 안전)
+        - 예약이 없거나 취소되었거나 금액이 예약 금액과 다르면 ValidationError
+        - 이미 진행 중이거나 완료된 결제가 있는 예약이면 ValidationError (다른 키로 중복 결제 방지)
+        - 정산 파이프라인이 있으면 PENDING으로 저장해 바로 반환하고, 승인/거절은 파이프라인이 나중에 반영합니다.
+          없으면 (가정) PG사 결제 성공으로 보고 COMPLETED로 저장합니다.
         """
-        print(f"결제 서비스: {reservation_id}에 대한 결제 처리 시도...")
-        
-        # 1. 결제 객체 생성
-        payment = Payment(reservation_id=reservation_id, amount=amount)
-        
-        # 2. (가정) PG사 결제 성공
-        payment.status = PaymentStatus.COMPLETED
-        
-        # 3. DB에 저장
-        self._payment_repo.add(payment)
-        
-        # 4. (옵저버) 결제 완료 알림
+        logger.debug("결제 서비스: %s에 대한 결제 처리 시도...", reservation_id)
+
+        # 1. 같은 키의 재요청이면 처음 결제를 그대로 반환
+        if idempotency_key is not None:
+            existing = self._payment_repo.get_by_idempotency_key(idempotency_key)
+            if existing is not None:
+                return self._replay(existing, reservation_id, amount)
+
+        # 2. 예약 확인
+        reservation = self._reservation_repo.get_by_id(reservation_id)
+        if reservation is None:
+            raise ValidationError(f"존재하지 않는 예약입니다: {reservation_id}")
+        if reservation.status == ReservationStatus.CANCELLED:
+            raise ValidationError("취소된 예약은 결제할 수 없습니다.")
+        if amount != reservation.total_price:
+            raise ValidationError(f"결제 금액({amount})이 예약 금액({reservation.total_price})과 다릅니다.")
+
+        # 3. 결제 저장 (같은 키/같은 예약의 결제가 동시에 들어와도 리포지토리가 하나만 저장)
+        status = PaymentStatus.PENDING if self._settlement is not None else PaymentStatus.COMPLETED
+        payment = Payment(reservation_id=reservation_id, amount=amount, status=status,
+                          idempotency_key=idempotency_key)
+        stored = self._payment_repo.add_if_absent(payment)
+        if stored.payment_id != payment.payment_id:
+            if idempotency_key is not None and stored.idempotency_key == idempotency_key:
+                return self._replay(stored, reservation_id, amount)
+            raise ValidationError("이미 결제가 진행 중이거나 완료된 예약입니다.")
+
+        # 4. 정산 파이프라인에 넘기고 바로 반환
+        if self._settlement is not None:
+            self._settlement.submit(payment)
+            logger.info("결제 서비스: 결제 %s 접수 (정산 대기)", payment.payment_id)
+            return payment
+
+        # 5. (옵저버) 결제 완료 알림
         # reservation = self._reservation_repo.get_by_id(reservation_id)
         # self._notification_service.send_notification(reservation.guest_id, "결제가 완료되었습니다.")
-        
-        print(f"결제 서비스: 결제 {payment.payment_id} 완료")
-        return payment
\ No newline at end of file
+
+        logger.info("결제 서비스: 결제 %s 완료", payment.payment_id)
+        return payment
+
+    def _replay(self, existing: Payment, reservation_id: str, amount: int) -> Payment:
+        if existing.reservation_id != reservation_id or existing.amount != amount:
+            raise ValidationError("같은 멱등 키로 다른 결제를 요청했습니다.")
+        logger.info("결제 서비스: 같은 키의 재요청 - 결제 %s 반환", existing.payment_id)
+        return existing
@@ -0,0 +1,112 @@
+# src/services/pricing.py
+"""
+상태 없는(stateless) 가격 엔진 - 시즌/요일 배율 + 할인 규칙 중첩
+
+- 날짜별 배율을 미리 계산한 표(만분율 정수)와 그 누적합을 만들어 두므로,
+  숙박 기간의 기본 요금은 기간 길이와 관계없이 누적합 차 한 번(O(1))으로 계산됩니다.
+- 엔진은 만든 뒤 바뀌지 않으므로(set_strategy 없음) 여러 스레드가 같은 엔진을 함께 써도 안전합니다.
+- 기간은 [check_in, check_out) 박(night) 단위입니다. 종료일을 포함하는 src 예약은
+  calculate_total_price()가 종료일 다음 날을 체크아웃으로 바꿔 계산합니다.
+"""
+import logging
+from array import array
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from src.services.strategies import DiscountStrategy, LongStayDiscountStrategy
+from src.exceptions.custom_exceptions import ValidationError
+
+logger = logging.getLogger(__name__)
+
+BASIS = 10_000 # 배율 1.0 = 10000 (만분율 정수로 계산해 float 누적 오차를 없앰)
+DEFAULT_HORIZON_DAYS = 366 * 4
+
+@dataclass(frozen=True)
+class PricingRules:
+    """
+    - weekday_multipliers: 월요일(0) ~ 일요일(6) 배율
+    - month_multipliers: {월: 배율} (예: 성수기 {7: 1.3, 8: 1.3})
+    - discounts: 앞에서부터 차례로 적용되는 할인 규칙 (각 규칙은 앞 할인이 적용된 금액을 기준으로 계산)
+    """
+    weekday_multipliers: tuple[float, ...] = (1.0,) * 7
+    month_multipliers: Mapping[int, float] = field(default_factory=dict)
+    discounts: tuple[DiscountStrategy, ...] = (LongStayDiscountStrategy(),)
+
+    def day_basis(self, day: date) -> int:
+        return round(BASIS * self.weekday_multipliers[day.weekday()] * self.month_multipliers.get(day.month, 1.0))
+
+@dataclass(frozen=True, slots=True)
+class Quote:
+    nights: int
+    base_price: int # 배율 적용 후, 할인 전
+    discount: int
+    total_price: int
+
+class PricingEngine:
+    """
+    PricingRules로 가격을 계산합니다. horizon_start부터 horizon_days일 동안의 배율 누적합을 미리 만들어 두며,
+    그 밖의 날짜는 하루씩 계산합니다. (결과는 같고 속도만 다름)
+    """
+    def __init__(self, rules: PricingRules | None = None, horizon_start: date | None = None,
+                 horizon_days: int = DEFAULT_HORIZON_DAYS):
+        self._rules = rules or PricingRules()
+        if len(self._rules.weekday_multipliers) != 7:
+            raise ValidationError("요일 배율은 7개(월~일)여야 합니다.")
+        start = horizon_start or date(date.today().year - 1, 1, 1)
+        self._origin = start.toordinal()
+        prefix = array("q", [0])
+        total = 0
+        for offset in range(horizon_days):
+            total += self._rules.day_basis(start + timedelta(days=offset))
+            prefix.append(total)
+        self._prefix = prefix
+
+    @property
+    def rules(self) -> PricingRules:
+        return self._rules
+
+    def _basis_sum(self, check_in: date, check_out: date) -> int:
+        i = check_in.toordinal() - self._origin
+        j = check_out.toordinal() - self._origin
+        if 0 <= i and j < len(self._prefix):
+            return self._prefix[j] - self._prefix[i]
+        day_basis = self._rules.day_basis
+        return sum(day_basis(check_in + timedelta(days=n)) for n in range(j - i))
+
+    def quote(self, daily_rate: int, check_in: date, check_out: date) -> Quote:
+        """[check_in, check_out) 숙박의 가격을 계산합니다."""
+        nights = (check_out - check_in).days
+        if nights < 1:
+            raise ValidationError("체크아웃 날짜는 체크인 날짜보다 늦어야 합니다.")
+        base_price = (daily_rate * self._basis_sum(check_in, check_out) + BASIS // 2) // BASIS
+        price = base_price
+        for strategy in self._rules.discounts:
+            price -= strategy.calculate_discount(price, nights)
+        return Quote(nights, base_price, base_price - price, price)
+
+    def quote_many(self, requests: Iterable[tuple[int, date, date]]) -> list[Quote]:
+        """(1일 요금, 체크인, 체크아웃) 여러 건을 한 번에 계산합니다. (배율표 조회를 묶어 호출 비용을 줄임)"""
+        prefix, origin, limit = self._prefix, self._origin, len(self._prefix)
+        discounts = self._rules.discounts
+        half = BASIS // 2
+        quotes = []
+        append = quotes.append
+        for daily_rate, check_in, check_out in requests:
+            i = check_in.toordinal() - origin
+            j = check_out.toordinal() - origin
+            nights = j - i
+            if nights < 1:
+                raise ValidationError("체크아웃 날짜는 체크인 날짜보다 늦어야 합니다.")
+            basis = prefix[j] - prefix[i] if 0 <= i and j < limit else self._basis_sum(check_in, check_out)
+            base_price = (daily_rate * basis + half) // BASIS
+            price = base_price
+            for strategy in discounts:
+                price -= strategy.calculate_discount(price, nights)
+            append(Quote(nights, base_price, base_price - price, price))
+        return quotes
+
+    def calculate_total_price(self, daily_rate: int, start_date: date, end_date: date) -> int:
+        """종료일을 포함하는 예약(src 모델)의 총 금액. PriceCalculator와 같은 인터페이스입니다."""
+        total_price = self.quote(daily_rate, start_date, end_date + timedelta(days=1)).total_price
+        logger.debug("가격 계산: %s ~ %s, 1일 %s -> 총 %s", start_date, end_date, daily_rate, total_price)
+        return total_price
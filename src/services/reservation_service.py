@@ -1,21 +1,25 @@
 # src/services/reservation_service.py
+import logging
 from datetime import date
 from src.models.user import User # ❗️ import 경로 변경
 from src.models.caravan import Caravan # ❗️ import 경로 변경
 from src.services.validators import ReservationValidator # ❗️ import 경로 변경
 from src.repositories.base import ReservationRepository # ❗️ import 경로 변경
 from src.services.factories import ReservationFactory # ❗️ import 경로 변경
-from src.services.strategies import PriceCalculator, LongStayDiscountStrategy, NoDiscountStrategy # ❗️ import 경로 변경
+from src.services.strategies import PriceCalculator # ❗️ import 경로 변경
+from src.services.pricing import PricingEngine
 from src.services.observers import NotificationService # ❗️ import 경로 변경
 from src.exceptions.custom_exceptions import ValidationError, ReservationConflictError # ❗️ import 경로 변경
 
+logger = logging.getLogger(__name__)
+
 class ReservationService:
     def __init__(
         self,
         validator: ReservationValidator,
         repository: ReservationRepository,
         factory: ReservationFactory,
-        price_calculator: PriceCalculator,
+        price_calculator: PricingEngine | PriceCalculator,
         notification_service: NotificationService
     ):
         self._validator = validator
@@ -28,12 +32,7 @@ class ReservationService:
         try:
             self._validator.validate_reservation_request(guest, caravan, start_date, end_date)
             
-            rental_days = (end_date - start_date).days + 1
-            if rental_days >= 7:
-                self._price_calculator.set_strategy(LongStayDiscountStrategy())
-            else:
-                self._price_calculator.set_strategy(NoDiscountStrategy())
-                
+            # 할인 규칙(장기 숙박 등)은 가격 엔진이 기간을 보고 적용합니다. (공유 객체의 상태를 바꾸지 않음)
             total_price = self._price_calculator.calculate_total_price(
                 caravan.daily_rate, start_date, end_date
             )
@@ -46,7 +45,9 @@ class ReservationService:
                 total_price=total_price
             )
             
-            self._repository.add(new_reservation)
+            # 검증 이후 다른 요청이 같은 기간을 먼저 예약했을 수 있으므로, 확인과 저장을 한 번에 수행합니다.
+            if not self._repository.reserve_if_available(new_reservation):
+                raise ReservationConflictError("선택한 날짜에 이미 예약이 있습니다.")
             
             self._notification_service.send_notification(
                 user_id=guest.user_id,
@@ -60,8 +61,8 @@ class ReservationService:
             return new_reservation
 
         except (ValidationError, ReservationConflictError) as e:
-            print(f"예약 실패: {e.message}")
+            logger.warning("예약 실패: %s", e.message)
             return None
         except Exception as e:
-            print(f"알 수 없는 오류 발생: {e}")
+            logger.exception("알 수 없는 오류 발생: %s", e)
             return None
\ No newline at end of file
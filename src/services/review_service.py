@@ -1,8 +1,11 @@
 # src/services/review_service.py
+import logging
 from src.repositories.base import ReviewRepository, ReservationRepository
 from src.models.review import Review
 from src.exceptions.custom_exceptions import ValidationError
 
+logger = logging.getLogger(__name__)
+
 class ReviewService:
     def __init__(
         self,
@@ -16,7 +19,7 @@ class ReviewService:
         """
         리뷰를 작성합니다.
         """
-        print(f"리뷰 서비스: {reservation_id}에 대한 리뷰 작성 시도...")
+        logger.debug("리뷰 서비스: %s에 대한 리뷰 작성 시도...", reservation_id)
         
         # 1. 검증: 이미 리뷰가 작성되었는지?
         if self._review_repo.get_by_reservation_id(reservation_id):
@@ -38,5 +41,5 @@ class ReviewService:
         
         # 4. (확장) 호스트의 신뢰도 점수(trust_score) 업데이트 로직 추가 가능
         
-        print(f"리뷰 서비스: 리뷰 {review.review_id} 생성 완료")
+        logger.info("리뷰 서비스: 리뷰 %s 생성 완료", review.review_id)
         return review
\ No newline at end of file
@@ -0,0 +1,170 @@
+# src/services/settlement.py
+"""
+결제 정산 파이프라인 - PENDING 결제를 묶어서 결제 대행사(PG)에 보내고 결과를 비동기로 반영합니다.
+
+- PaymentService는 결제를 PENDING으로 저장하고 submit()만 호출하므로, 결제 요청은 PG 응답을 기다리지 않습니다.
+- 워커 스레드가 큐에서 결제를 batch_size개까지 모아 gateway.settle_batch()를 한 번 호출하고,
+  승인/거절 결과를 payment_repo.add_all()로 한 번에 저장합니다. (결제마다 PG 호출/저장을 하지 않음)
+- PG 통신이 실패하면 같은 묶음을 backoff_base * 2^n 초 간격으로 max_retries번까지 재시도합니다.
+  게이트웨이는 같은 payment_id를 다시 받으면 새로 청구하지 않으므로(멱등) 응답만 유실된 경우에도 이중 청구가 없습니다.
+- 재시도 후에도 실패했거나 결과 저장(add_all)이 실패한 결제는 PENDING으로 남겨 두며(unsettled),
+  나중에 submit()으로 다시 보낼 수 있습니다. (PG가 이미 청구했더라도 같은 결과를 돌려받음)
+"""
+import logging
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from src.models.payment import Payment, PaymentStatus
+from src.repositories.base import PaymentRepository
+from src.services.batching import BatchingWorker
+
+logger = logging.getLogger(__name__)
+
+@dataclass(slots=True)
+class SettlementResult:
+    payment_id: str
+    approved: bool
+    reference: str | None = None # PG 거래 번호 (승인된 경우)
+    reason: str | None = None    # 거절 사유
+
+class PaymentGateway(ABC):
+    """결제 대행사(PG) 연동 인터페이스"""
+    @abstractmethod
+    def settle_batch(self, payments: list[Payment]) -> list[SettlementResult]:
+        """
+        결제 묶음의 승인을 한 번에 요청하고 결제마다 결과를 반환합니다. 통신이 실패하면 예외를 발생시킵니다.
+        같은 payment_id를 다시 받으면 새로 청구하지 않고 처음 결과를 돌려줘야 합니다. (재시도 안전)
+        """
+        pass
+
+class FakePaymentGateway(PaymentGateway):
+    """
+    오프라인 테스트용 가짜 PG
+    - delay: 묶음 1회 요청에 걸리는 시간(초)
+    - fail_times: 처음 n번의 요청을 청구 전에 실패시킴 (재시도 검증용)
+    - lost_responses: 처음 n번의 요청은 청구까지 한 뒤 응답을 유실시킴 (이중 청구 방지 검증용)
+    - decline_over: 이 금액을 넘는 결제는 거절 (None이면 모두 승인)
+    """
+    def __init__(self, delay: float = 0.0, fail_times: int = 0, lost_responses: int = 0,
+                 decline_over: int | None = None):
+        self.delay = delay
+        self.fail_times = fail_times
+        self.lost_responses = lost_responses
+        self.decline_over = decline_over
+        self.results: dict[str, SettlementResult] = {} # payment_id -> 처음 처리 결과
+        self.charged: list[str] = [] # 실제로 청구한 payment_id (이중 청구 확인용)
+        self.batches: list[int] = [] # 요청된 묶음 크기
+        self.attempts = 0
+        self._lock = threading.Lock()
+
+    def settle_batch(self, payments: list[Payment]) -> list[SettlementResult]:
+        if self.delay:
+            time.sleep(self.delay)
+        with self._lock:
+            self.attempts += 1
+            if self.fail_times > 0:
+                self.fail_times -= 1
+                raise ConnectionError("가짜 PG 통신 실패")
+            self.batches.append(len(payments))
+            results = [self._settle(payment) for payment in payments]
+            if self.lost_responses > 0:
+                self.lost_responses -= 1
+                raise TimeoutError("가짜 PG 응답 유실")
+            return results
+
+    def _settle(self, payment: Payment) -> SettlementResult:
+        if payment.payment_id in self.results:
+            return self.results[payment.payment_id]
+        if self.decline_over is not None and payment.amount > self.decline_over:
+            result = SettlementResult(payment.payment_id, approved=False, reason="한도 초과")
+        else:
+            self.charged.append(payment.payment_id)
+            result = SettlementResult(payment.payment_id, approved=True, reference=f"fake-{uuid.uuid4().hex[:12]}")
+        self.results[payment.payment_id] = result
+        return result
+
+class SettlementPipeline(BatchingWorker):
+    """
+    PENDING 결제를 큐에 받아 워커 스레드가 묶음 단위로 정산합니다. (batching.BatchingWorker 기반, AsyncNotificationService와 같은 구조)
+
+    - 큐가 가득 차면 submit()이 자리가 날 때까지 기다립니다. (결제는 버리지 않음)
+    - on_settled: 결과를 저장한 뒤 정산된 결제 목록으로 호출됩니다. (알림 등, 선택)
+    - shutdown() 호출 시 큐에 남은 결제를 모두 정산한 뒤 워커를 종료
+    """
+    def __init__(
+        self,
+        gateway: PaymentGateway,
+        payment_repo: PaymentRepository,
+        workers: int = 1,
+        max_queue_size: int = 10000,
+        batch_size: int = 50,
+        max_retries: int = 3,
+        backoff_base: float = 0.1,
+        on_settled: Callable[[list[Payment]], None] | None = None
+    ):
+        super().__init__(workers, max_queue_size, batch_size, thread_name="settlement-worker")
+        self._gateway = gateway
+        self._payment_repo = payment_repo
+        self._max_retries = max_retries
+        self._backoff_base = backoff_base
+        self._on_settled = on_settled
+        self.completed = 0
+        self.declined = 0
+        self.unsettled = 0 # 재시도 후에도 결과를 받지 못했거나 저장하지 못해 PENDING으로 남은 결제
+        self.retried = 0
+        self._start_workers()
+
+    def submit(self, payment: Payment):
+        if self._closed:
+            raise RuntimeError("이미 종료된 정산 파이프라인입니다.")
+        if payment.status != PaymentStatus.PENDING:
+            raise ValueError(f"PENDING 결제만 정산할 수 있습니다: {payment.payment_id} ({payment.status.name})")
+        self._queue.put(payment)
+
+    def _process_batch(self, batch: list[Payment]):
+        for attempt in range(self._max_retries + 1):
+            try:
+                results = self._gateway.settle_batch(batch)
+                break
+            except Exception as e:
+                if attempt == self._max_retries:
+                    self._count("unsettled", len(batch))
+                    logger.error("결제 %s건 정산 실패 (재시도 %s회 후 포기, PENDING 유지): %s", len(batch), attempt, e)
+                    return
+                self._count("retried", 1)
+                logger.warning("결제 정산 실패, %s초 후 재시도: %s", self._backoff_base * 2 ** attempt, e)
+                time.sleep(self._backoff_base * 2 ** attempt)
+        self._reconcile(batch, {result.payment_id: result for result in results})
+
+    def _reconcile(self, batch: list[Payment], results: dict[str, SettlementResult]):
+        """PG 결과를 결제 상태에 반영하고 한 번에 저장합니다. (결과가 빠진 결제는 PENDING 유지)"""
+        settled = []
+        for payment in batch:
+            result = results.get(payment.payment_id)
+            if result is None:
+                continue
+            if result.approved:
+                settled.append(replace(payment, status=PaymentStatus.COMPLETED, gateway_reference=result.reference))
+            else:
+                settled.append(replace(payment, status=PaymentStatus.FAILED))
+                logger.info("결제 %s 거절: %s", payment.payment_id, result.reason)
+        try:
+            self._payment_repo.add_all(settled)
+        except Exception:
+            self._count("unsettled", len(batch))
+            logger.exception("결제 %s건 정산 결과 저장 실패 (PENDING 유지)", len(batch))
+            return
+        approved = sum(payment.status == PaymentStatus.COMPLETED for payment in settled)
+        self._count("completed", approved)
+        self._count("declined", len(settled) - approved)
+        self._count("unsettled", len(batch) - len(settled))
+        logger.debug("결제 %s건 정산 (승인 %s, 거절 %s)", len(settled), approved, len(settled) - approved)
+        if self._on_settled is not None and settled:
+            try:
+                self._on_settled(settled)
+            except Exception:
+                # 결과는 이미 저장되었으므로 정산 통계는 그대로 두고 후처리 실패만 남깁니다.
+                logger.exception("정산 후처리(on_settled) 실패: 결제 %s건", len(settled))
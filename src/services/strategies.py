@@ -1,7 +1,10 @@
 # src/services/strategies.py
+import logging
 from abc import ABC, abstractmethod
 from datetime import date
 
+logger = logging.getLogger(__name__)
+
 class DiscountStrategy(ABC):
     """할인 전략 인터페이스"""
     @abstractmethod
@@ -34,5 +37,5 @@ class PriceCalculator:
         discount = self._strategy.calculate_discount(original_price, rental_days)
         
         total_price = original_price - discount
-        print(f"가격 계산: 원가 {original_price} - 할인 {discount} = 총 {total_price}")
+        logger.debug("가격 계산: 원가 %s - 할인 %s = 총 %s", original_price, discount, total_price)
         return total_price
\ No newline at end of file
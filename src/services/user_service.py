@@ -1,9 +1,12 @@
 # src/services/user_service.py
+import logging
 from src.models.user import User
 from src.models.common import UserRole
 from src.repositories.base import UserRepository
 from src.exceptions.custom_exceptions import ValidationError
 
+logger = logging.getLogger(__name__)
+
 class UserService:
     def __init__(self, user_repo: UserRepository):
         self._user_repo = user_repo
@@ -24,5 +27,5 @@ class UserService:
         user = User(username=username, role=role)
         self._user_repo.add(user)
         
-        print(f"사용자 서비스: {username} ({role.name})님 회원가입 완료")
+        logger.info("사용자 서비스: %s (%s)님 회원가입 완료", username, role.name)
         return user
\ No newline at end of file
@@ -1,4 +1,5 @@
 # src/services/validators.py
+import logging
 from datetime import date
 from src.constants import MIN_RESERVATION_DAYS # ❗️ import 경로 변경
 from src.models.user import User # ❗️ import 경로 변경
@@ -7,33 +8,42 @@ from src.models.common import UserRole, CaravanStatus # ❗️ import 경로 변
 from src.repositories.base import ReservationRepository # ❗️ import 경로 변경
 from src.exceptions.custom_exceptions import ValidationError, ReservationConflictError # ❗️ import 경로 변경
 
+logger = logging.getLogger(__name__)
+
 class ReservationValidator:
     def __init__(self, repository: ReservationRepository):
         self._repository = repository
 
     def validate_reservation_request(self, guest: User, caravan: Caravan, start_date: date, end_date: date):
-        print("검증기: 예약 검증 시작...")
+        logger.debug("검증기: 예약 검증 시작...")
+        self.validate_request_rules(guest, caravan, start_date, end_date)
+
+        if not self._repository.is_caravan_available(caravan.caravan_id, start_date, end_date):
+            raise ReservationConflictError("선택한 날짜에 이미 예약이 있습니다.")
         
+        logger.debug("검증기: 모든 검증 통과")
+        return True
+
+    def validate_request_rules(self, guest: User, caravan: Caravan, start_date: date, end_date: date):
+        """리포지토리 조회 없이 확인할 수 있는 규칙 (역할, 기간, 카라반 상태). 비동기 서비스도 같은 규칙을 씁니다."""
         if not self._validate_user_role(guest):
             raise ValidationError("게스트만 예약을 신청할 수 있습니다.")
         
-        if not self._validate_dates(start_date, end_date):
-            raise ValidationError("예약 날짜가 유효하지 않습니다.")
+        self.validate_period(start_date, end_date)
 
         if not self._validate_caravan_status(caravan):
             raise ReservationConflictError("현재 예약 불가능한 카라반입니다.")
 
-        if not self._repository.is_caravan_available(caravan.caravan_id, start_date, end_date):
-            raise ReservationConflictError("선택한 날짜에 이미 예약이 있습니다.")
-        
-        print("검증기: 모든 검증 통과")
-        return True
+    def validate_period(self, start_date: date, end_date: date, allow_past: bool = False):
+        """예약 기간 규칙 검증 (allow_past=True: 과거 예약 이관처럼 오늘 이전 시작일도 허용)"""
+        if not self._validate_dates(start_date, end_date, allow_past):
+            raise ValidationError("예약 날짜가 유효하지 않습니다.")
 
     def _validate_user_role(self, user: User) -> bool:
         return user.role == UserRole.GUEST
 
-    def _validate_dates(self, start_date: date, end_date: date) -> bool:
-        if start_date < date.today():
+    def _validate_dates(self, start_date: date, end_date: date, allow_past: bool = False) -> bool:
+        if start_date < date.today() and not allow_past:
             return False
         if end_date < start_date:
             return False
@@ -0,0 +1,21 @@
+# tests/conftest.py
+import os
+import pytest
+
+# ❗️ main.py를 import 하기 전에 설정해야 실제 caravan_share.db 대신 메모리 DB를 사용합니다.
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+# asgi.py의 기본 앱도 파일(caravan_repository.db) 대신 메모리 DB를 사용
+os.environ.setdefault("REPOSITORY_DATABASE_URL", "sqlite://")
+
+
+@pytest.fixture
+def flask_app():
+    """main.py의 Flask 앱을 빈 메모리 DB로 준비합니다. (테스트마다 테이블 재생성)"""
+    from main import app, db, detail_cache
+    app.config.update(TESTING=True, WTF_CSRF_ENABLED=False)
+    detail_cache.clear()  # 테스트마다 DB가 새로 만들어지므로 이전 테스트의 캐시도 비움
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
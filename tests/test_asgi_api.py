@@ -0,0 +1,135 @@
+# tests/test_asgi_api.py
+import asyncio
+import json
+import threading
+from datetime import date, timedelta
+from urllib.parse import urlencode
+
+import pytest
+
+# --- 테스트 대상 ---
+from asgi import create_app
+from src.models.caravan import Caravan
+from src.models.common import UserRole, CaravanStatus
+from src.models.user import User
+from src.repositories.concurrent_repository import (ThreadSafeUserRepository, ThreadSafeCaravanRepository,
+                                                    ThreadSafeReservationRepository)
+from src.services.observers import AsyncNotificationService, InMemoryNotificationTransport
+
+
+async def call(app, method, path, query=None, body=None):
+    """ASGI 앱을 서버 없이 직접 호출하고 (상태 코드, JSON)을 반환합니다."""
+    scope = {"type": "http", "method": method, "path": path,
+             "query_string": urlencode(query or {}).encode()}
+    messages = [{"type": "http.request", "body": json.dumps(body).encode() if body is not None else b""}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0) if messages else {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+    return sent[0]["status"], json.loads(sent[1]["body"])
+
+
+@pytest.fixture
+def api():
+    users, caravans, reservations = (ThreadSafeUserRepository(), ThreadSafeCaravanRepository(),
+                                     ThreadSafeReservationRepository())
+    users.add(User(username="guest", role=UserRole.GUEST))
+    users.add(User(username="host", role=UserRole.HOST))
+    fleet = [Caravan(host_id="h1", name=f"C{i}", capacity=2 + i, caravan_id=f"c{i}", daily_rate=50000)
+             for i in range(3)]
+    fleet.append(Caravan(host_id="h1", name="수리 중", capacity=6, caravan_id="broken",
+                         status=CaravanStatus.MAINTENANCE))
+    caravans.add_all(fleet)
+    transport = InMemoryNotificationTransport()
+    notifications = AsyncNotificationService(transport)
+    app = create_app(caravans, reservations, users, notification_service=notifications, db_threads=4)
+    yield app, reservations, transport
+    notifications.shutdown()
+
+
+def test_search_quote_and_booking_flow(api):
+    """
+    [비동기 API 테스트] 검색 -> 견적 -> 예약 -> 같은 기간 재검색/가용성 조회 흐름과 응답 코드를 검증
+    """
+    # 1. 준비 (Arrange)
+    app, reservations, _ = api
+    start = date.today() + timedelta(days=30)
+    period = {"start_date": start.isoformat(), "end_date": (start + timedelta(days=2)).isoformat()}
+
+    async def scenario():
+        found = await call(app, "GET", "/caravans/search", {"capacity": 3, "user": "guest", **period})
+        quote = await call(app, "POST", "/quotes", body={"caravan_id": "c1", **period})
+        booked = await call(app, "POST", "/reservations", body={"user": "guest", "caravan_id": "c1", **period})
+        again = await call(app, "POST", "/reservations", body={"user": "guest", "caravan_id": "c1", **period})
+        after = await call(app, "GET", "/caravans/search", {"capacity": 3, "user": "guest", **period})
+        available = await call(app, "GET", "/caravans/availability", {"ids": "c0,c1,c2", **period})
+        return found, quote, booked, again, after, available
+
+    # 2. 실행 (Act)
+    found, quote, booked, again, after, available = asyncio.run(scenario())
+
+    # 3. 검증 (Assert)
+    assert found[0] == 200 and [c["caravan_id"] for c in found[1]] == ["c1", "c2", "broken"]
+    assert quote == (200, {"caravan_id": "c1", "nights": 3, "base_price": 150000, "discount": 0,
+                           "total_price": 150000})
+    assert booked[0] == 201 and booked[1]["total_price"] == 150000 and booked[1]["status"] == "PENDING"
+    assert reservations.get_by_id(booked[1]["reservation_id"]) is not None
+    assert again == (409, {"error": "선택한 날짜에 이미 예약이 있습니다."})
+    assert [c["caravan_id"] for c in after[1]] == ["c2", "broken"]
+    assert available == (200, {"available": ["c0", "c2"]})
+
+
+@pytest.mark.parametrize("method, path, query, body, status", [
+    ("GET", "/caravans/search", {"capacity": 3}, None, 400),                          # user 누락
+    ("GET", "/caravans/search", {"capacity": 3, "user": "nobody"}, None, 404),
+    ("GET", "/caravans/search", {"capacity": 3, "user": "host"}, None, 400),          # 호스트는 검색 불가
+    ("GET", "/caravans/search", {"capacity": 3, "user": "guest", "cursor": "x"}, None, 400),
+    ("GET", "/caravans/availability", {"ids": "c0", "start_date": "2030-13-01", "end_date": "2030-01-02"}, None, 400),
+    ("POST", "/quotes", None, {"caravan_id": "missing", "start_date": "2030-01-01", "end_date": "2030-01-02"}, 404),
+    ("POST", "/reservations", None, {"user": "guest", "caravan_id": "broken",
+                                      "start_date": "2030-01-01", "end_date": "2030-01-02"}, 409),
+    ("POST", "/reservations", None, {"user": "guest", "caravan_id": "c0",
+                                      "start_date": "2000-01-01", "end_date": "2000-01-02"}, 400),
+    ("GET", "/reservations", None, None, 405),
+    ("GET", "/nowhere", None, None, 404),
+])
+def test_errors_map_to_status_codes(api, method, path, query, body, status):
+    """
+    [비동기 API 테스트] 검증 실패 400, 없는 대상 404, 예약 충돌/불가 409, 잘못된 메서드 405로 응답하는지 검증
+    """
+    app, _, _ = api
+    code, payload = asyncio.run(call(app, method, path, query, body))
+    assert code == status and "error" in payload
+
+
+def test_requests_wait_for_repository_concurrently(api):
+    """
+    [비동기 API 테스트] 리포지토리 호출이 막혀 있는 동안에도 이벤트 루프가 다른 요청을 받아 동시에 진행하는지 검증
+    (리포지토리 호출 4개가 동시에 배리어에 도달해야만 모두 통과 - 요청을 하나씩 처리하면 배리어가 깨짐)
+    """
+    # 1. 준비 (Arrange)
+    app, reservations, _ = api
+    barrier = threading.Barrier(4, timeout=5)
+    original = reservations.find_available_caravan_ids
+
+    def slow_lookup(*args):
+        barrier.wait()
+        return original(*args)
+
+    reservations.find_available_caravan_ids = slow_lookup
+    query = {"ids": "c0,c1", "start_date": "2030-01-01", "end_date": "2030-01-02"}
+
+    async def concurrent_requests():
+        return await asyncio.gather(*(call(app, "GET", "/caravans/availability", query) for _ in range(4)))
+
+    # 2. 실행 (Act)
+    responses = asyncio.run(concurrent_requests())
+
+    # 3. 검증 (Assert)
+    assert responses == [(200, {"available": ["c0", "c1"]})] * 4
+    assert not barrier.broken
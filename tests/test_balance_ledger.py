@@ -0,0 +1,174 @@
+# tests/test_balance_ledger.py
+import multiprocessing
+import sqlite3
+
+from flask import g
+import pytest
+
+# --- 테스트 대상 (main.py의 잔액 원장) ---
+from main import (db, User, UserRole, BalanceLedger, to_minor_units, post_balance_entry,
+                  migrate_legacy_balances, rebuild_balances)
+
+
+def login(client, user):
+    g.pop('_login_user', None)  # 앱 컨텍스트가 요청 사이에 공유되므로 이전 요청의 사용자 캐시를 비움
+    with client.session_transaction() as session:
+        session['_user_id'] = str(user.id)
+        session['_fresh'] = True
+
+
+@pytest.fixture
+def host_and_guest(flask_app):
+    host = User(email='host@test.com', name='Host', password_hash='x', user_role=UserRole.HOST)
+    guest = User(email='guest@test.com', name='Guest', password_hash='x')
+    db.session.add_all([host, guest])
+    db.session.commit()
+    return host, guest
+
+
+def ledger_of(user_id):
+    return [(entry.amount_minor, entry.balance_after_minor, entry.entry_type)
+            for entry in BalanceLedger.query.filter_by(user_id=user_id).order_by(BalanceLedger.id)]
+
+
+def test_to_minor_units_rejects_fractions_and_non_numbers():
+    """
+    [잔액 원장 테스트] 금액을 float 없이 정수(원)로 바꾸고, 원 단위 미만/숫자가 아닌 값은 거부하는지 검증
+    """
+    assert to_minor_units('15000') == 15000
+    assert to_minor_units('1e3') == 1000
+    for invalid in ('1000.5', 'abc', None, 'NaN', 'Infinity'):
+        with pytest.raises(ValueError):
+            to_minor_units(invalid)
+
+
+def test_deposit_routes_append_ledger_and_update_snapshot(flask_app, host_and_guest):
+    """
+    [잔액 원장 테스트] 본인 충전/호스트의 게스트 충전이 원장에 한 줄씩 추가되고 잔액 스냅샷과 일치하는지 검증
+    """
+    # 1. 준비 (Arrange)
+    host, guest = host_and_guest
+    client = flask_app.test_client()
+
+    # 2. 실행 (Act)
+    login(client, guest)
+    client.post('/deposit', data={'amount': '15000'})
+    client.post('/deposit', data={'amount': '0.5'})  # 원 단위 미만: 거부
+    client.post('/deposit', data={'amount': '-100'})  # 음수: 거부
+    login(client, host)
+    response = client.post('/admin/deposit', data={'user_id': guest.id, 'amount': '2500'},
+                           follow_redirects=True)
+
+    # 3. 검증 (Assert)
+    assert ledger_of(guest.id) == [(15000, 15000, 'deposit'), (2500, 17500, 'admin_deposit')]
+    assert BalanceLedger.query.filter_by(entry_type='admin_deposit').one().actor_id == host.id
+    db.session.expire_all()
+    assert db.session.get(User, guest.id).balance_minor == 17500
+    assert '현재 잔액: ₩17,500' in response.get_data(as_text=True)
+
+
+def test_ledger_entries_cannot_be_changed(host_and_guest):
+    """
+    [잔액 원장 테스트] 원장 항목은 추가만 되고 ORM으로 수정/삭제하면 거부되는지 검증
+    """
+    # 1. 준비 (Arrange)
+    _, guest = host_and_guest
+    post_balance_entry(guest.id, 1000, 'deposit')
+    db.session.commit()
+    entry = BalanceLedger.query.one()
+
+    # 2. 실행 (Act) & 3. 검증 (Assert)
+    entry.amount_minor = 1
+    with pytest.raises(ValueError):
+        db.session.commit()
+    db.session.rollback()
+    db.session.delete(BalanceLedger.query.one())
+    with pytest.raises(ValueError):
+        db.session.commit()
+    db.session.rollback()
+    assert ledger_of(guest.id) == [(1000, 1000, 'deposit')]
+
+
+def test_legacy_float_balance_is_migrated_and_drift_is_rebuilt(host_and_guest):
+    """
+    [잔액 원장 테스트] 이전 float 잔액이 opening 원장 항목으로 옮겨지고, 스냅샷이 원장과 다르면 다시 계산되는지 검증
+    """
+    # 1. 준비 (Arrange): 누적 오차가 있는 float 잔액
+    host, guest = host_and_guest
+    guest.legacy_balance = 0.1 + 0.2 + 12345.0  # 12345.300000000001
+    db.session.commit()
+
+    # 2. 실행 (Act)
+    migrated = migrate_legacy_balances()
+    migrated_again = migrate_legacy_balances()
+    db.session.execute(db.update(User).where(User.id == host.id).values(balance_minor=999))
+    db.session.commit()
+    corrected = rebuild_balances()
+
+    # 3. 검증 (Assert)
+    assert (migrated, migrated_again) == (1, 0)
+    assert ledger_of(guest.id) == [(12345, 12345, 'opening')]
+    assert corrected == 1 and rebuild_balances() == 0
+    db.session.expire_all()
+    assert (db.session.get(User, guest.id).balance_minor, db.session.get(User, host.id).balance_minor) == (12345, 0)
+
+
+# --- 다중 프로세스 동시 충전 스트레스 테스트 ---
+# 프로세스 8개 x 50회 = 같은 게스트 한 명에게 충전 400건이 동시에 몰립니다.
+
+WORKERS = 8
+ROUNDS = 50
+
+
+def _deposit_worker(seed, result_queue):
+    """자식 프로세스: 같은 사용자(ID 1)에게 반복 충전합니다. (spawn으로 시작되어 DATABASE_URL의 파일 DB를 사용)"""
+    import main
+
+    total = 0
+    with main.app.app_context():
+        for i in range(ROUNDS):
+            amount = 1000 + seed * 100 + i
+            main.post_balance_entry(1, amount, 'deposit')
+            main.db.session.commit()
+            total += amount
+    result_queue.put(total)
+
+
+def test_parallel_deposits_never_lose_updates(tmp_path, monkeypatch):
+    """
+    [동시 충전 테스트] 여러 프로세스가 같은 사용자에게 동시에 충전해도 잔액 = 충전 합계 = 원장 합계인지 검증
+    (read-modify-write였다면 같은 잔액을 읽은 충전끼리 서로 덮어써 합계보다 작아짐)
+    """
+    # 1. 준비 (Arrange): 파일 DB에 게스트 1명 생성
+    db_path = tmp_path / 'deposits.db'
+    from sqlalchemy import create_engine
+    engine = create_engine(f'sqlite:///{db_path}')
+    db.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(User.__table__.insert().values(email='g@test.com', name='G', password_hash='x'))
+    engine.dispose()
+
+    # 2. 실행 (Act): 자식 프로세스는 환경 변수를 물려받아 main을 새로 import
+    monkeypatch.setenv('DATABASE_URL', f'sqlite:///{db_path}')
+    ctx = multiprocessing.get_context('spawn')
+    result_queue = ctx.Queue()
+    workers = [ctx.Process(target=_deposit_worker, args=(seed, result_queue)) for seed in range(WORKERS)]
+    for worker in workers:
+        worker.start()
+    deposited = sum(result_queue.get(timeout=120) for _ in workers)
+    for worker in workers:
+        worker.join(timeout=30)
+        assert worker.exitcode == 0
+
+    # 3. 검증 (Assert): 스냅샷 = 원장 합계 = 충전 합계, 기록 직후 잔액은 원장 순서대로 누적
+    conn = sqlite3.connect(db_path)
+    balance = conn.execute('SELECT balance_minor FROM user WHERE id = 1').fetchone()[0]
+    entries = conn.execute(
+        'SELECT amount_minor, balance_after_minor FROM balance_ledger ORDER BY id').fetchall()
+    conn.close()
+    assert balance == deposited == sum(amount for amount, _ in entries)
+    assert len(entries) == WORKERS * ROUNDS
+    running = 0
+    for amount, balance_after in entries:
+        running += amount
+        assert balance_after == running
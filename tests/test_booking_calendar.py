@@ -0,0 +1,96 @@
+# tests/test_booking_calendar.py
+from datetime import date
+
+from flask import g
+import pytest
+
+# --- 테스트 대상 (main.py의 카라반 달력 비트맵) ---
+from main import (db, User, Caravan, Reservation, CaravanCalendar, UserRole, ReservationStatus,
+                  BookingConflictError, create_pending_reservation, confirm_reservation,
+                  complete_confirmed_reservation, rebuild_booking_calendar)
+
+
+@pytest.fixture
+def caravans_and_guest(flask_app):
+    host = User(email='host@test.com', name='Host', password_hash='x', user_role=UserRole.HOST)
+    guest = User(email='guest@test.com', name='Guest', password_hash='x')
+    db.session.add_all([host, guest])
+    db.session.flush()
+    caravans = [Caravan(host_id=host.id, name=f'C{i}', location='서울', daily_rate=50000, capacity=4)
+                for i in range(2)]
+    db.session.add_all(caravans)
+    db.session.commit()
+    return host, guest, caravans
+
+
+def book(caravan, guest, start, end):
+    reservation = create_pending_reservation(caravan.id, guest.id, start, end, 100000)
+    return confirm_reservation(reservation.id)
+
+
+def calendar_rows():
+    return {(row.caravan_id, row.month): row.booked_mask for row in CaravanCalendar.query}
+
+
+def test_confirm_and_complete_update_calendar(caravans_and_guest):
+    """
+    [달력 테스트] 확정하면 밤이 달력에 표시되어 겹치는 신청이 거절되고, 완료하면 해제되는지 검증
+    """
+    # 1. 준비 (Arrange)
+    _, guest, caravans = caravans_and_guest
+    stay = book(caravans[0], guest, date(2030, 1, 30), date(2030, 2, 2))
+
+    # 2. 실행 & 3. 검증: 확정 직후
+    with pytest.raises(BookingConflictError):
+        create_pending_reservation(caravans[0].id, guest.id, date(2030, 2, 1), date(2030, 2, 4), 1)
+    create_pending_reservation(caravans[0].id, guest.id, date(2030, 2, 2), date(2030, 2, 4), 1)
+    assert calendar_rows() == {(caravans[0].id, date(2030, 1, 1)): 0b11 << 29,
+                               (caravans[0].id, date(2030, 2, 1)): 0b1}
+
+    # 2. 실행 & 3. 검증: 완료 후 (확정 예약만 날짜를 차지)
+    complete_confirmed_reservation(stay.id)
+    assert set(calendar_rows().values()) == {0}
+    assert db.session.get(Reservation, stay.id).status == ReservationStatus.COMPLETED
+
+
+def test_rebuild_matches_incremental_calendar(caravans_and_guest):
+    """
+    [달력 테스트] 확정 예약 전체로 다시 만든 달력이 점진 갱신한 달력과 같은지 검증
+    """
+    # 1. 준비 (Arrange)
+    _, guest, caravans = caravans_and_guest
+    book(caravans[0], guest, date(2030, 1, 1), date(2030, 1, 4))
+    book(caravans[0], guest, date(2030, 1, 10), date(2030, 2, 3))
+    book(caravans[1], guest, date(2030, 3, 31), date(2030, 4, 1))
+    incremental = {key: mask for key, mask in calendar_rows().items() if mask}
+
+    # 2. 실행 (Act)
+    rebuild_booking_calendar()
+
+    # 3. 검증 (Assert)
+    assert calendar_rows() == incremental
+
+
+def test_calendar_api_returns_month_for_many_caravans(flask_app, caravans_and_guest):
+    """
+    [달력 API 테스트] 여러 카라반의 한 달 예약 일자와 빈 밤 수를 한 번에 반환하는지 검증
+    """
+    # 1. 준비 (Arrange)
+    _, guest, caravans = caravans_and_guest
+    book(caravans[0], guest, date(2030, 2, 27), date(2030, 3, 2))
+    client = flask_app.test_client()
+    g.pop('_login_user', None)
+    with client.session_transaction() as session:
+        session['_user_id'] = str(guest.id)
+        session['_fresh'] = True
+    ids = f'{caravans[0].id},{caravans[1].id},999'
+
+    # 2. 실행 (Act)
+    body = client.get(f'/api/caravans/calendar?month=2030-02&ids={ids}').get_json()
+
+    # 3. 검증 (Assert)
+    assert body == {"month": "2030-02", "days": 28, "caravans": [
+        {"id": caravans[0].id, "booked_days": [27, 28], "free_nights": 26},
+        {"id": caravans[1].id, "booked_days": [], "free_nights": 28}]}
+    assert client.get('/api/caravans/calendar?month=2030-13&ids=1').status_code == 400
+    assert client.get('/api/caravans/calendar?month=2030-02').status_code == 400
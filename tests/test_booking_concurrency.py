@@ -0,0 +1,199 @@
+# tests/test_booking_concurrency.py
+import multiprocessing
+import random
+import sqlite3
+from datetime import date, timedelta
+
+import pytest
+
+# --- 테스트 대상 (main.py의 예약 신청/승인 트랜잭션) ---
+from main import (db, User, Caravan, Reservation, UserRole, ReservationStatus,
+                  BookingConflictError, create_pending_reservation,
+                  confirm_reservation)
+from src.repositories.month_bitmap import night_masks
+
+
+@pytest.fixture
+def caravan_and_guests(flask_app):
+    host = User(email='host@test.com', name='Host', password_hash='x', user_role=UserRole.HOST)
+    guests = [User(email=f'g{i}@test.com', name=f'Guest{i}', password_hash='x') for i in range(2)]
+    db.session.add_all([host, *guests])
+    db.session.flush()
+    caravan = Caravan(host_id=host.id, name='C', location='서울', daily_rate=50000, capacity=4)
+    db.session.add(caravan)
+    db.session.commit()
+    return host, caravan, guests
+
+
+def login(client, user):
+    with client.session_transaction() as session:
+        session['_user_id'] = str(user.id)
+        session['_fresh'] = True
+
+
+def test_confirm_rejects_overlap_with_confirmed(caravan_and_guests):
+    """
+    [예약 승인 테스트] 두 신청이 겹칠 때 먼저 승인된 것만 확정되고, 나머지 승인은 거절되는지 검증
+    """
+    # 1. 준비 (Arrange): 겹치는 기간의 신청 2건 (신청 단계에서는 확정 예약이 없으므로 모두 허용)
+    _, caravan, guests = caravan_and_guests
+    first = create_pending_reservation(caravan.id, guests[0].id, date(2030, 1, 1), date(2030, 1, 5), 200000)
+    second = create_pending_reservation(caravan.id, guests[1].id, date(2030, 1, 3), date(2030, 1, 6), 150000)
+
+    # 2. 실행 (Act)
+    confirm_reservation(first.id)
+    with pytest.raises(BookingConflictError):
+        confirm_reservation(second.id)
+
+    # 3. 검증 (Assert)
+    assert db.session.get(Reservation, first.id).status == ReservationStatus.CONFIRMED
+    assert db.session.get(Reservation, second.id).status == ReservationStatus.PENDING
+    assert db.session.get(Caravan, caravan.id).booking_version == 3  # 신청 2회 + 승인 1회
+
+
+def test_create_rejects_overlap_and_allows_checkout_day(caravan_and_guests):
+    """
+    [예약 신청 테스트] 확정 예약과 겹치는 신청은 거절하고, 체크아웃 날짜부터 시작하는 신청은 허용하는지 검증
+    """
+    # 1. 준비 (Arrange)
+    _, caravan, guests = caravan_and_guests
+    confirmed = create_pending_reservation(caravan.id, guests[0].id, date(2030, 1, 1), date(2030, 1, 5), 200000)
+    confirm_reservation(confirmed.id)
+
+    # 2. 실행 & 3. 검증
+    with pytest.raises(BookingConflictError):
+        create_pending_reservation(caravan.id, guests[1].id, date(2030, 1, 4), date(2030, 1, 8), 200000)
+    after = create_pending_reservation(caravan.id, guests[1].id, date(2030, 1, 5), date(2030, 1, 8), 150000)
+    assert after.id is not None
+    assert Reservation.query.count() == 2
+
+
+def test_approve_route_flashes_conflict(flask_app, caravan_and_guests):
+    """
+    [예약 승인 라우트 테스트] 겹치는 예약 승인 시 상태를 바꾸지 않고 경고를 표시하는지 검증
+    """
+    # 1. 준비 (Arrange)
+    host, caravan, guests = caravan_and_guests
+    first = create_pending_reservation(caravan.id, guests[0].id, date(2030, 1, 1), date(2030, 1, 5), 200000)
+    second = create_pending_reservation(caravan.id, guests[1].id, date(2030, 1, 2), date(2030, 1, 4), 100000)
+    confirm_reservation(first.id)
+    client = flask_app.test_client()
+    login(client, host)
+
+    # 2. 실행 (Act)
+    response = client.get(f'/reservations/approve/{second.id}', follow_redirects=True)
+
+    # 3. 검증 (Assert)
+    assert '승인할 수 없습니다' in response.data.decode()
+    db.session.expire_all()
+    assert db.session.get(Reservation, second.id).status == ReservationStatus.PENDING
+
+
+def test_lock_refuses_session_with_uncommitted_changes(caravan_and_guests):
+    """
+    [예약 트랜잭션 테스트] 호출자의 커밋되지 않은 변경이 있으면 함께 커밋하지 않고 RuntimeError를 발생시키는지 검증
+    """
+    # 1. 준비 (Arrange): 커밋하지 않은 이름 변경 (flush까지만 수행)
+    _, caravan, _ = caravan_and_guests
+    caravan.name = '변경 중'
+    db.session.flush()
+
+    # 2. 실행 (Act)
+    with pytest.raises(RuntimeError):
+        create_pending_reservation(caravan.id, caravan.host_id, date(2030, 1, 1), date(2030, 1, 3), 100000)
+    db.session.rollback()
+
+    # 3. 검증 (Assert): 호출자의 변경과 예약 모두 저장되지 않음
+    assert db.session.get(Caravan, caravan.id).name == 'C'
+    assert Reservation.query.count() == 0
+
+
+# --- 다중 프로세스 스트레스 테스트 ---
+# 프로세스 8개 x 50회 = 예약 신청/승인 400건이 카라반 3대의 같은 기간(11일)에 몰립니다.
+
+CARAVANS = 3
+WORKERS = 8
+ROUNDS = 50
+
+
+def _booking_worker(seed, result_queue):
+    """자식 프로세스: 겹치는 기간을 반복해서 신청/승인합니다. (spawn으로 시작되어 DATABASE_URL의 파일 DB를 사용)"""
+    import main
+
+    rng = random.Random(seed)
+    successes = conflicts = 0
+    with main.app.app_context():
+        guest_id = seed + CARAVANS + 1
+        for _ in range(ROUNDS):
+            caravan_id = rng.randint(1, CARAVANS)
+            start = date(2030, 1, 1) + timedelta(days=rng.randint(0, 10))
+            end = start + timedelta(days=rng.randint(1, 4))
+            try:
+                reservation = main.create_pending_reservation(
+                    caravan_id, guest_id, start, end, 100000)
+                main.confirm_reservation(reservation.id)
+                successes += 1
+            except main.BookingConflictError:
+                conflicts += 1
+    result_queue.put((successes, conflicts))
+
+
+def test_parallel_bookings_never_double_confirm(tmp_path, monkeypatch):
+    """
+    [동시 예약 테스트] 여러 프로세스가 같은 카라반을 동시에 예약/승인해도 확정 예약이 겹치지 않는지 검증
+    """
+    # 1. 준비 (Arrange): 파일 DB에 호스트/게스트/카라반 생성
+    db_path = tmp_path / 'stress.db'
+    from sqlalchemy import create_engine
+    engine = create_engine(f'sqlite:///{db_path}')
+    db.metadata.create_all(engine)
+    with engine.begin() as conn:
+        for i in range(CARAVANS + 1 + WORKERS):
+            conn.execute(User.__table__.insert().values(
+                email=f'u{i}@test.com', name=f'U{i}', password_hash='x',
+                user_role=UserRole.HOST if i == 0 else UserRole.GUEST))
+        for i in range(CARAVANS):
+            conn.execute(Caravan.__table__.insert().values(
+                host_id=1, name=f'C{i}', location='서울', daily_rate=50000, capacity=4))
+    engine.dispose()
+
+    # 2. 실행 (Act): 자식 프로세스는 환경 변수를 물려받아 main을 새로 import
+    monkeypatch.setenv('DATABASE_URL', f'sqlite:///{db_path}')
+    ctx = multiprocessing.get_context('spawn')
+    result_queue = ctx.Queue()
+    workers = [ctx.Process(target=_booking_worker, args=(seed, result_queue))
+               for seed in range(WORKERS)]
+    for worker in workers:
+        worker.start()
+    results = [result_queue.get(timeout=120) for _ in workers]
+    for worker in workers:
+        worker.join(timeout=30)
+        assert worker.exitcode == 0
+
+    # 3. 검증 (Assert): 같은 카라반의 확정 예약끼리 겹치는 쌍이 없어야 함
+    conn = sqlite3.connect(db_path)
+    overlapping = conn.execute(
+        "SELECT COUNT(*) FROM reservation a JOIN reservation b "
+        "ON a.caravan_id = b.caravan_id AND a.id < b.id "
+        "AND a.start_date < b.end_date AND a.end_date > b.start_date "
+        "WHERE a.status = 'CONFIRMED' AND b.status = 'CONFIRMED'").fetchone()[0]
+    confirmed = conn.execute(
+        "SELECT COUNT(*) FROM reservation WHERE status = 'CONFIRMED'").fetchone()[0]
+    expected_calendar = {}
+    for caravan_id, start, end in conn.execute(
+            "SELECT caravan_id, start_date, end_date FROM reservation WHERE status = 'CONFIRMED'"):
+        for month, mask in night_masks(date.fromisoformat(start), date.fromisoformat(end)):
+            key = (caravan_id, month.isoformat())
+            expected_calendar[key] = expected_calendar.get(key, 0) | mask
+    calendar = {(caravan_id, month): mask for caravan_id, month, mask in conn.execute(
+        "SELECT caravan_id, month, booked_mask FROM caravan_calendar")}
+    pending = conn.execute(
+        "SELECT COUNT(*) FROM reservation WHERE status = 'PENDING'").fetchone()[0]
+    host_stats = conn.execute(
+        "SELECT bookings, pending_count FROM host_stats WHERE host_id = 1 AND year = 2030").fetchone()
+    conn.close()
+    assert overlapping == 0
+    assert calendar == expected_calendar  # 동시 확정 후에도 달력 비트맵이 확정 예약과 일치
+    assert host_stats == (confirmed, pending)  # 예약 요약도 같은 트랜잭션에서 갱신되어 일치
+    assert confirmed == sum(s for s, _ in results) > 0
+    assert sum(c for _, c in results) > 0
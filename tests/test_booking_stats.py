@@ -0,0 +1,146 @@
+# tests/test_booking_stats.py
+from datetime import date
+
+from flask import g
+import pytest
+
+# --- 테스트 대상 (main.py의 호스트/카라반 예약 요약) ---
+from main import (db, User, Caravan, CaravanStats, HostStats, UserRole, STATS_COUNTERS,
+                  create_pending_reservation, confirm_reservation, cancel_pending_reservation,
+                  complete_confirmed_reservation, rebuild_booking_stats, nights_by_year, increment_stats)
+from sqlalchemy import event
+
+
+def login(client, user):
+    g.pop('_login_user', None)  # 앱 컨텍스트가 요청 사이에 공유되므로 이전 요청의 사용자 캐시를 비움
+    with client.session_transaction() as session:
+        session['_user_id'] = str(user.id)
+        session['_fresh'] = True
+
+
+@pytest.fixture
+def host_with_bookings(flask_app):
+    """호스트 1명, 카라반 2대에 확정/완료/대기/거절 예약을 만듭니다."""
+    host = User(email='host@test.com', name='Host', password_hash='x', user_role=UserRole.HOST)
+    guest = User(email='guest@test.com', name='Guest', password_hash='x')
+    db.session.add_all([host, guest])
+    db.session.flush()
+    caravans = [Caravan(host_id=host.id, name=f'C{i}', location='서울', daily_rate=50000, capacity=4)
+                for i in range(2)]
+    db.session.add_all(caravans)
+    db.session.commit()
+
+    def request_stay(caravan, start, end, price):
+        return create_pending_reservation(caravan.id, guest.id, start, end, price)
+
+    confirm_reservation(request_stay(caravans[0], date(2030, 12, 30), date(2031, 1, 2), 300000).id)
+    done = confirm_reservation(request_stay(caravans[0], date(2030, 3, 1), date(2030, 3, 5), 200000).id)
+    complete_confirmed_reservation(done.id)
+    confirm_reservation(request_stay(caravans[1], date(2030, 6, 1), date(2030, 6, 3), 100000).id)
+    request_stay(caravans[1], date(2030, 7, 1), date(2030, 7, 2), 50000)
+    cancel_pending_reservation(request_stay(caravans[1], date(2030, 8, 1), date(2030, 8, 2), 50000).id)
+    return host, guest, caravans
+
+
+def stats_rows(model):
+    return {(row.caravan_id if model is CaravanStats else row.host_id, row.year):
+            tuple(getattr(row, column) for column in STATS_COUNTERS) for row in model.query}
+
+
+def test_increment_stats_is_a_single_upsert(host_with_bookings):
+    """
+    [예약 요약 테스트] 요약 행 증감이 문장 하나(INSERT ... ON CONFLICT DO UPDATE)로 처리되어
+    첫 행 생성과 이후 증감이 같은 경로로 누적되는지 검증 (동시 첫 예약의 기본 키 충돌 방지)
+    """
+    # 1. 준비 (Arrange)
+    host_id = host_with_bookings[0].id
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    # 2. 실행 (Act): 요약 행이 없는 연도에 두 번 증가
+    event.listen(db.engine, 'before_cursor_execute', capture)
+    try:
+        increment_stats(HostStats, {'host_id': host_id, 'year': 2040}, {'bookings': 1, 'revenue': 1000})
+        increment_stats(HostStats, {'host_id': host_id, 'year': 2040}, {'bookings': 1, 'revenue': 500})
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', capture)
+    db.session.commit()
+
+    # 3. 검증 (Assert)
+    assert len(statements) == 2 and all('ON CONFLICT' in statement for statement in statements)
+    assert stats_rows(HostStats)[(host_id, 2040)] == (2, 0, 1500, 0)
+
+
+def test_nights_by_year_splits_stays_over_new_year():
+    """
+    [예약 요약 테스트] 연말에 걸친 숙박의 밤이 연도별로 나뉘는지 검증 (체크아웃 날짜 미포함)
+    """
+    assert nights_by_year(date(2030, 12, 30), date(2031, 1, 2)) == {2030: 2, 2031: 1}
+    assert nights_by_year(date(2030, 3, 1), date(2030, 3, 5)) == {2030: 4}
+    assert nights_by_year(date(2030, 12, 31), date(2031, 1, 1)) == {2030: 1}
+
+
+def test_incremental_stats_follow_reservation_transitions(host_with_bookings):
+    """
+    [예약 요약 테스트] 신청/승인/완료/거절이 요약 테이블에 (예약 수, 밤 수, 매출, 대기 수)로 반영되는지 검증
+    """
+    # 1. 준비 (Arrange)
+    host, _, caravans = host_with_bookings
+
+    # 2. 실행 (Act)
+    host_rows = stats_rows(HostStats)
+    caravan_rows = stats_rows(CaravanStats)
+
+    # 3. 검증 (Assert) - (bookings, nights_booked, revenue, pending_count)
+    assert host_rows == {(host.id, 2030): (3, 2 + 4 + 2, 600000, 1),
+                         (host.id, 2031): (0, 1, 0, 0)}
+    assert caravan_rows[caravans[0].id, 2030] == (2, 6, 500000, 0)
+    assert caravan_rows[caravans[1].id, 2030] == (1, 2, 100000, 1)
+
+
+def test_rebuild_matches_incremental_stats_and_repairs_drift(host_with_bookings):
+    """
+    [예약 요약 테스트] 재계산 결과가 점진 갱신 결과와 같고, 어긋난 요약 행은 바로잡고 그 수를 반환하는지 검증
+    """
+    # 1. 준비 (Arrange)
+    host, _, caravans = host_with_bookings
+    incremental = (stats_rows(HostStats), stats_rows(CaravanStats))
+
+    # 2. 실행 & 3. 검증: 어긋남 없음
+    assert rebuild_booking_stats() == 0
+    assert (stats_rows(HostStats), stats_rows(CaravanStats)) == incremental
+
+    # 2. 실행 & 3. 검증: 호스트 행 하나가 어긋나고, 없어야 할 카라반 행이 하나 있는 경우
+    db.session.get(HostStats, (host.id, 2030)).revenue += 1
+    db.session.add(CaravanStats(caravan_id=caravans[1].id, host_id=host.id, year=2029,
+                                bookings=1, nights_booked=1, revenue=1, pending_count=0))
+    db.session.commit()
+    assert rebuild_booking_stats() == 2
+    assert (stats_rows(HostStats), stats_rows(CaravanStats)) == incremental
+
+
+def test_dashboard_and_stats_api_read_summary_rows(flask_app, host_with_bookings):
+    """
+    [예약 요약 API 테스트] 호스트 요약 JSON(가동률 포함)과 대시보드 요약 카드, 게스트 접근 거부를 검증
+    """
+    # 1. 준비 (Arrange)
+    host, guest, caravans = host_with_bookings
+    client = flask_app.test_client()
+    login(client, host)
+
+    # 2. 실행 (Act)
+    body = client.get('/api/stats/host?year=2030').get_json()
+    page = client.get('/dashboard').get_data(as_text=True)
+    login(client, guest)
+    forbidden = client.get('/api/stats/host')
+
+    # 3. 검증 (Assert)
+    assert body['host'] == {'year': 2030, 'bookings': 3, 'nights_booked': 8, 'revenue': 600000,
+                            'pending_count': 1, 'occupancy_rate': round(8 * 100 / 730, 1),
+                            'caravan_count': 2}
+    assert [(c['id'], c['bookings'], c['occupancy_rate']) for c in body['caravans']] == \
+        [(caravans[0].id, 2, round(6 * 100 / 365, 1)), (caravans[1].id, 1, round(2 * 100 / 365, 1))]
+    assert '예약 요약' in page and '승인 대기' in page
+    assert forbidden.status_code == 403
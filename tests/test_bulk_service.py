@@ -0,0 +1,160 @@
+# tests/test_bulk_service.py
+import io
+import json
+import pytest
+from datetime import date
+
+# --- 테스트 대상 ---
+from src.services.bulk_service import BulkImportService, read_rows, reservation_from_row
+from src import bulk_cli
+from src.repositories.memory_repository import InMemoryCaravanRepository, InMemoryReservationRepository
+from src.repositories.sql_repository import SqlCaravanRepository, SqlReservationRepository, create_repository_engine
+
+# --- 테스트에 필요한 모델 ---
+from src.models.common import CaravanStatus, ReservationStatus
+
+CARAVANS_CSV = """caravan_id,host_id,name,capacity,daily_rate,status,amenities
+c1,h1,바다뷰,4,90000,AVAILABLE,샤워;주방
+c2,h1,숲속,2,,MAINTENANCE,
+c3,h2,인원없음,0,50000,,
+c4,h2,요금오류,3,abc,,
+c5,h2,산장,6,120000,,
+"""
+
+def reservation_lines(*rows) -> io.StringIO:
+    return io.StringIO("\n".join(json.dumps(row, ensure_ascii=False) for row in rows) + "\n")
+
+def booking(reservation_id, caravan_id, start, end, **extra):
+    return {"reservation_id": reservation_id, "guest_id": "g1", "caravan_id": caravan_id,
+            "start_date": start, "end_date": end, "total_price": 100000, **extra}
+
+@pytest.fixture(params=["memory", "sql"])
+def repos(request):
+    if request.param == "memory":
+        yield InMemoryCaravanRepository(), InMemoryReservationRepository()
+        return
+    engine = create_repository_engine("sqlite://")
+    yield SqlCaravanRepository(engine), SqlReservationRepository(engine)
+    engine.dispose()
+
+def test_import_caravans_validates_rows_and_loads_in_chunks(repos):
+    """
+    [대량 적재 테스트] 규칙에 맞지 않는 행은 행 번호와 함께 거부하고, 나머지는 chunk 단위로 저장되는지 검증
+    """
+    # 1. 준비 (Arrange)
+    caravan_repo, reservation_repo = repos
+    service = BulkImportService(caravan_repo, reservation_repo, chunk_size=2)
+
+    # 2. 실행 (Act)
+    result = service.import_caravans(read_rows(io.StringIO(CARAVANS_CSV), "csv"))
+
+    # 3. 검증 (Assert)
+    assert result.imported == 3
+    assert [line for line, _ in result.errors] == [3, 4]
+    assert "수용 인원" in result.errors[0][1]
+    assert caravan_repo.get_by_id("c1").amenities == ["샤워", "주방"]
+    assert caravan_repo.get_by_id("c2").status == CaravanStatus.MAINTENANCE
+    assert [c.caravan_id for c in caravan_repo.search_by_capacity(1)] == ["c2", "c1", "c5"]
+
+def test_import_reservations_rejects_overlaps_and_updates_availability(repos):
+    """
+    [대량 적재 테스트] 기존 예약/파일 안의 예약과 겹치는 행을 거부하고, 적재 후 가용성 조회에 반영되는지 검증
+    """
+    # 1. 준비 (Arrange): 기존 예약 1건 (c1, 3/1~3/3)
+    caravan_repo, reservation_repo = repos
+    reservation_repo.add_all([reservation_from_row(booking("old", "c1", "2020-03-01", "2020-03-03"))])
+    service = BulkImportService(caravan_repo, reservation_repo, chunk_size=2)
+    rows = reservation_lines(
+        booking("r1", "c1", "2020-01-01", "2020-01-05", status="COMPLETED"),  # 과거 예약도 이관 가능
+        booking("r2", "c1", "2020-01-05", "2020-01-07"),                       # r1과 겹침
+        booking("r3", "c1", "2020-03-03", "2020-03-04"),                       # 기존 예약과 겹침
+        booking("r4", "c2", "2020-01-07", "2020-01-01"),                       # 종료일이 시작일보다 빠름
+        booking("r5", "c2", "2020-01-01", "2020-01-10"),
+        booking("r5", "c3", "2020-01-01", "2020-01-10"),                       # 파일 안 ID 중복
+        {"guest_id": "g1", "caravan_id": "c3", "start_date": "2020/01/01", "end_date": "2020-01-02", "total_price": 1},
+    )
+
+    # 2. 실행 (Act)
+    result = service.import_reservations(read_rows(rows, "jsonl"))
+
+    # 3. 검증 (Assert)
+    assert result.imported == 2
+    assert [line for line, _ in result.errors] == [2, 3, 4, 6, 7]
+    assert reservation_repo.get_by_id("r1").status == ReservationStatus.COMPLETED
+    assert not reservation_repo.is_caravan_available("c1", date(2020, 1, 3), date(2020, 1, 3))
+    assert not reservation_repo.is_caravan_available("c2", date(2020, 1, 9), date(2020, 1, 12))
+    assert reservation_repo.is_caravan_available("c1", date(2020, 1, 6), date(2020, 2, 28))
+
+def test_import_records_malformed_jsonl_lines_without_losing_buffered_rows(repos):
+    """
+    [대량 적재 테스트] JSON 문법 오류/객체가 아닌 줄을 줄 번호와 함께 거부하고, 앞뒤의 정상 행은 모두 저장하는지 검증
+    (빈 줄도 줄 번호를 차지)
+    """
+    # 1. 준비 (Arrange): 묶음 크기보다 적은 정상 행이 버퍼에 있는 상태에서 잘못된 줄을 만남
+    caravan_repo, reservation_repo = repos
+    service = BulkImportService(caravan_repo, reservation_repo, chunk_size=10)
+    lines = [
+        json.dumps(booking("r1", "c1", "2030-01-01", "2030-01-03")),
+        "",
+        '{"reservation_id": "r2", ',
+        "[1, 2]",
+        json.dumps(booking("r3", "c2", "2030-01-01", "2030-01-03")),
+    ]
+
+    # 2. 실행 (Act)
+    result = service.import_reservations(read_rows(io.StringIO("\n".join(lines) + "\n"), "jsonl"))
+    caravans = service.import_caravans(read_rows(io.StringIO('"c1"\n{"host_id": "h1", "name": "a", "capacity": 2}\n'),
+                                                 "jsonl"))
+
+    # 3. 검증 (Assert)
+    assert result.imported == 2
+    assert [line for line, _ in result.errors] == [3, 4]
+    assert {r.reservation_id for r in reservation_repo.iter_all()} == {"r1", "r3"}
+    assert caravans.imported == 1 and [line for line, _ in caravans.errors] == [1]
+
+def test_export_then_import_round_trip(repos):
+    """
+    [내보내기 테스트] CSV/JSONL로 내보낸 데이터를 새 저장소에 다시 적재하면 같은 내용이 되는지 검증
+    """
+    # 1. 준비 (Arrange)
+    caravan_repo, reservation_repo = repos
+    service = BulkImportService(caravan_repo, reservation_repo, chunk_size=2)
+    service.import_caravans(read_rows(io.StringIO(CARAVANS_CSV), "csv"))
+    service.import_reservations(read_rows(reservation_lines(
+        booking("r1", "c1", "2030-01-01", "2030-01-05"), booking("r2", "c5", "2030-01-01", "2030-01-05")), "jsonl"))
+
+    for fmt in ("csv", "jsonl"):
+        caravan_out, reservation_out = io.StringIO(), io.StringIO()
+
+        # 2. 실행 (Act)
+        assert service.export_caravans(caravan_out, fmt, page_size=2) == 3
+        assert service.export_reservations(reservation_out, fmt) == 2
+        copy = BulkImportService(InMemoryCaravanRepository(), InMemoryReservationRepository())
+        copy.import_caravans(read_rows(io.StringIO(caravan_out.getvalue()), fmt))
+        copy.import_reservations(read_rows(io.StringIO(reservation_out.getvalue()), fmt))
+
+        # 3. 검증 (Assert)
+        assert copy._caravan_repo.search_by_capacity(1) == caravan_repo.search_by_capacity(1)
+        assert sorted(copy._reservation_repo.iter_all(), key=lambda r: r.reservation_id) == \
+            sorted(reservation_repo.iter_all(), key=lambda r: r.reservation_id)
+
+def test_bulk_cli_import_and_export(tmp_path, capsys):
+    """
+    [CLI 테스트] 파일 -> SQL DB 적재와 DB -> 파일 내보내기가 동작하고, 거부된 행이 있으면 종료 코드 1인지 검증
+    """
+    # 1. 준비 (Arrange)
+    source = tmp_path / "fleet.csv"
+    source.write_text(CARAVANS_CSV, encoding="utf-8")
+    target = tmp_path / "fleet.jsonl"
+    db_url = f"sqlite:///{tmp_path / 'bulk.db'}"
+
+    # 2. 실행 (Act)
+    import_code = bulk_cli.main(["import", "caravans", str(source), "--db", db_url, "--chunk-size", "2"])
+    export_code = bulk_cli.main(["export", "caravans", str(target), "--db", db_url])
+
+    # 3. 검증 (Assert)
+    assert import_code == 1
+    assert "3건 적재, 2건 거부" in capsys.readouterr().err
+    assert export_code == 0
+    exported = [json.loads(line) for line in target.read_text(encoding="utf-8").splitlines()]
+    assert [row["caravan_id"] for row in exported] == ["c2", "c1", "c5"]
@@ -0,0 +1,105 @@
+# tests/test_cache.py
+import pytest
+
+# --- 테스트 대상 ---
+from src.services.cache import InMemoryLRUCache, RedisCacheBackend, ReadThroughCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeRedis:
+    """redis-py의 get/set(px)/delete/scan_iter만 흉내 낸 가짜 클라이언트 (만료는 검증하지 않음)"""
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, px=None):
+        self.data[key] = value.encode()
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def scan_iter(self, match):
+        return [key for key in self.data if key.startswith(match.rstrip("*"))]
+
+
+def test_lru_evicts_least_recently_used_and_expires_by_ttl():
+    """
+    [캐시 테스트] 용량을 넘으면 가장 오래 쓰지 않은 항목을 버리고, TTL이 지난 항목은 조회되지 않는지 검증
+    """
+    # 1. 준비 (Arrange)
+    clock = FakeClock()
+    cache = InMemoryLRUCache(max_entries=2, clock=clock)
+    cache.set("a", 1, ttl=10)
+    cache.set("b", 2, ttl=10)
+
+    # 2. 실행 (Act): a를 읽어 최근 사용으로 만든 뒤 c 추가 -> b가 밀려남
+    assert cache.get("a") == 1
+    cache.set("c", 3, ttl=10)
+    clock.now = 10
+
+    # 3. 검증 (Assert)
+    assert cache.evictions == 1
+    assert cache.get("b") is None
+    assert cache.get("a") is None and cache.get("c") is None  # 만료
+    assert len(cache) == 0
+
+
+def test_read_through_loads_once_and_counts_hits():
+    """
+    [캐시 테스트] 두 번째 조회부터는 loader를 부르지 않고, 없는 값(None)은 저장하지 않으며, invalidate 후 다시 읽는지 검증
+    """
+    # 1. 준비 (Arrange)
+    cache = ReadThroughCache(InMemoryLRUCache(max_entries=10), ttl=60)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return {"name": "바다뷰"}
+
+    # 2. 실행 (Act)
+    first = cache.get_or_load("caravan:1", loader)
+    second = cache.get_or_load("caravan:1", loader)
+    missing = [cache.get_or_load("caravan:404", lambda: None) for _ in range(2)]
+    cache.invalidate("caravan:1")
+    cache.get_or_load("caravan:1", loader)
+
+    # 3. 검증 (Assert)
+    assert first == second == {"name": "바다뷰"}
+    assert missing == [None, None]
+    assert len(calls) == 2
+    assert cache.stats() == {"hits": 1, "misses": 4, "evictions": 0, "size": 1}
+
+
+def test_redis_backend_round_trips_json_under_prefix():
+    """
+    [캐시 테스트] 공유 캐시 백엔드가 값을 JSON으로 저장/복원하고, clear()는 자기 prefix의 키만 지우는지 검증
+    """
+    # 1. 준비 (Arrange)
+    client = FakeRedis()
+    client.data["other:key"] = b"1"
+    backend = RedisCacheBackend(client, prefix="cs:")
+
+    # 2. 실행 (Act)
+    backend.set("caravan:1", {"fragments": {"summary": "<p>평점</p>"}}, ttl=30)
+    restored = backend.get("caravan:1")
+    backend.clear()
+
+    # 3. 검증 (Assert)
+    assert restored == {"fragments": {"summary": "<p>평점</p>"}}
+    assert backend.get("caravan:1") is None
+    assert list(client.data) == ["other:key"]
+
+
+def test_lru_rejects_non_positive_capacity():
+    with pytest.raises(ValueError):
+        InMemoryLRUCache(max_entries=0)
@@ -0,0 +1,40 @@
+# tests/test_caravan_bulk_cli.py
+import json
+
+# --- 테스트 대상 (main.py의 import-caravans / export-caravans 명령) ---
+from main import db, User, Caravan, UserRole, CaravanStatus
+
+CARAVANS_JSONL = [
+    {"host_id": 1, "name": "바다뷰", "location": "부산 해운대", "daily_rate": 90000, "capacity": 4, "description": "오션뷰"},
+    {"host_id": 1, "name": "숲속", "location": "강원 평창", "daily_rate": 70000, "capacity": 2, "description": "조용함", "status": "MAINTENANCE"},
+    {"host_id": 1, "name": "싼곳", "location": "서울", "daily_rate": 500, "capacity": 2, "description": "x"},      # 요금 1000 미만
+    {"host_id": 99, "name": "유령", "location": "서울", "daily_rate": 50000, "capacity": 2, "description": "x"},   # 없는 호스트
+    {"host_id": 1, "name": "산장", "location": "제주 애월", "daily_rate": 120000, "capacity": 6, "description": ""},  # 설명 없음
+]
+
+
+def test_import_and_export_caravans_commands(flask_app, tmp_path):
+    """
+    [대량 적재 CLI 테스트] 등록 폼과 같은 규칙으로 행을 거부하고, 나머지를 묶음 INSERT 한 뒤 그대로 내보내는지 검증
+    """
+    # 1. 준비 (Arrange)
+    db.session.add(User(email='host@test.com', name='Host', password_hash='x', user_role=UserRole.HOST))
+    db.session.commit()
+    source = tmp_path / 'fleet.jsonl'
+    source.write_text('\n'.join(json.dumps(row, ensure_ascii=False) for row in CARAVANS_JSONL), encoding='utf-8')
+    target = tmp_path / 'fleet.csv'
+    runner = flask_app.test_cli_runner()
+
+    # 2. 실행 (Act)
+    imported = runner.invoke(args=['import-caravans', str(source), '--chunk-size', '2'])
+    exported = runner.invoke(args=['export-caravans', str(target)])
+
+    # 3. 검증 (Assert)
+    assert '카라반 2건 등록, 3건 거부' in imported.output
+    assert '3행: daily_rate' in imported.output and '4행: host_id' in imported.output
+    assert [c.name for c in Caravan.query.order_by(Caravan.id)] == ['바다뷰', '숲속']
+    assert Caravan.query.filter_by(name='숲속').one().status == CaravanStatus.MAINTENANCE
+    assert '카라반 2건 내보내기 완료' in exported.output
+    lines = target.read_text(encoding='utf-8').splitlines()
+    assert lines[0] == 'id,host_id,name,location,daily_rate,capacity,description,status'
+    assert lines[2].endswith(',MAINTENANCE')
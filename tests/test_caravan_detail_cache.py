@@ -0,0 +1,92 @@
+# tests/test_caravan_detail_cache.py
+from datetime import date
+
+from flask import g
+from sqlalchemy import event
+
+# --- 테스트 대상 (main.py의 카라반 상세 캐시) ---
+from main import (db, User, Caravan, Reservation, UserRole, ReservationStatus, CaravanStatus,
+                  detail_cache)
+
+
+def login(client, user):
+    # 테스트의 앱 컨텍스트는 요청 사이에 공유되므로, Flask-Login이 g에 남긴 이전 요청의 사용자를 비웁니다.
+    g.pop('_login_user', None)
+    with client.session_transaction() as session:
+        session['_user_id'] = str(user.id)
+        session['_fresh'] = True
+
+
+def count_queries(fn):
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', record)
+    try:
+        result = fn()
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', record)
+    return result, len(statements)
+
+
+def make_listing():
+    host = User(email='host@test.com', name='호스트', password_hash='x', user_role=UserRole.HOST)
+    guest = User(email='guest@test.com', name='게스트', password_hash='x')
+    db.session.add_all([host, guest])
+    db.session.flush()
+    caravan = Caravan(host_id=host.id, name='바다뷰', location='부산', daily_rate=50000,
+                      capacity=4, description='오션뷰')
+    db.session.add(caravan)
+    db.session.commit()
+    return host, guest, caravan
+
+
+def test_detail_page_is_served_from_cache(flask_app):
+    """
+    [상세 캐시 테스트] 두 번째 상세 조회는 DB를 조회하지 않고 같은 내용을 돌려주는지 검증
+    """
+    # 1. 준비 (Arrange)
+    _, _, caravan = make_listing()
+    client = flask_app.test_client()
+
+    # 2. 실행 (Act)
+    first, first_queries = count_queries(lambda: client.get(f'/caravans/{caravan.id}'))
+    second, second_queries = count_queries(lambda: client.get(f'/caravans/{caravan.id}'))
+
+    # 3. 검증 (Assert)
+    assert first.status_code == second.status_code == 200
+    assert '오션뷰' in second.get_data(as_text=True) and '호스트' in second.get_data(as_text=True)
+    assert first_queries > 0 and second_queries == 0
+    assert detail_cache.stats()['hits'] == 1
+    assert client.get('/caravans/999').status_code == 404
+
+
+def test_review_and_reject_invalidate_cached_detail(flask_app):
+    """
+    [상세 캐시 테스트] 리뷰 작성(평점 갱신)과 예약 거절(상태 변경) 후에는 캐시가 지워져 새 내용이 보이는지 검증
+    """
+    # 1. 준비 (Arrange): 완료된 예약 1건, 대기 예약 1건, 상세 페이지를 캐시에 올려 둠
+    host, guest, caravan = make_listing()
+    done = Reservation(caravan_id=caravan.id, guest_id=guest.id, start_date=date(2030, 1, 1),
+                       end_date=date(2030, 1, 3), total_price=100000, status=ReservationStatus.COMPLETED)
+    pending = Reservation(caravan_id=caravan.id, guest_id=guest.id, start_date=date(2030, 2, 1),
+                          end_date=date(2030, 2, 3), total_price=100000)
+    caravan.status = CaravanStatus.BOOKED
+    db.session.add_all([done, pending])
+    db.session.commit()
+    client = flask_app.test_client()
+    assert '아직 등록된 리뷰가 없습니다' in client.get(f'/caravans/{caravan.id}').get_data(as_text=True)
+
+    # 2. 실행 (Act)
+    login(client, guest)
+    client.post(f'/reservations/{done.id}/review', data={'rating': 4, 'comment': '깨끗해요'})
+    after_review = client.get(f'/caravans/{caravan.id}').get_data(as_text=True)
+    login(client, host)
+    client.get(f'/reservations/reject/{pending.id}')
+    client.get(f'/caravans/{caravan.id}')
+
+    # 3. 검증 (Assert)
+    assert '깨끗해요' in after_review and '4.00 / 5.0' in after_review
+    assert detail_cache.get_or_load(f'caravan:{caravan.id}', lambda: None)['caravan']['status'] == 'available'
@@ -0,0 +1,98 @@
+# tests/test_caravan_fts.py
+import pytest
+
+# --- 테스트 대상 (main.py의 FTS5 위치 검색) ---
+from main import db, User, Caravan, UserRole, search_caravan_page, fts_match_expression, ensure_schema
+
+
+@pytest.fixture
+def host(flask_app):
+    host = User(email='host@test.com', name='Host', password_hash='x', user_role=UserRole.HOST)
+    db.session.add(host)
+    db.session.commit()
+    return host
+
+
+def add_caravan(host, name, location, description='설명'):
+    caravan = Caravan(host_id=host.id, name=name, location=location, daily_rate=50000,
+                      capacity=4, description=description)
+    db.session.add(caravan)
+    db.session.commit()
+    return caravan
+
+
+def names(location, page_size=50):
+    caravans, _ = search_caravan_page(location, None, None, None, page_size)
+    return [c.name for c in caravans]
+
+
+def test_match_expression_uses_prefix_terms():
+    """
+    [FTS 테스트] 검색어가 단어별 접두어 검색 식으로 변환되고 특수문자는 제거되는지 검증
+    """
+    assert fts_match_expression('서울 마포') == '"서울"* "마포"*'
+    assert fts_match_expression('"부산" OR') == '"부산"* "OR"*'
+    assert fts_match_expression(' !! ') is None
+
+
+def test_fts_index_follows_insert_update_delete(host):
+    """
+    [FTS 테스트] 카라반 추가/수정/삭제가 트리거로 FTS 인덱스에 반영되는지 검증
+    """
+    caravan = add_caravan(host, '바다뷰', '강릉 경포')
+    assert names('강릉') == ['바다뷰']
+    assert names('강') == ['바다뷰']  # 접두어 검색
+
+    caravan.location = '속초 영랑'
+    db.session.commit()
+    assert names('강릉') == []
+    assert names('속초') == ['바다뷰']
+
+    db.session.delete(caravan)
+    db.session.commit()
+    assert names('속초') == []
+
+
+def test_fts_ranks_location_match_first(host):
+    """
+    [FTS 테스트] 위치에 검색어가 있는 카라반이 설명에만 있는 카라반보다 먼저 나오는지 검증
+    """
+    add_caravan(host, '숲속', '가평', description='제주 여행 다녀온 캠핑카')
+    add_caravan(host, '해변', '제주 애월')
+    add_caravan(host, '도심', '서울')
+
+    assert names('제주') == ['해변', '숲속']
+
+
+def test_ranked_pages_follow_cursor_without_gaps(host):
+    """
+    [FTS 테스트] 관련도 정렬에서도 커서('순위:id')를 따라가면 중복/누락 없이 전체 결과를 받는지 검증
+    """
+    for i in range(7):
+        add_caravan(host, f'L{i}', '여수 돌산')
+    for i in range(5):
+        add_caravan(host, f'D{i}', '순천', description='여수 근처')
+
+    seen, cursor = [], None
+    while True:
+        caravans, cursor = search_caravan_page('여수', None, None, cursor, 3)
+        seen += [c.name for c in caravans]
+        if cursor is None:
+            break
+
+    assert seen == [f'L{i}' for i in range(7)] + [f'D{i}' for i in range(5)]
+    with pytest.raises(ValueError):
+        search_caravan_page('여수', None, None, 'not-a-cursor', 3)
+
+
+def test_ensure_schema_rebuilds_missing_fts_table(host):
+    """
+    [FTS 테스트] FTS 테이블이 없는 기존 DB에서 ensure_schema()가 테이블을 만들고 기존 데이터를 색인하는지 검증
+    """
+    add_caravan(host, '기존', '대구')
+    with db.engine.begin() as conn:
+        conn.exec_driver_sql('DROP TABLE caravan_fts')
+
+    ensure_schema()
+
+    assert names('대구') == ['기존']
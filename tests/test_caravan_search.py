@@ -0,0 +1,86 @@
+# tests/test_caravan_search.py
+import json
+import pytest
+from datetime import date
+
+# --- 테스트 대상 (main.py의 카라반 검색 라우트) ---
+from main import db, User, Caravan, Reservation, UserRole, ReservationStatus
+
+
+@pytest.fixture
+def client_with_caravans(flask_app):
+    """카라반 25대(서울 15대, 부산 10대)와 로그인된 게스트 클라이언트를 준비합니다."""
+    host = User(email='host@test.com', name='Host', password_hash='x', user_role=UserRole.HOST)
+    guest = User(email='guest@test.com', name='Guest', password_hash='x')
+    db.session.add_all([host, guest])
+    db.session.flush()
+    for i in range(25):
+        db.session.add(Caravan(host_id=host.id, name=f'C{i:02d}', location='서울 마포' if i < 15 else '부산',
+                               daily_rate=50000, capacity=4, description='설명'))
+    db.session.commit()
+
+    client = flask_app.test_client()
+    with client.session_transaction() as session:
+        session['_user_id'] = str(guest.id)
+        session['_fresh'] = True
+    return client, guest
+
+
+def test_api_pages_cover_all_results_once(client_with_caravans):
+    """
+    [검색 API 테스트] next_cursor를 따라가면 모든 결과를 중복/누락 없이 받는지 검증
+    """
+    client, _ = client_with_caravans
+    names, cursor, pages = [], None, 0
+    while True:
+        url = '/api/caravans/search?location=서울&per_page=4' + (f'&after={cursor}' if cursor else '')
+        body = client.get(url).get_json()
+        names += [c['name'] for c in body['items']]
+        cursor, pages = body['next_cursor'], pages + 1
+        if cursor is None:
+            break
+
+    assert names == [f'C{i:02d}' for i in range(15)]
+    assert pages == 4
+
+
+def test_api_stream_returns_one_page_per_line(client_with_caravans):
+    """
+    [검색 API 테스트] stream=1이면 전체 페이지를 NDJSON 한 줄씩 스트리밍하는지 검증
+    """
+    client, _ = client_with_caravans
+    response = client.get('/api/caravans/search?per_page=10&stream=1')
+
+    assert response.mimetype == 'application/x-ndjson'
+    pages = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [len(p['items']) for p in pages] == [10, 10, 5]
+    assert pages[-1]['next_cursor'] is None
+
+
+def test_api_excludes_caravans_booked_for_dates(client_with_caravans):
+    """
+    [검색 API 테스트] 날짜를 주면 확정 예약이 겹치는 카라반이 제외되는지 검증
+    """
+    client, guest = client_with_caravans
+    booked = Caravan.query.filter_by(name='C20').one()
+    db.session.add(Reservation(caravan_id=booked.id, guest_id=guest.id, start_date=date(2030, 3, 1),
+                               end_date=date(2030, 3, 4), total_price=1, status=ReservationStatus.CONFIRMED))
+    db.session.commit()
+
+    body = client.get('/api/caravans/search?location=부산&start_date=2030-03-03&end_date=2030-03-05').get_json()
+
+    assert 'C20' not in [c['name'] for c in body['items']]
+    assert len(body['items']) == 9
+    assert client.get('/api/caravans/search?start_date=2030-03-05&end_date=2030-03-01').status_code == 400
+
+
+def test_search_page_links_to_next_page(client_with_caravans):
+    """
+    [검색 화면 테스트] 결과가 페이지 크기보다 많으면 '다음 페이지' 링크가 표시되는지 검증
+    """
+    client, _ = client_with_caravans
+    first = client.get('/caravans/search?per_page=20').get_data(as_text=True)
+    assert '다음 페이지' in first and 'C19' in first and 'C20' not in first
+
+    last = client.get('/caravans/search?per_page=20&after=20').get_data(as_text=True)
+    assert '다음 페이지' not in last and 'C24' in last
@@ -1,5 +1,6 @@
 # tests/test_caravan_service.py
 import pytest
+from datetime import date
 from unittest.mock import Mock
 
 # --- 테스트 대상 ---
@@ -7,17 +8,19 @@ from src.services.caravan_service import CaravanService
 from src.exceptions.custom_exceptions import ValidationError
 
 # --- Mock 객체로 대체할 대상 ---
-from src.repositories.base import CaravanRepository
+from src.repositories.base import CaravanRepository, ReservationRepository
 
 # --- 테스트에 필요한 모델 ---
 from src.models.user import User
+from src.models.caravan import Caravan
 from src.models.common import UserRole
 
 @pytest.fixture
 def mock_caravan_deps():
     """CaravanService의 의존성 Mock 객체를 만듭니다."""
     return {
-        "caravan_repo": Mock(spec=CaravanRepository)
+        "caravan_repo": Mock(spec=CaravanRepository),
+        "reservation_repo": Mock(spec=ReservationRepository)
     }
 
 @pytest.fixture
@@ -53,4 +56,62 @@ def test_register_caravan_fail_if_not_host(mock_caravan_deps, guest_user):
     # [검증 2] 리포지토리 'add'는 호출되지 않아야 함
     caravan_repo.add.assert_not_called()
     
-    print("\n테스트 성공: CaravanService (권한 없음) 검증 완료")
\ No newline at end of file
+    print("\n테스트 성공: CaravanService (권한 없음) 검증 완료")
+
+
+def test_search_caravans_filters_by_dates_in_one_call(mock_caravan_deps, guest_user):
+    """
+    [CaravanService 테스트] 날짜를 주면 예약 가능 여부를 리포지토리에 한 번만 일괄 조회하는지 검증
+    """
+    # 1. 준비 (Arrange)
+    caravan_repo = mock_caravan_deps["caravan_repo"]
+    reservation_repo = mock_caravan_deps["reservation_repo"]
+    caravans = [Caravan(host_id="Host", name=f"C{i}", capacity=4) for i in range(3)]
+    caravan_repo.search_by_capacity.return_value = caravans
+    reservation_repo.find_available_caravan_ids.return_value = [caravans[0].caravan_id, caravans[2].caravan_id]
+
+    service = CaravanService(caravan_repo=caravan_repo, reservation_repo=reservation_repo)
+    start_date, end_date = date(2030, 5, 1), date(2030, 5, 3)
+
+    # 2. 실행 (Act)
+    result = service.search_caravans(guest_user, 2, start_date, end_date)
+
+    # 3. 검증 (Assert)
+    assert result == [caravans[0], caravans[2]]
+    reservation_repo.find_available_caravan_ids.assert_called_once_with(
+        [c.caravan_id for c in caravans], start_date, end_date
+    )
+    reservation_repo.is_caravan_available.assert_not_called()
+
+    print("\n테스트 성공: CaravanService (날짜 일괄 조회) 검증 완료")
+
+
+def test_search_caravans_page_rejects_oversized_page(mock_caravan_deps, guest_user):
+    """
+    [CaravanService 테스트] 페이지 크기가 허용 범위를 넘으면 리포지토리를 호출하지 않고 ValidationError가 발생하는지 검증
+    """
+    caravan_repo = mock_caravan_deps["caravan_repo"]
+    service = CaravanService(caravan_repo=caravan_repo)
+
+    with pytest.raises(ValidationError):
+        service.search_caravans_page(guest_user, 2, limit=10_000)
+
+    caravan_repo.search_by_capacity_page.assert_not_called()
+
+    service.search_caravans_page(guest_user, 2, limit=10, cursor="3:abc")
+    caravan_repo.search_by_capacity_page.assert_called_once_with(2, 10, "3:abc")
+
+
+@pytest.mark.parametrize("cursor", ["abc", "x:c1", "3:", "", ":c1"])
+def test_search_caravans_page_rejects_malformed_cursor(mock_caravan_deps, guest_user, cursor):
+    """
+    [CaravanService 테스트] 형식이 잘못된 커서는 리포지토리에 넘기지 않고 ValidationError가 발생하는지 검증
+    """
+    # 1. 준비 (Arrange)
+    caravan_repo = mock_caravan_deps["caravan_repo"]
+    service = CaravanService(caravan_repo=caravan_repo)
+
+    # 2. 실행 (Act) & 3. 검증 (Assert)
+    with pytest.raises(ValidationError):
+        service.search_caravans_page(guest_user, 2, limit=10, cursor=cursor)
+    caravan_repo.search_by_capacity_page.assert_not_called()
@@ -0,0 +1,119 @@
+# tests/test_columnar_store.py
+import random
+import pytest
+from datetime import date, timedelta
+
+# --- 테스트 대상 ---
+from src.repositories.columnar_store import ColumnarReservationStore, BOOKED_STATUSES
+from src.repositories.memory_repository import InMemoryReservationRepository
+from src.models.reservation import Reservation
+from src.models.common import ReservationStatus
+
+
+def make_reservation(caravan_id, start, end, price, status=ReservationStatus.CONFIRMED, guest_id="g1") -> Reservation:
+    return Reservation(guest_id=guest_id, caravan_id=caravan_id, start_date=start, end_date=end,
+                       total_price=price, status=status)
+
+
+@pytest.fixture
+def store():
+    repo = InMemoryReservationRepository()
+    for reservation in [
+        make_reservation("c1", date(2030, 1, 30), date(2030, 2, 2), 400),               # 4일, 1월 체크인
+        make_reservation("c1", date(2030, 2, 10), date(2030, 2, 11), 200, ReservationStatus.COMPLETED),
+        make_reservation("c1", date(2030, 2, 20), date(2030, 2, 25), 999, ReservationStatus.CANCELLED),
+        make_reservation("c2", date(2030, 2, 1), date(2030, 2, 3), 300, guest_id="g2"),
+        make_reservation("c2", date(2030, 2, 5), date(2030, 2, 6), 150, ReservationStatus.PENDING),
+        make_reservation("c3", date(2030, 3, 1), date(2030, 3, 1), 100),
+    ]:
+        repo.add(reservation)
+    return ColumnarReservationStore.from_repository(repo)
+
+
+def test_columnar_store_groups_revenue_by_caravan_host_and_month(store):
+    """
+    [열 저장소 테스트] 확정/완료 예약만 매출로 집계하고, 카라반/호스트/월 단위로 묶이는지 검증
+    """
+    # 1. 준비 (Arrange)
+    hosts = {"c1": "h1", "c2": "h1", "c3": "h2"}
+
+    # 2. 실행 (Act)
+    by_caravan = store.revenue_by_caravan()
+    by_host = store.revenue_by_host(hosts)
+    by_month = store.revenue_by_month()
+    by_host_month = store.revenue_by_month(hosts)
+
+    # 3. 검증 (Assert)
+    assert len(store) == 6
+    assert store.caravan_ids == ["c1", "c2", "c3"]
+    assert by_caravan == {"c1": 600, "c2": 300, "c3": 100}
+    assert by_host == {"h1": 900, "h2": 100}
+    assert by_month == {(2030, 1): 400, (2030, 2): 500, (2030, 3): 100}
+    assert by_host_month == {("h1", 2030, 1): 400, ("h1", 2030, 2): 500, ("h2", 2030, 3): 100}
+    assert store.nights_by_caravan() == {"c1": 6, "c2": 3, "c3": 1}
+    assert store.average_stay_nights() == pytest.approx(10 / 4)
+
+
+def test_columnar_store_occupancy_clips_stays_to_period(store):
+    """
+    [열 저장소 테스트] 가동률이 기간에 걸친 예약을 기간 안의 숙박일만 세고, 취소/대기 예약은 빼는지 검증
+    """
+    # 1. 준비 (Arrange)
+    february = (date(2030, 2, 1), date(2030, 2, 28))
+
+    # 2. 실행 (Act)
+    c1 = store.occupancy_rate(*february, caravan_ids=["c1"])
+    c1_c2 = store.occupancy_rate(*february, caravan_ids=["c1", "c2"])
+    with_idle = store.occupancy_rate(*february, caravan_ids=["c1", "c2", "unknown"])
+
+    # 3. 검증 (Assert)
+    assert c1 == pytest.approx(4 / 28)          # 2/1~2/2 + 2/10~2/11
+    assert c1_c2 == pytest.approx(7 / 56)       # + c2의 2/1~2/3
+    assert with_idle == pytest.approx(7 / 84)   # 예약 없는 카라반은 분모에만 포함
+    assert store.occupancy_rate(date(2030, 4, 1), date(2030, 3, 1)) == 0.0
+
+
+def test_columnar_store_accepts_rebooking_identical_to_cancelled_booking():
+    """
+    [열 저장소 테스트] 취소된 예약과 상태만 다른 같은 예약(재예약)이 있어도 스냅샷이 만들어지고 재예약만 집계되는지 검증
+    """
+    # 1. 준비 (Arrange)
+    cancelled = make_reservation("c1", date(2030, 5, 1), date(2030, 5, 3), 300, ReservationStatus.CANCELLED)
+    rebooked = make_reservation("c1", date(2030, 5, 1), date(2030, 5, 3), 300)
+
+    # 2. 실행 (Act)
+    store = ColumnarReservationStore([cancelled, rebooked])
+
+    # 3. 검증 (Assert)
+    assert len(store) == 2
+    assert store.revenue_by_caravan() == {"c1": 300}
+
+
+def test_columnar_store_matches_row_by_row_aggregation():
+    """
+    [열 저장소 테스트] 무작위 예약에서 열 저장소 집계가 예약 객체를 하나씩 도는 집계와 같은지 검증
+    """
+    # 1. 준비 (Arrange)
+    rng = random.Random(19)
+    reservations = []
+    for _ in range(2000):
+        start = date(2030, 1, 1) + timedelta(days=rng.randrange(365))
+        reservations.append(make_reservation(
+            f"c{rng.randrange(40)}", start, start + timedelta(days=rng.randrange(14)),
+            rng.randrange(10_000, 500_000), rng.choice(list(ReservationStatus)), f"g{rng.randrange(300)}"))
+    period = (date(2030, 6, 1), date(2030, 6, 30))
+
+    # 2. 실행 (Act)
+    store = ColumnarReservationStore(reservations)
+
+    # 3. 검증 (Assert)
+    expected_revenue, expected_nights = {}, 0
+    for r in reservations:
+        expected_revenue.setdefault(r.caravan_id, 0)
+        if r.status in BOOKED_STATUSES:
+            expected_revenue[r.caravan_id] += r.total_price
+            overlap = (min(r.end_date, period[1]) - max(r.start_date, period[0])).days + 1
+            expected_nights += max(0, overlap)
+    assert store.revenue_by_caravan() == expected_revenue
+    assert store.occupancy_rate(*period) == pytest.approx(expected_nights / (len(expected_revenue) * 30))
+    assert len(store.guest_ids) == len({r.guest_id for r in reservations})
@@ -0,0 +1,78 @@
+# tests/test_compact_models.py
+import dataclasses
+import pytest
+from datetime import date
+
+# --- 테스트 대상 ---
+from src.models.compact import CompactReservation, encode_id, decode_id
+from src.models.reservation import Reservation
+from src.models.caravan import Caravan
+from src.models.common import ReservationStatus
+from src.repositories.memory_repository import InMemoryReservationRepository
+from src.services.bulk_service import reservation_to_row
+from src.exceptions.custom_exceptions import ValidationError
+
+
+def make_reservation(**extra) -> Reservation:
+    return Reservation(guest_id="g1", caravan_id="c1", start_date=date(2030, 1, 1),
+                       end_date=date(2030, 1, 3), total_price=270000, **extra)
+
+
+@pytest.mark.parametrize("id_format, reservation_id", [
+    ("bytes", "0f8fad5b-d9cb-469f-a165-70867728950e"),
+    ("int", "1024"),
+])
+def test_compact_reservation_round_trip(id_format, reservation_id):
+    """
+    [압축 모델 테스트] 압축 예약이 원래 예약과 같은 속성을 제공하고, 다시 Reservation으로 되돌리면 같은 값인지 검증
+    """
+    # 1. 준비 (Arrange)
+    original = make_reservation(reservation_id=reservation_id, status=ReservationStatus.CONFIRMED)
+
+    # 2. 실행 (Act)
+    compact = CompactReservation.from_reservation(original, id_format)
+
+    # 3. 검증 (Assert)
+    assert compact.to_reservation() == original
+    assert (compact.reservation_id, compact.start_date, compact.end_date) == \
+        (reservation_id, date(2030, 1, 1), date(2030, 1, 3))
+    assert reservation_to_row(compact) == reservation_to_row(original)
+
+
+def test_compact_reservation_works_with_in_memory_repository():
+    """
+    [압축 모델 테스트] 압축 예약을 인메모리 리포지토리에 그대로 저장해도 조회/가용성 확인이 동작하는지 검증
+    """
+    # 1. 준비 (Arrange)
+    repo = InMemoryReservationRepository()
+    compact = CompactReservation.from_reservation(make_reservation())
+
+    # 2. 실행 (Act)
+    repo.add_all([compact])
+
+    # 3. 검증 (Assert)
+    assert repo.get_by_id(compact.reservation_id) is compact
+    assert not repo.is_caravan_available("c1", date(2030, 1, 3), date(2030, 1, 5))
+    assert repo.is_caravan_available("c1", date(2030, 1, 4), date(2030, 1, 5))
+
+
+def test_models_have_no_instance_dict():
+    """
+    [압축 모델 테스트] 도메인 모델이 __slots__를 사용하고, 압축 모델은 변경할 수 없는지(frozen) 검증
+    """
+    compact = CompactReservation.from_reservation(make_reservation())
+
+    assert not hasattr(make_reservation(), "__dict__")
+    assert not hasattr(Caravan(host_id="h", name="C", capacity=2), "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        compact.total_price = 0
+    confirmed = dataclasses.replace(compact, status=ReservationStatus.CONFIRMED)
+    assert (compact.status, confirmed.status) == (ReservationStatus.PENDING, ReservationStatus.CONFIRMED)
+
+
+def test_encode_id_rejects_unconvertible_values():
+    assert decode_id(encode_id("42", "int")) == "42"
+    with pytest.raises(ValidationError):
+        encode_id("not-a-uuid", "bytes")
+    with pytest.raises(ValidationError):
+        encode_id("42", "base64")
@@ -0,0 +1,136 @@
+# tests/test_concurrent_repository.py
+import threading
+import pytest
+from datetime import date, timedelta
+
+# --- 테스트 대상 ---
+from src.repositories.concurrent_repository import ThreadSafeReservationRepository, ThreadSafeCaravanRepository
+from src.repositories.memory_repository import InMemoryReservationRepository
+from src.exceptions.custom_exceptions import ReservationConflictError
+
+# --- 테스트에 필요한 모델 ---
+from src.models.reservation import Reservation
+from src.models.caravan import Caravan
+
+BASE = date(2030, 1, 1)
+
+def make_reservation(caravan_id: str, start_offset: int, days: int) -> Reservation:
+    start_date = BASE + timedelta(days=start_offset)
+    return Reservation(guest_id="Guest", caravan_id=caravan_id, start_date=start_date,
+                       end_date=start_date + timedelta(days=days - 1), total_price=100000 * days)
+
+def run_in_threads(count: int, target) -> list:
+    """count개의 스레드가 동시에 출발해 target(i)를 실행하고, 결과를 순서대로 반환합니다."""
+    barrier = threading.Barrier(count)
+    results = [None] * count
+
+    def worker(i):
+        barrier.wait()
+        results[i] = target(i)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+@pytest.mark.parametrize("repo_class", [InMemoryReservationRepository, ThreadSafeReservationRepository])
+def test_reserve_if_available(repo_class):
+    """
+    [ReservationRepository 테스트] 겹치면 저장하지 않고 False, 아니면 저장하고 True를 반환하는지 검증
+    """
+    # 1. 준비 (Arrange)
+    repo = repo_class()
+    first = make_reservation("c1", 0, 5)
+
+    # 2. 실행 및 검증 (Act & Assert)
+    assert repo.reserve_if_available(first)
+    overlapping = make_reservation("c1", 4, 3)
+    assert not repo.reserve_if_available(overlapping)
+    assert repo.get_by_id(overlapping.reservation_id) is None
+    assert repo.reserve_if_available(make_reservation("c1", 5, 3))  # 종료 다음 날부터
+    assert repo.reserve_if_available(make_reservation("c2", 0, 5))  # 다른 카라반
+    with pytest.raises(ReservationConflictError):
+        repo.add(make_reservation("c1", 2, 1))
+
+def test_concurrent_overlapping_reservations_only_one_wins():
+    """
+    [ThreadSafeReservationRepository 테스트] 같은 기간을 여러 스레드가 동시에 예약하면 정확히 1건만 성공하는지 검증
+    """
+    # 1. 준비 (Arrange)
+    repo = ThreadSafeReservationRepository()
+    reservations = [make_reservation("c1", i % 3, 4) for i in range(32)]
+
+    # 2. 실행 (Act)
+    results = run_in_threads(32, lambda i: repo.reserve_if_available(reservations[i]))
+
+    # 3. 검증 (Assert): 모두 0~6일 사이에서 겹치므로 1건만 저장
+    assert results.count(True) == 1
+    winner = reservations[results.index(True)]
+    assert repo.get_by_id(winner.reservation_id) is winner
+    assert len(repo._bookings_by_caravan["c1"]) == 1
+
+def test_concurrent_reservations_on_many_caravans_are_all_stored():
+    """
+    [ThreadSafeReservationRepository 테스트] 여러 스레드가 서로 다른 카라반/날짜에 예약하면 모두 저장되는지 검증
+    """
+    # 1. 준비 (Arrange): 스레드 i는 카라반 i % 4의 i번째 주를 예약
+    repo = ThreadSafeReservationRepository()
+
+    def book(i):
+        return all(repo.reserve_if_available(make_reservation(f"c{i % 4}", 7 * (i + 8 * week), 7))
+                   for week in range(50))
+
+    # 2. 실행 (Act)
+    results = run_in_threads(8, book)
+
+    # 3. 검증 (Assert)
+    assert all(results)
+    assert len(repo._reservations) == 400
+    assert sum(len(index) for index in repo._bookings_by_caravan.values()) == 400
+
+def test_bookings_on_different_caravans_do_not_contend():
+    """
+    [ThreadSafeReservationRepository 테스트] 한 카라반의 잠금이 잡혀 있어도 다른 카라반 예약은 진행되는지 검증
+    """
+    # 1. 준비 (Arrange): c1의 잠금을 테스트 스레드가 잡고 있음
+    repo = ThreadSafeReservationRepository()
+    done = threading.Event()
+
+    def book_other_caravan():
+        repo.reserve_if_available(make_reservation("c2", 0, 3))
+        done.set()
+
+    # 2. 실행 (Act)
+    with repo._lock_for("c1"):
+        thread = threading.Thread(target=book_other_caravan)
+        thread.start()
+        finished_while_locked = done.wait(timeout=5)
+    thread.join()
+
+    # 3. 검증 (Assert)
+    assert finished_while_locked
+    assert not repo.is_caravan_available("c2", BASE, BASE)
+
+def test_thread_safe_caravan_repository_concurrent_add_keeps_index_sorted():
+    """
+    [ThreadSafeCaravanRepository 테스트] 여러 스레드가 동시에 등록해도 정렬 인덱스가 깨지지 않는지 검증
+    """
+    # 1. 준비 (Arrange)
+    repo = ThreadSafeCaravanRepository()
+
+    def register(i):
+        for n in range(100):
+            repo.add(Caravan(host_id="Host", name=f"C{i}-{n}", capacity=(i * 100 + n) % 10 + 1,
+                             caravan_id=f"{i}-{n:03d}"))
+
+    # 2. 실행 (Act)
+    run_in_threads(8, register)
+
+    # 3. 검증 (Assert)
+    keys = repo._capacity_keys
+    assert len(keys) == len(repo._capacity_caravans) == 800
+    assert keys == sorted(keys)
+    assert all(c.capacity >= 5 for c in repo.search_by_range(min_capacity=5))
+    assert len(repo.search_by_capacity(1)) == 800
@@ -0,0 +1,63 @@
+# tests/test_logging_config.py
+import logging
+import threading
+import pytest
+
+# --- 테스트 대상 ---
+from src.logging_config import configure_logging
+
+# --- 로그를 남기는 서비스 ---
+from src.services.observers import NotificationService
+
+
+class RecordingHandler(logging.Handler):
+    """기록된 로그와 기록한 스레드를 저장하는 테스트용 핸들러"""
+    def __init__(self):
+        super().__init__()
+        self.records: list[tuple[str, str]] = []
+
+    def emit(self, record):
+        self.records.append((record.getMessage(), threading.current_thread().name))
+
+
+@pytest.fixture
+def restore_src_logger():
+    """테스트 후 'src' 로거 설정을 원래대로 되돌립니다."""
+    logger = logging.getLogger("src")
+    handlers, level = list(logger.handlers), logger.level
+    yield
+    logger.handlers[:] = handlers
+    logger.setLevel(level)
+
+
+def test_queue_handler_writes_off_the_calling_thread(restore_src_logger):
+    """
+    [로깅 테스트] use_queue=True면 서비스 로그가 호출 스레드가 아닌 리스너 스레드에서 기록되는지 검증
+    """
+    # 1. 준비 (Arrange)
+    handler = RecordingHandler()
+    listener = configure_logging(logging.INFO, use_queue=True, handler=handler)
+
+    # 2. 실행 (Act)
+    NotificationService().send_notification("guest-1", "예약 완료")
+    listener.stop()  # 큐에 남은 로그를 모두 처리
+
+    # 3. 검증 (Assert)
+    assert handler.records == [("알림 (옵저버): [To: guest-1] 예약 완료", handler.records[0][1])]
+    assert handler.records[0][1] != threading.current_thread().name
+
+
+def test_level_filters_debug_logs(restore_src_logger):
+    """
+    [로깅 테스트] INFO 레벨에서는 DEBUG 로그(예: 가격 계산)가 기록되지 않는지 검증
+    """
+    from src.services.strategies import PriceCalculator, NoDiscountStrategy
+    from datetime import date
+
+    handler = RecordingHandler()
+    configure_logging(logging.INFO, handler=handler)
+
+    PriceCalculator(NoDiscountStrategy()).calculate_total_price(100000, date(2030, 1, 1), date(2030, 1, 2))
+    NotificationService().send_notification("host-1", "새 예약")
+
+    assert [message for message, _ in handler.records] == ["알림 (옵저버): [To: host-1] 새 예약"]
@@ -0,0 +1,193 @@
+# tests/test_memory_repository.py
+import pytest
+from datetime import date, timedelta
+
+# --- 테스트 대상 ---
+from src.repositories.memory_repository import InMemoryReservationRepository, InMemoryCaravanRepository
+from src.repositories.interval_index import IntervalIndex
+from src.exceptions.custom_exceptions import ReservationConflictError
+
+# --- 테스트에 필요한 모델 ---
+from src.models.reservation import Reservation
+from src.models.caravan import Caravan
+from src.models.common import CaravanStatus
+
+BASE = date(2030, 1, 1)
+
+def make_reservation(caravan_id: str, start_offset: int, days: int) -> Reservation:
+    """BASE 기준 start_offset일부터 days일 동안의 예약을 만듭니다."""
+    start_date = BASE + timedelta(days=start_offset)
+    return Reservation(
+        guest_id="Guest",
+        caravan_id=caravan_id,
+        start_date=start_date,
+        end_date=start_date + timedelta(days=days - 1),
+        total_price=100000 * days
+    )
+
+def test_is_caravan_available_detects_overlap():
+    """
+    [ReservationRepository 테스트] 구간 인덱스가 양 끝을 포함한 겹침을 정확히 판단하는지 검증
+    """
+    # 1. 준비 (Arrange): 1/11 ~ 1/20 예약
+    repo = InMemoryReservationRepository()
+    repo.add(make_reservation("c1", 10, 10))
+
+    # 2. 실행 및 검증 (Act & Assert)
+    assert repo.is_caravan_available("c1", BASE, BASE + timedelta(days=9))          # 직전까지
+    assert not repo.is_caravan_available("c1", BASE, BASE + timedelta(days=10))     # 시작일 겹침
+    assert not repo.is_caravan_available("c1", BASE + timedelta(days=19), BASE + timedelta(days=25))  # 종료일 겹침
+    assert not repo.is_caravan_available("c1", BASE + timedelta(days=12), BASE + timedelta(days=13))  # 내부 포함
+    assert not repo.is_caravan_available("c1", BASE, BASE + timedelta(days=40))     # 전체 포함
+    assert repo.is_caravan_available("c1", BASE + timedelta(days=20), BASE + timedelta(days=30))      # 직후부터
+    assert repo.is_caravan_available("c2", BASE, BASE + timedelta(days=40))         # 다른 카라반
+
+def test_long_stay_is_single_interval():
+    """
+    [ReservationRepository 테스트] 90일 장기 예약도 구간 1개로 저장되는지 검증
+    """
+    repo = InMemoryReservationRepository()
+    repo.add(make_reservation("c1", 0, 90))
+
+    assert len(repo._bookings_by_caravan["c1"]) == 1
+    assert not repo.is_caravan_available("c1", BASE + timedelta(days=89), BASE + timedelta(days=89))
+    assert repo.is_caravan_available("c1", BASE + timedelta(days=90), BASE + timedelta(days=90))
+
+def test_add_rejects_overlapping_reservation():
+    """
+    [ReservationRepository 테스트] 겹치는 예약을 추가하면 ReservationConflictError가 발생하고 저장되지 않는지 검증
+    """
+    repo = InMemoryReservationRepository()
+    repo.add(make_reservation("c1", 10, 5))
+    overlapping = make_reservation("c1", 12, 5)
+
+    with pytest.raises(ReservationConflictError):
+        repo.add(overlapping)
+
+    assert repo.get_by_id(overlapping.reservation_id) is None
+
+def test_interval_index_keeps_order_and_removes():
+    """
+    [IntervalIndex 테스트] 순서 없이 추가해도 겹침 검사가 맞고, 삭제 후 다시 예약 가능한지 검증
+    """
+    index = IntervalIndex()
+    for offset in (50, 10, 30):
+        index.add(BASE + timedelta(days=offset), BASE + timedelta(days=offset + 4), f"r{offset}")
+
+    assert index.overlaps(BASE + timedelta(days=32), BASE + timedelta(days=33))
+    assert not index.overlaps(BASE + timedelta(days=15), BASE + timedelta(days=29))
+
+    assert index.remove(BASE + timedelta(days=30), "r30")
+    assert not index.remove(BASE + timedelta(days=30), "r30")
+    assert not index.overlaps(BASE + timedelta(days=32), BASE + timedelta(days=33))
+
+def test_find_available_caravan_ids_in_one_pass():
+    """
+    [ReservationRepository 테스트] 여러 카라반 중 해당 기간에 비어 있는 카라반 ID만 입력 순서대로 반환하는지 검증
+    """
+    repo = InMemoryReservationRepository()
+    repo.add(make_reservation("c1", 10, 5))
+    repo.add(make_reservation("c2", 30, 5))
+
+    result = repo.find_available_caravan_ids(
+        ["c3", "c2", "c1"], BASE + timedelta(days=12), BASE + timedelta(days=14)
+    )
+
+    assert result == ["c3", "c2"]
+
+def test_search_by_capacity_page_walks_all_pages():
+    """
+    [CaravanRepository 테스트] 커서를 따라가면 조건에 맞는 카라반을 중복/누락 없이 모두 받는지 검증
+    """
+    repo = InMemoryCaravanRepository()
+    caravans = [Caravan(host_id="Host", name=f"C{i}", capacity=i % 6 + 1) for i in range(50)]
+    for caravan in caravans:
+        repo.add(caravan)
+
+    seen, cursor = [], None
+    while True:
+        page = repo.search_by_capacity_page(4, limit=7, cursor=cursor)
+        assert len(page.items) <= 7
+        seen += page.items
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    expected = sorted((c for c in caravans if c.capacity >= 4), key=lambda c: (c.capacity, c.caravan_id))
+    assert seen == expected
+
+def test_search_by_range_combines_capacity_rate_and_status():
+    """
+    [CaravanRepository 테스트] 수용 인원 범위 + 요금 범위 + 상태 조건이 함께 적용되는지 검증
+    """
+    repo = InMemoryCaravanRepository()
+    caravans = [
+        Caravan(host_id="Host", name=f"C{i}", capacity=i % 8 + 1, daily_rate=50000 + 10000 * (i % 5),
+                status=CaravanStatus.MAINTENANCE if i % 7 == 0 else CaravanStatus.AVAILABLE)
+        for i in range(200)
+    ]
+    repo.add_all(caravans[:150])
+    for caravan in caravans[150:]:
+        repo.add(caravan)
+
+    result = repo.search_by_range(3, 5, min_daily_rate=60000, max_daily_rate=80000, available_only=True)
+
+    expected = [c for c in caravans
+                if 3 <= c.capacity <= 5 and 60000 <= c.daily_rate <= 80000 and c.status == CaravanStatus.AVAILABLE]
+    assert sorted(result, key=lambda c: c.caravan_id) == sorted(expected, key=lambda c: c.caravan_id)
+    assert [c.capacity for c in repo.search_by_capacity(7)] == sorted(c.capacity for c in caravans if c.capacity >= 7)
+
+def test_re_adding_caravan_moves_it_in_capacity_index():
+    """
+    [CaravanRepository 테스트] 수용 인원을 바꿔 다시 저장하면 인덱스에서도 위치가 바뀌는지 검증
+    """
+    repo = InMemoryCaravanRepository()
+    caravan = Caravan(host_id="Host", name="C", capacity=2)
+    repo.add(caravan)
+
+    caravan.capacity = 6
+    repo.add(caravan)
+
+    assert repo.search_by_capacity(5) == [caravan]
+    assert repo.search_by_range(1, 3) == []
+
+def test_add_all_with_overlap_stores_nothing():
+    """
+    [ReservationRepository 테스트] 대량 저장 중 겹침이 있으면 아무것도 저장하지 않고, 이후 저장/재구성이 정상 동작하는지 검증
+    """
+    # 1. 준비 (Arrange)
+    repo = InMemoryReservationRepository()
+    existing = make_reservation("c1", 0, 2)
+    repo.add(existing)
+    a, b = make_reservation("c1", 10, 5), make_reservation("c1", 12, 5)
+
+    # 2. 실행 (Act)
+    with pytest.raises(ReservationConflictError):
+        repo.add_all([a, b])
+
+    # 3. 검증 (Assert): 기존 상태 그대로이며 저장소가 망가지지 않음
+    assert repo.get_by_id(a.reservation_id) is None and repo.get_by_id(b.reservation_id) is None
+    assert repo.is_caravan_available("c1", BASE + timedelta(days=10), BASE + timedelta(days=20))
+    assert not repo.is_caravan_available("c1", BASE, BASE)
+    repo.rebuild_index()
+    repo.add_all([a])
+    assert not repo.is_caravan_available("c1", BASE + timedelta(days=12), BASE + timedelta(days=12))
+
+def test_add_all_deferred_index_is_applied_on_rebuild():
+    """
+    [ReservationRepository 테스트] rebuild_index=False로 쌓은 예약은 rebuild_index() 호출 시 한 번에 반영되는지 검증
+    """
+    # 1. 준비 (Arrange)
+    repo = InMemoryReservationRepository()
+    chunks = [[make_reservation(f"c{i % 3}", 10 * i, 5)] for i in range(6)]
+
+    # 2. 실행 (Act)
+    for chunk in chunks:
+        repo.add_all(chunk, rebuild_index=False)
+    before = repo.get_by_id(chunks[0][0].reservation_id)
+    repo.rebuild_index()
+
+    # 3. 검증 (Assert)
+    assert before is None
+    assert len(list(repo.iter_all())) == 6
+    assert [len(repo._bookings_by_caravan[f"c{i}"]) for i in range(3)] == [2, 2, 2]
@@ -0,0 +1,33 @@
+# tests/test_month_bitmap.py
+from datetime import date
+
+# --- 테스트 대상 ---
+from src.repositories.month_bitmap import night_masks, is_free, booked_days, free_nights
+
+
+def test_night_masks_split_stay_by_month():
+    """
+    [달력 비트맵 테스트] 월을 넘는 숙박이 달마다 나뉘고, 체크아웃 날짜의 밤은 포함되지 않는지 검증
+    """
+    # 1. 준비 (Arrange) & 2. 실행 (Act): 1/30 ~ 2/2 (1/30, 1/31, 2/1 세 밤)
+    masks = dict(night_masks(date(2030, 1, 30), date(2030, 2, 2)))
+
+    # 3. 검증 (Assert)
+    assert booked_days(masks[date(2030, 1, 1)]) == [30, 31]
+    assert booked_days(masks[date(2030, 2, 1)]) == [1]
+    assert free_nights(date(2030, 2, 1), masks[date(2030, 2, 1)]) == 27
+    assert list(night_masks(date(2030, 1, 5), date(2030, 1, 5))) == []
+
+
+def test_is_free_checks_every_month_in_range():
+    """
+    [달력 비트맵 테스트] 기간 확인이 겹치는 밤만 충돌로 보고, 체크아웃 날짜부터 시작하는 숙박은 허용하는지 검증
+    """
+    # 1. 준비 (Arrange): 2/1 ~ 2/3 (1일, 2일 밤) 예약
+    masks = dict(night_masks(date(2030, 2, 1), date(2030, 2, 3)))
+
+    # 2. 실행 (Act) & 3. 검증 (Assert)
+    assert not is_free(masks, date(2030, 1, 28), date(2030, 2, 2))
+    assert is_free(masks, date(2030, 2, 3), date(2030, 2, 10))
+    assert is_free(masks, date(2030, 1, 20), date(2030, 2, 1))
+    assert is_free({}, date(2030, 1, 1), date(2031, 1, 1))
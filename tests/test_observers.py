@@ -0,0 +1,119 @@
+# tests/test_observers.py
+import threading
+import pytest
+from datetime import date, timedelta
+
+# --- 테스트 대상 ---
+from src.services.observers import AsyncNotificationService, InMemoryNotificationTransport
+
+# --- 예약 경로 통합 검증에 필요한 객체 ---
+from src.models.user import User
+from src.models.caravan import Caravan
+from src.models.common import UserRole
+from src.repositories.memory_repository import InMemoryReservationRepository
+from src.services.reservation_service import ReservationService
+from src.services.validators import ReservationValidator
+from src.services.factories import ReservationFactory
+from src.services.strategies import PriceCalculator, NoDiscountStrategy
+
+
+class GatedTransport(InMemoryNotificationTransport):
+    """release가 설정될 때까지 전송을 붙잡아 두는 가짜 전송 수단 (시간 측정 없이 '기다리지 않음'을 검증)"""
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def send_batch(self, notifications):
+        self.release.wait(timeout=5)
+        super().send_batch(notifications)
+
+
+def test_booking_does_not_wait_for_slow_transport():
+    """
+    [알림 테스트] 전송이 끝나지 않아도 예약 생성은 기다리지 않고, shutdown 시 알림 2건이 모두 전송되는지 검증
+    """
+    # 1. 준비 (Arrange): 전송이 release 전까지 멈춰 있는 전송 수단
+    transport = GatedTransport()
+    notifier = AsyncNotificationService(transport, workers=1)
+    repo = InMemoryReservationRepository()
+    service = ReservationService(ReservationValidator(repo), repo, ReservationFactory(),
+                                 PriceCalculator(NoDiscountStrategy()), notifier)
+    guest = User(username="Guest", role=UserRole.GUEST)
+    caravan = Caravan(host_id="Host", name="C", capacity=4)
+    start_date = date.today() + timedelta(days=5)
+
+    # 2. 실행 (Act)
+    reservation = service.create_reservation(guest, caravan, start_date, start_date + timedelta(days=2))
+    sent_on_return = list(transport.sent)
+    transport.release.set()
+    notifier.shutdown()
+
+    # 3. 검증 (Assert): 예약은 전송이 하나도 끝나기 전에 반환됨
+    assert reservation is not None
+    assert sent_on_return == []
+    assert [n.user_id for n in transport.sent] == [guest.user_id, "Host"]
+
+
+def test_notifications_are_sent_in_batches():
+    """
+    [알림 테스트] 쌓인 알림이 batch_size 이하의 묶음으로 전송되는지 검증
+    """
+    transport = InMemoryNotificationTransport(delay=0.01)
+    notifier = AsyncNotificationService(transport, workers=1, batch_size=25)
+
+    for i in range(100):
+        notifier.send_notification(f"user-{i}", "알림")
+    notifier.shutdown()
+
+    assert sum(transport.batches) == 100 == notifier.sent
+    assert max(transport.batches) <= 25
+    assert len(transport.batches) < 100
+    assert [n.user_id for n in transport.sent] == [f"user-{i}" for i in range(100)]
+
+
+def test_failed_batch_is_retried_with_backoff():
+    """
+    [알림 테스트] 전송이 일시적으로 실패하면 재시도 후 성공하는지 검증
+    """
+    transport = InMemoryNotificationTransport(fail_times=2)
+    notifier = AsyncNotificationService(transport, workers=1, backoff_base=0.001)
+
+    notifier.send_notification("user-1", "알림")
+    notifier.shutdown()
+
+    assert (notifier.sent, notifier.retried, notifier.failed) == (1, 2, 0)
+    assert transport.attempts == 3
+
+
+def test_batch_is_dropped_after_max_retries():
+    """
+    [알림 테스트] 재시도 횟수를 모두 쓰면 실패로 집계하고 워커는 계속 동작하는지 검증
+    """
+    transport = InMemoryNotificationTransport(fail_times=3)
+    notifier = AsyncNotificationService(transport, workers=1, max_retries=2, backoff_base=0.001)
+
+    notifier.send_notification("user-1", "실패할 알림")
+    notifier.shutdown()
+
+    assert (notifier.sent, notifier.failed) == (0, 1)
+    with pytest.raises(RuntimeError):
+        notifier.send_notification("user-2", "종료 후 알림")
+
+
+def test_full_queue_drops_instead_of_blocking():
+    """
+    [알림 테스트] 큐가 가득 차면 호출자를 막지 않고 알림을 버리는지 검증
+    """
+    transport = GatedTransport()
+    notifier = AsyncNotificationService(transport, workers=1, max_queue_size=2, batch_size=1)
+
+    # 워커가 첫 알림 전송에서 멈춰 있는 동안 10건을 보냄 (큐 2칸 + 워커 1건 외에는 버려짐)
+    for i in range(10):
+        notifier.send_notification(f"user-{i}", "알림")
+    attempts_on_return = transport.attempts
+    transport.release.set()
+    notifier.shutdown()
+
+    assert attempts_on_return == 0
+    assert notifier.dropped >= 7
+    assert notifier.sent + notifier.dropped == 10
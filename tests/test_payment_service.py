@@ -1,4 +1,7 @@
 # tests/test_payment_service.py
+import threading
+from datetime import date
+
 import pytest
 from unittest.mock import Mock, MagicMock
 
@@ -8,9 +11,14 @@ from src.services.payment_service import PaymentService
 # --- Mock 객체로 대체할 대상 ---
 from src.repositories.base import PaymentRepository, ReservationRepository
 from src.services.observers import NotificationService
+from src.repositories.memory_repository import InMemoryReservationRepository
+from src.repositories.concurrent_repository import ThreadSafePaymentRepository
+from src.exceptions.custom_exceptions import ValidationError
 
 # --- 테스트에 필요한 모델 ---
 from src.models.payment import PaymentStatus
+from src.models.reservation import Reservation
+from src.models.common import ReservationStatus
 
 @pytest.fixture
 def mock_payment_deps():
@@ -39,14 +47,18 @@ def test_process_payment_success(mock_payment_deps):
     
     test_reservation_id = "res-123"
     test_amount = 150000
+    reservation_repo.get_by_id.return_value = Reservation(
+        guest_id="g1", caravan_id="c1", start_date=date(2030, 1, 1), end_date=date(2030, 1, 2),
+        total_price=test_amount, reservation_id=test_reservation_id)
+    payment_repo.add_if_absent.side_effect = lambda payment: payment
 
     # 2. 실행 (Act)
     result_payment = service.process_payment(test_reservation_id, test_amount)
 
     # 3. 검증 (Assert)
     
-    # [검증 1] 리포지토리에 'add'가 1번 호출되었는지?
-    payment_repo.add.assert_called_once()
+    # [검증 1] 리포지토리에 'add_if_absent'가 1번 호출되었는지? (중복 결제 확인과 저장을 한 번에)
+    payment_repo.add_if_absent.assert_called_once()
     
     # [검증 2] 반환된 Payment 객체의 상태가 'COMPLETED'인지?
     assert result_payment.status == PaymentStatus.COMPLETED
@@ -54,4 +66,87 @@ def test_process_payment_success(mock_payment_deps):
     # [검증 3] 반환된 Payment 객체의 금액이 일치하는지?
     assert result_payment.amount == test_amount
 
-    print("\n테스트 성공: PaymentService (결제 성공) 로직 검증 완료")
\ No newline at end of file
+    print("\n테스트 성공: PaymentService (결제 성공) 로직 검증 완료")
+
+@pytest.fixture
+def payment_env():
+    """실제(스레드 안전) 리포지토리와 결제 대기 예약 1건을 준비합니다."""
+    reservation_repo = InMemoryReservationRepository()
+    reservation = Reservation(guest_id="g1", caravan_id="c1", start_date=date(2030, 1, 1),
+                              end_date=date(2030, 1, 2), total_price=150000, reservation_id="res-1")
+    reservation_repo.add(reservation)
+    payment_repo = ThreadSafePaymentRepository()
+    service = PaymentService(payment_repo=payment_repo, reservation_repo=reservation_repo,
+                             notification_service=Mock(spec=NotificationService))
+    return service, payment_repo, reservation
+
+def test_same_idempotency_key_returns_first_payment(payment_env):
+    """
+    [PaymentService 테스트] 같은 멱등 키로 재요청하면 새 결제 없이 처음 결제를 반환하고,
+    같은 키로 다른 금액을 요청하면 거부하는지 검증
+    """
+    # 1. 준비 (Arrange)
+    service, payment_repo, reservation = payment_env
+
+    # 2. 실행 (Act)
+    first = service.process_payment("res-1", 150000, idempotency_key="checkout-1")
+    retried = service.process_payment("res-1", 150000, idempotency_key="checkout-1")
+
+    # 3. 검증 (Assert)
+    assert retried.payment_id == first.payment_id
+    assert payment_repo.find_by_reservation_id("res-1") == [first]
+    with pytest.raises(ValidationError):
+        service.process_payment("res-1", 99000, idempotency_key="checkout-1")
+
+@pytest.mark.parametrize("reservation_id, amount, setup, message", [
+    ("missing", 150000, None, "존재하지 않는 예약"),
+    ("res-1", 99000, None, "예약 금액"),
+    ("res-1", 150000, "cancel", "취소된 예약"),
+    ("res-1", 150000, "paid", "이미 결제"),
+])
+def test_process_payment_rejects_invalid_requests(payment_env, reservation_id, amount, setup, message):
+    """
+    [PaymentService 테스트] 없는/취소된 예약, 금액 불일치, 이미 결제된 예약(다른 키)의 결제를 거부하는지 검증
+    """
+    # 1. 준비 (Arrange)
+    service, payment_repo, reservation = payment_env
+    if setup == "cancel":
+        reservation.status = ReservationStatus.CANCELLED
+    elif setup == "paid":
+        service.process_payment("res-1", 150000, idempotency_key="first")
+
+    # 2. 실행 (Act) & 3. 검증 (Assert)
+    with pytest.raises(ValidationError, match=message):
+        service.process_payment(reservation_id, amount, idempotency_key="second")
+    assert len(payment_repo.find_by_reservation_id("res-1")) == (1 if setup == "paid" else 0)
+
+@pytest.mark.parametrize("same_key", [True, False])
+def test_concurrent_checkout_retries_create_one_payment(payment_env, same_key):
+    """
+    [PaymentService 테스트] 8개 스레드가 동시에 같은 예약을 결제해도 결제는 1건만 저장되는지 검증
+    (같은 키면 모두 같은 결제를 받고, 다른 키면 1건만 성공하고 나머지는 ValidationError)
+    """
+    # 1. 준비 (Arrange)
+    service, payment_repo, _ = payment_env
+    barrier = threading.Barrier(8, timeout=5)
+    results, errors = [], []
+
+    def checkout(i: int):
+        barrier.wait()
+        try:
+            results.append(service.process_payment("res-1", 150000,
+                                                   idempotency_key="retry" if same_key else f"key-{i}"))
+        except ValidationError as e:
+            errors.append(e)
+
+    # 2. 실행 (Act)
+    threads = [threading.Thread(target=checkout, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 3. 검증 (Assert)
+    assert len(payment_repo.find_by_reservation_id("res-1")) == 1
+    assert len({payment.payment_id for payment in results}) == 1
+    assert (len(results), len(errors)) == ((8, 0) if same_key else (1, 7))
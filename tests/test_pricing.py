@@ -0,0 +1,79 @@
+# tests/test_pricing.py
+import pytest
+from datetime import date, timedelta
+
+# --- 테스트 대상 ---
+from src.services.pricing import PricingEngine, PricingRules
+from src.services.strategies import DiscountStrategy, LongStayDiscountStrategy, PriceCalculator
+from src.exceptions.custom_exceptions import ValidationError
+
+
+class FixedDiscountStrategy(DiscountStrategy):
+    """테스트용: 항상 10000원 할인"""
+    def calculate_discount(self, original_price: int, rental_days: int) -> int:
+        return 10000
+
+
+def test_default_engine_matches_legacy_calculator():
+    """
+    [가격 엔진 테스트] 기본 규칙(배율 1.0 + 장기 숙박 할인)이 기존 PriceCalculator 결과와 같은지 검증 (종료일 포함 기간)
+    """
+    # 1. 준비 (Arrange)
+    engine = PricingEngine(horizon_start=date(2030, 1, 1))
+    legacy = PriceCalculator(LongStayDiscountStrategy())
+
+    # 2. 실행 (Act) & 3. 검증 (Assert): 1~14일 숙박
+    for days in range(1, 15):
+        end = date(2030, 3, 1) + timedelta(days=days - 1)
+        assert engine.calculate_total_price(90000, date(2030, 3, 1), end) == \
+            legacy.calculate_total_price(90000, date(2030, 3, 1), end)
+
+
+def test_multipliers_and_stacked_discounts():
+    """
+    [가격 엔진 테스트] 요일/월 배율이 밤마다 적용되고, 할인 규칙이 앞 할인 적용 금액 기준으로 차례로 적용되는지 검증
+    """
+    # 1. 준비 (Arrange): 토요일 1.5배, 7월 1.2배 / 고정 10000원 할인 후 장기 숙박 10% 할인
+    rules = PricingRules(weekday_multipliers=(1.0, 1.0, 1.0, 1.0, 1.0, 1.5, 1.0), month_multipliers={7: 1.2},
+                         discounts=(FixedDiscountStrategy(), LongStayDiscountStrategy()))
+    engine = PricingEngine(rules, horizon_start=date(2030, 1, 1))
+
+    # 2. 실행 (Act): 2030-06-28(금) ~ 07-05(금) 7박 = 6/28, 6/29(토) + 7월 5박(7/1~7/4 평일, 7/5 체크아웃)
+    quote = engine.quote(100000, date(2030, 6, 28), date(2030, 7, 5))
+
+    # 3. 검증 (Assert): 6/28 100000 + 6/29 150000 + 6/30 100000 + 7/1~7/4 120000 x 4
+    assert quote.nights == 7
+    assert quote.base_price == 830000
+    assert quote.total_price == int((830000 - 10000) * 0.9)
+    assert quote.discount == 830000 - quote.total_price
+
+
+def test_quote_many_matches_single_quotes_inside_and_outside_horizon():
+    """
+    [가격 엔진 테스트] 일괄 계산 결과가 건별 계산과 같고, 미리 계산한 범위 밖 날짜도 같은 규칙으로 계산되는지 검증
+    """
+    # 1. 준비 (Arrange): 2030년 한 해만 미리 계산
+    rules = PricingRules(weekday_multipliers=(0.9, 0.9, 0.9, 0.9, 1.1, 1.3, 1.2), month_multipliers={8: 1.25})
+    engine = PricingEngine(rules, horizon_start=date(2030, 1, 1), horizon_days=365)
+    requests = [(85000, date(2030, 7, 28), date(2030, 8, 9)),
+                (85000, date(2029, 12, 25), date(2030, 1, 3)),   # 앞쪽 범위 밖
+                (120000, date(2030, 12, 30), date(2031, 1, 2)),  # 뒤쪽 범위 밖
+                (50000, date(2031, 8, 4), date(2031, 8, 5))]  # 월요일 0.9 x 8월 1.25
+
+    # 2. 실행 (Act)
+    batch = engine.quote_many(requests)
+
+    # 3. 검증 (Assert)
+    assert batch == [engine.quote(*request) for request in requests]
+    assert batch == [PricingEngine(rules, horizon_start=date(2029, 1, 1)).quote(*request) for request in requests]
+    assert batch[3].base_price == 56250
+
+
+def test_invalid_range_is_rejected():
+    engine = PricingEngine(horizon_start=date(2030, 1, 1))
+    with pytest.raises(ValidationError):
+        engine.quote(50000, date(2030, 1, 5), date(2030, 1, 5))
+    with pytest.raises(ValidationError):
+        engine.quote_many([(50000, date(2030, 1, 5), date(2030, 1, 4))])
+    with pytest.raises(ValidationError):
+        PricingEngine(PricingRules(weekday_multipliers=(1.0,)))
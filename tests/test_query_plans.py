@@ -0,0 +1,94 @@
+# tests/test_query_plans.py
+import re
+from datetime import date
+
+# --- 테스트 대상 (main.py의 SQLAlchemy 모델) ---
+from main import (db, Caravan, Reservation, Review, ReservationStatus,
+                  filter_available_caravans, caravan_fts)
+
+START, END = date(2030, 1, 1), date(2030, 1, 5)
+
+
+def query_plan(statement) -> list[str]:
+    """SQLite EXPLAIN QUERY PLAN 결과의 detail 열만 반환합니다. (플랜은 바인딩 값과 무관하므로 NULL로 채움)"""
+    compiled = statement.compile(dialect=db.engine.dialect,
+                                 compile_kwargs={"render_postcompile": True})
+    params = tuple(None for _ in compiled.positiontup)
+    rows = db.session.connection().exec_driver_sql(
+        'EXPLAIN QUERY PLAN ' + str(compiled), params).fetchall()
+    return [row[-1] for row in rows]
+
+
+def assert_no_full_scan(statement, *tables):
+    """지정한 테이블들이 인덱스 없이 전체 스캔(SCAN)되지 않는지 검증합니다."""
+    plan = query_plan(statement)
+    for table in tables:
+        scans = [d for d in plan if re.match(rf'SCAN {table}\b', d)]
+        assert not scans, f"{table} 전체 스캔 발생: {plan}"
+        assert any(re.match(rf'SEARCH {table}\b', d) for d in plan), plan
+
+
+def test_reserve_caravan_conflict_query_uses_index(flask_app):
+    """
+    [쿼리 플랜 테스트] reserve_caravan의 중복 예약 확인 쿼리가 인덱스를 사용하는지 검증
+    """
+    query = Reservation.query.filter(
+        Reservation.caravan_id == 1,
+        Reservation.status == ReservationStatus.CONFIRMED,
+        Reservation.start_date < END, Reservation.end_date > START)
+    assert_no_full_scan(query.statement, 'reservation')
+
+
+def test_available_caravans_anti_join_uses_index(flask_app):
+    """
+    [쿼리 플랜 테스트] 날짜 검색의 NOT EXISTS 서브쿼리가 reservation을 인덱스로 조회하는지 검증
+    (위치 LIKE '%q%' 조건 때문에 caravan 자체는 스캔되므로 reservation만 확인)
+    """
+    query = filter_available_caravans(
+        Caravan.query.filter(Caravan.location.contains('서울')), START, END)
+    assert_no_full_scan(query.statement, 'reservation')
+
+
+def test_guest_reservations_query_uses_index(flask_app):
+    """
+    [쿼리 플랜 테스트] reservations_guest 쿼리가 guest_id 인덱스를 사용하는지 검증
+    """
+    query = Reservation.query.filter_by(guest_id=1)
+    assert_no_full_scan(query.statement, 'reservation')
+
+
+def test_host_reservations_query_uses_index(flask_app):
+    """
+    [쿼리 플랜 테스트] reservations_host의 카라반 목록 / caravan_id IN 쿼리가 인덱스를 사용하는지 검증
+    """
+    assert_no_full_scan(Caravan.query.filter_by(host_id=1).statement, 'caravan')
+    query = Reservation.query.filter(Reservation.caravan_id.in_([1, 2, 3]))
+    assert_no_full_scan(query.statement, 'reservation')
+
+
+def test_review_lookups_use_index(flask_app):
+    """
+    [쿼리 플랜 테스트] 평점 계산(reviewed_user_id) / 카라반 리뷰(caravan_id) 쿼리가 인덱스를 사용하는지 검증
+    """
+    assert_no_full_scan(Review.query.filter_by(reviewed_user_id=1).statement, 'review')
+    assert_no_full_scan(Review.query.filter_by(caravan_id=1).statement, 'review')
+
+
+def test_keyset_page_seeks_by_primary_key(flask_app):
+    """
+    [쿼리 플랜 테스트] 다음 페이지 조회가 OFFSET 없이 id 범위 탐색(SEARCH)으로 시작하는지 검증
+    """
+    query = Caravan.query.filter(Caravan.id > 500).order_by(Caravan.id).limit(21)
+    assert_no_full_scan(query.statement, 'caravan')
+    assert 'OFFSET' not in str(query.statement)
+
+
+def test_location_search_uses_fts_index(flask_app):
+    """
+    [쿼리 플랜 테스트] FTS 위치 검색은 caravan을 전체 스캔하지 않고 FTS 결과의 id로 조회하는지 검증
+    """
+    matches = db.select(caravan_fts.c.rowid.label('caravan_id'), caravan_fts.c.rank.label('rank')).where(
+        caravan_fts.c.caravan_fts.op('MATCH')('"서울"*')).subquery()
+    query = Caravan.query.join(matches, matches.c.caravan_id == Caravan.id)
+    assert_no_full_scan(query.statement, 'caravan')
+    assert any('VIRTUAL TABLE INDEX' in d for d in query_plan(query.statement))
@@ -0,0 +1,72 @@
+# tests/test_quotes_api.py
+from datetime import date
+
+from flask import g
+
+# --- 테스트 대상 (main.py의 가격 계산) ---
+from main import db, User, Caravan, Reservation, UserRole
+
+
+def login(client, user):
+    g.pop('_login_user', None)  # 앱 컨텍스트가 요청 사이에 공유되므로 이전 요청의 사용자 캐시를 비움
+    with client.session_transaction() as session:
+        session['_user_id'] = str(user.id)
+        session['_fresh'] = True
+
+
+def make_caravans():
+    host = User(email='host@test.com', name='Host', password_hash='x', user_role=UserRole.HOST)
+    guest = User(email='guest@test.com', name='Guest', password_hash='x')
+    db.session.add_all([host, guest])
+    db.session.flush()
+    caravans = [Caravan(host_id=host.id, name=f'C{i}', location='서울', daily_rate=rate, capacity=4)
+                for i, rate in enumerate((50000.0, 80000.0))]
+    db.session.add_all(caravans)
+    db.session.commit()
+    return guest, caravans
+
+
+def test_quotes_api_prices_many_stays_in_one_call(flask_app):
+    """
+    [견적 API 테스트] 여러 (카라반, 기간)을 한 번에 계산하고, 7박 이상이면 장기 숙박 할인이 적용되는지 검증
+    """
+    # 1. 준비 (Arrange)
+    guest, caravans = make_caravans()
+    client = flask_app.test_client()
+    login(client, guest)
+    payload = {"quotes": [
+        {"caravan_id": caravans[0].id, "start_date": "2030-01-01", "end_date": "2030-01-03"},
+        {"caravan_id": caravans[1].id, "start_date": "2030-01-01", "end_date": "2030-01-08"},
+    ]}
+
+    # 2. 실행 (Act)
+    body = client.post('/api/quotes', json=payload).get_json()
+
+    # 3. 검증 (Assert)
+    assert body == {"quotes": [
+        {"caravan_id": caravans[0].id, "nights": 2, "base_price": 100000, "discount": 0, "total_price": 100000},
+        {"caravan_id": caravans[1].id, "nights": 7, "base_price": 560000, "discount": 56000, "total_price": 504000},
+    ]}
+    assert client.post('/api/quotes', json={"quotes": [{"caravan_id": 999, "start_date": "2030-01-01",
+                                                        "end_date": "2030-01-02"}]}).status_code == 404
+    assert client.post('/api/quotes', json={"quotes": [{"caravan_id": caravans[0].id}]}).status_code == 400
+    assert client.post('/api/quotes', json={"quotes": []}).status_code == 400
+
+
+def test_reserve_route_uses_same_price_as_quote(flask_app):
+    """
+    [예약 신청 테스트] 예약 신청 금액이 견적 API와 같은 가격 엔진으로 계산되는지 검증 (체크아웃 날짜 미포함)
+    """
+    # 1. 준비 (Arrange)
+    guest, caravans = make_caravans()
+    client = flask_app.test_client()
+    login(client, guest)
+
+    # 2. 실행 (Act): 8박
+    client.post(f'/reservations/new/{caravans[0].id}',
+                data={'start_date': '2030-02-01', 'end_date': '2030-02-09'})
+
+    # 3. 검증 (Assert)
+    reservation = Reservation.query.one()
+    assert (reservation.start_date, reservation.end_date) == (date(2030, 2, 1), date(2030, 2, 9))
+    assert reservation.total_price == 400000 - 40000
@@ -0,0 +1,132 @@
+# tests/test_rating_aggregates.py
+import pytest
+from datetime import date, timedelta
+
+# --- 테스트 대상 (main.py의 평점 집계) ---
+from main import (db, User, Caravan, Reservation, Review, UserRole, ReservationStatus,
+                  rebuild_rating_aggregates, ensure_schema)
+
+
+@pytest.fixture
+def completed_stays(flask_app):
+    """호스트 1명, 카라반 2대, 리뷰 작성이 가능한(COMPLETED) 예약 3건을 만듭니다."""
+    host = User(email='host@test.com', name='Host', password_hash='x', user_role=UserRole.HOST)
+    guest = User(email='guest@test.com', name='Guest', password_hash='x')
+    db.session.add_all([host, guest])
+    db.session.flush()
+    caravans = [Caravan(host_id=host.id, name=f'C{i}', location='부산', daily_rate=50000, capacity=2)
+                for i in range(2)]
+    db.session.add_all(caravans)
+    db.session.flush()
+    reservations = []
+    for i, caravan in enumerate([caravans[0], caravans[0], caravans[1]]):
+        start = date(2030, 1, 1) + timedelta(days=5 * i)
+        reservations.append(Reservation(caravan_id=caravan.id, guest_id=guest.id, start_date=start,
+                                        end_date=start + timedelta(days=2), total_price=100000,
+                                        status=ReservationStatus.COMPLETED))
+    db.session.add_all(reservations)
+    db.session.commit()
+    return host, guest, caravans, reservations
+
+
+def post_review(client, guest, reservation_id, rating):
+    with client.session_transaction() as session:
+        session['_user_id'] = str(guest.id)
+        session['_fresh'] = True
+    response = client.post(f'/reservations/{reservation_id}/review',
+                           data={'rating': rating, 'comment': '좋았어요'})
+    assert response.status_code == 302
+
+
+def test_review_updates_host_and_caravan_aggregates(flask_app, completed_stays):
+    """
+    [평점 집계 테스트] 리뷰를 작성할 때마다 호스트/카라반 평균과 개수가 누적 갱신되는지 검증
+    """
+    # 1. 준비 (Arrange)
+    host, guest, caravans, reservations = completed_stays
+    client = flask_app.test_client()
+
+    # 2. 실행 (Act): 5점, 4점(카라반 0) / 2점(카라반 1)
+    for reservation, rating in zip(reservations, (5, 4, 2)):
+        post_review(client, guest, reservation.id, rating)
+    db.session.expire_all()
+
+    # 3. 검증 (Assert)
+    assert (host.host_review_count, host.host_rating_sum, host.average_host_rating) == (3, 11, 3.67)
+    assert (caravans[0].review_count, caravans[0].average_rating) == (2, 4.5)
+    assert (caravans[1].review_count, caravans[1].average_rating) == (1, 2.0)
+
+
+def test_rebuild_recomputes_aggregates_from_reviews(flask_app, completed_stays):
+    """
+    [평점 집계 테스트] 집계 값이 어긋나도 rebuild_rating_aggregates()로 리뷰 기준 값이 복구되는지 검증
+    """
+    # 1. 준비 (Arrange): 리뷰 2건을 직접 저장 (집계는 반영하지 않음)
+    host, guest, caravans, reservations = completed_stays
+    for reservation, rating in zip(reservations[1:], (3, 4)):
+        db.session.add(Review(reservation_id=reservation.id, reviewer_id=guest.id,
+                              reviewed_user_id=host.id, caravan_id=reservation.caravan_id,
+                              rating=rating, comment='ok'))
+    host.host_review_count = 99
+    db.session.commit()
+
+    # 2. 실행 (Act)
+    rebuild_rating_aggregates()
+    db.session.expire_all()
+
+    # 3. 검증 (Assert)
+    assert (host.host_review_count, host.host_rating_sum, host.average_host_rating) == (2, 7, 3.5)
+    assert (caravans[0].review_count, caravans[0].rating_sum, caravans[0].average_rating) == (1, 3, 3.0)
+    assert (caravans[1].review_count, caravans[1].average_rating) == (1, 4.0)
+    assert (guest.host_review_count, guest.average_host_rating) == (0, 0.0)
+
+
+def test_ensure_schema_adds_missing_columns(flask_app):
+    """
+    [스키마 테스트] 예전 DB에 없는 집계 컬럼을 ensure_schema()가 기본값 0으로 추가하는지 검증
+    """
+    with db.engine.begin() as conn:
+        conn.exec_driver_sql('ALTER TABLE caravan DROP COLUMN rating_sum')
+
+    ensure_schema()
+
+    columns = {c['name'] for c in db.inspect(db.engine).get_columns('caravan')}
+    assert 'rating_sum' in columns
+
+
+def test_ensure_schema_backfills_rating_sums_for_existing_reviews(flask_app):
+    """
+    [스키마 테스트] 합계 컬럼이 없던 DB(리뷰 4건, 평균 5.0)를 업그레이드한 뒤 5점 리뷰를 더해도 평균이 5.0인지 검증
+    """
+    # 1. 준비 (Arrange): 업그레이드 전 상태 - 리뷰 4건과 개수/평균만 저장된 호스트·카라반
+    host = User(email='host@test.com', name='Host', password_hash='x', user_role=UserRole.HOST,
+                host_review_count=4, average_host_rating=5.0)
+    guest = User(email='guest@test.com', name='Guest', password_hash='x')
+    db.session.add_all([host, guest])
+    db.session.flush()
+    caravan = Caravan(host_id=host.id, name='C', location='부산', daily_rate=50000, capacity=2,
+                      review_count=4, average_rating=5.0)
+    db.session.add(caravan)
+    db.session.flush()
+    reservations = [Reservation(caravan_id=caravan.id, guest_id=guest.id,
+                                start_date=date(2030, 1, 1) + timedelta(days=5 * i),
+                                end_date=date(2030, 1, 3) + timedelta(days=5 * i),
+                                total_price=100000, status=ReservationStatus.COMPLETED)
+                    for i in range(5)]
+    db.session.add_all(reservations)
+    db.session.flush()
+    db.session.add_all([Review(reservation_id=r.id, reviewer_id=guest.id, reviewed_user_id=host.id,
+                               caravan_id=caravan.id, rating=5, comment='ok') for r in reservations[:4]])
+    db.session.commit()
+    with db.engine.begin() as conn:
+        conn.exec_driver_sql('ALTER TABLE user DROP COLUMN host_rating_sum')
+        conn.exec_driver_sql('ALTER TABLE caravan DROP COLUMN rating_sum')
+
+    # 2. 실행 (Act)
+    ensure_schema()
+    post_review(flask_app.test_client(), guest, reservations[4].id, 5)
+    db.session.expire_all()
+
+    # 3. 검증 (Assert)
+    assert (host.host_review_count, host.host_rating_sum, host.average_host_rating) == (5, 25, 5.0)
+    assert (caravan.review_count, caravan.rating_sum, caravan.average_rating) == (5, 25, 5.0)
@@ -0,0 +1,273 @@
+# tests/test_repository_conformance.py
+"""
+리포지토리 인터페이스 공통 테스트 (InMemory / ThreadSafe / SQL 구현체 모두 같은 동작을 해야 함)
+"""
+import pytest
+from datetime import date, timedelta
+
+# --- 테스트 대상 ---
+from src.repositories import memory_repository, concurrent_repository, sql_repository
+from src.exceptions.custom_exceptions import ReservationConflictError
+
+# --- 테스트에 필요한 모델 ---
+from src.models.reservation import Reservation
+from src.models.caravan import Caravan
+from src.models.user import User
+from src.models.payment import Payment, PaymentStatus
+from src.models.review import Review
+from src.models.common import UserRole, CaravanStatus
+
+BASE = date(2030, 1, 1)
+
+BACKENDS = {
+    "memory": {
+        "reservation": memory_repository.InMemoryReservationRepository,
+        "caravan": memory_repository.InMemoryCaravanRepository,
+        "user": memory_repository.InMemoryUserRepository,
+        "payment": memory_repository.InMemoryPaymentRepository,
+        "review": memory_repository.InMemoryReviewRepository,
+    },
+    "thread_safe": {
+        "reservation": concurrent_repository.ThreadSafeReservationRepository,
+        "caravan": concurrent_repository.ThreadSafeCaravanRepository,
+        "user": concurrent_repository.ThreadSafeUserRepository,
+        "payment": concurrent_repository.ThreadSafePaymentRepository,
+        "review": concurrent_repository.ThreadSafeReviewRepository,
+    },
+    "sql": {
+        "reservation": sql_repository.SqlReservationRepository,
+        "caravan": sql_repository.SqlCaravanRepository,
+        "user": sql_repository.SqlUserRepository,
+        "payment": sql_repository.SqlPaymentRepository,
+        "review": sql_repository.SqlReviewRepository,
+    },
+}
+
+@pytest.fixture(params=list(BACKENDS))
+def make_repo(request):
+    """백엔드별로 리포지토리를 만드는 함수를 반환합니다. (SQL은 테스트마다 새 메모리 DB)"""
+    backend = BACKENDS[request.param]
+    if request.param != "sql":
+        yield lambda kind: backend[kind]()
+        return
+    engine = sql_repository.create_repository_engine("sqlite://")
+    yield lambda kind: backend[kind](engine)
+    engine.dispose()
+
+def make_reservation(caravan_id: str, start_offset: int, days: int) -> Reservation:
+    start_date = BASE + timedelta(days=start_offset)
+    return Reservation(guest_id="Guest", caravan_id=caravan_id, start_date=start_date,
+                       end_date=start_date + timedelta(days=days - 1), total_price=100000 * days)
+
+def make_caravans(count: int) -> list[Caravan]:
+    return [
+        Caravan(host_id="Host", name=f"C{i}", capacity=i % 5 + 1, caravan_id=f"c{i:03d}",
+                daily_rate=50000 + 10000 * (i % 4),
+                status=CaravanStatus.MAINTENANCE if i % 3 == 0 else CaravanStatus.AVAILABLE)
+        for i in range(count)
+    ]
+
+# --- ReservationRepository ---
+
+def test_reservation_add_and_get(make_repo):
+    """
+    [리포지토리 공통 테스트] 저장한 예약을 ID로 같은 값으로 조회하는지 검증
+    """
+    # 1. 준비 (Arrange)
+    repo = make_repo("reservation")
+    reservation = make_reservation("c1", 0, 3)
+
+    # 2. 실행 (Act)
+    repo.add(reservation)
+
+    # 3. 검증 (Assert)
+    assert repo.get_by_id(reservation.reservation_id) == reservation
+    assert repo.get_by_id("missing") is None
+
+def test_reservation_overlap_rules(make_repo):
+    """
+    [리포지토리 공통 테스트] 양 끝을 포함한 겹침 판단과 reserve_if_available/add의 충돌 처리가 같은지 검증
+    """
+    # 1. 준비 (Arrange): 1/11 ~ 1/20 예약
+    repo = make_repo("reservation")
+    repo.add(make_reservation("c1", 10, 10))
+
+    # 2. 실행 및 검증 (Act & Assert)
+    assert repo.is_caravan_available("c1", BASE, BASE + timedelta(days=9))
+    assert not repo.is_caravan_available("c1", BASE, BASE + timedelta(days=10))
+    assert not repo.is_caravan_available("c1", BASE + timedelta(days=19), BASE + timedelta(days=25))
+    assert repo.is_caravan_available("c1", BASE + timedelta(days=20), BASE + timedelta(days=25))
+    assert repo.is_caravan_available("c2", BASE, BASE + timedelta(days=30))
+
+    assert not repo.reserve_if_available(make_reservation("c1", 15, 10))
+    assert repo.reserve_if_available(make_reservation("c1", 20, 5))
+    with pytest.raises(ReservationConflictError):
+        repo.add(make_reservation("c1", 0, 11))
+
+def test_reservation_duplicate_id_is_rejected(make_repo):
+    """
+    [리포지토리 공통 테스트] 같은 예약 ID를 두 번 저장하면 ReservationConflictError가 발생하는지 검증
+    """
+    # 1. 준비 (Arrange)
+    repo = make_repo("reservation")
+    first = make_reservation("c1", 0, 3)
+    repo.add(first)
+    duplicate = make_reservation("c2", 0, 3)
+    duplicate.reservation_id = first.reservation_id
+
+    # 2. 실행 및 검증 (Act & Assert)
+    with pytest.raises(ReservationConflictError):
+        repo.add(duplicate)
+    assert repo.is_caravan_available("c2", BASE, BASE + timedelta(days=5))
+
+def test_find_available_caravan_ids_keeps_order(make_repo):
+    """
+    [리포지토리 공통 테스트] 예약 가능한 카라반 ID만 입력 순서대로 반환하는지 검증
+    """
+    # 1. 준비 (Arrange): c1, c3만 해당 기간에 예약 있음
+    repo = make_repo("reservation")
+    repo.add(make_reservation("c1", 0, 5))
+    repo.add(make_reservation("c2", 10, 5))
+    repo.add(make_reservation("c3", 4, 1))
+
+    # 2. 실행 (Act)
+    available = repo.find_available_caravan_ids(["c4", "c3", "c2", "c1", "c0"], BASE + timedelta(days=2), BASE + timedelta(days=6))
+
+    # 3. 검증 (Assert)
+    assert available == ["c4", "c2", "c0"]
+
+# --- CaravanRepository ---
+
+def test_caravan_add_overwrites_and_searches(make_repo):
+    """
+    [리포지토리 공통 테스트] 같은 ID로 다시 저장하면 덮어쓰고, 수용 인원 검색 결과가 (인원, ID) 순서인지 검증
+    """
+    # 1. 준비 (Arrange)
+    repo = make_repo("caravan")
+    for caravan in make_caravans(10):
+        repo.add(caravan)
+    moved = Caravan(host_id="Host", name="C0-big", capacity=9, caravan_id="c000", amenities=["샤워"])
+
+    # 2. 실행 (Act)
+    repo.add(moved)
+
+    # 3. 검증 (Assert)
+    assert repo.get_by_id("c000") == moved
+    assert repo.get_by_id("missing") is None
+    assert [c.caravan_id for c in repo.search_by_capacity(4)] == ["c003", "c008", "c004", "c009", "c000"]
+
+def test_caravan_search_by_range(make_repo):
+    """
+    [리포지토리 공통 테스트] 인원/요금 범위와 상태 조건 검색 결과가 백엔드와 관계없이 같은지 검증
+    """
+    # 1. 준비 (Arrange)
+    repo = make_repo("caravan")
+    repo.add_all(make_caravans(40))
+
+    # 2. 실행 (Act)
+    result = repo.search_by_range(min_capacity=2, max_capacity=3, min_daily_rate=60000,
+                                  max_daily_rate=70000, available_only=True)
+
+    # 3. 검증 (Assert)
+    expected = sorted(
+        (c for c in make_caravans(40)
+         if 2 <= c.capacity <= 3 and 60000 <= c.daily_rate <= 70000 and c.status == CaravanStatus.AVAILABLE),
+        key=lambda c: (c.capacity, c.caravan_id))
+    assert result == expected
+    assert len(repo.search_by_range()) == 40
+
+def test_caravan_pages_cover_all_results_once(make_repo):
+    """
+    [리포지토리 공통 테스트] 커서를 따라가면 모든 결과를 중복 없이 순서대로 받는지 검증
+    """
+    # 1. 준비 (Arrange)
+    repo = make_repo("caravan")
+    repo.add_all(make_caravans(23))
+
+    # 2. 실행 (Act)
+    ids, cursor = [], None
+    while True:
+        page = repo.search_by_capacity_page(2, limit=5, cursor=cursor)
+        ids.extend(c.caravan_id for c in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    # 3. 검증 (Assert)
+    assert ids == [c.caravan_id for c in repo.search_by_capacity(2)]
+
+# --- User / Payment / Review ---
+
+def test_user_add_and_get_by_username(make_repo):
+    """
+    [리포지토리 공통 테스트] 사용자 이름으로 저장한 사용자를 조회하는지 검증
+    """
+    # 1. 준비 (Arrange)
+    repo = make_repo("user")
+    user = User(username="Guest01", role=UserRole.GUEST)
+
+    # 2. 실행 (Act)
+    repo.add(user)
+
+    # 3. 검증 (Assert)
+    assert repo.get_by_username("Guest01") == user
+    assert repo.get_by_username("Nobody") is None
+
+def test_payment_add_updates_status(make_repo):
+    """
+    [리포지토리 공통 테스트] 같은 결제를 상태만 바꿔 다시 저장하면 갱신되는지 검증
+    """
+    # 1. 준비 (Arrange)
+    repo = make_repo("payment")
+    payment = Payment(reservation_id="r1", amount=300000)
+    repo.add(payment)
+
+    # 2. 실행 (Act)
+    payment.status = PaymentStatus.COMPLETED
+    repo.add(payment)
+
+    # 3. 검증 (Assert)
+    assert repo.get_by_id(payment.payment_id) == payment
+    assert repo.get_by_id("missing") is None
+
+def test_payment_add_if_absent_and_indexes(make_repo):
+    """
+    [리포지토리 공통 테스트] 같은 멱등 키나 같은 예약의 진행 중 결제가 있으면 기존 결제를 반환하고,
+    실패한 결제 뒤에는 새 결제를 저장하며, 예약/멱등 키 인덱스로 조회되는지 검증
+    """
+    # 1. 준비 (Arrange)
+    repo = make_repo("payment")
+    first = Payment(reservation_id="r1", amount=300000, idempotency_key="k1")
+
+    # 2. 실행 (Act)
+    stored = repo.add_if_absent(first)
+    same_key = repo.add_if_absent(Payment(reservation_id="r1", amount=300000, idempotency_key="k1"))
+    same_reservation = repo.add_if_absent(Payment(reservation_id="r1", amount=300000, idempotency_key="k2"))
+    first.status = PaymentStatus.FAILED
+    repo.add_all([first])
+    retry = Payment(reservation_id="r1", amount=300000, idempotency_key="k3")
+    after_failure = repo.add_if_absent(retry)
+
+    # 3. 검증 (Assert)
+    assert stored == first
+    assert same_key.payment_id == first.payment_id and same_reservation.payment_id == first.payment_id
+    assert after_failure == retry
+    assert [p.payment_id for p in repo.find_by_reservation_id("r1")] == [first.payment_id, retry.payment_id]
+    assert repo.find_by_reservation_id("r1")[0].status == PaymentStatus.FAILED
+    assert repo.get_by_idempotency_key("k3") == retry
+    assert repo.get_by_idempotency_key("k2") is None and repo.find_by_reservation_id("r2") == []
+
+def test_review_get_by_reservation_id(make_repo):
+    """
+    [리포지토리 공통 테스트] 예약 ID로 리뷰를 조회하는지 검증
+    """
+    # 1. 준비 (Arrange)
+    repo = make_repo("review")
+    review = Review(reservation_id="r1", guest_id="g1", host_id="h1", rating=5, comment="좋아요")
+
+    # 2. 실행 (Act)
+    repo.add(review)
+
+    # 3. 검증 (Assert)
+    assert repo.get_by_reservation_id("r1") == review
+    assert repo.get_by_reservation_id("r2") is None
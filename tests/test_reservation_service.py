@@ -16,7 +16,7 @@ from src.models.common import UserRole
 from src.services.validators import ReservationValidator
 from src.repositories.base import ReservationRepository
 from src.services.factories import ReservationFactory
-from src.services.strategies import PriceCalculator, LongStayDiscountStrategy # ❗️ LongStayDiscountStrategy 추가
+from src.services.pricing import PricingEngine
 from src.services.observers import NotificationService
 
 
@@ -29,7 +29,7 @@ def mock_dependencies():
         "validator": Mock(spec=ReservationValidator),
         "repository": Mock(spec=ReservationRepository),
         "factory": Mock(spec=ReservationFactory),
-        "price_calculator": Mock(spec=PriceCalculator),
+        "price_calculator": Mock(spec=PricingEngine),
         "notification_service": Mock(spec=NotificationService)
     }
 
@@ -88,22 +88,15 @@ def test_create_reservation_success_long_stay(mock_dependencies, sample_data):
         guest, caravan, start_date, end_date
     )
     
-    # --- ❗️ 2. [AssertionError] 수정 ---
-    # 이전 코드는 객체 '인스턴스'를 비교하려 해서 실패했습니다. (테스트 객체 vs 서비스 객체)
-    # 'set_strategy'가 호출되었는지, 그리고 그 인자가 'LongStayDiscountStrategy'의
-    # *인스턴스(타입)*가 맞는지 확인하는 것이 올바른 방법입니다.
-    price_calc.set_strategy.assert_called_once() # 1. 일단 호출되었는지 확인
-    args, _ = price_calc.set_strategy.call_args  # 2. 호출된 인자(args)를 가져옴
-    assert isinstance(args[0], LongStayDiscountStrategy) # 3. 인자의 타입이 맞는지 확인
-
-    # [검증 3] 가격 계산기가 1번 호출되었는가?
-    price_calc.calculate_total_price.assert_called_once()
+    # [검증 2] 가격 엔진이 예약 기간 그대로 1번 호출되었는가? (할인 규칙은 엔진이 적용)
+    price_calc.calculate_total_price.assert_called_once_with(caravan.daily_rate, start_date, end_date)
     
-    # [검증 4] Factory가 1번 호출되었는가?
+    # [검증 3] Factory가 엔진이 계산한 금액으로 1번 호출되었는가?
     factory.create_reservation.assert_called_once()
+    assert factory.create_reservation.call_args.kwargs["total_price"] == 630000
     
-    # [검증 5] Repository가 1번 호출되었는가? (DB에 저장)
-    repo.add.assert_called_once_with(mock_reservation)
+    # [검증 5] Repository의 원자적 저장이 1번 호출되었는가? (DB에 저장)
+    repo.reserve_if_available.assert_called_once_with(mock_reservation)
     
     # [검증 6] 알림이 2번(게스트, 호스트) 호출되었는가?
     assert notifier.send_notification.call_count == 2
@@ -115,7 +108,7 @@ def test_create_reservation_success_long_stay(mock_dependencies, sample_data):
 # --- (추가 테스트 1) 할인 없는 5일 예약 ---
 def test_create_reservation_success_short_stay(mock_dependencies, sample_data):
     """
-    [Service 테스트] 5일 단기 예약 시, NoDiscountStrategy가 설정되는지 검증
+    [Service 테스트] 5일 단기 예약 시, 공유 가격 엔진의 상태를 바꾸지 않고 기간만 전달하는지 검증
     """
     # 1. 준비 (Arrange)
     validator = mock_dependencies["validator"]
@@ -154,16 +147,13 @@ def test_create_reservation_success_short_stay(mock_dependencies, sample_data):
         guest, caravan, start_date, end_date
     )
     
-    # [검증 2] ❗️ NoDiscountStrategy가 설정되었는지 확인
-    price_calc.set_strategy.assert_called_once()
-    args, _ = price_calc.set_strategy.call_args
-    # pytest.approx() 대신 'NoDiscountStrategy' 타입인지 확인합니다.
-    # (이전 테스트에서 사용한 isinstance() 방식과 동일하게 수정)
-    from src.services.strategies import NoDiscountStrategy
-    assert isinstance(args[0], NoDiscountStrategy)
+    # [검증 2] ❗️ 가격 엔진에는 계산 요청만 전달 (set_strategy 같은 상태 변경 없음)
+    assert price_calc.method_calls == [
+        ("calculate_total_price", (caravan.daily_rate, start_date, end_date), {})
+    ]
 
     # [검증 3] Repository가 호출되었는지 확인
-    repo.add.assert_called_once_with(mock_reservation)
+    repo.reserve_if_available.assert_called_once_with(mock_reservation)
     
     # [검증 4] 알림이 2번 호출되었는지 확인
     assert notifier.send_notification.call_count == 2
@@ -208,9 +198,37 @@ def test_create_reservation_fails_if_validation_fails(mock_dependencies, sample_
     # [검증 2] ❗️ 검증 실패 시, 가격 계산, 팩토리, 리포지토리는 *호출되지 않아야 함*
     price_calc.calculate_total_price.assert_not_called()
     factory.create_reservation.assert_not_called()
-    repo.add.assert_not_called()
+    repo.reserve_if_available.assert_not_called()
     
     # [검증 3] ❗️ 실패했으므로 None을 반환해야 함
     assert result is None
     
-    print("\n테스트 성공: Service (검증 실패) 로직 검증 완료")
\ No newline at end of file
+    print("\n테스트 성공: Service (검증 실패) 로직 검증 완료")
+
+
+# --- (추가 테스트 3) 검증 이후 다른 요청이 먼저 예약한 경우 ---
+def test_create_reservation_fails_if_reserved_concurrently(mock_dependencies, sample_data):
+    """
+    [Service 테스트] 검증은 통과했지만 원자적 저장에서 겹침이 발견되면, 알림 없이 None을 반환하는지 검증
+    """
+    # 1. 준비 (Arrange)
+    repo = mock_dependencies["repository"]
+    notifier = mock_dependencies["notification_service"]
+    guest, caravan, start_date, end_date = sample_data
+
+    mock_reservation = MagicMock(spec=Reservation)
+    mock_reservation.reservation_id = "test-mock-id-789"
+    mock_dependencies["validator"].validate_reservation_request.return_value = True
+    mock_dependencies["price_calculator"].calculate_total_price.return_value = 500000
+    mock_dependencies["factory"].create_reservation.return_value = mock_reservation
+    repo.reserve_if_available.return_value = False # 그 사이 다른 요청이 먼저 예약함
+
+    service = ReservationService(**mock_dependencies)
+
+    # 2. 실행 (Act)
+    result = service.create_reservation(guest, caravan, start_date, end_date)
+
+    # 3. 검증 (Assert)
+    repo.reserve_if_available.assert_called_once_with(mock_reservation)
+    notifier.send_notification.assert_not_called()
+    assert result is None
@@ -0,0 +1,73 @@
+# tests/test_reservations_host.py
+import pytest
+from datetime import date, timedelta
+from sqlalchemy import event
+
+# --- 테스트 대상 (main.py의 호스트 예약 관리 라우트) ---
+from main import db, User, Caravan, Reservation, UserRole
+
+
+@pytest.fixture
+def host_with_bookings(flask_app):
+    """카라반 2대와 게스트 3명을 가진 호스트를 만들고, 예약 개수를 지정해 추가하는 함수를 반환합니다."""
+    host = User(email='host@test.com', name='Host', password_hash='x', user_role=UserRole.HOST)
+    guests = [User(email=f'g{i}@test.com', name=f'Guest{i}', password_hash='x') for i in range(3)]
+    db.session.add_all([host, *guests])
+    db.session.flush()
+    caravans = [Caravan(host_id=host.id, name=f'C{i}', location='서울', daily_rate=50000, capacity=4)
+                for i in range(2)]
+    db.session.add_all(caravans)
+    db.session.commit()
+
+    def add_bookings(count):
+        for i in range(count):
+            start = date(2030, 1, 1) + timedelta(days=3 * i)
+            db.session.add(Reservation(caravan_id=caravans[i % 2].id, guest_id=guests[i % 3].id,
+                                       start_date=start, end_date=start + timedelta(days=2),
+                                       total_price=100000))
+        db.session.commit()
+
+    return host, add_bookings
+
+
+def count_statements(client, url) -> tuple[int, bytes]:
+    """요청 한 번 동안 실행된 SQL 문 개수를 셉니다."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        response = client.get(url)
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+    assert response.status_code == 200
+    return len(statements), response.data
+
+
+def login(client, user):
+    with client.session_transaction() as session:
+        session['_user_id'] = str(user.id)
+        session['_fresh'] = True
+
+
+def test_reservations_host_query_count_is_constant(flask_app, host_with_bookings):
+    """
+    [호스트 예약 관리 테스트] 예약 수와 관계없이 요청당 SQL 문 개수가 일정한지 (N+1 없음) 검증
+    """
+    # 1. 준비 (Arrange)
+    host, add_bookings = host_with_bookings
+    client = flask_app.test_client()
+    login(client, host)
+
+    # 2. 실행 (Act): 예약 1건 / 40건일 때 각각 측정
+    add_bookings(1)
+    few, _ = count_statements(client, '/reservations/host')
+    add_bookings(39)
+    db.session.expire_all()
+    many, body = count_statements(client, '/reservations/host')
+
+    # 3. 검증 (Assert): 사용자 로드 1회 + 조인 쿼리 1회
+    assert few == many == 2
+    assert 'Guest2 (g2@test.com)' in body.decode()
@@ -0,0 +1,113 @@
+# tests/test_serializers.py
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+
+import pytest
+
+# --- 테스트 대상 ---
+from src import serializers
+from src.serializers import encoder_for, dumps, dumps_stdlib, dumps_list, iter_json_array
+from src.models.caravan import Caravan
+from src.models.common import CaravanStatus, ReservationStatus
+from src.models.payment import Payment
+from src.models.reservation import Reservation
+from src.constants import DEFAULT_DAILY_RATE
+
+
+@dataclass(slots=True)
+class Sample:
+    name: str
+    status: CaravanStatus | None = None
+    checked_at: datetime | None = None
+    tags: tuple[str, ...] = ()
+
+
+def test_encoder_maps_enums_dates_and_copies_lists():
+    """
+    [직렬화 테스트] 모델 인코더가 Enum은 이름, 날짜는 ISO 문자열로 바꾸고 목록 필드는 복사본을 담는지 검증
+    """
+    # 1. 준비 (Arrange)
+    caravan = Caravan(host_id="h1", name="바다뷰", capacity=4, caravan_id="c1", daily_rate=70000,
+                      status=CaravanStatus.MAINTENANCE, amenities=["샤워", "주방"])
+    reservation = Reservation(guest_id="g1", caravan_id="c1", start_date=date(2030, 1, 1),
+                              end_date=date(2030, 1, 3), total_price=210000, reservation_id="r1")
+    payment = Payment(reservation_id="r1", amount=210000, payment_id="p1",
+                      created_at=datetime(2030, 1, 1, 9, 30))
+
+    # 2. 실행 (Act)
+    encoded_caravan = encoder_for(Caravan)(caravan)
+    encoded_reservation = encoder_for(Reservation)(reservation)
+    encoded_payment = encoder_for(Payment)(payment)
+
+    # 3. 검증 (Assert)
+    assert encoded_caravan == {"host_id": "h1", "name": "바다뷰", "capacity": 4, "caravan_id": "c1",
+                               "daily_rate": 70000, "status": "MAINTENANCE", "amenities": ["샤워", "주방"]}
+    assert encoded_caravan["amenities"] is not caravan.amenities
+    assert encoded_reservation == {"guest_id": "g1", "caravan_id": "c1", "start_date": "2030-01-01",
+                                   "end_date": "2030-01-03", "total_price": 210000, "reservation_id": "r1",
+                                   "status": ReservationStatus.PENDING.name}
+    assert encoded_payment["created_at"] == "2030-01-01T09:30:00" and encoded_payment["status"] == "PENDING"
+    assert encoder_for(Caravan) is encoder_for(Caravan)  # 모델당 한 번만 생성
+
+
+def test_encoder_handles_optional_fields_and_rejects_non_dataclasses():
+    """
+    [직렬화 테스트] Optional 필드는 None이면 그대로 None, 값이 있으면 변환하고, dataclass가 아니면 TypeError인지 검증
+    """
+    encode = encoder_for(Sample)
+
+    assert encode(Sample("a")) == {"name": "a", "status": None, "checked_at": None, "tags": []}
+    assert encode(Sample("b", CaravanStatus.RESERVED, datetime(2030, 1, 1), ("x",))) == {
+        "name": "b", "status": "RESERVED", "checked_at": "2030-01-01T00:00:00", "tags": ["x"]}
+    with pytest.raises(TypeError):
+        encoder_for(dict)
+
+
+@pytest.mark.parametrize("count", [0, 1, 3, 7])
+def test_streamed_array_matches_single_document(count):
+    """
+    [직렬화 테스트] 조각(batch_size=3)으로 나눈 스트리밍 배열을 이어 붙이면 한 번에 만든 배열과 같은지 검증
+    """
+    # 1. 준비 (Arrange)
+    caravans = [Caravan(host_id="h", name=f"카라반{i}", capacity=i, caravan_id=f"c{i}") for i in range(count)]
+
+    # 2. 실행 (Act)
+    chunks = list(iter_json_array(caravans, encoder_for(Caravan), batch_size=3))
+
+    # 3. 검증 (Assert)
+    assert json.loads(b"".join(chunks)) == json.loads(dumps_list(caravans, encoder_for(Caravan)))
+    assert len(chunks) == max(1, -(-count // 3) + 1)  # 조각 수 = 배치 수 + 닫는 괄호
+
+
+def test_fast_path_and_stdlib_produce_same_json():
+    """
+    [직렬화 테스트] 선택 의존성(orjson) 경로와 표준 json 경로가 같은 JSON(UTF-8, 한글 그대로)을 만드는지 검증
+    """
+    payload = [{"name": "바다뷰", "capacity": 4, "rate": 1.5, "tags": [], "next": None}]
+
+    assert json.loads(dumps(payload)) == json.loads(dumps_stdlib(payload)) == payload
+    assert "바다뷰".encode() in dumps_stdlib(payload)
+    assert serializers.JSON_BACKEND in ("orjson", "json")
+
+
+def test_search_route_serializes_caravans():
+    """
+    [직렬화 테스트] app.py 검색 API가 상태를 이름으로 응답하고, stream=1 응답도 같은 본문인지 검증
+    """
+    # 1. 준비 (Arrange)
+    import app as flask_module
+    flask_module.caravan_repo.add(Caravan(host_id="h1", name="직렬화 테스트", capacity=37,
+                                          caravan_id="serializer-c1", amenities=["와이파이"]))
+    client = flask_module.app.test_client()
+
+    # 2. 실행 (Act)
+    response = client.get("/caravans/search?capacity=37&user=guest")
+    streamed = client.get("/caravans/search?capacity=37&user=guest&stream=1")
+
+    # 3. 검증 (Assert)
+    assert response.status_code == 200 and response.mimetype == "application/json"
+    assert response.get_json() == [{"host_id": "h1", "name": "직렬화 테스트", "capacity": 37,
+                                    "caravan_id": "serializer-c1", "daily_rate": DEFAULT_DAILY_RATE,
+                                    "status": "AVAILABLE", "amenities": ["와이파이"]}]
+    assert streamed.status_code == 200 and json.loads(streamed.get_data()) == response.get_json()
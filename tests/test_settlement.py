@@ -0,0 +1,162 @@
+# tests/test_settlement.py
+import threading
+from datetime import date
+from unittest.mock import Mock
+
+import pytest
+
+# --- 테스트 대상 ---
+from src.services.settlement import SettlementPipeline, FakePaymentGateway
+from src.services.payment_service import PaymentService
+
+# --- 테스트에 필요한 객체 ---
+from src.models.payment import PaymentStatus
+from src.models.reservation import Reservation
+from src.repositories.memory_repository import InMemoryReservationRepository
+from src.repositories.concurrent_repository import ThreadSafePaymentRepository
+from src.services.observers import NotificationService
+from src.exceptions.custom_exceptions import ValidationError
+
+
+class GatedGateway(FakePaymentGateway):
+    """release가 설정될 때까지 정산을 붙잡아 두는 가짜 PG (시간 측정 없이 '기다리지 않음'을 검증)"""
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.release = threading.Event()
+
+    def settle_batch(self, payments):
+        self.release.wait(timeout=5)
+        return super().settle_batch(payments)
+
+
+def make_service(gateway, count: int = 1, **pipeline_options):
+    """결제 대기 예약 count건(res-0, res-1, ...)과 정산 파이프라인을 연결한 PaymentService를 만듭니다."""
+    reservation_repo = InMemoryReservationRepository()
+    for i in range(count):
+        reservation_repo.add(Reservation(guest_id=f"g{i}", caravan_id=f"c{i}", start_date=date(2030, 1, 1),
+                                         end_date=date(2030, 1, 2), total_price=100000 + i,
+                                         reservation_id=f"res-{i}"))
+    payment_repo = ThreadSafePaymentRepository()
+    pipeline = SettlementPipeline(gateway, payment_repo, **pipeline_options)
+    service = PaymentService(payment_repo, reservation_repo, Mock(spec=NotificationService), settlement=pipeline)
+    return service, payment_repo, pipeline
+
+
+def test_checkout_returns_before_gateway_settles():
+    """
+    [정산 테스트] 결제 요청은 PG 응답을 기다리지 않고 PENDING으로 반환되고, 정산 후 COMPLETED와 PG 거래 번호가 저장되는지 검증
+    """
+    # 1. 준비 (Arrange): release 전까지 멈춰 있는 PG
+    gateway = GatedGateway()
+    service, payment_repo, pipeline = make_service(gateway)
+
+    # 2. 실행 (Act)
+    payment = service.process_payment("res-0", 100000, idempotency_key="checkout-0")
+    status_on_return = payment_repo.get_by_id(payment.payment_id).status
+    gateway.release.set()
+    pipeline.shutdown()
+
+    # 3. 검증 (Assert)
+    assert payment.status == status_on_return == PaymentStatus.PENDING
+    settled = payment_repo.get_by_id(payment.payment_id)
+    assert settled.status == PaymentStatus.COMPLETED and settled.gateway_reference.startswith("fake-")
+    assert gateway.charged == [payment.payment_id] and pipeline.completed == 1
+
+
+def test_pending_payments_are_settled_in_batches():
+    """
+    [정산 테스트] 쌓인 결제가 batch_size 이하의 묶음으로 PG에 전달되고, 결과가 결제마다 반영되는지 검증
+    """
+    # 1. 준비 (Arrange): 첫 결제를 붙잡아 두는 동안 나머지가 큐에 쌓이도록
+    gateway = GatedGateway(decline_over=100089)  # 마지막 10건(100090원 이상)은 거절
+    service, payment_repo, pipeline = make_service(gateway, count=100, batch_size=25)
+
+    # 2. 실행 (Act)
+    payments = [service.process_payment(f"res-{i}", 100000 + i) for i in range(100)]
+    gateway.release.set()
+    pipeline.shutdown()
+
+    # 3. 검증 (Assert)
+    assert sum(gateway.batches) == 100 and max(gateway.batches) <= 25 and len(gateway.batches) < 100
+    statuses = [payment_repo.get_by_id(p.payment_id).status for p in payments]
+    assert statuses == [PaymentStatus.COMPLETED] * 90 + [PaymentStatus.FAILED] * 10
+    assert (pipeline.completed, pipeline.declined, pipeline.unsettled) == (90, 10, 0)
+
+
+def test_lost_gateway_response_is_retried_without_double_charge():
+    """
+    [정산 테스트] PG 통신 실패/응답 유실 후 같은 묶음을 재시도해도 결제마다 한 번만 청구되는지 검증
+    """
+    # 1. 준비 (Arrange): 1번째 요청은 청구 전 실패, 2번째 요청은 청구 후 응답 유실
+    gateway = FakePaymentGateway(fail_times=1, lost_responses=1)
+    service, payment_repo, pipeline = make_service(gateway, count=3, backoff_base=0.001)
+
+    # 2. 실행 (Act)
+    payments = [service.process_payment(f"res-{i}", 100000 + i) for i in range(3)]
+    pipeline.shutdown()
+
+    # 3. 검증 (Assert)
+    assert sorted(gateway.charged) == sorted(p.payment_id for p in payments)
+    assert all(payment_repo.get_by_id(p.payment_id).status == PaymentStatus.COMPLETED for p in payments)
+    assert pipeline.retried >= 2 and gateway.attempts >= 3
+
+
+def test_payment_stays_pending_when_gateway_keeps_failing():
+    """
+    [정산 테스트] 재시도 후에도 PG가 응답하지 않으면 결제를 실패로 바꾸지 않고 PENDING으로 남기는지 검증
+    (PG가 실제로 청구했는지 알 수 없으므로, 같은 예약의 중복 결제도 계속 막힘)
+    """
+    # 1. 준비 (Arrange)
+    gateway = FakePaymentGateway(fail_times=10)
+    service, payment_repo, pipeline = make_service(gateway, max_retries=2, backoff_base=0.001)
+
+    # 2. 실행 (Act)
+    payment = service.process_payment("res-0", 100000)
+    pipeline.shutdown()
+
+    # 3. 검증 (Assert)
+    assert payment_repo.get_by_id(payment.payment_id).status == PaymentStatus.PENDING
+    assert pipeline.unsettled == 1 and gateway.charged == []
+    with pytest.raises(ValidationError):
+        service.process_payment("res-0", 100000, idempotency_key="another-try")
+
+
+class FlakyPaymentRepository(ThreadSafePaymentRepository):
+    """처음 failures번의 add_all()이 실패하는 결제 리포지토리 (DB 장애 흉내)"""
+    def __init__(self, failures: int):
+        super().__init__()
+        self.failures = failures
+
+    def add_all(self, payments):
+        if self.failures > 0:
+            self.failures -= 1
+            raise ConnectionError("가짜 DB 장애")
+        super().add_all(payments)
+
+
+def test_worker_survives_result_store_and_callback_failures():
+    """
+    [정산 테스트] 결과 저장(add_all)이나 on_settled가 실패해도 워커가 죽지 않고 다음 결제를 계속 정산하는지 검증
+    (저장에 실패한 결제는 PENDING으로 남고 unsettled로 집계)
+    """
+    # 1. 준비 (Arrange): 첫 저장은 실패하는 리포지토리, 항상 실패하는 후처리
+    gateway = FakePaymentGateway()
+    reservation_repo = InMemoryReservationRepository()
+    for i in range(2):
+        reservation_repo.add(Reservation(guest_id=f"g{i}", caravan_id=f"c{i}", start_date=date(2030, 1, 1),
+                                         end_date=date(2030, 1, 2), total_price=100000, reservation_id=f"res-{i}"))
+    payment_repo = FlakyPaymentRepository(failures=1)
+    on_settled = Mock(side_effect=RuntimeError("알림 실패"))
+    pipeline = SettlementPipeline(gateway, payment_repo, batch_size=1, on_settled=on_settled)
+    service = PaymentService(payment_repo, reservation_repo, Mock(spec=NotificationService), settlement=pipeline)
+
+    # 2. 실행 (Act)
+    first = service.process_payment("res-0", 100000)
+    second = service.process_payment("res-1", 100000)
+    pipeline.shutdown()
+
+    # 3. 검증 (Assert)
+    assert payment_repo.get_by_id(first.payment_id).status == PaymentStatus.PENDING
+    assert payment_repo.get_by_id(second.payment_id).status == PaymentStatus.COMPLETED
+    assert (pipeline.completed, pipeline.unsettled) == (1, 1)
+    assert on_settled.call_count == 1
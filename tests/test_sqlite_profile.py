@@ -0,0 +1,83 @@
+# tests/test_sqlite_profile.py
+import pytest
+import sqlalchemy as sa
+
+# --- 테스트 대상 ---
+from src.repositories.sqlite_profile import SqliteProfile, install_sqlite_profile, pool_options
+
+
+def make_engine(path, profile):
+    engine = sa.create_engine(f"sqlite:///{path}")
+    install_sqlite_profile(engine, profile)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE IF NOT EXISTS item (id INTEGER PRIMARY KEY, name TEXT)")
+        conn.exec_driver_sql("INSERT INTO item (name) VALUES ('a')")
+    return engine
+
+
+def test_profile_pragmas_are_applied_to_every_connection(tmp_path):
+    """
+    [SQLite 프로필 테스트] 풀에서 새로 연 커넥션마다 WAL/synchronous/busy_timeout/mmap/cache 설정이 적용되는지 검증
+    """
+    # 1. 준비 (Arrange)
+    profile = SqliteProfile(busy_timeout_ms=1234, mmap_size=1 << 20, cache_size_kib=2048)
+    engine = make_engine(tmp_path / "app.db", profile)
+
+    # 2. 실행 (Act)
+    with engine.connect() as first, engine.connect() as second:
+        values = [tuple(conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+                        for name in ("journal_mode", "synchronous", "busy_timeout", "mmap_size", "cache_size"))
+                  for conn in (first, second)]
+
+    # 3. 검증 (Assert) - synchronous: NORMAL = 1
+    assert values == [("wal", 1, 1234, 1 << 20, -2048)] * 2
+
+
+def test_wal_lets_writer_commit_while_reader_holds_snapshot(tmp_path):
+    """
+    [SQLite 프로필 테스트] WAL에서는 읽기 트랜잭션이 열려 있어도 쓰기가 커밋되고, 읽기는 자기 스냅샷을 보는지 검증
+    (기본 롤백 저널에서는 같은 상황에서 쓰기 커밋이 "database is locked"로 실패)
+    """
+    # 1. 준비 (Arrange)
+    legacy = make_engine(tmp_path / "legacy.db", SqliteProfile(journal_mode="DELETE", busy_timeout_ms=50))
+    wal = make_engine(tmp_path / "wal.db", SqliteProfile(busy_timeout_ms=50))
+
+    def write_during_read(engine):
+        with engine.connect() as reader, engine.connect() as writer:
+            reader.exec_driver_sql("BEGIN")
+            before = reader.exec_driver_sql("SELECT COUNT(*) FROM item").scalar()
+            writer.exec_driver_sql("BEGIN IMMEDIATE")
+            writer.exec_driver_sql("INSERT INTO item (name) VALUES ('b')")
+            try:
+                writer.exec_driver_sql("COMMIT")
+            finally:
+                seen = reader.exec_driver_sql("SELECT COUNT(*) FROM item").scalar()
+                reader.exec_driver_sql("COMMIT")
+        return before, seen
+
+    # 2. 실행 & 3. 검증 (Assert)
+    assert write_during_read(wal) == (1, 1)  # 커밋 성공, 읽기는 시작 시점의 스냅샷
+    with pytest.raises(sa.exc.OperationalError, match="locked"):
+        write_during_read(legacy)
+
+
+@pytest.mark.parametrize("environ, expected", [
+    ({}, {"pool_size": 1, "max_overflow": 2}),
+    ({"GUNICORN_THREADS": "8"}, {"pool_size": 8, "max_overflow": 4}),
+    ({"GUNICORN_THREADS": "8", "DB_POOL_SIZE": "3"}, {"pool_size": 3, "max_overflow": 2}),
+])
+def test_pool_is_sized_per_worker(environ, expected):
+    """
+    [SQLite 프로필 테스트] 커넥션 풀이 워커당 스레드 수(또는 DB_POOL_SIZE)에 맞춰지는지 검증
+    """
+    assert pool_options(environ) == expected
+
+
+def test_profile_from_env_can_be_turned_off():
+    """
+    [SQLite 프로필 테스트] 환경 변수로 값을 바꾸거나 프로필을 끌 수 있고, 잘못된 synchronous는 거부하는지 검증
+    """
+    assert SqliteProfile.from_env({"SQLITE_PROFILE": "none"}) is None
+    assert SqliteProfile.from_env({"SQLITE_BUSY_TIMEOUT_MS": "250"}).busy_timeout_ms == 250
+    with pytest.raises(ValueError):
+        SqliteProfile.from_env({"SQLITE_SYNCHRONOUS": "sometimes"})